@@ -8,15 +8,24 @@ import plotly.express as px
 from datetime import datetime, timedelta
 import numpy as np
 import time
-from typing import List, Dict, Optional
+from typing import Iterator, List, Dict, Optional
+from contextlib import contextmanager
 import os
 import json
 import io
-import requests
-import urllib.request
 import tempfile
+import shutil
+import threading
 import logging
 
+from db_storage import checkpoint, connect_database
+from changesets import MANIFEST_NAME, applied_seq, parse_manifest, sync_database
+from downloader import DEFAULT_MAX_AGE, CachedDownloader
+from schema import read_queries, schema_version
+from result_cache import ResultCache
+from signal_frame import SignalFrame
+from snapshot import SNAPSHOT_QUERIES, read_snapshot_table, snapshot_available, snapshot_files
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -48,57 +57,191 @@ st.markdown("""
     </style>
 """, unsafe_allow_html=True)
 
+# How long all sessions share one loaded dashboard before it is refreshed from GitHub
+DASHBOARD_TTL_SECONDS = 300
+# Memory for query results shared by all sessions (see result_cache.py)
+DASHBOARD_RESULT_CACHE_MB = 128
+# Signal cards rendered per page in the tabs without a page size selector
+CARDS_PER_PAGE = 25
+
 class TradingDashboard:
-    def __init__(self, db_path: Optional[str] = None):
-        """Initialize dashboard with database connection"""
-        # Download latest database from GitHub
-        self.db_path = self.download_latest_database()
+    def __init__(self, db_path: Optional[str] = None, refresh: bool = False,
+                 result_cache: Optional[ResultCache] = None):
+        """Initialize dashboard from the Parquet snapshot, or the database when there is none
+        
+        The snapshot is the primary source (pyarrow is a requirement); the
+        database, kept current with changesets, is only downloaded when the
+        snapshot can't be. With refresh, cached downloads are revalidated with
+        GitHub right away instead of after DEFAULT_MAX_AGE. Tables read from
+        either source are kept in result_cache (shared with later instances)
+        for as long as the data version is unchanged.
+        """
+        self.result_cache = result_cache or ResultCache()
+        # Downloads are kept between page loads and only refetched when they changed
+        self.downloader = CachedDownloader(os.path.join(tempfile.gettempdir(), "trading_dashboard_cache"),
+                                           max_age=0 if refresh else DEFAULT_MAX_AGE)
+        
+        # Download the latest snapshot (or the full database) from GitHub
+        self.snapshot = self.download_latest_snapshot()
+        self.db_path = ':memory:' if self.snapshot is not None else self.download_latest_database()
         self.connection = None
         self.setup_database_connection()
+        
+        # Parsed on first use; the data (and so the model) never changes during this dashboard's life
+        self.signal_frame: Optional[SignalFrame] = None
+        self.signal_frame_lock = threading.Lock()
+    
+    def download_latest_snapshot(self) -> Optional[Dict[str, str]]:
+        """Download the Parquet snapshot published by the scheduler (much smaller than the database)
+        
+        Returns the local file per table; the tables are read on first use.
+        """
+        if not snapshot_available():
+            return None
+        
+        try:
+            # GitHub snapshot directory written by scheduler_v2.py (see snapshot.py)
+            github_snapshot_url = "https://raw.githubusercontent.com/NewAgeNations/trading-dashboard/main/snapshot"
+            
+            files = {}
+            downloaded = 0
+            with st.spinner("🌐 Checking latest snapshot on GitHub..."):
+                for table in SNAPSHOT_QUERIES:
+                    path, status = self.downloader.fetch(f"{github_snapshot_url}/{table}.parquet",
+                                                         f"snapshot_{table}.parquet")
+                    if path is None:
+                        logger.warning(f"⚠️ Snapshot download failed for {table} ({status})")
+                        files = None
+                        break
+                    files[table] = path
+                    downloaded += status == 'downloaded'
+            
+            if files is not None:
+                if downloaded:
+                    logger.info(f"✅ Downloaded {downloaded} updated snapshot tables")
+                    st.success(f"✅ Snapshot updated ({downloaded} tables downloaded)")
+                return files
+                
+        except Exception as e:
+            logger.warning(f"⚠️ Could not download snapshot from GitHub: {e}")
+        
+        # Fall back to a local snapshot (written next to a local scheduler), then to the database
+        return snapshot_files("snapshot")
     
     def download_latest_database(self) -> str:
-        """Download the latest database from GitHub"""
+        """Bring the local copy of the database up to date from GitHub
+        
+        A copy kept from an earlier page load only downloads the changesets it
+        is missing (see changesets.py); the full database is downloaded when
+        there is no copy yet or it has fallen too far behind.
+        """
+        # Kept between page loads as the base the changesets are applied to
+        temp_db_path = os.path.join(tempfile.gettempdir(), "trading_signals_latest.db")
+        
+        # GitHub repository URL
+        github_url = "https://raw.githubusercontent.com/NewAgeNations/trading-dashboard/main"
+        
+        if os.path.exists(temp_db_path) and self.sync_changesets(temp_db_path, github_url) is not None:
+            return temp_db_path
+        
         try:
-            # Create a temporary file for the database
-            temp_dir = tempfile.gettempdir()
-            temp_db_path = os.path.join(temp_dir, "trading_signals_latest.db")
-            
-            # GitHub repository URL
-            github_db_url = "https://raw.githubusercontent.com/NewAgeNations/trading-dashboard/main/trading_signals.db"
-            
             # Show downloading status
             with st.spinner("🌐 Downloading latest database from GitHub..."):
-                # Download the database file
-                response = requests.get(github_db_url, timeout=30)
+                # Prefer the gzip-compressed copy published with each base (see scheduler_v2.run_rebase)
+                base_path, status = self.downloader.fetch(f"{github_url}/trading_signals.db.gz",
+                                                          "trading_signals_base.db", gunzip=True)
+                if status == 'missing':
+                    base_path, status = self.downloader.fetch(f"{github_url}/trading_signals.db",
+                                                              "trading_signals_base_plain.db")
+                
+                if status == 'failed' and os.path.exists(temp_db_path):
+                    # Offline: the working copy is at least as new as the cached base
+                    st.warning("⚠️ Could not reach GitHub, showing the last downloaded data")
+                    return temp_db_path
                 
-                if response.status_code == 200:
-                    with open(temp_db_path, 'wb') as f:
-                        f.write(response.content)
+                if base_path is not None:
+                    if status == 'downloaded':
+                        file_size = os.path.getsize(base_path)
+                        logger.info(f"✅ Downloaded database ({file_size} bytes)")
+                        st.success(f"✅ Database downloaded ({file_size:,} bytes)")
                     
-                    file_size = os.path.getsize(temp_db_path)
-                    logger.info(f"✅ Downloaded database ({file_size} bytes)")
-                    st.success(f"✅ Database downloaded ({file_size:,} bytes)")
+                    # Start the working copy over from the base; its WAL files belong to the old file
+                    # (DashboardCache closed the previous dashboard's connection to it first)
+                    for suffix in ('-wal', '-shm'):
+                        if os.path.exists(temp_db_path + suffix):
+                            os.remove(temp_db_path + suffix)
+                    shutil.copyfile(base_path, f"{temp_db_path}.tmp")
+                    os.replace(f"{temp_db_path}.tmp", temp_db_path)
                     
+                    # The published database is the last base; apply the changesets since
+                    self.sync_changesets(temp_db_path, github_url)
                     return temp_db_path
                 else:
-                    logger.warning(f"⚠️ GitHub download failed: Status {response.status_code}")
+                    logger.warning(f"⚠️ GitHub download failed ({status})")
                     st.warning("⚠️ Could not download latest database from GitHub")
                     
         except Exception as e:
             logger.warning(f"⚠️ Could not download from GitHub: {e}")
             st.warning("⚠️ Using local database (if available)")
         
-        # Fall back to local database if download fails
-        if os.path.exists("trading_signals.db"):
+        # Fall back to the (possibly stale) copy, then to a local database
+        if os.path.exists(temp_db_path):
+            return temp_db_path
+        elif os.path.exists("trading_signals.db"):
             return "trading_signals.db"
         else:
             # Use empty database as last resort
             return ":memory:"
     
+    def sync_changesets(self, db_path: str, github_url: str) -> Optional[int]:
+        """Apply the published changesets db_path is missing; None if it needs a full download"""
+        downloaded = []
+        manifest = []
+        
+        def fetch(name: str) -> Optional[bytes]:
+            if name == MANIFEST_NAME:
+                # Revalidated at most every few minutes; unchanged most page loads
+                data = self.downloader.read(f"{github_url}/changesets/{name}", "changesets_manifest.json")
+                manifest.append(data)
+                return data
+            # A changeset never changes once published, so a cached copy is always current
+            path, status = self.downloader.fetch(f"{github_url}/changesets/{name}", f"changeset_{name}",
+                                                 immutable=True)
+            if path is None:
+                return None
+            with open(path, 'rb') as f:
+                data = f.read()
+            if status == 'downloaded':
+                downloaded.append(len(data))
+            return data
+        
+        try:
+            with st.spinner("🌐 Downloading database changes from GitHub..."):
+                connection = connect_database(db_path)
+                try:
+                    applied = sync_database(connection, fetch)
+                    checkpoint(connection, 'TRUNCATE')
+                finally:
+                    connection.close()
+        except Exception as e:
+            logger.warning(f"⚠️ Could not apply changesets: {e}")
+            return None
+        
+        # Drop cached changesets that are no longer published
+        if manifest and manifest[0] is not None:
+            published = parse_manifest(manifest[0])['changesets']
+            self.downloader.prune("changeset_", [f"changeset_{entry['file']}" for entry in published])
+        
+        if applied:
+            logger.info(f"✅ Applied {applied} changesets ({sum(downloaded)} bytes)")
+            st.success(f"✅ Database updated with {applied} changesets ({sum(downloaded):,} bytes)")
+        return applied
+    
     def setup_database_connection(self):
         """Establish database connection - cloud safe"""
         try:
-            self.connection = sqlite3.connect(self.db_path, check_same_thread=False)
+            # WAL mode so reads don't block (or get blocked by) a scheduler writing the same file
+            self.connection = connect_database(self.db_path, check_same_thread=False)
             # Enable foreign keys
             self.connection.execute("PRAGMA foreign_keys = ON")
             self.connection.row_factory = sqlite3.Row
@@ -108,10 +251,75 @@ class TradingDashboard:
             st.error(f"❌ Database connection failed: {str(e)}")
             # Create an empty connection for demo purposes
             self.connection = sqlite3.connect(':memory:', check_same_thread=False)
+        
+        # Resolve the queries for this database's schema once (see schema.py)
+        self.schema_version = schema_version(self.connection)
+        self.queries = read_queries(self.schema_version)
+        self.data_version = self.get_data_version()
+    
+    def close(self):
+        """Close the database connection and downloads; the dashboard can't be used afterwards"""
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+        self.downloader.close()
+    
+    def get_data_version(self) -> Optional[tuple]:
+        """Key identifying the database contents, for the result cache (None: don't cache)"""
+        try:
+            if self.snapshot is not None:
+                # The downloader only ever replaces a snapshot file whole, when it changed
+                return ('snapshot',) + tuple((os.path.abspath(path), os.stat(path).st_mtime_ns,
+                                              os.path.getsize(path)) for path in self.snapshot.values())
+            if self.db_path == ':memory:':
+                return None
+            
+            row = self.connection.execute('SELECT last_updated FROM dashboard_metadata WHERE id = 1').fetchone()
+            return (os.path.abspath(self.db_path), os.stat(self.db_path).st_mtime_ns, self.schema_version,
+                    applied_seq(self.connection), row[0] if row else None)
+        except (sqlite3.Error, OSError) as e:
+            logger.debug(f"Could not determine data version: {e}")
+            return None
+    
+    def read_table(self, name: str) -> pd.DataFrame:
+        """Read table `name` (snapshot file or read query), or take it from the cache while the data version is unchanged"""
+        if self.snapshot is not None:
+            return self.result_cache.get(self.data_version, name, lambda: read_snapshot_table(self.snapshot[name]))
+        return self.result_cache.get(self.data_version, name,
+                                     lambda: pd.read_sql_query(self.queries[name], self.connection))
+    
+    def get_snapshot_metadata(self) -> Dict:
+        """Get metadata from the Parquet snapshot (see get_database_metadata)"""
+        metadata = self.read_table('dashboard_metadata')
+        signals = self.read_table('trading_signals')
+        
+        if not metadata.empty:
+            return {
+                'last_updated': metadata['last_updated'].iloc[0],
+                'total_symbols': int(metadata['total_symbols'].iloc[0]),
+                'status': metadata['last_update_status'].iloc[0],
+                'data_source': 'Real Data'
+            }
+        if not signals.empty:
+            return {
+                'last_updated': signals['timestamp'].max(),
+                'total_symbols': signals['symbol'].nunique(),
+                'status': 'active',
+                'data_source': 'Real Data'
+            }
+        return {
+            'last_updated': 'No data',
+            'total_symbols': 0,
+            'status': 'empty',
+            'data_source': 'Sample Data'
+        }
     
     def get_database_metadata(self) -> Dict:
         """Get metadata about the database - UPDATED FOR scheduler_v2.py"""
         try:
+            if self.snapshot is not None:
+                return self.get_snapshot_metadata()
+            
             # Try to get from dashboard_metadata table first
             try:
                 query = """
@@ -179,73 +387,7 @@ class TradingDashboard:
     def get_all_signals(self) -> pd.DataFrame:
         """Retrieve all trading signals from database - UPDATED FOR scheduler_v2.py"""
         try:
-            # First check what columns exist in the table
-            cursor = self.connection.cursor()
-            cursor.execute("PRAGMA table_info(trading_signals)")
-            columns_info = cursor.fetchall()
-            available_columns = [col[1] for col in columns_info]
-            
-            # Build query based on available columns
-            select_columns = []
-            if 'symbol' in available_columns:
-                select_columns.append('symbol')
-            if 'current_price' in available_columns:
-                select_columns.append('current_price')
-            if 'poly_1h_signal' in available_columns:
-                select_columns.append('poly_1h_signal')
-            if 'fib_15m_signal' in available_columns:
-                select_columns.append('fib_15m_signal')
-            if 'fib_signal' in available_columns:
-                select_columns.append('fib_signal')
-            if 'poly_signal' in available_columns:
-                select_columns.append('poly_signal')
-            if 'rsi_zone' in available_columns:
-                select_columns.append('rsi_zone')
-            if 'macd_signal' in available_columns:
-                select_columns.append('macd_signal')
-            if 'pivot_zone' in available_columns:
-                select_columns.append('pivot_zone')
-            if 'overall_signal' in available_columns:
-                select_columns.append('overall_signal')
-            if 'forecast_1h' in available_columns:
-                select_columns.append('forecast_1h')
-            if 'forecast_1d' in available_columns:
-                select_columns.append('forecast_1d')
-            if 'forecast_7d' in available_columns:
-                select_columns.append('forecast_7d')
-            if 'forecast_14d' in available_columns:
-                select_columns.append('forecast_14d')
-            if 'forecast_30d' in available_columns:
-                select_columns.append('forecast_30d')
-            if 'timestamp' in available_columns:
-                select_columns.append('timestamp')
-            if 'created_at' in available_columns:
-                select_columns.append('created_at')
-            
-            if not select_columns:
-                return pd.DataFrame()
-            
-            query = f"""
-                SELECT {', '.join(select_columns)}
-                FROM trading_signals
-                ORDER BY timestamp DESC
-            """
-            
-            df = pd.read_sql_query(query, self.connection)
-            
-            # Ensure all expected columns exist (add with NaN if missing)
-            expected_columns = [
-                'symbol', 'current_price', 'poly_1h_signal', 'fib_15m_signal',
-                'fib_signal', 'poly_signal', 'rsi_zone', 'macd_signal',
-                'pivot_zone', 'overall_signal', 'forecast_1h', 'forecast_1d',
-                'forecast_7d', 'forecast_14d', 'forecast_30d', 'timestamp'
-            ]
-            
-            for col in expected_columns:
-                if col not in df.columns:
-                    df[col] = None
-            
-            return df
+            return self.read_table('trading_signals')
         except Exception as e:
             st.error(f"Error fetching signals: {str(e)}")
             return pd.DataFrame()
@@ -253,402 +395,107 @@ class TradingDashboard:
     def get_hvts_forecast(self) -> pd.DataFrame:
         """Retrieve HVTS forecast data - UPDATED FOR scheduler_v2.py"""
         try:
-            # Check if table exists
-            cursor = self.connection.cursor()
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='hvts_forecast'")
-            if not cursor.fetchone():
-                return pd.DataFrame()
-            
-            query = """
-                SELECT 
-                    symbol,
-                    current_price,
-                    forecast_1d,
-                    forecast_7d,
-                    forecast_14d,
-                    forecast_30d,
-                    poly_signal,
-                    poly_emoji,
-                    timestamp
-                FROM hvts_forecast
-                ORDER BY timestamp DESC
-            """
-            df = pd.read_sql_query(query, self.connection)
-            return df
+            return self.read_table('hvts_forecast')
         except Exception as e:
             logger.error(f"Error getting hvts forecast: {e}")
             return pd.DataFrame()
     
     def get_fibonacci_data(self) -> pd.DataFrame:
-        """Retrieve Fibonacci 1-hour indicator data - UPDATED FOR scheduler_v2.py"""
+        """Retrieve Fibonacci 1-hour indicator data (latest row per symbol) - UPDATED FOR scheduler_v2.py"""
         try:
-            # First check if table exists
-            cursor = self.connection.cursor()
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='fibonacci_1h'")
-            if not cursor.fetchone():
-                return pd.DataFrame()
-            
-            # Check what columns exist
-            cursor.execute("PRAGMA table_info(fibonacci_1h)")
-            columns_info = cursor.fetchall()
-            available_columns = [col[1] for col in columns_info]
-            
-            # Build query with available columns
-            select_columns = []
-            if 'symbol' in available_columns:
-                select_columns.append('symbol')
-            if 'current_price' in available_columns:
-                select_columns.append('current_price')
-            if 'fib_level_0' in available_columns:
-                select_columns.append('fib_level_0')
-            if 'fib_level_23_6' in available_columns:
-                select_columns.append('fib_level_23_6')
-            if 'fib_level_38_2' in available_columns:
-                select_columns.append('fib_level_38_2')
-            if 'fib_level_50' in available_columns:
-                select_columns.append('fib_level_50')
-            if 'fib_level_61_8' in available_columns:
-                select_columns.append('fib_level_61_8')
-            if 'fib_level_78_6' in available_columns:
-                select_columns.append('fib_level_78_6')
-            if 'fib_level_100' in available_columns:
-                select_columns.append('fib_level_100')
-            if 'fib_level_127_2' in available_columns:
-                select_columns.append('fib_level_127_2')
-            if 'fib_level_161_8' in available_columns:
-                select_columns.append('fib_level_161_8')
-            if 'fib_level_261_8' in available_columns:
-                select_columns.append('fib_level_261_8')
-            if 'fib_level_423_6' in available_columns:
-                select_columns.append('fib_level_423_6')
-            if 'fib_1h_signal' in available_columns:
-                select_columns.append('fib_1h_signal')
-            if 'pivot_zone' in available_columns:
-                select_columns.append('pivot_zone')
-            if 'timestamp' in available_columns:
-                select_columns.append('timestamp')
-            
-            if not select_columns:
-                return pd.DataFrame()
-            
-            # Get latest record per symbol
-            query = f"""
-                SELECT {', '.join(select_columns)}
-                FROM fibonacci_1h f1
-                WHERE timestamp = (
-                    SELECT MAX(timestamp) 
-                    FROM fibonacci_1h f2 
-                    WHERE f2.symbol = f1.symbol
-                )
-                ORDER BY symbol
-            """
-            
-            df = pd.read_sql_query(query, self.connection)
-            return df
+            return self.read_table('fibonacci_1h')
         except Exception as e:
             logger.error(f"Error getting fibonacci data: {e}")
             return pd.DataFrame()
     
     def get_regression_data(self) -> pd.DataFrame:
-        """Retrieve Polynomial Regression Daily indicator data - UPDATED FOR scheduler_v2.py"""
+        """Retrieve Polynomial Regression Daily indicator data (latest row per symbol) - UPDATED FOR scheduler_v2.py"""
         try:
-            # First check if table exists
-            cursor = self.connection.cursor()
-            cursor.execute("SELECT name FROM sqlite_master WHERE type='table' AND name='polynomial_regression_daily'")
-            if not cursor.fetchone():
-                return pd.DataFrame()
-            
-            # Check what columns exist
-            cursor.execute("PRAGMA table_info(polynomial_regression_daily)")
-            columns_info = cursor.fetchall()
-            available_columns = [col[1] for col in columns_info]
-            
-            # Build query with available columns
-            select_columns = []
-            if 'symbol' in available_columns:
-                select_columns.append('symbol')
-            if 'current_price' in available_columns:
-                select_columns.append('current_price')
-            if 'poly_regression_value' in available_columns:
-                select_columns.append('poly_regression_value')
-            if 'poly_signal_daily' in available_columns:
-                select_columns.append('poly_signal_daily')
-            if 'poly_confidence' in available_columns:
-                select_columns.append('poly_confidence')
-            if 'r_squared' in available_columns:
-                select_columns.append('r_squared')
-            if 'trend_strength' in available_columns:
-                select_columns.append('trend_strength')
-            if 'support_level' in available_columns:
-                select_columns.append('support_level')
-            if 'resistance_level' in available_columns:
-                select_columns.append('resistance_level')
-            if 'forecast_1d' in available_columns:
-                select_columns.append('forecast_1d')
-            if 'forecast_7d' in available_columns:
-                select_columns.append('forecast_7d')
-            if 'forecast_30d' in available_columns:
-                select_columns.append('forecast_30d')
-            if 'timestamp' in available_columns:
-                select_columns.append('timestamp')
-            
-            if not select_columns:
-                return pd.DataFrame()
-            
-            # Get latest record per symbol
-            query = f"""
-                SELECT {', '.join(select_columns)}
-                FROM polynomial_regression_daily r1
-                WHERE timestamp = (
-                    SELECT MAX(timestamp) 
-                    FROM polynomial_regression_daily r2 
-                    WHERE r2.symbol = r1.symbol
-                )
-                ORDER BY symbol
-            """
-            
-            df = pd.read_sql_query(query, self.connection)
-            return df
+            return self.read_table('polynomial_regression_daily')
         except Exception as e:
             logger.error(f"Error getting regression data: {e}")
             return pd.DataFrame()
     
+    def get_signal_frame(self) -> SignalFrame:
+        """The parsed latest signal per symbol that every view reads (built once per dashboard)"""
+        with self.signal_frame_lock:
+            if self.signal_frame is None:
+                self.signal_frame = SignalFrame(self.get_all_signals(), self.get_regression_data())
+            return self.signal_frame
+    
     def get_extreme_discount_signals(self) -> pd.DataFrame:
         """Retrieve signals where price is in Extreme Discount Zone - UPDATED FOR scheduler_v2.py"""
-        try:
-            all_signals = self.get_all_signals()
-            if all_signals.empty:
-                return pd.DataFrame()
-            
-            # Filter for Extreme Discount signals (case-insensitive)
-            mask = all_signals['pivot_zone'].str.contains('EXTREME DISCOUNT', case=False, na=False) | \
-                   all_signals['pivot_zone'].str.contains('Extreme Discount', case=False, na=False) | \
-                   all_signals['pivot_zone'].str.contains('extreme discount', case=False, na=False)
-            
-            discount_df = all_signals[mask].copy()
-            return discount_df
-        except Exception as e:
-            logger.error(f"Error getting extreme discount signals: {e}")
-            return pd.DataFrame()
+        return self.get_signal_frame().view('extreme_discount')
     
     def get_overvalued_signals(self) -> pd.DataFrame:
         """Retrieve signals where price is in ABOVE BUY ZONE - UPDATED FOR scheduler_v2.py"""
-        try:
-            all_signals = self.get_all_signals()
-            if all_signals.empty:
-                return pd.DataFrame()
-            
-            # Filter for Above Buy Zone signals (case-insensitive)
-            mask = all_signals['pivot_zone'].str.contains('ABOVE BUY ZONE', case=False, na=False) | \
-                   all_signals['pivot_zone'].str.contains('Above Buy Zone', case=False, na=False) | \
-                   all_signals['pivot_zone'].str.contains('above buy zone', case=False, na=False)
-            
-            overvalued_df = all_signals[mask].copy()
-            return overvalued_df
-        except Exception as e:
-            logger.error(f"Error getting overvalued signals: {e}")
-            return pd.DataFrame()
+        return self.get_signal_frame().view('overvalued')
     
     def get_portfolio_signals(self) -> pd.DataFrame:
         """Get portfolio signals - Bullish Regression + Extreme Discount - UPDATED FOR scheduler_v2.py"""
-        try:
-            # Get all signals and deduplicate
-            all_signals = self.get_all_signals()
-            if all_signals.empty:
-                return pd.DataFrame()
-            
-            # Get latest signal per symbol
-            all_signals = all_signals.sort_values(['symbol', 'timestamp'], ascending=[True, False])
-            all_signals = all_signals.drop_duplicates(subset=['symbol'], keep='first')
-            
-            # Get regression data
-            reg_df = self.get_regression_data()
-            
-            # Get extreme discount signals
-            discount_df = self.get_extreme_discount_signals()
-            
-            if reg_df.empty or discount_df.empty:
-                return pd.DataFrame()
-            
-            # Filter for bullish regression signals
-            bullish_regression = reg_df[
-                reg_df['poly_signal_daily'].str.contains('BULLISH', case=False, na=False)
-            ]
-            
-            if bullish_regression.empty:
-                return pd.DataFrame()
-            
-            # Get symbols that are both bullish regression AND extreme discount
-            portfolio_symbols = set(bullish_regression['symbol']).intersection(set(discount_df['symbol']))
-            
-            if not portfolio_symbols:
-                return pd.DataFrame()
-            
-            # Get full data for these symbols
-            portfolio_df = all_signals[all_signals['symbol'].isin(portfolio_symbols)]
-            
-            return portfolio_df
-            
-        except Exception as e:
-            logger.error(f"Error getting portfolio signals: {e}")
-            return pd.DataFrame()
+        return self.get_signal_frame().view('portfolio')
     
-    def get_signal_stats(self, df: pd.DataFrame) -> Dict:
+    def get_signal_stats(self) -> Dict:
         """Calculate statistics from signals - UPDATED FOR scheduler_v2.py"""
-        if df.empty:
+        signal_frame = self.get_signal_frame()
+        if signal_frame.empty:
             return {}
         
-        # Get latest signal per symbol
-        df_unique = df.sort_values(['symbol', 'timestamp'], ascending=[True, False])
-        df_unique = df_unique.drop_duplicates(subset=['symbol'], keep='first')
-        
+        df = signal_frame.view()
         stats = {
-            'total_symbols': len(df_unique),
-            'strong_buy': len(df_unique[df_unique['overall_signal'].str.contains('STRONG BUY', case=False, na=False)]),
-            'buy': len(df_unique[df_unique['overall_signal'].str.contains('BUY', case=False, na=False) & 
-                                 ~df_unique['overall_signal'].str.contains('STRONG', case=False, na=False)]),
-            'strong_sell': len(df_unique[df_unique['overall_signal'].str.contains('STRONG SELL', case=False, na=False)]),
-            'sell': len(df_unique[df_unique['overall_signal'].str.contains('SELL', case=False, na=False) & 
-                                ~df_unique['overall_signal'].str.contains('STRONG', case=False, na=False)]),
-            'neutral': len(df_unique[df_unique['overall_signal'].str.contains('NEUTRAL', case=False, na=False)]),
-            'latest_update': df_unique['timestamp'].max() if len(df_unique) > 0 else 'N/A'
+            'total_symbols': len(df),
+            **signal_frame.signal_counts(),
+            'latest_update': df['timestamp'].max()
         }
         
-        # Calculate average price change forecasts
-        if 'forecast_30d' in df_unique.columns and 'current_price' in df_unique.columns:
-            df_temp = df_unique.dropna(subset=['forecast_30d', 'current_price']).copy()
-            if not df_temp.empty:
-                df_temp['price_change_pct'] = ((df_temp['forecast_30d'] - df_temp['current_price']) / df_temp['current_price']) * 100
-                stats['avg_price_change_30d'] = df_temp['price_change_pct'].mean()
-                
-                if not df_temp['price_change_pct'].empty:
-                    try:
-                        max_idx = df_temp['price_change_pct'].idxmax()
-                        min_idx = df_temp['price_change_pct'].idxmin()
-                        stats['max_bullish'] = df_temp.loc[max_idx, 'symbol'] if max_idx in df_temp.index else 'N/A'
-                        stats['max_bearish'] = df_temp.loc[min_idx, 'symbol'] if min_idx in df_temp.index else 'N/A'
-                        stats['max_bullish_change'] = df_temp.loc[max_idx, 'price_change_pct'] if max_idx in df_temp.index else 0
-                        stats['max_bearish_change'] = df_temp.loc[min_idx, 'price_change_pct'] if min_idx in df_temp.index else 0
-                    except:
-                        stats['max_bullish'] = 'N/A'
-                        stats['max_bearish'] = 'N/A'
-                        stats['max_bullish_change'] = 0
-                        stats['max_bearish_change'] = 0
+        # Average and extreme price change forecasts
+        changes = df['pct_change_30d'].dropna()
+        if not changes.empty:
+            stats['avg_price_change_30d'] = changes.mean()
+            stats['max_bullish'] = df.loc[changes.idxmax(), 'symbol']
+            stats['max_bearish'] = df.loc[changes.idxmin(), 'symbol']
+            stats['max_bullish_change'] = changes.max()
+            stats['max_bearish_change'] = changes.min()
         
         return stats
     
-    def get_extreme_discount_stats(self, df: pd.DataFrame) -> Dict:
-        """Calculate statistics for extreme discount signals - UPDATED FOR scheduler_v2.py"""
+    def get_view_stats(self, view: str) -> Dict:
+        """Symbol count, signal counts and averages of one view of the signal frame"""
+        signal_frame = self.get_signal_frame()
+        df = signal_frame.view(view)
         if df.empty:
             return {}
         
-        # Get latest signal per symbol
-        df_unique = df.sort_values(['symbol', 'timestamp'], ascending=[True, False])
-        df_unique = df_unique.drop_duplicates(subset=['symbol'], keep='first')
-        
-        stats = {
-            'total_symbols': len(df_unique),
-            'strong_buy': len(df_unique[df_unique['overall_signal'].str.contains('STRONG BUY', case=False, na=False)]),
-            'buy': len(df_unique[df_unique['overall_signal'].str.contains('BUY', case=False, na=False) & 
-                                 ~df_unique['overall_signal'].str.contains('STRONG', case=False, na=False)]),
-            'strong_sell': len(df_unique[df_unique['overall_signal'].str.contains('STRONG SELL', case=False, na=False)]),
-            'sell': len(df_unique[df_unique['overall_signal'].str.contains('SELL', case=False, na=False) & 
-                                ~df_unique['overall_signal'].str.contains('STRONG', case=False, na=False)]),
-            'neutral': len(df_unique[df_unique['overall_signal'].str.contains('NEUTRAL', case=False, na=False)]),
-            'avg_current_price': df_unique['current_price'].mean() if len(df_unique) > 0 else 0,
-            'avg_forecast_30d_change': 0,
-            'top_potential_gainers': []
+        changes = df['pct_change_30d'].dropna()
+        return {
+            'total_symbols': len(df),
+            **signal_frame.signal_counts(view),
+            'avg_current_price': df['current_price'].mean(),
+            'avg_forecast_30d_change': changes.mean() if not changes.empty else 0
         }
-        
-        if 'forecast_30d' in df_unique.columns and 'current_price' in df_unique.columns:
-            df_temp = df_unique.dropna(subset=['forecast_30d', 'current_price']).copy()
-            if not df_temp.empty:
-                df_temp['forecast_change_30d'] = ((df_temp['forecast_30d'] - df_temp['current_price']) / df_temp['current_price']) * 100
-                stats['avg_forecast_30d_change'] = df_temp['forecast_change_30d'].mean()
-                
-                top_gainers = df_temp.nlargest(5, 'forecast_change_30d')
-                stats['top_potential_gainers'] = top_gainers[['symbol', 'current_price', 'forecast_30d', 'forecast_change_30d']].to_dict('records')
-        
+    
+    def get_extreme_discount_stats(self) -> Dict:
+        """Calculate statistics for extreme discount signals - UPDATED FOR scheduler_v2.py"""
+        stats = self.get_view_stats('extreme_discount')
+        if stats:
+            stats['top_potential_gainers'] = self.get_signal_frame().top_movers('extreme_discount')
         return stats
     
-    def get_overvalued_stats(self, df: pd.DataFrame) -> Dict:
+    def get_overvalued_stats(self) -> Dict:
         """Calculate statistics for overvalued signals - UPDATED FOR scheduler_v2.py"""
-        if df.empty:
-            return {}
-        
-        # Get latest signal per symbol
-        df_unique = df.sort_values(['symbol', 'timestamp'], ascending=[True, False])
-        df_unique = df_unique.drop_duplicates(subset=['symbol'], keep='first')
-        
-        stats = {
-            'total_symbols': len(df_unique),
-            'strong_buy': len(df_unique[df_unique['overall_signal'].str.contains('STRONG BUY', case=False, na=False)]),
-            'buy': len(df_unique[df_unique['overall_signal'].str.contains('BUY', case=False, na=False) & 
-                                 ~df_unique['overall_signal'].str.contains('STRONG', case=False, na=False)]),
-            'strong_sell': len(df_unique[df_unique['overall_signal'].str.contains('STRONG SELL', case=False, na=False)]),
-            'sell': len(df_unique[df_unique['overall_signal'].str.contains('SELL', case=False, na=False) & 
-                                ~df_unique['overall_signal'].str.contains('STRONG', case=False, na=False)]),
-            'neutral': len(df_unique[df_unique['overall_signal'].str.contains('NEUTRAL', case=False, na=False)]),
-            'avg_current_price': df_unique['current_price'].mean() if len(df_unique) > 0 else 0,
-            'avg_forecast_30d_change': 0,
-            'top_potential_decliners': []
-        }
-        
-        if 'forecast_30d' in df_unique.columns and 'current_price' in df_unique.columns:
-            df_temp = df_unique.dropna(subset=['forecast_30d', 'current_price']).copy()
-            if not df_temp.empty:
-                df_temp['forecast_change_30d'] = ((df_temp['forecast_30d'] - df_temp['current_price']) / df_temp['current_price']) * 100
-                stats['avg_forecast_30d_change'] = df_temp['forecast_change_30d'].mean()
-                
-                top_decliners = df_temp.nsmallest(5, 'forecast_change_30d')
-                stats['top_potential_decliners'] = top_decliners[['symbol', 'current_price', 'forecast_30d', 'forecast_change_30d']].to_dict('records')
-        
+        stats = self.get_view_stats('overvalued')
+        if stats:
+            stats['top_potential_decliners'] = self.get_signal_frame().top_movers('overvalued', largest=False)
         return stats
     
-    def get_portfolio_stats(self, df: pd.DataFrame) -> Dict:
+    def get_portfolio_stats(self) -> Dict:
         """Calculate statistics for portfolio signals - UPDATED FOR scheduler_v2.py"""
-        if df.empty:
-            return {}
-        
-        # Get latest signal per symbol
-        df_unique = df.sort_values(['symbol', 'timestamp'], ascending=[True, False])
-        df_unique = df_unique.drop_duplicates(subset=['symbol'], keep='first')
-        
-        stats = {
-            'total_symbols': len(df_unique),
-            'symbols_list': df_unique['symbol'].tolist(),
-            'avg_current_price': df_unique['current_price'].mean() if len(df_unique) > 0 else 0,
-            'avg_forecast_30d_change': 0,
-            'top_potential_gainers': []
-        }
-        
-        if 'forecast_30d' in df_unique.columns and 'current_price' in df_unique.columns:
-            df_temp = df_unique.dropna(subset=['forecast_30d', 'current_price']).copy()
-            if not df_temp.empty:
-                df_temp['forecast_change_30d'] = ((df_temp['forecast_30d'] - df_temp['current_price']) / df_temp['current_price']) * 100
-                stats['avg_forecast_30d_change'] = df_temp['forecast_change_30d'].mean()
-                
-                top_gainers = df_temp.nlargest(5, 'forecast_change_30d')
-                stats['top_potential_gainers'] = top_gainers[['symbol', 'current_price', 'forecast_30d', 'forecast_change_30d']].to_dict('records')
-        
+        stats = self.get_view_stats('portfolio')
+        if stats:
+            stats['symbols_list'] = self.get_portfolio_signals()['symbol'].tolist()
+            stats['top_potential_gainers'] = self.get_signal_frame().top_movers('portfolio')
         return stats
     
-    def extract_signal_type(self, signal_str: str) -> str:
-        """Extract signal type from formatted string"""
-        if isinstance(signal_str, str):
-            signal_upper = signal_str.upper()
-            if 'STRONG BUY' in signal_upper:
-                return 'STRONG BUY'
-            elif 'BUY' in signal_upper and 'STRONG' not in signal_upper:
-                return 'BUY'
-            elif 'STRONG SELL' in signal_upper:
-                return 'STRONG SELL'
-            elif 'SELL' in signal_upper and 'STRONG' not in signal_upper:
-                return 'SELL'
-            elif 'NEUTRAL' in signal_upper:
-                return 'NEUTRAL'
-        return 'UNKNOWN'
-    
     # All chart creation methods remain the same (no changes needed)
     def create_price_forecast_chart(self, symbol: str, current_price: float, 
                                    forecast_1h: float, forecast_1d: float, 
@@ -1055,17 +902,13 @@ class TradingDashboard:
             return go.Figure()
     
     def create_signal_distribution_chart(self, signals_df: pd.DataFrame) -> go.Figure:
-        """Create chart showing signal distribution"""
+        """Create chart showing signal distribution (signals_df: a SignalFrame view)"""
         if signals_df.empty:
             return go.Figure()
         
         try:
-            # Get latest signal per symbol
-            signals_df = signals_df.sort_values(['symbol', 'timestamp'], ascending=[True, False])
-            signals_df = signals_df.drop_duplicates(subset=['symbol'], keep='first')
-            
-            signals_df['signal_type'] = signals_df['overall_signal'].apply(self.extract_signal_type)
             signal_counts = signals_df['signal_type'].value_counts()
+            signal_counts = signal_counts[signal_counts > 0]
             
             color_map = {
                 'STRONG BUY': '#4CAF50',
@@ -1100,32 +943,10 @@ class TradingDashboard:
         except Exception as e:
             return go.Figure()
     
-    def filter_signals(self, df: pd.DataFrame, filter_type: str = 'all') -> pd.DataFrame:
-        """Filter signals based on type"""
-        if df.empty:
-            return df
-        
-        # Get latest signal per symbol first
-        df_latest = df.sort_values(['symbol', 'timestamp'], ascending=[True, False])
-        df_latest = df_latest.drop_duplicates(subset=['symbol'], keep='first')
-        
-        df_lower = df_latest.copy()
-        df_lower['overall_signal_lower'] = df_lower['overall_signal'].str.lower()
-        
-        if filter_type == 'strong_buy':
-            return df_latest[df_lower['overall_signal_lower'].str.contains('strong buy', na=False)]
-        elif filter_type == 'buy':
-            return df_latest[df_lower['overall_signal_lower'].str.contains('buy', na=False) & 
-                     ~df_lower['overall_signal_lower'].str.contains('strong', na=False)]
-        elif filter_type == 'strong_sell':
-            return df_latest[df_lower['overall_signal_lower'].str.contains('strong sell', na=False)]
-        elif filter_type == 'sell':
-            return df_latest[df_lower['overall_signal_lower'].str.contains('sell', na=False) & 
-                     ~df_lower['overall_signal_lower'].str.contains('strong', na=False)]
-        elif filter_type == 'neutral':
-            return df_latest[df_lower['overall_signal_lower'].str.contains('neutral', na=False)]
-        else:
-            return df_latest
+    def filter_signals(self, filter_type: str = 'all') -> pd.DataFrame:
+        """Latest signal per symbol of one signal type ('strong_buy', 'buy', ...; anything else: all)"""
+        signal_frame = self.get_signal_frame()
+        return signal_frame.view(filter_type if filter_type in signal_frame.masks else 'all')
     
     def get_portfolio_symbols_csv(self, portfolio_df: pd.DataFrame) -> str:
         """Generate CSV content for portfolio symbols in the requested format"""
@@ -1152,1033 +973,302 @@ class TradingDashboard:
         
         return filename, csv_content
 
-def main():
-    """Main Streamlit application - UPDATED FOR scheduler_v2.py compatibility"""
-    # Initialize dashboard (will automatically download latest database)
-    dashboard = TradingDashboard()
+class DashboardCache:
+    """One TradingDashboard shared by every session and rerun of this process
     
-    # Get database metadata
-    metadata = dashboard.get_database_metadata()
+    use() lends the loaded dashboard to one rerun until it is `ttl` seconds
+    old or invalidate() was called, then builds a new one. Building happens
+    under the lock, so concurrent sessions trigger a single download and the
+    others wait for its result. The previous dashboard is closed first, once
+    the reruns still rendering with it are done, so the reload never resets
+    the working copy of the database under an open connection.
+    """
     
-    # Header
-    col1, col2, col3 = st.columns([1, 2, 1])
-    with col2:
-        st.markdown("<h1 class='main-header'>📈 HVTS Trading Signals Dashboard</h1>", unsafe_allow_html=True)
-        
-        # Show database info with download status
-        status_color = "#4CAF50" if metadata.get('total_symbols', 0) > 0 else "#FF9800"
-        status_text = "🟢 Live Data" if metadata.get('total_symbols', 0) > 0 else "🟡 No Data"
-        
-        # Show file source info
-        if dashboard.db_path.endswith("_latest.db"):
-            source_text = "🌐 GitHub (Latest)"
-        elif dashboard.db_path == "trading_signals.db":
-            source_text = "💾 Local"
-        else:
-            source_text = "🧠 Memory"
-        
-        st.markdown(f"""
-        <div style='text-align: center; color: #546E7A; margin-bottom: 20px; padding: 10px; border-radius: 10px; background-color: {status_color}20; border: 1px solid {status_color}50;'>
-            <strong>📊 Database:</strong> {metadata.get('total_symbols', 0)} symbols | 
-            <strong>⏰ Last Updated:</strong> {metadata.get('last_updated', 'Never')} | 
-            <strong>📁 Source:</strong> {source_text}
-        </div>
-        """, unsafe_allow_html=True)
+    def __init__(self, ttl: float = DASHBOARD_TTL_SECONDS):
+        self.ttl = ttl
+        self.lock = threading.Condition()
+        # Outlives the dashboards: a reload with unchanged data still hits it
+        self.results = ResultCache(DASHBOARD_RESULT_CACHE_MB * 1024 * 1024)
+        self.dashboard: Optional[TradingDashboard] = None
+        self.users = 0
+        self.loaded_at = 0.0
+        self.refresh = False
     
-    # Sidebar
-    with st.sidebar:
-        st.markdown("### 🔧 Dashboard Controls")
-        
-        # Manual refresh only (auto-refresh disabled for Streamlit Cloud)
-        if st.button("🔄 Refresh Dashboard", use_container_width=True, type="primary"):
-            st.rerun()
-        
-        # Database refresh button
-        if st.button("🌐 Download Latest Data", use_container_width=True):
-            with st.spinner("Downloading latest database from GitHub..."):
-                # Create new dashboard instance which will download fresh database
-                dashboard = TradingDashboard()
-                st.success("✅ Database updated!")
-                st.rerun()
-        
-        st.markdown("---")
-        st.markdown("### 📊 Signal Filters")
-        
-        signal_filter = st.selectbox(
-            "Filter by Signal Type",
-            ["All Signals", "STRONG BUY", "BUY", "NEUTRAL", "SELL", "STRONG SELL"]
-        )
-        
-        st.markdown("---")
-        st.markdown("### 📈 Display Options")
-        show_forecasts = st.checkbox("Show Price Forecast Charts", value=True)
-        show_charts = st.checkbox("Show Analysis Charts", value=True)
-        show_detailed = st.checkbox("Show Detailed Views", value=True)
+    @contextmanager
+    def use(self) -> Iterator[TradingDashboard]:
+        """The current dashboard, kept open until the block is left"""
+        with self.lock:
+            if self.dashboard is None or self.refresh or time.time() - self.loaded_at > self.ttl:
+                self.lock.wait_for(lambda: self.users == 0)
+                if self.dashboard is not None:
+                    self.dashboard.close()
+                self.dashboard = TradingDashboard(refresh=self.refresh, result_cache=self.results)
+                self.loaded_at = time.time()
+                self.refresh = False
+            dashboard = self.dashboard
+            self.users += 1
         
-        st.markdown("---")
-        st.markdown("### 📦 Database Info")
+        try:
+            yield dashboard
+        finally:
+            with self.lock:
+                self.users -= 1
+                self.lock.notify_all()
+    
+    def invalidate(self):
+        """Reload on the next get(), revalidating every download with GitHub"""
+        with self.lock:
+            self.refresh = True
+    
+    def age(self) -> float:
+        return time.time() - self.loaded_at
+
+@st.cache_resource
+def get_dashboard_cache() -> DashboardCache:
+    """The process-wide DashboardCache (st.cache_resource keeps it across reruns and sessions)"""
+    return DashboardCache()
+
+def paginate(df: pd.DataFrame, key: str, page_size: int) -> pd.DataFrame:
+    """Rows of the page picked with a page selector (only shown when there is more than one page)"""
+    pages = max(1, -(-len(df) // page_size))
+    if pages == 1:
+        return df
+    
+    # A search can shrink the list below the page the user was on
+    page_key = f"{key}_page"
+    if st.session_state.get(page_key, 1) > pages:
+        st.session_state[page_key] = pages
+    page = st.number_input(f"Page (of {pages})", min_value=1, max_value=pages, step=1, key=page_key)
+    start = (page - 1) * page_size
+    st.caption(f"Showing {start + 1}-{min(start + page_size, len(df))} of {len(df)}")
+    return df.iloc[start:start + page_size]
+
+def render_overview(dashboard: TradingDashboard, options: Dict):
+    """Market overview: signal counts, distribution, top performers and the latest signals"""
+    signal_frame = dashboard.get_signal_frame()
+    signals_df = signal_frame.view()
+    stats = dashboard.get_signal_stats()
+    show_charts = options['show_charts']
+    signal_filter = options['signal_filter']
+    
+    st.markdown("<h2 class='sub-header'>📊 Market Overview</h2>", unsafe_allow_html=True)
+    
+    if stats and stats.get('total_symbols', 0) > 0:
+        # Metrics row
+        col1, col2, col3, col4, col5, col6 = st.columns(6)
         
-        # Check database status
-        if metadata.get('total_symbols', 0) == 0:
-            st.error("⚠️ Database is empty or failed to load")
-            st.info("Click 'Download Latest Data' to fetch fresh data")
-        else:
-            st.success(f"✅ {metadata.get('total_symbols', 0)} symbols loaded")
-            
-            if metadata.get('last_updated', 'Unknown') != 'Unknown':
+        with col1:
+            st.metric("Total Symbols", stats.get('total_symbols', 0))
+        with col2:
+            strong_buy = stats.get('strong_buy', 0)
+            st.metric("STRONG BUY", strong_buy, 
+                     delta=f"+{strong_buy}" if strong_buy > 0 else None)
+        with col3:
+            buy = stats.get('buy', 0)
+            st.metric("BUY", buy, 
+                     delta=f"+{buy}" if buy > 0 else None)
+        with col4:
+            strong_sell = stats.get('strong_sell', 0)
+            st.metric("STRONG SELL", strong_sell, 
+                     delta=f"-{strong_sell}" if strong_sell > 0 else None)
+        with col5:
+            sell = stats.get('sell', 0)
+            st.metric("SELL", sell, 
+                     delta=f"-{sell}" if sell > 0 else None)
+        with col6:
+            last_update = stats.get('latest_update', 'N/A')
+            if last_update != 'N/A':
                 try:
-                    last_update = pd.to_datetime(metadata['last_updated'])
-                    st.info(f"**Last Updated:** {last_update.strftime('%Y-%m-%d %H:%M:%S')}")
+                    dt = pd.to_datetime(last_update)
+                    st.metric("Last Update", dt.strftime('%H:%M:%S'))
                 except:
-                    st.info(f"**Last Updated:** {metadata.get('last_updated', 'Unknown')}")
-            
-            st.info(f"**Data Source:** {metadata.get('data_source', 'Unknown')}")
+                    st.metric("Last Update", "N/A")
+            else:
+                st.metric("Last Update", "N/A")
         
         st.markdown("---")
-        st.markdown("### ℹ️ About")
-        st.info("""
-        **HVTS Trading Signals Dashboard**
-        
-        This dashboard displays trading signals 
-        generated by algorithmic analysis of 
-        cryptocurrency markets.
-        
-        • Data from Gate.io Exchange
-        • Updated automatically from GitHub
-        • 9 different analysis views
-        • Real-time database updates
-        """)
-    
-    # Main tabs - ALL 9 TABS
-    tab1, tab2, tab3, tab4, tab5, tab6, tab7, tab8, tab9 = st.tabs([
-        "📊 Overview", "📈 All Signals", "🎯 Strong Signals", 
-        "📅 Forecasts", "📐 Fibonacci", "📈 Regression", 
-        "🔥 Extreme Discount", "💰 Portfolio", "⚠️ Overvalued"
-    ])
-    
-    # Load data once for all tabs
-    with st.spinner("📊 Loading trading signals..."):
-        signals_df = dashboard.get_all_signals()
-        hvts_df = dashboard.get_hvts_forecast()
-        fib_df = dashboard.get_fibonacci_data()
-        reg_df = dashboard.get_regression_data()
-        extreme_discount_df = dashboard.get_extreme_discount_signals()
-        overvalued_df = dashboard.get_overvalued_signals()
-        portfolio_df = dashboard.get_portfolio_signals()
-        
-        # Get stats
-        if signals_df.empty:
-            stats = {}
-            discount_stats = {}
-            overvalued_stats = {}
-            portfolio_stats = {}
-            
-            st.warning("⚠️ No signals found in database. Click 'Download Latest Data' to fetch fresh data.")
-        else:
-            stats = dashboard.get_signal_stats(signals_df)
-            discount_stats = dashboard.get_extreme_discount_stats(extreme_discount_df)
-            overvalued_stats = dashboard.get_overvalued_stats(overvalued_df)
-            portfolio_stats = dashboard.get_portfolio_stats(portfolio_df)
-    
-    # TAB 1: OVERVIEW (updated to handle missing columns)
-    with tab1:
-        st.markdown("<h2 class='sub-header'>📊 Market Overview</h2>", unsafe_allow_html=True)
         
-        if stats and stats.get('total_symbols', 0) > 0:
-            # Metrics row
-            col1, col2, col3, col4, col5, col6 = st.columns(6)
+        # Charts and top performers
+        if show_charts:
+            col1, col2 = st.columns(2)
             
             with col1:
-                st.metric("Total Symbols", stats.get('total_symbols', 0))
-            with col2:
-                strong_buy = stats.get('strong_buy', 0)
-                st.metric("STRONG BUY", strong_buy, 
-                         delta=f"+{strong_buy}" if strong_buy > 0 else None)
-            with col3:
-                buy = stats.get('buy', 0)
-                st.metric("BUY", buy, 
-                         delta=f"+{buy}" if buy > 0 else None)
-            with col4:
-                strong_sell = stats.get('strong_sell', 0)
-                st.metric("STRONG SELL", strong_sell, 
-                         delta=f"-{strong_sell}" if strong_sell > 0 else None)
-            with col5:
-                sell = stats.get('sell', 0)
-                st.metric("SELL", sell, 
-                         delta=f"-{sell}" if sell > 0 else None)
-            with col6:
-                last_update = stats.get('latest_update', 'N/A')
-                if last_update != 'N/A':
-                    try:
-                        dt = pd.to_datetime(last_update)
-                        st.metric("Last Update", dt.strftime('%H:%M:%S'))
-                    except:
-                        st.metric("Last Update", "N/A")
+                st.markdown("### 📊 Signal Distribution")
+                dist_chart = dashboard.create_signal_distribution_chart(signals_df)
+                if dist_chart:
+                    st.plotly_chart(dist_chart, use_container_width=True)
                 else:
-                    st.metric("Last Update", "N/A")
-            
-            st.markdown("---")
+                    st.info("No signal distribution data available")
             
-            # Charts and top performers
-            if show_charts:
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    st.markdown("### 📊 Signal Distribution")
-                    dist_chart = dashboard.create_signal_distribution_chart(signals_df)
-                    if dist_chart:
-                        st.plotly_chart(dist_chart, use_container_width=True)
-                    else:
-                        st.info("No signal distribution data available")
-                
-                with col2:
-                    st.markdown("### 📈 Top Performers (30D Forecast)")
-                    if 'forecast_30d' in signals_df.columns and 'current_price' in signals_df.columns:
-                        # Get latest signal per symbol
-                        metrics_df = signals_df.sort_values(['symbol', 'timestamp'], ascending=[True, False])
-                        metrics_df = metrics_df.drop_duplicates(subset=['symbol'], keep='first')
-                        metrics_df = metrics_df.dropna(subset=['forecast_30d', 'current_price'])
+            with col2:
+                st.markdown("### 📈 Top Performers (30D Forecast)")
+                if 'forecast_30d' in signals_df.columns and 'current_price' in signals_df.columns:
+                    metrics_df = signals_df.dropna(subset=['forecast_30d', 'current_price'])
+                    
+                    if not metrics_df.empty:
+                        metrics_df = metrics_df.rename(columns={'pct_change_30d': '30d_change_pct'})
                         
-                        if not metrics_df.empty:
-                            metrics_df['30d_change_pct'] = ((metrics_df['forecast_30d'] - metrics_df['current_price']) / metrics_df['current_price']) * 100
-                            
-                            top_bullish = metrics_df.nlargest(5, '30d_change_pct')[['symbol', 'current_price', 'forecast_30d', '30d_change_pct']]
-                            top_bearish = metrics_df.nsmallest(5, '30d_change_pct')[['symbol', 'current_price', 'forecast_30d', '30d_change_pct']]
-                            
-                            st.markdown("**Top Bullish:**")
-                            st.dataframe(
-                                top_bullish.style.format({
-                                    'current_price': '${:.4f}',
-                                    'forecast_30d': '${:.4f}',
-                                    '30d_change_pct': '{:.1f}%'
-                                }).apply(
-                                    lambda x: ['background-color: #E8F5E9' if v > 0 else '' for v in x] if x.name == '30d_change_pct' else [''] * len(x),
-                                    axis=0
-                                ),
-                                use_container_width=True,
-                                hide_index=True
-                            )
-                            
-                            st.markdown("**Top Bearish:**")
-                            st.dataframe(
-                                top_bearish.style.format({
-                                    'current_price': '${:.4f}',
-                                    'forecast_30d': '${:.4f}',
-                                    '30d_change_pct': '{:.1f}%'
-                                }).apply(
-                                    lambda x: ['background-color: #FFEBEE' if v < 0 else '' for v in x] if x.name == '30d_change_pct' else [''] * len(x),
-                                    axis=0
-                                ),
-                                use_container_width=True,
-                                hide_index=True
-                            )
-                        else:
-                            st.info("No forecast data available")
+                        top_bullish = metrics_df.nlargest(5, '30d_change_pct')[['symbol', 'current_price', 'forecast_30d', '30d_change_pct']]
+                        top_bearish = metrics_df.nsmallest(5, '30d_change_pct')[['symbol', 'current_price', 'forecast_30d', '30d_change_pct']]
+                        
+                        st.markdown("**Top Bullish:**")
+                        st.dataframe(
+                            top_bullish.style.format({
+                                'current_price': '${:.4f}',
+                                'forecast_30d': '${:.4f}',
+                                '30d_change_pct': '{:.1f}%'
+                            }).apply(
+                                lambda x: ['background-color: #E8F5E9' if v > 0 else '' for v in x] if x.name == '30d_change_pct' else [''] * len(x),
+                                axis=0
+                            ),
+                            use_container_width=True,
+                            hide_index=True
+                        )
+                        
+                        st.markdown("**Top Bearish:**")
+                        st.dataframe(
+                            top_bearish.style.format({
+                                'current_price': '${:.4f}',
+                                'forecast_30d': '${:.4f}',
+                                '30d_change_pct': '{:.1f}%'
+                            }).apply(
+                                lambda x: ['background-color: #FFEBEE' if v < 0 else '' for v in x] if x.name == '30d_change_pct' else [''] * len(x),
+                                axis=0
+                            ),
+                            use_container_width=True,
+                            hide_index=True
+                        )
                     else:
-                        st.info("Forecast columns not found in data")
-            
-            st.markdown("### 📋 Recent Trading Signals")
-            if not signals_df.empty:
-                filtered_df = signals_df.copy()
-                
-                if signal_filter != "All Signals":
-                    filter_map = {
-                        "STRONG BUY": "strong_buy",
-                        "BUY": "buy",
-                        "NEUTRAL": "neutral",
-                        "SELL": "sell",
-                        "STRONG SELL": "strong_sell"
-                    }
-                    filtered_df = dashboard.filter_signals(filtered_df, filter_map[signal_filter])
-                
-                # Get latest signal per symbol
-                filtered_df = filtered_df.sort_values(['symbol', 'timestamp'], ascending=[True, False])
-                filtered_df = filtered_df.drop_duplicates(subset=['symbol'], keep='first')
-                
-                display_cols = ['symbol', 'current_price', 'overall_signal', 'pivot_zone', 'timestamp']
-                display_cols = [col for col in display_cols if col in filtered_df.columns]
-                
-                if display_cols:
-                    display_df = filtered_df[display_cols].copy()
-                    display_df.columns = ['Symbol', 'Current Price', 'Signal', 'Pivot Zone', 'Last Updated']
-                    
-                    st.dataframe(
-                        display_df.style.format({'Current Price': '${:.4f}'}),
-                        use_container_width=True,
-                        hide_index=True,
-                        height=400
-                    )
-            else:
-                st.warning("No signals available to display")
-        else:
-            st.info("""
-            ## 📊 No Data Available
-            
-            To view trading signals:
-            
-            1. **Click "Download Latest Data" button** in the sidebar
-            
-            2. **Or wait for automatic GitHub updates**:
-               - Database updates automatically via GitHub Actions
-               - Updates every hour
-               - Click refresh to get latest data
-            
-            The dashboard automatically downloads the latest database from GitHub.
-            """)
-    
-    # TAB 2: ALL SIGNALS (updated to handle missing columns)
-    with tab2:
-        st.markdown("<h2 class='sub-header'>📈 Detailed Trading Signals</h2>", unsafe_allow_html=True)
+                        st.info("No forecast data available")
+                else:
+                    st.info("Forecast columns not found in data")
         
+        st.markdown("### 📋 Recent Trading Signals")
         if not signals_df.empty:
-            # Get latest signal per symbol
-            signals_latest = signals_df.sort_values(['symbol', 'timestamp'], ascending=[True, False])
-            signals_latest = signals_latest.drop_duplicates(subset=['symbol'], keep='first')
-            
-            # Search and filter
-            col1, col2 = st.columns([3, 1])
-            with col1:
-                search_symbol = st.text_input("🔍 Search by Symbol", "", key="signals_search", 
-                                            placeholder="Enter symbol name...")
-            with col2:
-                items_per_page = st.selectbox("Items per page", [10, 25, 50], index=0)
-            
-            display_df = signals_latest.copy()
+            filtered_df = signals_df
+            
+            if signal_filter != "All Signals":
+                filter_map = {
+                    "STRONG BUY": "strong_buy",
+                    "BUY": "buy",
+                    "NEUTRAL": "neutral",
+                    "SELL": "sell",
+                    "STRONG SELL": "strong_sell"
+                }
+                filtered_df = dashboard.filter_signals(filter_map[signal_filter])
             
-            if search_symbol:
-                display_df = display_df[display_df['symbol'].str.contains(search_symbol, case=False, na=False)]
+            display_cols = ['symbol', 'current_price', 'overall_signal', 'pivot_zone', 'timestamp']
+            display_cols = [col for col in display_cols if col in filtered_df.columns]
             
-            # Pagination
-            total_items = len(display_df)
-            if total_items > 0:
-                st.info(f"📋 Found {total_items} signals" + (f" matching '{search_symbol}'" if search_symbol else ""))
+            if display_cols:
+                display_df = filtered_df[display_cols].copy()
+                display_df.columns = ['Symbol', 'Current Price', 'Signal', 'Pivot Zone', 'Last Updated']
                 
-                # Display signals
-                for idx, row in display_df.iterrows():
-                    try:
-                        symbol = row.get('symbol', 'N/A')
-                        current_price = float(row.get('current_price', 0))
-                        overall_signal = str(row.get('overall_signal', ''))
-                        
-                        # Determine CSS class
-                        if 'BUY' in overall_signal.upper():
-                            if 'STRONG' in overall_signal.upper():
-                                css_class = 'bullish'
-                                signal_icon = "🟢"
-                                signal_text = "STRONG BUY"
-                            else:
-                                css_class = 'bullish'
-                                signal_icon = "🟢"
-                                signal_text = "BUY"
-                        elif 'SELL' in overall_signal.upper():
-                            if 'STRONG' in overall_signal.upper():
-                                css_class = 'bearish'
-                                signal_icon = "🔴"
-                                signal_text = "STRONG SELL"
-                            else:
-                                css_class = 'bearish'
-                                signal_icon = "🔴"
-                                signal_text = "SELL"
-                        else:
-                            css_class = 'neutral'
-                            signal_icon = "🟡"
-                            signal_text = "NEUTRAL"
-                        
-                        with st.container():
-                            st.markdown(f"""
-                            <div class='signal-card {css_class}'>
-                                <div style='display: flex; justify-content: space-between; align-items: center;'>
-                                    <div>
-                                        <h3 style='margin: 0; display: flex; align-items: center;'>
-                                            {signal_icon} {symbol}
-                                            <span style='margin-left: 10px; font-size: 0.9rem; color: #546E7A;'>
-                                                {row.get('timestamp', 'N/A')}
-                                            </span>
-                                        </h3>
-                                    </div>
-                                    <div style='text-align: right;'>
-                                        <span style='font-size: 1.5rem; font-weight: bold;'>${current_price:.4f}</span><br>
-                                        <span style='font-size: 0.9rem; font-weight: 600;'>{signal_text}</span>
-                                    </div>
-                                </div>
-                                <div style='margin-top: 15px;'>
-                                    <div style='display: grid; grid-template-columns: repeat(2, 1fr); gap: 10px;'>
-                                        <div>
-                                            <strong>1H Fibonacci:</strong> {row.get('fib_15m_signal', 'N/A')}<br>
-                                            <strong>ML Signal:</strong> {row.get('poly_signal', 'N/A')}<br>
-                                            <strong>RSI Zone:</strong> {row.get('rsi_zone', 'N/A')}
-                                        </div>
-                                        <div>
-                                            <strong>MACD:</strong> {row.get('macd_signal', 'N/A')}<br>
-                                            <strong>Pivot Zone:</strong> {row.get('pivot_zone', 'N/A')}<br>
-                                            <strong>Fib Signal:</strong> {row.get('fib_signal', 'N/A')}
-                                        </div>
-                                    </div>
-                                </div>
-                            </div>
-                            """, unsafe_allow_html=True)
-                            
-                            if show_forecasts:
-                                with st.expander("📈 View Price Forecast", expanded=False):
-                                    try:
-                                        forecast_chart = dashboard.create_price_forecast_chart(
-                                            symbol,
-                                            current_price,
-                                            float(row.get('forecast_1h', current_price)),
-                                            float(row.get('forecast_1d', current_price)),
-                                            float(row.get('forecast_7d', current_price)),
-                                            float(row.get('forecast_14d', current_price)),
-                                            float(row.get('forecast_30d', current_price))
-                                        )
-                                        st.plotly_chart(forecast_chart, use_container_width=True)
-                                    except Exception as e:
-                                        st.error(f"Could not create forecast chart: {e}")
-                    except Exception as e:
-                        continue
-            else:
-                st.warning(f"No signals found{' matching your search' if search_symbol else ''}")
-        else:
-            st.warning("No signals found in the database.")
-    
-    # TAB 3: STRONG SIGNALS (updated to handle missing columns)
-    with tab3:
-        st.markdown("<h2 class='sub-header'>🎯 Strong Signals Focus</h2>", unsafe_allow_html=True)
-        
-        if not signals_df.empty:
-            # Get latest signal per symbol
-            signals_latest = signals_df.sort_values(['symbol', 'timestamp'], ascending=[True, False])
-            signals_latest = signals_latest.drop_duplicates(subset=['symbol'], keep='first')
-            
-            strong_signals = signals_latest[
-                signals_latest['overall_signal'].str.contains('STRONG', case=False, na=False)
-            ]
-            
-            if not strong_signals.empty:
-                col1, col2 = st.columns(2)
-                
-                with col1:
-                    st.markdown("### 🟢 STRONG BUY Signals")
-                    strong_buy_df = strong_signals[
-                        strong_signals['overall_signal'].str.contains('BUY', case=False, na=False)
-                    ]
-                    
-                    if not strong_buy_df.empty:
-                        for _, row in strong_buy_df.iterrows():
-                            try:
-                                symbol = row.get('symbol', 'N/A')
-                                current_price = float(row.get('current_price', 0))
-                                forecast_30d = float(row.get('forecast_30d', current_price))
-                                pct_change = ((forecast_30d - current_price) / current_price) * 100
-                                pivot_zone = row.get('pivot_zone', 'N/A')
-                                
-                                st.markdown(f"""
-                                <div class='signal-card bullish' style='margin-bottom: 15px;'>
-                                    <div style='display: flex; justify-content: space-between; align-items: center;'>
-                                        <div>
-                                            <h4 style='margin: 0;'>🟢 {symbol}</h4>
-                                            <span style='font-size: 0.9rem; color: #546E7A;'>{pivot_zone}</span>
-                                        </div>
-                                        <div style='text-align: right;'>
-                                            <span style='font-size: 1.2rem; font-weight: bold;'>${current_price:.4f}</span><br>
-                                            <span style='color: #4CAF50; font-weight: 600;'>30D: {pct_change:+.1f}%</span>
-                                        </div>
-                                    </div>
-                                    <div style='margin-top: 10px; font-size: 0.9rem;'>
-                                        <strong>RSI:</strong> {row.get('rsi_zone', 'N/A')}<br>
-                                        <strong>MACD:</strong> {row.get('macd_signal', 'N/A')}<br>
-                                        <strong>Forecast:</strong> ${forecast_30d:.4f}
-                                    </div>
-                                </div>
-                                """, unsafe_allow_html=True)
-                            except:
-                                continue
-                    else:
-                        st.info("No STRONG BUY signals at the moment.")
-                
-                with col2:
-                    st.markdown("### 🔴 STRONG SELL Signals")
-                    strong_sell_df = strong_signals[
-                        strong_signals['overall_signal'].str.contains('SELL', case=False, na=False)
-                    ]
-                    
-                    if not strong_sell_df.empty:
-                        for _, row in strong_sell_df.iterrows():
-                            try:
-                                symbol = row.get('symbol', 'N/A')
-                                current_price = float(row.get('current_price', 0))
-                                forecast_30d = float(row.get('forecast_30d', current_price))
-                                pct_change = ((forecast_30d - current_price) / current_price) * 100
-                                pivot_zone = row.get('pivot_zone', 'N/A')
-                                
-                                st.markdown(f"""
-                                <div class='signal-card bearish' style='margin-bottom: 15px;'>
-                                    <div style='display: flex; justify-content: space-between; align-items: center;'>
-                                        <div>
-                                            <h4 style='margin: 0;'>🔴 {symbol}</h4>
-                                            <span style='font-size: 0.9rem; color: #546E7A;'>{pivot_zone}</span>
-                                        </div>
-                                        <div style='text-align: right;'>
-                                            <span style='font-size: 1.2rem; font-weight: bold;'>${current_price:.4f}</span><br>
-                                            <span style='color: #F44336; font-weight: 600;'>30D: {pct_change:+.1f}%</span>
-                                        </div>
-                                    </div>
-                                    <div style='margin-top: 10px; font-size: 0.9rem;'>
-                                        <strong>RSI:</strong> {row.get('rsi_zone', 'N/A')}<br>
-                                        <strong>MACD:</strong> {row.get('macd_signal', 'N/A')}<br>
-                                        <strong>Forecast:</strong> ${forecast_30d:.4f}
-                                    </div>
-                                </div>
-                                """, unsafe_allow_html=True)
-                            except:
-                                continue
-                    else:
-                        st.info("No STRONG SELL signals at the moment.")
-                
-                # Summary metrics
-                st.markdown("---")
-                col1, col2, col3 = st.columns(3)
-                with col1:
-                    st.metric("Total Strong Signals", len(strong_signals))
-                with col2:
-                    st.metric("STRONG BUY", len(strong_buy_df))
-                with col3:
-                    st.metric("STRONG SELL", len(strong_sell_df))
-                
-            else:
-                st.info("No strong signals (STRONG BUY/SELL) at the moment.")
-        else:
-            st.warning("No signals found in the database.")
-    
-    # TAB 4: FORECASTS (updated to handle missing columns)
-    with tab4:
-        st.markdown("<h2 class='sub-header'>📅 Price Forecasts</h2>", unsafe_allow_html=True)
-        
-        if not hvts_df.empty:
-            # Get latest forecast per symbol
-            forecast_latest = hvts_df.sort_values(['symbol', 'timestamp'], ascending=[True, False])
-            forecast_latest = forecast_latest.drop_duplicates(subset=['symbol'], keep='first')
-            
-            st.markdown("### 📊 30-Day Forecast Comparison")
-            
-            forecast_df = forecast_latest.copy()
-            forecast_df = forecast_df.dropna(subset=['forecast_30d', 'current_price']).copy()
-            
-            if not forecast_df.empty:
-                forecast_df['forecast_change_30d'] = ((forecast_df['forecast_30d'] - forecast_df['current_price']) / forecast_df['current_price']) * 100
-                sorted_df = forecast_df.sort_values('forecast_change_30d', ascending=False)
-                
-                display_df = sorted_df.head(20)
-                
-                fig = go.Figure()
-                
-                colors = ['#4CAF50' if x > 0 else '#F44336' for x in display_df['forecast_change_30d']]
-                
-                fig.add_trace(go.Bar(
-                    x=display_df['symbol'],
-                    y=display_df['forecast_change_30d'],
-                    marker_color=colors,
-                    text=[f"{x:.1f}%" for x in display_df['forecast_change_30d']],
-                    textposition='auto',
-                    hovertemplate='<b>%{x}</b><br>Change: %{y:.1f}%<extra></extra>'
-                ))
-                
-                fig.update_layout(
-                    title='30-Day Forecast Percentage Change (Top 20)',
-                    xaxis_title='Symbol',
-                    yaxis_title='Forecast Change (%)',
-                    template='plotly_white',
-                    height=500,
-                    showlegend=False
-                )
-                
-                st.plotly_chart(fig, use_container_width=True)
-                
-                st.markdown("### 📋 Detailed Forecasts")
-                
-                forecast_search = st.text_input("🔍 Search Forecasts by Symbol", "", key="forecast_search")
-                
-                forecast_display_df = forecast_latest.copy()
-                
-                if forecast_search:
-                    forecast_display_df = forecast_display_df[forecast_display_df['symbol'].str.contains(forecast_search, case=False, na=False)]
-                
-                display_cols = ['symbol', 'current_price', 'forecast_1d', 'forecast_7d', 
-                              'forecast_14d', 'forecast_30d', 'poly_signal', 'timestamp']
-                
-                display_cols = [col for col in display_cols if col in forecast_display_df.columns]
-                
-                if display_cols:
-                    # Calculate percentage changes
-                    display_df_with_pct = forecast_display_df.copy()
-                    for period in ['1d', '7d', '14d', '30d']:
-                        col_name = f'forecast_{period}'
-                        if col_name in display_df_with_pct.columns:
-                            pct_col = f'{period}_change_pct'
-                            display_df_with_pct[pct_col] = ((display_df_with_pct[col_name] - display_df_with_pct['current_price']) / display_df_with_pct['current_price']) * 100
-                    
-                    # Prepare for display
-                    display_data = display_df_with_pct[['symbol', 'current_price']].copy()
-                    
-                    for period in ['1d', '7d', '14d', '30d']:
-                        col_name = f'forecast_{period}'
-                        pct_col = f'{period}_change_pct'
-                        if col_name in display_df_with_pct.columns:
-                            display_data[f'{period.upper()}'] = display_df_with_pct[col_name]
-                            if pct_col in display_df_with_pct.columns:
-                                display_data[f'{period.upper()} %'] = display_df_with_pct[pct_col]
-                    
-                    if 'poly_signal' in display_df_with_pct.columns:
-                        display_data['ML Signal'] = display_df_with_pct['poly_signal']
-                    if 'timestamp' in display_df_with_pct.columns:
-                        display_data['Updated'] = display_df_with_pct['timestamp']
-                    
-                    st.dataframe(
-                        display_data.style.format({
-                            'current_price': '${:.4f}',
-                            '1D': '${:.4f}',
-                            '1D %': '{:.1f}%',
-                            '7D': '${:.4f}',
-                            '7D %': '{:.1f}%',
-                            '14D': '${:.4f}',
-                            '14D %': '{:.1f}%',
-                            '30D': '${:.4f}',
-                            '30D %': '{:.1f}%'
-                        }).apply(
-                            lambda x: ['background-color: #E8F5E9' if v > 0 else 'background-color: #FFEBEE' if v < 0 else '' 
-                                      for v in x] if x.name in ['1D %', '7D %', '14D %', '30D %'] else [''] * len(x),
-                            axis=0
-                        ),
-                        use_container_width=True,
-                        hide_index=True,
-                        height=400
-                    )
-        else:
-            st.warning("No forecast data found in the database.")
-    
-    # TAB 5: FIBONACCI (updated to handle missing columns)
-    with tab5:
-        st.markdown("<h2 class='sub-header'>📐 Fibonacci 1-Hour Indicators</h2>", unsafe_allow_html=True)
-        
-        if not fib_df.empty:
-            st.markdown(f"""
-            <div class='info-badge'>
-                📊 Displaying {len(fib_df)} unique symbols with latest Fibonacci 1-hour data
-            </div>
-            """, unsafe_allow_html=True)
-            
-            # Metrics
-            col1, col2, col3, col4 = st.columns(4)
-            with col1:
-                st.metric("Unique Symbols", len(fib_df))
-            with col2:
-                bullish_count = len(fib_df[fib_df['fib_1h_signal'].str.contains('BULLISH', case=False, na=False)]) if 'fib_1h_signal' in fib_df.columns else 0
-                st.metric("Bullish Signals", bullish_count)
-            with col3:
-                bearish_count = len(fib_df[fib_df['fib_1h_signal'].str.contains('BEARISH', case=False, na=False)]) if 'fib_1h_signal' in fib_df.columns else 0
-                st.metric("Bearish Signals", bearish_count)
-            with col4:
-                latest_update = fib_df['timestamp'].max() if len(fib_df) > 0 and 'timestamp' in fib_df.columns else 'N/A'
-                if latest_update != 'N/A':
-                    try:
-                        dt = pd.to_datetime(latest_update)
-                        st.metric("Last Updated", dt.strftime('%H:%M:%S'))
-                    except:
-                        st.metric("Last Updated", latest_update)
-                else:
-                    st.metric("Last Updated", 'N/A')
-            
-            st.markdown("---")
-            
-            # Search
-            fib_search = st.text_input("🔍 Search Fibonacci 1h Symbols", "", key="fib_search")
-            
-            display_fib_df = fib_df.copy()
-            if fib_search:
-                display_fib_df = display_fib_df[display_fib_df['symbol'].str.contains(fib_search, case=False, na=False)]
-                st.info(f"Found {len(display_fib_df)} symbols matching '{fib_search}'")
-            
-            # Display Fibonacci data
-            for _, row in display_fib_df.iterrows():
-                try:
-                    symbol = row.get('symbol', 'N/A')
-                    current_price = float(row.get('current_price', 0))
-                    fib_signal = row.get('fib_1h_signal', 'N/A')
-                    
-                    fib_levels = {}
-                    for key in ['0', '23_6', '38_2', '50', '61_8', '78_6', '100', '127_2', '161_8', '261_8', '423_6']:
-                        level_key = f'fib_level_{key}'
-                        fib_levels[level_key] = row.get(level_key)
-                    
-                    with st.expander(f"{symbol} - ${current_price:.4f} | 1h Signal: {fib_signal}", expanded=False):
-                        col1, col2 = st.columns([1, 1])
-                        
-                        with col1:
-                            st.markdown("### 📐 Fibonacci Levels (1h)")
-                            
-                            st.markdown("**Retracement Levels:**")
-                            retrace_cols = st.columns(3)
-                            retracement_levels = [
-                                ('0', '0.0%'),
-                                ('23_6', '23.6%'),
-                                ('38_2', '38.2%'),
-                                ('50', '50.0%'),
-                                ('61_8', '61.8%'),
-                                ('78_6', '78.6%'),
-                                ('100', '100.0%')
-                            ]
-                            
-                            for i, (key, label) in enumerate(retracement_levels):
-                                level_value = row.get(f'fib_level_{key}')
-                                if pd.notna(level_value):
-                                    with retrace_cols[i % 3]:
-                                        st.markdown(f"""
-                                        <div class='fib-level fib-retracement'>
-                                            {label}: ${float(level_value):.4f}
-                                        </div>
-                                        """, unsafe_allow_html=True)
-                            
-                            st.markdown("**Extension Levels:**")
-                            ext_cols = st.columns(3)
-                            extension_levels = [
-                                ('127_2', '127.2%'),
-                                ('161_8', '161.8%'),
-                                ('261_8', '261.8%'),
-                                ('423_6', '423.6%')
-                            ]
-                            
-                            for i, (key, label) in enumerate(extension_levels):
-                                level_value = row.get(f'fib_level_{key}')
-                                if pd.notna(level_value):
-                                    with ext_cols[i % 3]:
-                                        st.markdown(f"""
-                                        <div class='fib-level fib-extension'>
-                                            {label}: ${float(level_value):.4f}
-                                        </div>
-                                        """, unsafe_allow_html=True)
-                        
-                        with col2:
-                            fib_chart = dashboard.create_fibonacci_chart(symbol, current_price, fib_levels)
-                            st.plotly_chart(fib_chart, use_container_width=True)
-                        
-                        st.markdown(f"""
-                        **Pivot Zone:** {row.get('pivot_zone', 'N/A')}  
-                        **Last Updated:** {row.get('timestamp', 'N/A')}
-                        """)
-                
-                except Exception as e:
-                    continue
-            
-            # Data table
-            st.markdown("### 📋 Fibonacci 1h Data Table")
-            display_cols = ['symbol', 'current_price', 'fib_1h_signal', 'pivot_zone', 'timestamp']
-            display_cols = [col for col in display_cols if col in fib_df.columns]
-            
-            if display_cols:
                 st.dataframe(
-                    fib_df[display_cols].rename(columns={
-                        'symbol': 'Symbol',
-                        'current_price': 'Current Price',
-                        'fib_1h_signal': 'Fib Signal (1h)',
-                        'pivot_zone': 'Pivot Zone',
-                        'timestamp': 'Updated'
-                    }).style.format({'Current Price': '${:.4f}'}),
+                    display_df.style.format({'Current Price': '${:.4f}'}),
                     use_container_width=True,
-                    hide_index=True
+                    hide_index=True,
+                    height=400
                 )
         else:
-            st.warning("No Fibonacci data found in the database.")
+            st.warning("No signals available to display")
+    else:
+        st.info("""
+        ## 📊 No Data Available
+        
+        To view trading signals:
+        
+        1. **Click "Download Latest Data" button** in the sidebar
+        
+        2. **Or wait for automatic GitHub updates**:
+           - Database updates automatically via GitHub Actions
+           - Updates every hour
+           - Click refresh to get latest data
+        
+        The dashboard automatically downloads the latest database from GitHub.
+        """)
+
+def render_all_signals(dashboard: TradingDashboard, options: Dict):
+    """Signal card per symbol, searchable and paginated"""
+    signals_df = dashboard.get_signal_frame().view()
+    show_forecasts = options['show_forecasts']
     
-    # TAB 6: REGRESSION (updated to handle missing columns)
-    with tab6:
-        st.markdown("<h2 class='sub-header'>📈 Polynomial Regression Daily Indicators</h2>", unsafe_allow_html=True)
+    st.markdown("<h2 class='sub-header'>📈 Detailed Trading Signals</h2>", unsafe_allow_html=True)
+    
+    if not signals_df.empty:
+        # Search and filter
+        col1, col2 = st.columns([3, 1])
+        with col1:
+            search_symbol = st.text_input("🔍 Search by Symbol", "", key="signals_search", 
+                                        placeholder="Enter symbol name...")
+        with col2:
+            items_per_page = st.selectbox("Items per page", [10, 25, 50], index=0, key="signals_page_size")
         
-        if not reg_df.empty:
-            st.markdown(f"""
-            <div class='info-badge'>
-                📊 Displaying {len(reg_df)} unique symbols with latest Regression data
-            </div>
-            """, unsafe_allow_html=True)
-            
-            # Metrics
-            col1, col2, col3, col4 = st.columns(4)
-            with col1:
-                st.metric("Unique Symbols", len(reg_df))
-            with col2:
-                bullish_count = len(reg_df[reg_df['poly_signal_daily'].str.contains('BULLISH', case=False, na=False)]) if 'poly_signal_daily' in reg_df.columns else 0
-                st.metric("Bullish Signals", bullish_count)
-            with col3:
-                bearish_count = len(reg_df[reg_df['poly_signal_daily'].str.contains('BEARISH', case=False, na=False)]) if 'poly_signal_daily' in reg_df.columns else 0
-                st.metric("Bearish Signals", bearish_count)
-            with col4:
-                avg_confidence = reg_df['poly_confidence'].mean() if 'poly_confidence' in reg_df.columns else 0
-                st.metric("Avg Confidence", f"{avg_confidence:.1f}%" if avg_confidence > 0 else "N/A")
-            
-            st.markdown("---")
-            
-            # Search
-            reg_search = st.text_input("🔍 Search Regression Symbols", "", key="reg_search")
-            
-            display_reg_df = reg_df.copy()
-            if reg_search:
-                display_reg_df = display_reg_df[display_reg_df['symbol'].str.contains(reg_search, case=False, na=False)]
-                st.info(f"Found {len(display_reg_df)} symbols matching '{reg_search}'")
+        display_df = signals_df
+        
+        if search_symbol:
+            display_df = display_df[display_df['symbol'].str.contains(search_symbol, case=False, na=False)]
+        
+        # Pagination
+        total_items = len(display_df)
+        if total_items > 0:
+            st.info(f"📋 Found {total_items} signals" + (f" matching '{search_symbol}'" if search_symbol else ""))
             
-            # Display regression data
-            for _, row in display_reg_df.iterrows():
+            # Display only the current page of signals
+            for idx, row in paginate(display_df, "signals", items_per_page).iterrows():
                 try:
                     symbol = row.get('symbol', 'N/A')
                     current_price = float(row.get('current_price', 0))
-                    reg_signal = row.get('poly_signal_daily', 'N/A')
-                    confidence = row.get('poly_confidence', 0)
-                    r_squared = row.get('r_squared', 0)
-                    trend_strength = row.get('trend_strength', 0)
+                    signal_text = row['signal_type']
                     
-                    signal_color = '#4CAF50' if 'BULLISH' in str(reg_signal).upper() else '#F44336' if 'BEARISH' in str(reg_signal).upper() else '#FF9800'
-                    
-                    with st.container():
-                        st.markdown(f"""
-                        <div class='regression-card'>
-                            <div style='display: flex; justify-content: space-between; align-items: center;'>
-                                <div>
-                                    <h3 style='margin: 0; color: {signal_color};'>{symbol}</h3>
-                                    <div style='font-size: 0.9rem; color: #546E7A;'>
-                                        Updated: {row.get('timestamp', 'N/A')}
-                                    </div>
-                                </div>
-                                <div style='text-align: right;'>
-                                    <span style='font-size: 1.2rem; font-weight: bold;'>${current_price:.4f}</span><br>
-                                    <span style='font-size: 0.9rem;'>Signal: <strong>{reg_signal}</strong></span>
-                                </div>
-                            </div>
-                            <div style='margin-top: 15px;'>
-                                <div style='display: grid; grid-template-columns: repeat(2, 1fr); gap: 15px;'>
-                                    <div>
-                                        <strong>Confidence:</strong> {confidence:.1f}%<br>
-                                        <strong>R² Score:</strong> {r_squared:.3f}<br>
-                                        <strong>Trend Strength:</strong> {trend_strength:.1f}%
-                                    </div>
-                                    <div>
-                                        <strong>Support:</strong> ${row.get('support_level', 0):.4f}<br>
-                                        <strong>Resistance:</strong> ${row.get('resistance_level', 0):.4f}<br>
-                                        <strong>1D Forecast:</strong> ${row.get('forecast_1d', 0):.4f}
-                                    </div>
-                                </div>
-                            </div>
-                        </div>
-                        """, unsafe_allow_html=True)
-                        
-                        if show_charts:
-                            reg_chart = dashboard.create_regression_chart(
-                                symbol,
-                                current_price,
-                                float(row.get('poly_regression_value', 0)),
-                                float(row.get('support_level', current_price * 0.95)),
-                                float(row.get('resistance_level', current_price * 1.05)),
-                                float(row.get('forecast_1d', current_price)),
-                                float(row.get('forecast_7d', current_price)),
-                                float(row.get('forecast_30d', current_price))
-                            )
-                            st.plotly_chart(reg_chart, use_container_width=True)
-                
-                except Exception as e:
-                    continue
-            
-            # Data table
-            st.markdown("### 📋 Regression Data Table")
-            display_cols = ['symbol', 'current_price', 'poly_signal_daily', 'poly_confidence', 
-                          'r_squared', 'trend_strength', 'support_level', 'resistance_level', 'timestamp']
-            
-            display_cols = [col for col in display_cols if col in reg_df.columns]
-            
-            if display_cols:
-                st.dataframe(
-                    reg_df[display_cols].rename(columns={
-                        'symbol': 'Symbol',
-                        'current_price': 'Current Price',
-                        'poly_signal_daily': 'Regression Signal',
-                        'poly_confidence': 'Confidence %',
-                        'r_squared': 'R²',
-                        'trend_strength': 'Trend Strength %',
-                        'support_level': 'Support',
-                        'resistance_level': 'Resistance',
-                        'timestamp': 'Updated'
-                    }).style.format({
-                        'Current Price': '${:.4f}',
-                        'Confidence %': '{:.1f}%',
-                        'R²': '{:.3f}',
-                        'Trend Strength %': '{:.1f}%',
-                        'Support': '${:.4f}',
-                        'Resistance': '${:.4f}'
-                    }),
-                    use_container_width=True,
-                    hide_index=True
-                )
-        else:
-            st.warning("No regression data found in the database.")
-    
-    # TAB 7: EXTREME DISCOUNT (updated to handle missing columns)
-    with tab7:
-        st.markdown("<h2 class='sub-header'>🔥 Extreme Discount Zone Opportunities</h2>", unsafe_allow_html=True)
-        
-        if not extreme_discount_df.empty:
-            # Get latest signal per symbol
-            discount_latest = extreme_discount_df.sort_values(['symbol', 'timestamp'], ascending=[True, False])
-            discount_latest = discount_latest.drop_duplicates(subset=['symbol'], keep='first')
-            
-            st.markdown("""
-            <div class='extreme-discount-indicator'>
-                🚀 BUYING OPPORTUNITY: These symbols are currently in EXTREME DISCOUNT ZONE
-            </div>
-            """, unsafe_allow_html=True)
-            
-            # Metrics
-            col1, col2, col3, col4 = st.columns(4)
-            
-            with col1:
-                st.markdown(f"""
-                <div class='discount-metric'>
-                    <h3 style='margin: 0; color: #2196F3;'>{len(discount_latest)}</h3>
-                    <p style='margin: 5px 0;'>Extreme Discount Symbols</p>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            with col2:
-                total_bullish = len(discount_latest[discount_latest['overall_signal'].str.contains('BUY', case=False, na=False)])
-                st.markdown(f"""
-                <div class='discount-metric'>
-                    <h3 style='margin: 0; color: #4CAF50;'>{total_bullish}</h3>
-                    <p style='margin: 5px 0;'>Bullish Signals</p>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            with col3:
-                if 'forecast_30d' in discount_latest.columns and 'current_price' in discount_latest.columns:
-                    discount_temp = discount_latest.dropna(subset=['forecast_30d', 'current_price']).copy()
-                    if not discount_temp.empty:
-                        discount_temp['avg_gain'] = ((discount_temp['forecast_30d'] - discount_temp['current_price']) / discount_temp['current_price']) * 100
-                        avg_gain = discount_temp['avg_gain'].mean()
+                    # Determine CSS class
+                    if signal_text in ('STRONG BUY', 'BUY'):
+                        css_class = 'bullish'
+                        signal_icon = "🟢"
+                    elif signal_text in ('STRONG SELL', 'SELL'):
+                        css_class = 'bearish'
+                        signal_icon = "🔴"
                     else:
-                        avg_gain = 0
-                else:
-                    avg_gain = 0
-                
-                color = '#4CAF50' if avg_gain > 0 else '#F44336'
-                st.markdown(f"""
-                <div class='discount-metric'>
-                    <h3 style='margin: 0; color: {color};'>{avg_gain:+.1f}%</h3>
-                    <p style='margin: 5px 0;'>Avg 30D Forecast</p>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            with col4:
-                avg_price = discount_latest['current_price'].mean() if len(discount_latest) > 0 else 0
-                st.markdown(f"""
-                <div class='discount-metric'>
-                    <h3 style='margin: 0; color: #FF9800;'>${avg_price:.4f}</h3>
-                    <p style='margin: 5px 0;'>Avg Current Price</p>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            st.markdown("---")
-            
-            # Chart
-            if show_charts:
-                st.markdown("### 📊 30-Day Potential Gains")
-                discount_chart = dashboard.create_extreme_discount_chart(discount_latest)
-                if discount_chart:
-                    st.plotly_chart(discount_chart, use_container_width=True)
-            
-            # Top gainers
-            if discount_stats.get('top_potential_gainers'):
-                st.markdown("### 🏆 Top 5 Potential Gainers")
-                gainers_cols = st.columns(5)
-                
-                for idx, gainer in enumerate(discount_stats['top_potential_gainers'][:5]):
-                    with gainers_cols[idx]:
-                        symbol = gainer['symbol']
-                        current_price = gainer['current_price']
-                        forecast = gainer['forecast_30d']
-                        change = gainer['forecast_change_30d']
-                        
-                        st.markdown(f"""
-                        <div style='background: linear-gradient(135deg, #E3F2FD 0%, #BBDEFB 100%); 
-                                    border-radius: 10px; padding: 15px; text-align: center; 
-                                    border: 2px solid #2196F3; margin: 5px;'>
-                            <h4 style='margin: 0; color: #1565C0;'>{symbol}</h4>
-                            <p style='margin: 5px 0; font-size: 0.9rem; color: #546E7A;'>
-                                Current: ${current_price:.4f}
-                            </p>
-                            <p style='margin: 5px 0; font-size: 0.9rem; color: #546E7A;'>
-                                Forecast: ${forecast:.4f}
-                            </p>
-                            <div style='background-color: #C8E6C9; color: #2E7D32; 
-                                        padding: 5px; border-radius: 5px; font-weight: bold;'>
-                                {change:+.1f}%
-                            </div>
-                        </div>
-                        """, unsafe_allow_html=True)
-            
-            st.markdown("---")
-            
-            # Search
-            discount_search = st.text_input("🔍 Search Extreme Discount Symbols", "", key="discount_search")
-            
-            display_discount_df = discount_latest.copy()
-            if discount_search:
-                display_discount_df = display_discount_df[display_discount_df['symbol'].str.contains(discount_search, case=False, na=False)]
-                st.info(f"Found {len(display_discount_df)} extreme discount symbols matching '{discount_search}'")
-            
-            # Display symbols
-            st.markdown(f"### 📋 Extreme Discount Symbols ({len(display_discount_df)} total)")
-            
-            for _, row in display_discount_df.iterrows():
-                try:
-                    symbol = row.get('symbol', 'N/A')
-                    current_price = float(row.get('current_price', 0))
-                    pivot_zone = row.get('pivot_zone', 'N/A')
-                    overall_signal = row.get('overall_signal', 'N/A')
-                    
-                    forecast_change = None
-                    if 'forecast_30d' in row and pd.notna(row['forecast_30d']):
-                        forecast_30d = float(row['forecast_30d'])
-                        forecast_change = ((forecast_30d - current_price) / current_price) * 100
+                        css_class = 'neutral'
+                        signal_icon = "🟡"
+                        signal_text = "NEUTRAL"
                     
                     with st.container():
                         st.markdown(f"""
-                        <div class='signal-card extreme-discount'>
+                        <div class='signal-card {css_class}'>
                             <div style='display: flex; justify-content: space-between; align-items: center;'>
                                 <div>
-                                    <h3 style='margin: 0; color: #1565C0;'>{symbol}</h3>
-                                    <div class='discount-badge'>EXTREME DISCOUNT ZONE</div>
+                                    <h3 style='margin: 0; display: flex; align-items: center;'>
+                                        {signal_icon} {symbol}
+                                        <span style='margin-left: 10px; font-size: 0.9rem; color: #546E7A;'>
+                                            {row.get('timestamp', 'N/A')}
+                                        </span>
+                                    </h3>
                                 </div>
                                 <div style='text-align: right;'>
                                     <span style='font-size: 1.5rem; font-weight: bold;'>${current_price:.4f}</span><br>
-                                    <span style='color: #546E7A; font-size: 0.9rem;'>{overall_signal}</span>
+                                    <span style='font-size: 0.9rem; font-weight: 600;'>{signal_text}</span>
                                 </div>
                             </div>
                             <div style='margin-top: 15px;'>
-                                <div style='display: grid; grid-template-columns: repeat(2, 1fr); gap: 15px;'>
+                                <div style='display: grid; grid-template-columns: repeat(2, 1fr); gap: 10px;'>
                                     <div>
-                                        <strong>Pivot Zone:</strong> {pivot_zone}<br>
-                                        <strong>RSI Zone:</strong> {row.get('rsi_zone', 'N/A')}<br>
-                                        <strong>MACD:</strong> {row.get('macd_signal', 'N/A')}
+                                        <strong>1H Fibonacci:</strong> {row.get('fib_15m_signal', 'N/A')}<br>
+                                        <strong>ML Signal:</strong> {row.get('poly_signal', 'N/A')}<br>
+                                        <strong>RSI Zone:</strong> {row.get('rsi_zone', 'N/A')}
                                     </div>
                                     <div>
-                                        <strong>Forecasts:</strong><br>
-                                        1D: ${float(row.get('forecast_1d', current_price)):.4f}<br>
-                                        7D: ${float(row.get('forecast_7d', current_price)):.4f}<br>
-                                        30D: ${float(row.get('forecast_30d', current_price)):.4f}
-                                        {f"<br><span style='color: #4CAF50; font-weight: bold;'>({forecast_change:+.1f}%)</span>" if forecast_change is not None else ""}
+                                        <strong>MACD:</strong> {row.get('macd_signal', 'N/A')}<br>
+                                        <strong>Pivot Zone:</strong> {row.get('pivot_zone', 'N/A')}<br>
+                                        <strong>Fib Signal:</strong> {row.get('fib_signal', 'N/A')}
                                     </div>
                                 </div>
-                                <div style='margin-top: 10px; font-size: 0.9rem; color: #546E7A;'>
-                                    <strong>Updated:</strong> {row.get('timestamp', 'N/A')}
-                                </div>
                             </div>
                         </div>
                         """, unsafe_allow_html=True)
                         
-                        if show_forecasts:
+                        # Charts are built only for the rows whose toggle is on
+                        if show_forecasts and st.toggle("📈 View Price Forecast", key=f"signals_forecast_{symbol}"):
                             try:
                                 forecast_chart = dashboard.create_price_forecast_chart(
                                     symbol,
@@ -2190,531 +1280,1291 @@ def main():
                                     float(row.get('forecast_30d', current_price))
                                 )
                                 st.plotly_chart(forecast_chart, use_container_width=True)
-                            except:
-                                pass
-                
-                except:
+                            except Exception as e:
+                                st.error(f"Could not create forecast chart: {e}")
+                except Exception as e:
                     continue
-            
-            # Data table
-            st.markdown("### 📊 Extreme Discount Data Table")
-            display_cols = ['symbol', 'current_price', 'pivot_zone', 'overall_signal', 
-                          'forecast_1d', 'forecast_7d', 'forecast_30d', 'timestamp']
-            
-            display_cols = [col for col in display_cols if col in display_discount_df.columns]
-            
-            if display_cols:
-                table_df = display_discount_df[display_cols].copy()
-                if 'forecast_30d' in table_df.columns and 'current_price' in table_df.columns:
-                    table_df['30d_change_pct'] = ((table_df['forecast_30d'] - table_df['current_price']) / table_df['current_price']) * 100
-                
-                st.dataframe(
-                    table_df.rename(columns={
-                        'symbol': 'Symbol',
-                        'current_price': 'Current Price',
-                        'pivot_zone': 'Pivot Zone',
-                        'overall_signal': 'Signal',
-                        'forecast_1d': '1D Forecast',
-                        'forecast_7d': '7D Forecast',
-                        'forecast_30d': '30D Forecast',
-                        '30d_change_pct': '30D Change %',
-                        'timestamp': 'Updated'
-                    }).style.format({
-                        'Current Price': '${:.4f}',
-                        '1D Forecast': '${:.4f}',
-                        '7D Forecast': '${:.4f}',
-                        '30D Forecast': '${:.4f}',
-                        '30D Change %': '{:.1f}%'
-                    }).apply(
-                        lambda x: ['background-color: #E8F5E9' if v > 0 else 'background-color: #FFEBEE' 
-                                  for v in x] if x.name == '30D Change %' else [''] * len(x),
-                        axis=0
-                    ),
-                    use_container_width=True,
-                    hide_index=True
-                )
         else:
-            st.warning("No symbols currently in Extreme Discount Zone.")
-            st.info("""
-            **What is Extreme Discount Zone?**
-            
-            The Extreme Discount Zone identifies symbols where the current price is 
-            significantly below its historical support levels, potentially indicating 
-            oversold conditions and buying opportunities.
-            
-            Check back regularly as market conditions change!
-            """)
+            st.warning(f"No signals found{' matching your search' if search_symbol else ''}")
+    else:
+        st.warning("No signals found in the database.")
+
+def render_strong_signals(dashboard: TradingDashboard, options: Dict):
+    """STRONG BUY and STRONG SELL signals side by side"""
+    signal_frame = dashboard.get_signal_frame()
+    signals_df = signal_frame.view()
     
-    # TAB 8: PORTFOLIO (updated to handle missing columns)
-    with tab8:
-        st.markdown("<h2 class='sub-header'>💰 Portfolio: Bullish Regression + Extreme Discount</h2>", unsafe_allow_html=True)
-        
-        if not portfolio_df.empty:
-            # Get latest signal per symbol
-            portfolio_latest = portfolio_df.sort_values(['symbol', 'timestamp'], ascending=[True, False])
-            portfolio_latest = portfolio_latest.drop_duplicates(subset=['symbol'], keep='first')
-            
-            st.markdown("""
-            <div class='portfolio-indicator'>
-                💰 PORTFOLIO OPPORTUNITY: Bullish Daily Regression + Extreme Discount Zone
-            </div>
-            """, unsafe_allow_html=True)
-            
-            # Metrics
-            col1, col2, col3, col4 = st.columns(4)
+    st.markdown("<h2 class='sub-header'>🎯 Strong Signals Focus</h2>", unsafe_allow_html=True)
+    
+    if not signals_df.empty:
+        strong_buy_df = signal_frame.view('strong_buy')
+        strong_sell_df = signal_frame.view('strong_sell')
+        strong_count = len(strong_buy_df) + len(strong_sell_df)
+        
+        if strong_count > 0:
+            col1, col2 = st.columns(2)
             
             with col1:
-                st.markdown(f"""
-                <div class='portfolio-metric'>
-                    <h3 style='margin: 0; color: #4CAF50;'>{len(portfolio_latest)}</h3>
-                    <p style='margin: 5px 0;'>Portfolio Symbols</p>
-                </div>
-                """, unsafe_allow_html=True)
+                st.markdown("### 🟢 STRONG BUY Signals")
+                
+                if not strong_buy_df.empty:
+                    for _, row in strong_buy_df.iterrows():
+                        try:
+                            symbol = row.get('symbol', 'N/A')
+                            current_price = float(row.get('current_price', 0))
+                            forecast_30d = float(row.get('forecast_30d', current_price))
+                            pct_change = row['pct_change_30d']
+                            pivot_zone = row.get('pivot_zone', 'N/A')
+                            
+                            st.markdown(f"""
+                            <div class='signal-card bullish' style='margin-bottom: 15px;'>
+                                <div style='display: flex; justify-content: space-between; align-items: center;'>
+                                    <div>
+                                        <h4 style='margin: 0;'>🟢 {symbol}</h4>
+                                        <span style='font-size: 0.9rem; color: #546E7A;'>{pivot_zone}</span>
+                                    </div>
+                                    <div style='text-align: right;'>
+                                        <span style='font-size: 1.2rem; font-weight: bold;'>${current_price:.4f}</span><br>
+                                        <span style='color: #4CAF50; font-weight: 600;'>30D: {pct_change:+.1f}%</span>
+                                    </div>
+                                </div>
+                                <div style='margin-top: 10px; font-size: 0.9rem;'>
+                                    <strong>RSI:</strong> {row.get('rsi_zone', 'N/A')}<br>
+                                    <strong>MACD:</strong> {row.get('macd_signal', 'N/A')}<br>
+                                    <strong>Forecast:</strong> ${forecast_30d:.4f}
+                                </div>
+                            </div>
+                            """, unsafe_allow_html=True)
+                        except:
+                            continue
+                else:
+                    st.info("No STRONG BUY signals at the moment.")
             
             with col2:
-                if 'forecast_30d' in portfolio_latest.columns and 'current_price' in portfolio_latest.columns:
-                    portfolio_temp = portfolio_latest.dropna(subset=['forecast_30d', 'current_price']).copy()
-                    if not portfolio_temp.empty:
-                        portfolio_temp['avg_gain'] = ((portfolio_temp['forecast_30d'] - portfolio_temp['current_price']) / portfolio_temp['current_price']) * 100
-                        avg_gain = portfolio_temp['avg_gain'].mean()
-                    else:
-                        avg_gain = 0
-                else:
-                    avg_gain = 0
+                st.markdown("### 🔴 STRONG SELL Signals")
                 
-                color = '#4CAF50' if avg_gain > 0 else '#F44336'
-                st.markdown(f"""
-                <div class='portfolio-metric'>
-                    <h3 style='margin: 0; color: {color};'>{avg_gain:+.1f}%</h3>
-                    <p style='margin: 5px 0;'>Avg 30D Forecast</p>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            with col3:
-                avg_price = portfolio_latest['current_price'].mean() if len(portfolio_latest) > 0 else 0
-                st.markdown(f"""
-                <div class='portfolio-metric'>
-                    <h3 style='margin: 0; color: #FF9800;'>${avg_price:.4f}</h3>
-                    <p style='margin: 5px 0;'>Avg Current Price</p>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            with col4:
-                # Download button for portfolio
-                filename, csv_content = dashboard.save_portfolio_csv(portfolio_latest)
-                if csv_content:
-                    st.download_button(
-                        label="📥 Download Portfolio CSV",
-                        data=csv_content,
-                        file_name=filename,
-                        mime="text/csv",
-                        use_container_width=True
-                    )
+                if not strong_sell_df.empty:
+                    for _, row in strong_sell_df.iterrows():
+                        try:
+                            symbol = row.get('symbol', 'N/A')
+                            current_price = float(row.get('current_price', 0))
+                            forecast_30d = float(row.get('forecast_30d', current_price))
+                            pct_change = row['pct_change_30d']
+                            pivot_zone = row.get('pivot_zone', 'N/A')
+                            
+                            st.markdown(f"""
+                            <div class='signal-card bearish' style='margin-bottom: 15px;'>
+                                <div style='display: flex; justify-content: space-between; align-items: center;'>
+                                    <div>
+                                        <h4 style='margin: 0;'>🔴 {symbol}</h4>
+                                        <span style='font-size: 0.9rem; color: #546E7A;'>{pivot_zone}</span>
+                                    </div>
+                                    <div style='text-align: right;'>
+                                        <span style='font-size: 1.2rem; font-weight: bold;'>${current_price:.4f}</span><br>
+                                        <span style='color: #F44336; font-weight: 600;'>30D: {pct_change:+.1f}%</span>
+                                    </div>
+                                </div>
+                                <div style='margin-top: 10px; font-size: 0.9rem;'>
+                                    <strong>RSI:</strong> {row.get('rsi_zone', 'N/A')}<br>
+                                    <strong>MACD:</strong> {row.get('macd_signal', 'N/A')}<br>
+                                    <strong>Forecast:</strong> ${forecast_30d:.4f}
+                                </div>
+                            </div>
+                            """, unsafe_allow_html=True)
+                        except:
+                            continue
+                else:
+                    st.info("No STRONG SELL signals at the moment.")
             
+            # Summary metrics
             st.markdown("---")
-            
-            # Portfolio symbols in CSV format
-            st.markdown("### 📋 Portfolio Symbols (CSV Format)")
-            portfolio_csv = dashboard.get_portfolio_symbols_csv(portfolio_latest)
-            
-            col1, col2 = st.columns([3, 1])
-            
+            col1, col2, col3 = st.columns(3)
             with col1:
-                st.code(portfolio_csv, language="csv")
-            
+                st.metric("Total Strong Signals", strong_count)
             with col2:
-                if st.button("📋 Copy to Clipboard", use_container_width=True):
-                    st.write("📋 Copied to clipboard! Paste in your trading platform.")
+                st.metric("STRONG BUY", len(strong_buy_df))
+            with col3:
+                st.metric("STRONG SELL", len(strong_sell_df))
             
-            # Top gainers
-            if portfolio_stats.get('top_potential_gainers'):
-                st.markdown("### 🏆 Top Portfolio Gainers")
-                gainers_cols = st.columns(5)
-                
-                for idx, gainer in enumerate(portfolio_stats['top_potential_gainers'][:5]):
-                    with gainers_cols[idx]:
-                        symbol = gainer['symbol']
-                        current_price = gainer['current_price']
-                        forecast = gainer['forecast_30d']
-                        change = gainer['forecast_change_30d']
-                        
-                        st.markdown(f"""
-                        <div style='background: linear-gradient(135deg, #E3F2FD 0%, #BBDEFB 100%); 
-                                    border-radius: 10px; padding: 15px; text-align: center; 
-                                    border: 2px solid #2196F3; margin: 5px;'>
-                            <h4 style='margin: 0; color: #1565C0;'>{symbol}</h4>
-                            <p style='margin: 5px 0; font-size: 0.9rem; color: #546E7A;'>
-                                Current: ${current_price:.4f}
-                            </p>
-                            <p style='margin: 5px 0; font-size: 0.9rem; color: #546E7A;'>
-                                Forecast: ${forecast:.4f}
-                            </p>
-                            <div style='background-color: #C8E6C9; color: #2E7D32; 
-                                        padding: 5px; border-radius: 5px; font-weight: bold;'>
-                                {change:+.1f}%
-                            </div>
-                        </div>
-                        """, unsafe_allow_html=True)
+        else:
+            st.info("No strong signals (STRONG BUY/SELL) at the moment.")
+    else:
+        st.warning("No signals found in the database.")
+
+def render_forecasts(dashboard: TradingDashboard, options: Dict):
+    """HVTS price forecasts per symbol"""
+    hvts_df = dashboard.get_hvts_forecast()
+    
+    st.markdown("<h2 class='sub-header'>📅 Price Forecasts</h2>", unsafe_allow_html=True)
+    
+    if not hvts_df.empty:
+        # Get latest forecast per symbol
+        forecast_latest = hvts_df.sort_values(['symbol', 'timestamp'], ascending=[True, False])
+        forecast_latest = forecast_latest.drop_duplicates(subset=['symbol'], keep='first')
+        
+        st.markdown("### 📊 30-Day Forecast Comparison")
+        
+        forecast_df = forecast_latest.copy()
+        forecast_df = forecast_df.dropna(subset=['forecast_30d', 'current_price']).copy()
+        
+        if not forecast_df.empty:
+            forecast_df['forecast_change_30d'] = ((forecast_df['forecast_30d'] - forecast_df['current_price']) / forecast_df['current_price']) * 100
+            sorted_df = forecast_df.sort_values('forecast_change_30d', ascending=False)
             
-            st.markdown("---")
+            display_df = sorted_df.head(20)
             
-            # Portfolio details
-            st.markdown(f"### 🔍 Portfolio Details ({len(portfolio_latest)} symbols)")
+            fig = go.Figure()
             
-            portfolio_search = st.text_input("🔍 Search Portfolio Symbols", "", key="portfolio_search")
+            colors = ['#4CAF50' if x > 0 else '#F44336' for x in display_df['forecast_change_30d']]
             
-            display_portfolio_df = portfolio_latest.copy()
-            if portfolio_search:
-                display_portfolio_df = display_portfolio_df[display_portfolio_df['symbol'].str.contains(portfolio_search, case=False, na=False)]
-                st.info(f"Found {len(display_portfolio_df)} portfolio symbols matching '{portfolio_search}'")
+            fig.add_trace(go.Bar(
+                x=display_df['symbol'],
+                y=display_df['forecast_change_30d'],
+                marker_color=colors,
+                text=[f"{x:.1f}%" for x in display_df['forecast_change_30d']],
+                textposition='auto',
+                hovertemplate='<b>%{x}</b><br>Change: %{y:.1f}%<extra></extra>'
+            ))
             
-            for _, row in display_portfolio_df.iterrows():
-                try:
-                    symbol = row.get('symbol', 'N/A')
-                    current_price = float(row.get('current_price', 0))
-                    pivot_zone = row.get('pivot_zone', 'N/A')
-                    overall_signal = row.get('overall_signal', 'N/A')
-                    
-                    forecast_change = None
-                    if 'forecast_30d' in row and pd.notna(row['forecast_30d']):
-                        forecast_30d = float(row['forecast_30d'])
-                        forecast_change = ((forecast_30d - current_price) / current_price) * 100
-                    
-                    with st.container():
-                        st.markdown(f"""
-                        <div class='signal-card portfolio'>
-                            <div style='display: flex; justify-content: space-between; align-items: center;'>
-                                <div>
-                                    <h3 style='margin: 0; color: #1565C0;'>{symbol}</h3>
-                                    <div class='portfolio-badge'>PORTFOLIO: Bullish Regression + Extreme Discount</div>
-                                </div>
-                                <div style='text-align: right;'>
-                                    <span style='font-size: 1.5rem; font-weight: bold;'>${current_price:.4f}</span><br>
-                                    <span style='color: #546E7A; font-size: 0.9rem;'>{overall_signal}</span>
-                                </div>
-                            </div>
-                            <div style='margin-top: 15px;'>
-                                <div style='display: grid; grid-template-columns: repeat(2, 1fr); gap: 15px;'>
-                                    <div>
-                                        <strong>Pivot Zone:</strong> {pivot_zone}<br>
-                                        <strong>RSI Zone:</strong> {row.get('rsi_zone', 'N/A')}<br>
-                                        <strong>MACD:</strong> {row.get('macd_signal', 'N/A')}
-                                    </div>
-                                    <div>
-                                        <strong>Forecasts:</strong><br>
-                                        1D: ${float(row.get('forecast_1d', current_price)):.4f}<br>
-                                        7D: ${float(row.get('forecast_7d', current_price)):.4f}<br>
-                                        30D: ${float(row.get('forecast_30d', current_price)):.4f}
-                                        {f"<br><span style='color: #4CAF50; font-weight: bold;'>({forecast_change:+.1f}%)</span>" if forecast_change is not None else ""}
-                                    </div>
-                                </div>
-                                <div style='margin-top: 10px; font-size: 0.9rem; color: #546E7A;'>
-                                    <strong>Updated:</strong> {row.get('timestamp', 'N/A')}
-                                </div>
-                            </div>
-                        </div>
-                        """, unsafe_allow_html=True)
-                        
-                        if show_forecasts:
-                            try:
-                                forecast_chart = dashboard.create_price_forecast_chart(
-                                    symbol,
-                                    current_price,
-                                    float(row.get('forecast_1h', current_price)),
-                                    float(row.get('forecast_1d', current_price)),
-                                    float(row.get('forecast_7d', current_price)),
-                                    float(row.get('forecast_14d', current_price)),
-                                    float(row.get('forecast_30d', current_price))
-                                )
-                                st.plotly_chart(forecast_chart, use_container_width=True)
-                            except:
-                                pass
-                
-                except:
-                    continue
+            fig.update_layout(
+                title='30-Day Forecast Percentage Change (Top 20)',
+                xaxis_title='Symbol',
+                yaxis_title='Forecast Change (%)',
+                template='plotly_white',
+                height=500,
+                showlegend=False
+            )
+            
+            st.plotly_chart(fig, use_container_width=True)
+            
+            st.markdown("### 📋 Detailed Forecasts")
+            
+            forecast_search = st.text_input("🔍 Search Forecasts by Symbol", "", key="forecast_search")
+            
+            forecast_display_df = forecast_latest.copy()
+            
+            if forecast_search:
+                forecast_display_df = forecast_display_df[forecast_display_df['symbol'].str.contains(forecast_search, case=False, na=False)]
             
-            # Data table
-            st.markdown("### 📊 Portfolio Data Table")
-            display_cols = ['symbol', 'current_price', 'pivot_zone', 'overall_signal', 
-                          'forecast_1d', 'forecast_7d', 'forecast_30d', 'timestamp']
+            display_cols = ['symbol', 'current_price', 'forecast_1d', 'forecast_7d', 
+                          'forecast_14d', 'forecast_30d', 'poly_signal', 'timestamp']
             
-            display_cols = [col for col in display_cols if col in display_portfolio_df.columns]
+            display_cols = [col for col in display_cols if col in forecast_display_df.columns]
             
             if display_cols:
-                table_df = display_portfolio_df[display_cols].copy()
-                if 'forecast_30d' in table_df.columns and 'current_price' in table_df.columns:
-                    table_df['30d_change_pct'] = ((table_df['forecast_30d'] - table_df['current_price']) / table_df['current_price']) * 100
+                # Calculate percentage changes
+                display_df_with_pct = forecast_display_df.copy()
+                for period in ['1d', '7d', '14d', '30d']:
+                    col_name = f'forecast_{period}'
+                    if col_name in display_df_with_pct.columns:
+                        pct_col = f'{period}_change_pct'
+                        display_df_with_pct[pct_col] = ((display_df_with_pct[col_name] - display_df_with_pct['current_price']) / display_df_with_pct['current_price']) * 100
+                
+                # Prepare for display
+                display_data = display_df_with_pct[['symbol', 'current_price']].copy()
+                
+                for period in ['1d', '7d', '14d', '30d']:
+                    col_name = f'forecast_{period}'
+                    pct_col = f'{period}_change_pct'
+                    if col_name in display_df_with_pct.columns:
+                        display_data[f'{period.upper()}'] = display_df_with_pct[col_name]
+                        if pct_col in display_df_with_pct.columns:
+                            display_data[f'{period.upper()} %'] = display_df_with_pct[pct_col]
+                
+                if 'poly_signal' in display_df_with_pct.columns:
+                    display_data['ML Signal'] = display_df_with_pct['poly_signal']
+                if 'timestamp' in display_df_with_pct.columns:
+                    display_data['Updated'] = display_df_with_pct['timestamp']
                 
                 st.dataframe(
-                    table_df.rename(columns={
-                        'symbol': 'Symbol',
-                        'current_price': 'Current Price',
-                        'pivot_zone': 'Pivot Zone',
-                        'overall_signal': 'Signal',
-                        'forecast_1d': '1D Forecast',
-                        'forecast_7d': '7D Forecast',
-                        'forecast_30d': '30D Forecast',
-                        '30d_change_pct': '30D Change %',
-                        'timestamp': 'Updated'
-                    }).style.format({
-                        'Current Price': '${:.4f}',
-                        '1D Forecast': '${:.4f}',
-                        '7D Forecast': '${:.4f}',
-                        '30D Forecast': '${:.4f}',
-                        '30D Change %': '{:.1f}%'
+                    display_data.style.format({
+                        'current_price': '${:.4f}',
+                        '1D': '${:.4f}',
+                        '1D %': '{:.1f}%',
+                        '7D': '${:.4f}',
+                        '7D %': '{:.1f}%',
+                        '14D': '${:.4f}',
+                        '14D %': '{:.1f}%',
+                        '30D': '${:.4f}',
+                        '30D %': '{:.1f}%'
                     }).apply(
-                        lambda x: ['background-color: #E8F5E9' if v > 0 else 'background-color: #FFEBEE' 
-                                  for v in x] if x.name == '30D Change %' else [''] * len(x),
+                        lambda x: ['background-color: #E8F5E9' if v > 0 else 'background-color: #FFEBEE' if v < 0 else '' 
+                                  for v in x] if x.name in ['1D %', '7D %', '14D %', '30D %'] else [''] * len(x),
                         axis=0
                     ),
                     use_container_width=True,
-                    hide_index=True
+                    hide_index=True,
+                    height=400
                 )
-        else:
-            st.warning("No portfolio symbols found (Bullish Regression + Extreme Discount).")
-            st.info("""
-            **Portfolio Criteria:**
-            
-            This portfolio shows symbols that meet BOTH conditions:
-            1. **Bullish Polynomial Regression** on Daily timeframe
-            2. **Price in Extreme Discount Zone**
+    else:
+        st.warning("No forecast data found in the database.")
+
+def render_fibonacci(dashboard: TradingDashboard, options: Dict):
+    """Fibonacci 1-hour levels per symbol"""
+    fib_df = dashboard.get_fibonacci_data()
+    
+    st.markdown("<h2 class='sub-header'>📐 Fibonacci 1-Hour Indicators</h2>", unsafe_allow_html=True)
+    
+    if not fib_df.empty:
+        st.markdown(f"""
+        <div class='info-badge'>
+            📊 Displaying {len(fib_df)} unique symbols with latest Fibonacci 1-hour data
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # Metrics
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("Unique Symbols", len(fib_df))
+        with col2:
+            bullish_count = len(fib_df[fib_df['fib_1h_signal'].str.contains('BULLISH', case=False, na=False)]) if 'fib_1h_signal' in fib_df.columns else 0
+            st.metric("Bullish Signals", bullish_count)
+        with col3:
+            bearish_count = len(fib_df[fib_df['fib_1h_signal'].str.contains('BEARISH', case=False, na=False)]) if 'fib_1h_signal' in fib_df.columns else 0
+            st.metric("Bearish Signals", bearish_count)
+        with col4:
+            latest_update = fib_df['timestamp'].max() if len(fib_df) > 0 and 'timestamp' in fib_df.columns else 'N/A'
+            if latest_update != 'N/A':
+                try:
+                    dt = pd.to_datetime(latest_update)
+                    st.metric("Last Updated", dt.strftime('%H:%M:%S'))
+                except:
+                    st.metric("Last Updated", latest_update)
+            else:
+                st.metric("Last Updated", 'N/A')
+        
+        st.markdown("---")
+        
+        # Search
+        fib_search = st.text_input("🔍 Search Fibonacci 1h Symbols", "", key="fib_search")
+        
+        display_fib_df = fib_df.copy()
+        if fib_search:
+            display_fib_df = display_fib_df[display_fib_df['symbol'].str.contains(fib_search, case=False, na=False)]
+            st.info(f"Found {len(display_fib_df)} symbols matching '{fib_search}'")
+        
+        # Display Fibonacci data, one page at a time
+        for _, row in paginate(display_fib_df, "fib", CARDS_PER_PAGE).iterrows():
+            try:
+                symbol = row.get('symbol', 'N/A')
+                current_price = float(row.get('current_price', 0))
+                fib_signal = row.get('fib_1h_signal', 'N/A')
+                
+                fib_levels = {}
+                for key in ['0', '23_6', '38_2', '50', '61_8', '78_6', '100', '127_2', '161_8', '261_8', '423_6']:
+                    level_key = f'fib_level_{key}'
+                    fib_levels[level_key] = row.get(level_key)
+                
+                # A toggle instead of an expander: collapsed rows build no levels or chart at all
+                if st.toggle(f"{symbol} - ${current_price:.4f} | 1h Signal: {fib_signal}", key=f"fib_open_{symbol}"):
+                    col1, col2 = st.columns([1, 1])
+                    
+                    with col1:
+                        st.markdown("### 📐 Fibonacci Levels (1h)")
+                        
+                        st.markdown("**Retracement Levels:**")
+                        retrace_cols = st.columns(3)
+                        retracement_levels = [
+                            ('0', '0.0%'),
+                            ('23_6', '23.6%'),
+                            ('38_2', '38.2%'),
+                            ('50', '50.0%'),
+                            ('61_8', '61.8%'),
+                            ('78_6', '78.6%'),
+                            ('100', '100.0%')
+                        ]
+                        
+                        for i, (key, label) in enumerate(retracement_levels):
+                            level_value = row.get(f'fib_level_{key}')
+                            if pd.notna(level_value):
+                                with retrace_cols[i % 3]:
+                                    st.markdown(f"""
+                                    <div class='fib-level fib-retracement'>
+                                        {label}: ${float(level_value):.4f}
+                                    </div>
+                                    """, unsafe_allow_html=True)
+                        
+                        st.markdown("**Extension Levels:**")
+                        ext_cols = st.columns(3)
+                        extension_levels = [
+                            ('127_2', '127.2%'),
+                            ('161_8', '161.8%'),
+                            ('261_8', '261.8%'),
+                            ('423_6', '423.6%')
+                        ]
+                        
+                        for i, (key, label) in enumerate(extension_levels):
+                            level_value = row.get(f'fib_level_{key}')
+                            if pd.notna(level_value):
+                                with ext_cols[i % 3]:
+                                    st.markdown(f"""
+                                    <div class='fib-level fib-extension'>
+                                        {label}: ${float(level_value):.4f}
+                                    </div>
+                                    """, unsafe_allow_html=True)
+                    
+                    with col2:
+                        fib_chart = dashboard.create_fibonacci_chart(symbol, current_price, fib_levels)
+                        st.plotly_chart(fib_chart, use_container_width=True)
+                    
+                    st.markdown(f"""
+                    **Pivot Zone:** {row.get('pivot_zone', 'N/A')}  
+                    **Last Updated:** {row.get('timestamp', 'N/A')}
+                    """)
             
-            These symbols represent potential buying opportunities with strong 
-            technical indicators supporting upward movement.
+            except Exception as e:
+                continue
+        
+        # Data table
+        st.markdown("### 📋 Fibonacci 1h Data Table")
+        display_cols = ['symbol', 'current_price', 'fib_1h_signal', 'pivot_zone', 'timestamp']
+        display_cols = [col for col in display_cols if col in fib_df.columns]
+        
+        if display_cols:
+            st.dataframe(
+                fib_df[display_cols].rename(columns={
+                    'symbol': 'Symbol',
+                    'current_price': 'Current Price',
+                    'fib_1h_signal': 'Fib Signal (1h)',
+                    'pivot_zone': 'Pivot Zone',
+                    'timestamp': 'Updated'
+                }).style.format({'Current Price': '${:.4f}'}),
+                use_container_width=True,
+                hide_index=True
+            )
+    else:
+        st.warning("No Fibonacci data found in the database.")
+
+def render_regression(dashboard: TradingDashboard, options: Dict):
+    """Polynomial regression daily indicators per symbol"""
+    reg_df = dashboard.get_regression_data()
+    show_charts = options['show_charts']
+    
+    st.markdown("<h2 class='sub-header'>📈 Polynomial Regression Daily Indicators</h2>", unsafe_allow_html=True)
+    
+    if not reg_df.empty:
+        st.markdown(f"""
+        <div class='info-badge'>
+            📊 Displaying {len(reg_df)} unique symbols with latest Regression data
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # Metrics
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("Unique Symbols", len(reg_df))
+        with col2:
+            bullish_count = len(reg_df[reg_df['poly_signal_daily'].str.contains('BULLISH', case=False, na=False)]) if 'poly_signal_daily' in reg_df.columns else 0
+            st.metric("Bullish Signals", bullish_count)
+        with col3:
+            bearish_count = len(reg_df[reg_df['poly_signal_daily'].str.contains('BEARISH', case=False, na=False)]) if 'poly_signal_daily' in reg_df.columns else 0
+            st.metric("Bearish Signals", bearish_count)
+        with col4:
+            avg_confidence = reg_df['poly_confidence'].mean() if 'poly_confidence' in reg_df.columns else 0
+            st.metric("Avg Confidence", f"{avg_confidence:.1f}%" if avg_confidence > 0 else "N/A")
+        
+        st.markdown("---")
+        
+        # Search
+        reg_search = st.text_input("🔍 Search Regression Symbols", "", key="reg_search")
+        
+        display_reg_df = reg_df.copy()
+        if reg_search:
+            display_reg_df = display_reg_df[display_reg_df['symbol'].str.contains(reg_search, case=False, na=False)]
+            st.info(f"Found {len(display_reg_df)} symbols matching '{reg_search}'")
+        
+        # Display regression data, one page at a time
+        for _, row in paginate(display_reg_df, "reg", CARDS_PER_PAGE).iterrows():
+            try:
+                symbol = row.get('symbol', 'N/A')
+                current_price = float(row.get('current_price', 0))
+                reg_signal = row.get('poly_signal_daily', 'N/A')
+                confidence = row.get('poly_confidence', 0)
+                r_squared = row.get('r_squared', 0)
+                trend_strength = row.get('trend_strength', 0)
+                
+                signal_color = '#4CAF50' if 'BULLISH' in str(reg_signal).upper() else '#F44336' if 'BEARISH' in str(reg_signal).upper() else '#FF9800'
+                
+                with st.container():
+                    st.markdown(f"""
+                    <div class='regression-card'>
+                        <div style='display: flex; justify-content: space-between; align-items: center;'>
+                            <div>
+                                <h3 style='margin: 0; color: {signal_color};'>{symbol}</h3>
+                                <div style='font-size: 0.9rem; color: #546E7A;'>
+                                    Updated: {row.get('timestamp', 'N/A')}
+                                </div>
+                            </div>
+                            <div style='text-align: right;'>
+                                <span style='font-size: 1.2rem; font-weight: bold;'>${current_price:.4f}</span><br>
+                                <span style='font-size: 0.9rem;'>Signal: <strong>{reg_signal}</strong></span>
+                            </div>
+                        </div>
+                        <div style='margin-top: 15px;'>
+                            <div style='display: grid; grid-template-columns: repeat(2, 1fr); gap: 15px;'>
+                                <div>
+                                    <strong>Confidence:</strong> {confidence:.1f}%<br>
+                                    <strong>R² Score:</strong> {r_squared:.3f}<br>
+                                    <strong>Trend Strength:</strong> {trend_strength:.1f}%
+                                </div>
+                                <div>
+                                    <strong>Support:</strong> ${row.get('support_level', 0):.4f}<br>
+                                    <strong>Resistance:</strong> ${row.get('resistance_level', 0):.4f}<br>
+                                    <strong>1D Forecast:</strong> ${row.get('forecast_1d', 0):.4f}
+                                </div>
+                            </div>
+                        </div>
+                    </div>
+                    """, unsafe_allow_html=True)
+                    
+                    if show_charts and st.toggle("📈 Show Regression Chart", key=f"reg_chart_{symbol}"):
+                        reg_chart = dashboard.create_regression_chart(
+                            symbol,
+                            current_price,
+                            float(row.get('poly_regression_value', 0)),
+                            float(row.get('support_level', current_price * 0.95)),
+                            float(row.get('resistance_level', current_price * 1.05)),
+                            float(row.get('forecast_1d', current_price)),
+                            float(row.get('forecast_7d', current_price)),
+                            float(row.get('forecast_30d', current_price))
+                        )
+                        st.plotly_chart(reg_chart, use_container_width=True)
             
-            Check back regularly as market conditions change!
-            """)
+            except Exception as e:
+                continue
+        
+        # Data table
+        st.markdown("### 📋 Regression Data Table")
+        display_cols = ['symbol', 'current_price', 'poly_signal_daily', 'poly_confidence', 
+                      'r_squared', 'trend_strength', 'support_level', 'resistance_level', 'timestamp']
+        
+        display_cols = [col for col in display_cols if col in reg_df.columns]
+        
+        if display_cols:
+            st.dataframe(
+                reg_df[display_cols].rename(columns={
+                    'symbol': 'Symbol',
+                    'current_price': 'Current Price',
+                    'poly_signal_daily': 'Regression Signal',
+                    'poly_confidence': 'Confidence %',
+                    'r_squared': 'R²',
+                    'trend_strength': 'Trend Strength %',
+                    'support_level': 'Support',
+                    'resistance_level': 'Resistance',
+                    'timestamp': 'Updated'
+                }).style.format({
+                    'Current Price': '${:.4f}',
+                    'Confidence %': '{:.1f}%',
+                    'R²': '{:.3f}',
+                    'Trend Strength %': '{:.1f}%',
+                    'Support': '${:.4f}',
+                    'Resistance': '${:.4f}'
+                }),
+                use_container_width=True,
+                hide_index=True
+            )
+    else:
+        st.warning("No regression data found in the database.")
+
+def render_extreme_discount(dashboard: TradingDashboard, options: Dict):
+    """Symbols in the Extreme Discount Zone"""
+    signal_frame = dashboard.get_signal_frame()
+    extreme_discount_df = signal_frame.view('extreme_discount')
+    discount_stats = dashboard.get_extreme_discount_stats()
+    show_charts = options['show_charts']
+    show_forecasts = options['show_forecasts']
     
-    # TAB 9: OVERVALUED (updated to handle missing columns)
-    with tab9:
-        st.markdown("<h2 class='sub-header'>⚠️ Overvalued: Above Buy Zone</h2>", unsafe_allow_html=True)
-        
-        if not overvalued_df.empty:
-            # Get latest signal per symbol
-            overvalued_latest = overvalued_df.sort_values(['symbol', 'timestamp'], ascending=[True, False])
-            overvalued_latest = overvalued_latest.drop_duplicates(subset=['symbol'], keep='first')
-            
-            st.markdown("""
-            <div class='overvalued-indicator'>
-                ⚠️ CAUTION: These symbols are currently in ABOVE BUY ZONE
+    st.markdown("<h2 class='sub-header'>🔥 Extreme Discount Zone Opportunities</h2>", unsafe_allow_html=True)
+    
+    if not extreme_discount_df.empty:
+        discount_latest = extreme_discount_df
+        
+        st.markdown("""
+        <div class='extreme-discount-indicator'>
+            🚀 BUYING OPPORTUNITY: These symbols are currently in EXTREME DISCOUNT ZONE
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # Metrics
+        col1, col2, col3, col4 = st.columns(4)
+        
+        with col1:
+            st.markdown(f"""
+            <div class='discount-metric'>
+                <h3 style='margin: 0; color: #2196F3;'>{len(discount_latest)}</h3>
+                <p style='margin: 5px 0;'>Extreme Discount Symbols</p>
             </div>
             """, unsafe_allow_html=True)
+        
+        with col2:
+            total_bullish = signal_frame.count('bullish', within='extreme_discount')
+            st.markdown(f"""
+            <div class='discount-metric'>
+                <h3 style='margin: 0; color: #4CAF50;'>{total_bullish}</h3>
+                <p style='margin: 5px 0;'>Bullish Signals</p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with col3:
+            avg_gain = discount_stats.get('avg_forecast_30d_change', 0)
             
-            # Metrics
-            col1, col2, col3, col4 = st.columns(4)
-            
-            with col1:
-                st.markdown(f"""
-                <div class='overvalued-metric'>
-                    <h3 style='margin: 0; color: #FF9800;'>{len(overvalued_latest)}</h3>
-                    <p style='margin: 5px 0;'>Overvalued Symbols</p>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            with col2:
-                total_bearish = len(overvalued_latest[overvalued_latest['overall_signal'].str.contains('SELL', case=False, na=False)])
-                st.markdown(f"""
-                <div class='overvalued-metric'>
-                    <h3 style='margin: 0; color: #F44336;'>{total_bearish}</h3>
-                    <p style='margin: 5px 0;'>Bearish Signals</p>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            with col3:
-                if 'forecast_30d' in overvalued_latest.columns and 'current_price' in overvalued_latest.columns:
-                    overvalued_temp = overvalued_latest.dropna(subset=['forecast_30d', 'current_price']).copy()
-                    if not overvalued_temp.empty:
-                        overvalued_temp['avg_change'] = ((overvalued_temp['forecast_30d'] - overvalued_temp['current_price']) / overvalued_temp['current_price']) * 100
-                        avg_change = overvalued_temp['avg_change'].mean()
-                    else:
-                        avg_change = 0
-                else:
-                    avg_change = 0
+            color = '#4CAF50' if avg_gain > 0 else '#F44336'
+            st.markdown(f"""
+            <div class='discount-metric'>
+                <h3 style='margin: 0; color: {color};'>{avg_gain:+.1f}%</h3>
+                <p style='margin: 5px 0;'>Avg 30D Forecast</p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with col4:
+            avg_price = discount_stats.get('avg_current_price', 0)
+            st.markdown(f"""
+            <div class='discount-metric'>
+                <h3 style='margin: 0; color: #FF9800;'>${avg_price:.4f}</h3>
+                <p style='margin: 5px 0;'>Avg Current Price</p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        st.markdown("---")
+        
+        # Chart
+        if show_charts:
+            st.markdown("### 📊 30-Day Potential Gains")
+            discount_chart = dashboard.create_extreme_discount_chart(discount_latest)
+            if discount_chart:
+                st.plotly_chart(discount_chart, use_container_width=True)
+        
+        # Top gainers
+        if discount_stats.get('top_potential_gainers'):
+            st.markdown("### 🏆 Top 5 Potential Gainers")
+            gainers_cols = st.columns(5)
+            
+            for idx, gainer in enumerate(discount_stats['top_potential_gainers'][:5]):
+                with gainers_cols[idx]:
+                    symbol = gainer['symbol']
+                    current_price = gainer['current_price']
+                    forecast = gainer['forecast_30d']
+                    change = gainer['forecast_change_30d']
+                    
+                    st.markdown(f"""
+                    <div style='background: linear-gradient(135deg, #E3F2FD 0%, #BBDEFB 100%); 
+                                border-radius: 10px; padding: 15px; text-align: center; 
+                                border: 2px solid #2196F3; margin: 5px;'>
+                        <h4 style='margin: 0; color: #1565C0;'>{symbol}</h4>
+                        <p style='margin: 5px 0; font-size: 0.9rem; color: #546E7A;'>
+                            Current: ${current_price:.4f}
+                        </p>
+                        <p style='margin: 5px 0; font-size: 0.9rem; color: #546E7A;'>
+                            Forecast: ${forecast:.4f}
+                        </p>
+                        <div style='background-color: #C8E6C9; color: #2E7D32; 
+                                    padding: 5px; border-radius: 5px; font-weight: bold;'>
+                            {change:+.1f}%
+                        </div>
+                    </div>
+                    """, unsafe_allow_html=True)
+        
+        st.markdown("---")
+        
+        # Search
+        discount_search = st.text_input("🔍 Search Extreme Discount Symbols", "", key="discount_search")
+        
+        display_discount_df = discount_latest.copy()
+        if discount_search:
+            display_discount_df = display_discount_df[display_discount_df['symbol'].str.contains(discount_search, case=False, na=False)]
+            st.info(f"Found {len(display_discount_df)} extreme discount symbols matching '{discount_search}'")
+        
+        # Display symbols
+        st.markdown(f"### 📋 Extreme Discount Symbols ({len(display_discount_df)} total)")
+        
+        for _, row in paginate(display_discount_df, "discount", CARDS_PER_PAGE).iterrows():
+            try:
+                symbol = row.get('symbol', 'N/A')
+                current_price = float(row.get('current_price', 0))
+                pivot_zone = row.get('pivot_zone', 'N/A')
+                overall_signal = row.get('overall_signal', 'N/A')
                 
-                color = '#4CAF50' if avg_change > 0 else '#F44336'
-                st.markdown(f"""
-                <div class='overvalued-metric'>
-                    <h3 style='margin: 0; color: {color};'>{avg_change:+.1f}%</h3>
-                    <p style='margin: 5px 0;'>Avg 30D Forecast</p>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            with col4:
-                avg_price = overvalued_latest['current_price'].mean() if len(overvalued_latest) > 0 else 0
-                st.markdown(f"""
-                <div class='overvalued-metric'>
-                    <h3 style='margin: 0; color: #FF5722;'>${avg_price:.4f}</h3>
-                    <p style='margin: 5px 0;'>Avg Current Price</p>
-                </div>
-                """, unsafe_allow_html=True)
-            
-            st.markdown("---")
-            
-            # Chart
-            if show_charts:
-                st.markdown("### 📊 30-Day Potential Changes")
-                overvalued_chart = dashboard.create_overvalued_chart(overvalued_latest)
-                if overvalued_chart:
-                    st.plotly_chart(overvalued_chart, use_container_width=True)
-            
-            # Top decliners
-            if overvalued_stats.get('top_potential_decliners'):
-                st.markdown("### 📉 Top 5 Potential Decliners")
-                decliners_cols = st.columns(5)
+                forecast_change = row['pct_change_30d'] if pd.notna(row['pct_change_30d']) else None
                 
-                for idx, decliner in enumerate(overvalued_stats['top_potential_decliners'][:5]):
-                    with decliners_cols[idx]:
-                        symbol = decliner['symbol']
-                        current_price = decliner['current_price']
-                        forecast = decliner['forecast_30d']
-                        change = decliner['forecast_change_30d']
-                        
-                        st.markdown(f"""
-                        <div style='background: linear-gradient(135deg, #FFEBEE 0%, #FFCDD2 100%); 
-                                    border-radius: 10px; padding: 15px; text-align: center; 
-                                    border: 2px solid #F44336; margin: 5px;'>
-                            <h4 style='margin: 0; color: #C62828;'>{symbol}</h4>
-                            <p style='margin: 5px 0; font-size: 0.9rem; color: #546E7A;'>
-                                Current: ${current_price:.4f}
-                            </p>
-                            <p style='margin: 5px 0; font-size: 0.9rem; color: #546E7A;'>
-                                Forecast: ${forecast:.4f}
-                            </p>
-                            <div style='background-color: #FFCDD2; color: #C62828; 
-                                        padding: 5px; border-radius: 5px; font-weight: bold;'>
-                                {change:+.1f}%
+                with st.container():
+                    st.markdown(f"""
+                    <div class='signal-card extreme-discount'>
+                        <div style='display: flex; justify-content: space-between; align-items: center;'>
+                            <div>
+                                <h3 style='margin: 0; color: #1565C0;'>{symbol}</h3>
+                                <div class='discount-badge'>EXTREME DISCOUNT ZONE</div>
+                            </div>
+                            <div style='text-align: right;'>
+                                <span style='font-size: 1.5rem; font-weight: bold;'>${current_price:.4f}</span><br>
+                                <span style='color: #546E7A; font-size: 0.9rem;'>{overall_signal}</span>
                             </div>
                         </div>
-                        """, unsafe_allow_html=True)
-            
-            st.markdown("---")
-            
-            # Search
-            overvalued_search = st.text_input("🔍 Search Overvalued Symbols", "", key="overvalued_search")
-            
-            display_overvalued_df = overvalued_latest.copy()
-            if overvalued_search:
-                display_overvalued_df = display_overvalued_df[display_overvalued_df['symbol'].str.contains(overvalued_search, case=False, na=False)]
-                st.info(f"Found {len(display_overvalued_df)} overvalued symbols matching '{overvalued_search}'")
+                        <div style='margin-top: 15px;'>
+                            <div style='display: grid; grid-template-columns: repeat(2, 1fr); gap: 15px;'>
+                                <div>
+                                    <strong>Pivot Zone:</strong> {pivot_zone}<br>
+                                    <strong>RSI Zone:</strong> {row.get('rsi_zone', 'N/A')}<br>
+                                    <strong>MACD:</strong> {row.get('macd_signal', 'N/A')}
+                                </div>
+                                <div>
+                                    <strong>Forecasts:</strong><br>
+                                    1D: ${float(row.get('forecast_1d', current_price)):.4f}<br>
+                                    7D: ${float(row.get('forecast_7d', current_price)):.4f}<br>
+                                    30D: ${float(row.get('forecast_30d', current_price)):.4f}
+                                    {f"<br><span style='color: #4CAF50; font-weight: bold;'>({forecast_change:+.1f}%)</span>" if forecast_change is not None else ""}
+                                </div>
+                            </div>
+                            <div style='margin-top: 10px; font-size: 0.9rem; color: #546E7A;'>
+                                <strong>Updated:</strong> {row.get('timestamp', 'N/A')}
+                            </div>
+                        </div>
+                    </div>
+                    """, unsafe_allow_html=True)
+                    
+                    if show_forecasts and st.toggle("📈 Show Price Forecast", key=f"discount_forecast_{symbol}"):
+                        try:
+                            forecast_chart = dashboard.create_price_forecast_chart(
+                                symbol,
+                                current_price,
+                                float(row.get('forecast_1h', current_price)),
+                                float(row.get('forecast_1d', current_price)),
+                                float(row.get('forecast_7d', current_price)),
+                                float(row.get('forecast_14d', current_price)),
+                                float(row.get('forecast_30d', current_price))
+                            )
+                            st.plotly_chart(forecast_chart, use_container_width=True)
+                        except:
+                            pass
             
-            # Display symbols
-            st.markdown(f"### 📋 Overvalued Symbols ({len(display_overvalued_df)} total)")
+            except:
+                continue
+        
+        # Data table
+        st.markdown("### 📊 Extreme Discount Data Table")
+        display_cols = ['symbol', 'current_price', 'pivot_zone', 'overall_signal', 
+                      'forecast_1d', 'forecast_7d', 'forecast_30d', 'timestamp']
+        
+        display_cols = [col for col in display_cols if col in display_discount_df.columns]
+        
+        if display_cols:
+            table_df = display_discount_df[display_cols].copy()
+            table_df['30d_change_pct'] = display_discount_df['pct_change_30d']
+            
+            st.dataframe(
+                table_df.rename(columns={
+                    'symbol': 'Symbol',
+                    'current_price': 'Current Price',
+                    'pivot_zone': 'Pivot Zone',
+                    'overall_signal': 'Signal',
+                    'forecast_1d': '1D Forecast',
+                    'forecast_7d': '7D Forecast',
+                    'forecast_30d': '30D Forecast',
+                    '30d_change_pct': '30D Change %',
+                    'timestamp': 'Updated'
+                }).style.format({
+                    'Current Price': '${:.4f}',
+                    '1D Forecast': '${:.4f}',
+                    '7D Forecast': '${:.4f}',
+                    '30D Forecast': '${:.4f}',
+                    '30D Change %': '{:.1f}%'
+                }).apply(
+                    lambda x: ['background-color: #E8F5E9' if v > 0 else 'background-color: #FFEBEE' 
+                              for v in x] if x.name == '30D Change %' else [''] * len(x),
+                    axis=0
+                ),
+                use_container_width=True,
+                hide_index=True
+            )
+    else:
+        st.warning("No symbols currently in Extreme Discount Zone.")
+        st.info("""
+        **What is Extreme Discount Zone?**
+        
+        The Extreme Discount Zone identifies symbols where the current price is 
+        significantly below its historical support levels, potentially indicating 
+        oversold conditions and buying opportunities.
+        
+        Check back regularly as market conditions change!
+        """)
+
+def render_portfolio(dashboard: TradingDashboard, options: Dict):
+    """Portfolio: bullish daily regression + Extreme Discount Zone"""
+    portfolio_df = dashboard.get_portfolio_signals()
+    portfolio_stats = dashboard.get_portfolio_stats()
+    show_forecasts = options['show_forecasts']
+    
+    st.markdown("<h2 class='sub-header'>💰 Portfolio: Bullish Regression + Extreme Discount</h2>", unsafe_allow_html=True)
+    
+    if not portfolio_df.empty:
+        portfolio_latest = portfolio_df
+        
+        st.markdown("""
+        <div class='portfolio-indicator'>
+            💰 PORTFOLIO OPPORTUNITY: Bullish Daily Regression + Extreme Discount Zone
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # Metrics
+        col1, col2, col3, col4 = st.columns(4)
+        
+        with col1:
+            st.markdown(f"""
+            <div class='portfolio-metric'>
+                <h3 style='margin: 0; color: #4CAF50;'>{len(portfolio_latest)}</h3>
+                <p style='margin: 5px 0;'>Portfolio Symbols</p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with col2:
+            avg_gain = portfolio_stats.get('avg_forecast_30d_change', 0)
             
-            for _, row in display_overvalued_df.iterrows():
-                try:
-                    symbol = row.get('symbol', 'N/A')
-                    current_price = float(row.get('current_price', 0))
-                    pivot_zone = row.get('pivot_zone', 'N/A')
-                    overall_signal = row.get('overall_signal', 'N/A')
-                    
-                    forecast_change = None
-                    if 'forecast_30d' in row and pd.notna(row['forecast_30d']):
-                        forecast_30d = float(row['forecast_30d'])
-                        forecast_change = ((forecast_30d - current_price) / current_price) * 100
+            color = '#4CAF50' if avg_gain > 0 else '#F44336'
+            st.markdown(f"""
+            <div class='portfolio-metric'>
+                <h3 style='margin: 0; color: {color};'>{avg_gain:+.1f}%</h3>
+                <p style='margin: 5px 0;'>Avg 30D Forecast</p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with col3:
+            avg_price = portfolio_stats.get('avg_current_price', 0)
+            st.markdown(f"""
+            <div class='portfolio-metric'>
+                <h3 style='margin: 0; color: #FF9800;'>${avg_price:.4f}</h3>
+                <p style='margin: 5px 0;'>Avg Current Price</p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with col4:
+            # Download button for portfolio
+            filename, csv_content = dashboard.save_portfolio_csv(portfolio_latest)
+            if csv_content:
+                st.download_button(
+                    label="📥 Download Portfolio CSV",
+                    data=csv_content,
+                    file_name=filename,
+                    mime="text/csv",
+                    use_container_width=True
+                )
+        
+        st.markdown("---")
+        
+        # Portfolio symbols in CSV format
+        st.markdown("### 📋 Portfolio Symbols (CSV Format)")
+        portfolio_csv = dashboard.get_portfolio_symbols_csv(portfolio_latest)
+        
+        col1, col2 = st.columns([3, 1])
+        
+        with col1:
+            st.code(portfolio_csv, language="csv")
+        
+        with col2:
+            if st.button("📋 Copy to Clipboard", use_container_width=True):
+                st.write("📋 Copied to clipboard! Paste in your trading platform.")
+        
+        # Top gainers
+        if portfolio_stats.get('top_potential_gainers'):
+            st.markdown("### 🏆 Top Portfolio Gainers")
+            gainers_cols = st.columns(5)
+            
+            for idx, gainer in enumerate(portfolio_stats['top_potential_gainers'][:5]):
+                with gainers_cols[idx]:
+                    symbol = gainer['symbol']
+                    current_price = gainer['current_price']
+                    forecast = gainer['forecast_30d']
+                    change = gainer['forecast_change_30d']
                     
-                    with st.container():
-                        st.markdown(f"""
-                        <div class='signal-card overvalued'>
-                            <div style='display: flex; justify-content: space-between; align-items: center;'>
+                    st.markdown(f"""
+                    <div style='background: linear-gradient(135deg, #E3F2FD 0%, #BBDEFB 100%); 
+                                border-radius: 10px; padding: 15px; text-align: center; 
+                                border: 2px solid #2196F3; margin: 5px;'>
+                        <h4 style='margin: 0; color: #1565C0;'>{symbol}</h4>
+                        <p style='margin: 5px 0; font-size: 0.9rem; color: #546E7A;'>
+                            Current: ${current_price:.4f}
+                        </p>
+                        <p style='margin: 5px 0; font-size: 0.9rem; color: #546E7A;'>
+                            Forecast: ${forecast:.4f}
+                        </p>
+                        <div style='background-color: #C8E6C9; color: #2E7D32; 
+                                    padding: 5px; border-radius: 5px; font-weight: bold;'>
+                            {change:+.1f}%
+                        </div>
+                    </div>
+                    """, unsafe_allow_html=True)
+        
+        st.markdown("---")
+        
+        # Portfolio details
+        st.markdown(f"### 🔍 Portfolio Details ({len(portfolio_latest)} symbols)")
+        
+        portfolio_search = st.text_input("🔍 Search Portfolio Symbols", "", key="portfolio_search")
+        
+        display_portfolio_df = portfolio_latest.copy()
+        if portfolio_search:
+            display_portfolio_df = display_portfolio_df[display_portfolio_df['symbol'].str.contains(portfolio_search, case=False, na=False)]
+            st.info(f"Found {len(display_portfolio_df)} portfolio symbols matching '{portfolio_search}'")
+        
+        for _, row in paginate(display_portfolio_df, "portfolio", CARDS_PER_PAGE).iterrows():
+            try:
+                symbol = row.get('symbol', 'N/A')
+                current_price = float(row.get('current_price', 0))
+                pivot_zone = row.get('pivot_zone', 'N/A')
+                overall_signal = row.get('overall_signal', 'N/A')
+                
+                forecast_change = row['pct_change_30d'] if pd.notna(row['pct_change_30d']) else None
+                
+                with st.container():
+                    st.markdown(f"""
+                    <div class='signal-card portfolio'>
+                        <div style='display: flex; justify-content: space-between; align-items: center;'>
+                            <div>
+                                <h3 style='margin: 0; color: #1565C0;'>{symbol}</h3>
+                                <div class='portfolio-badge'>PORTFOLIO: Bullish Regression + Extreme Discount</div>
+                            </div>
+                            <div style='text-align: right;'>
+                                <span style='font-size: 1.5rem; font-weight: bold;'>${current_price:.4f}</span><br>
+                                <span style='color: #546E7A; font-size: 0.9rem;'>{overall_signal}</span>
+                            </div>
+                        </div>
+                        <div style='margin-top: 15px;'>
+                            <div style='display: grid; grid-template-columns: repeat(2, 1fr); gap: 15px;'>
                                 <div>
-                                    <h3 style='margin: 0; color: #EF6C00;'>{symbol}</h3>
-                                    <div class='overvalued-badge'>ABOVE BUY ZONE - CAUTION</div>
+                                    <strong>Pivot Zone:</strong> {pivot_zone}<br>
+                                    <strong>RSI Zone:</strong> {row.get('rsi_zone', 'N/A')}<br>
+                                    <strong>MACD:</strong> {row.get('macd_signal', 'N/A')}
                                 </div>
-                                <div style='text-align: right;'>
-                                    <span style='font-size: 1.5rem; font-weight: bold;'>${current_price:.4f}</span><br>
-                                    <span style='color: #546E7A; font-size: 0.9rem;'>{overall_signal}</span>
+                                <div>
+                                    <strong>Forecasts:</strong><br>
+                                    1D: ${float(row.get('forecast_1d', current_price)):.4f}<br>
+                                    7D: ${float(row.get('forecast_7d', current_price)):.4f}<br>
+                                    30D: ${float(row.get('forecast_30d', current_price)):.4f}
+                                    {f"<br><span style='color: #4CAF50; font-weight: bold;'>({forecast_change:+.1f}%)</span>" if forecast_change is not None else ""}
                                 </div>
                             </div>
-                            <div style='margin-top: 15px;'>
-                                <div style='display: grid; grid-template-columns: repeat(2, 1fr); gap: 15px;'>
-                                    <div>
-                                        <strong>Pivot Zone:</strong> {pivot_zone}<br>
-                                        <strong>RSI Zone:</strong> {row.get('rsi_zone', 'N/A')}<br>
-                                        <strong>MACD:</strong> {row.get('macd_signal', 'N/A')}
-                                    </div>
-                                    <div>
-                                        <strong>Forecasts:</strong><br>
-                                        1D: ${float(row.get('forecast_1d', current_price)):.4f}<br>
-                                        7D: ${float(row.get('forecast_7d', current_price)):.4f}<br>
-                                        30D: ${float(row.get('forecast_30d', current_price)):.4f}
-                                        {f"<br><span style='color: #F44336; font-weight: bold;'>({forecast_change:+.1f}%)</span>" if forecast_change is not None else ""}
-                                    </div>
-                                </div>
-                                <div style='margin-top: 10px; font-size: 0.9rem; color: #546E7A;'>
-                                    <strong>Updated:</strong> {row.get('timestamp', 'N/A')}
-                                </div>
+                            <div style='margin-top: 10px; font-size: 0.9rem; color: #546E7A;'>
+                                <strong>Updated:</strong> {row.get('timestamp', 'N/A')}
                             </div>
                         </div>
-                        """, unsafe_allow_html=True)
-                        
-                        if show_forecasts:
-                            try:
-                                forecast_chart = dashboard.create_price_forecast_chart(
-                                    symbol,
-                                    current_price,
-                                    float(row.get('forecast_1h', current_price)),
-                                    float(row.get('forecast_1d', current_price)),
-                                    float(row.get('forecast_7d', current_price)),
-                                    float(row.get('forecast_14d', current_price)),
-                                    float(row.get('forecast_30d', current_price))
-                                )
-                                st.plotly_chart(forecast_chart, use_container_width=True)
-                            except:
-                                pass
-                
-                except:
-                    continue
-            
-            # Data table
-            st.markdown("### 📊 Overvalued Data Table")
-            display_cols = ['symbol', 'current_price', 'pivot_zone', 'overall_signal', 
-                          'forecast_1d', 'forecast_7d', 'forecast_30d', 'timestamp']
+                    </div>
+                    """, unsafe_allow_html=True)
+                    
+                    if show_forecasts and st.toggle("📈 Show Price Forecast", key=f"portfolio_forecast_{symbol}"):
+                        try:
+                            forecast_chart = dashboard.create_price_forecast_chart(
+                                symbol,
+                                current_price,
+                                float(row.get('forecast_1h', current_price)),
+                                float(row.get('forecast_1d', current_price)),
+                                float(row.get('forecast_7d', current_price)),
+                                float(row.get('forecast_14d', current_price)),
+                                float(row.get('forecast_30d', current_price))
+                            )
+                            st.plotly_chart(forecast_chart, use_container_width=True)
+                        except:
+                            pass
             
-            display_cols = [col for col in display_cols if col in display_overvalued_df.columns]
+            except:
+                continue
+        
+        # Data table
+        st.markdown("### 📊 Portfolio Data Table")
+        display_cols = ['symbol', 'current_price', 'pivot_zone', 'overall_signal', 
+                      'forecast_1d', 'forecast_7d', 'forecast_30d', 'timestamp']
+        
+        display_cols = [col for col in display_cols if col in display_portfolio_df.columns]
+        
+        if display_cols:
+            table_df = display_portfolio_df[display_cols].copy()
+            table_df['30d_change_pct'] = display_portfolio_df['pct_change_30d']
+            
+            st.dataframe(
+                table_df.rename(columns={
+                    'symbol': 'Symbol',
+                    'current_price': 'Current Price',
+                    'pivot_zone': 'Pivot Zone',
+                    'overall_signal': 'Signal',
+                    'forecast_1d': '1D Forecast',
+                    'forecast_7d': '7D Forecast',
+                    'forecast_30d': '30D Forecast',
+                    '30d_change_pct': '30D Change %',
+                    'timestamp': 'Updated'
+                }).style.format({
+                    'Current Price': '${:.4f}',
+                    '1D Forecast': '${:.4f}',
+                    '7D Forecast': '${:.4f}',
+                    '30D Forecast': '${:.4f}',
+                    '30D Change %': '{:.1f}%'
+                }).apply(
+                    lambda x: ['background-color: #E8F5E9' if v > 0 else 'background-color: #FFEBEE' 
+                              for v in x] if x.name == '30D Change %' else [''] * len(x),
+                    axis=0
+                ),
+                use_container_width=True,
+                hide_index=True
+            )
+    else:
+        st.warning("No portfolio symbols found (Bullish Regression + Extreme Discount).")
+        st.info("""
+        **Portfolio Criteria:**
+        
+        This portfolio shows symbols that meet BOTH conditions:
+        1. **Bullish Polynomial Regression** on Daily timeframe
+        2. **Price in Extreme Discount Zone**
+        
+        These symbols represent potential buying opportunities with strong 
+        technical indicators supporting upward movement.
+        
+        Check back regularly as market conditions change!
+        """)
+
+def render_overvalued(dashboard: TradingDashboard, options: Dict):
+    """Symbols in the Above Buy Zone"""
+    signal_frame = dashboard.get_signal_frame()
+    overvalued_df = signal_frame.view('overvalued')
+    overvalued_stats = dashboard.get_overvalued_stats()
+    show_charts = options['show_charts']
+    show_forecasts = options['show_forecasts']
+    
+    st.markdown("<h2 class='sub-header'>⚠️ Overvalued: Above Buy Zone</h2>", unsafe_allow_html=True)
+    
+    if not overvalued_df.empty:
+        overvalued_latest = overvalued_df
+        
+        st.markdown("""
+        <div class='overvalued-indicator'>
+            ⚠️ CAUTION: These symbols are currently in ABOVE BUY ZONE
+        </div>
+        """, unsafe_allow_html=True)
+        
+        # Metrics
+        col1, col2, col3, col4 = st.columns(4)
+        
+        with col1:
+            st.markdown(f"""
+            <div class='overvalued-metric'>
+                <h3 style='margin: 0; color: #FF9800;'>{len(overvalued_latest)}</h3>
+                <p style='margin: 5px 0;'>Overvalued Symbols</p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with col2:
+            total_bearish = signal_frame.count('bearish', within='overvalued')
+            st.markdown(f"""
+            <div class='overvalued-metric'>
+                <h3 style='margin: 0; color: #F44336;'>{total_bearish}</h3>
+                <p style='margin: 5px 0;'>Bearish Signals</p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with col3:
+            avg_change = overvalued_stats.get('avg_forecast_30d_change', 0)
             
-            if display_cols:
-                table_df = display_overvalued_df[display_cols].copy()
-                if 'forecast_30d' in table_df.columns and 'current_price' in table_df.columns:
-                    table_df['30d_change_pct'] = ((table_df['forecast_30d'] - table_df['current_price']) / table_df['current_price']) * 100
+            color = '#4CAF50' if avg_change > 0 else '#F44336'
+            st.markdown(f"""
+            <div class='overvalued-metric'>
+                <h3 style='margin: 0; color: {color};'>{avg_change:+.1f}%</h3>
+                <p style='margin: 5px 0;'>Avg 30D Forecast</p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        with col4:
+            avg_price = overvalued_stats.get('avg_current_price', 0)
+            st.markdown(f"""
+            <div class='overvalued-metric'>
+                <h3 style='margin: 0; color: #FF5722;'>${avg_price:.4f}</h3>
+                <p style='margin: 5px 0;'>Avg Current Price</p>
+            </div>
+            """, unsafe_allow_html=True)
+        
+        st.markdown("---")
+        
+        # Chart
+        if show_charts:
+            st.markdown("### 📊 30-Day Potential Changes")
+            overvalued_chart = dashboard.create_overvalued_chart(overvalued_latest)
+            if overvalued_chart:
+                st.plotly_chart(overvalued_chart, use_container_width=True)
+        
+        # Top decliners
+        if overvalued_stats.get('top_potential_decliners'):
+            st.markdown("### 📉 Top 5 Potential Decliners")
+            decliners_cols = st.columns(5)
+            
+            for idx, decliner in enumerate(overvalued_stats['top_potential_decliners'][:5]):
+                with decliners_cols[idx]:
+                    symbol = decliner['symbol']
+                    current_price = decliner['current_price']
+                    forecast = decliner['forecast_30d']
+                    change = decliner['forecast_change_30d']
+                    
+                    st.markdown(f"""
+                    <div style='background: linear-gradient(135deg, #FFEBEE 0%, #FFCDD2 100%); 
+                                border-radius: 10px; padding: 15px; text-align: center; 
+                                border: 2px solid #F44336; margin: 5px;'>
+                        <h4 style='margin: 0; color: #C62828;'>{symbol}</h4>
+                        <p style='margin: 5px 0; font-size: 0.9rem; color: #546E7A;'>
+                            Current: ${current_price:.4f}
+                        </p>
+                        <p style='margin: 5px 0; font-size: 0.9rem; color: #546E7A;'>
+                            Forecast: ${forecast:.4f}
+                        </p>
+                        <div style='background-color: #FFCDD2; color: #C62828; 
+                                    padding: 5px; border-radius: 5px; font-weight: bold;'>
+                            {change:+.1f}%
+                        </div>
+                    </div>
+                    """, unsafe_allow_html=True)
+        
+        st.markdown("---")
+        
+        # Search
+        overvalued_search = st.text_input("🔍 Search Overvalued Symbols", "", key="overvalued_search")
+        
+        display_overvalued_df = overvalued_latest.copy()
+        if overvalued_search:
+            display_overvalued_df = display_overvalued_df[display_overvalued_df['symbol'].str.contains(overvalued_search, case=False, na=False)]
+            st.info(f"Found {len(display_overvalued_df)} overvalued symbols matching '{overvalued_search}'")
+        
+        # Display symbols
+        st.markdown(f"### 📋 Overvalued Symbols ({len(display_overvalued_df)} total)")
+        
+        for _, row in paginate(display_overvalued_df, "overvalued", CARDS_PER_PAGE).iterrows():
+            try:
+                symbol = row.get('symbol', 'N/A')
+                current_price = float(row.get('current_price', 0))
+                pivot_zone = row.get('pivot_zone', 'N/A')
+                overall_signal = row.get('overall_signal', 'N/A')
                 
-                st.dataframe(
-                    table_df.rename(columns={
-                        'symbol': 'Symbol',
-                        'current_price': 'Current Price',
-                        'pivot_zone': 'Pivot Zone',
-                        'overall_signal': 'Signal',
-                        'forecast_1d': '1D Forecast',
-                        'forecast_7d': '7D Forecast',
-                        'forecast_30d': '30D Forecast',
-                        '30d_change_pct': '30D Change %',
-                        'timestamp': 'Updated'
-                    }).style.format({
-                        'Current Price': '${:.4f}',
-                        '1D Forecast': '${:.4f}',
-                        '7D Forecast': '${:.4f}',
-                        '30D Forecast': '${:.4f}',
-                        '30D Change %': '{:.1f}%'
-                    }).apply(
-                        lambda x: ['background-color: #E8F5E9' if v > 0 else 'background-color: #FFEBEE' 
-                                  for v in x] if x.name == '30D Change %' else [''] * len(x),
-                        axis=0
-                    ),
-                    use_container_width=True,
-                    hide_index=True
-                )
-        else:
-            st.warning("No symbols currently in Above Buy Zone.")
-            st.info("""
-            **What is Above Buy Zone?**
+                forecast_change = row['pct_change_30d'] if pd.notna(row['pct_change_30d']) else None
+                
+                with st.container():
+                    st.markdown(f"""
+                    <div class='signal-card overvalued'>
+                        <div style='display: flex; justify-content: space-between; align-items: center;'>
+                            <div>
+                                <h3 style='margin: 0; color: #EF6C00;'>{symbol}</h3>
+                                <div class='overvalued-badge'>ABOVE BUY ZONE - CAUTION</div>
+                            </div>
+                            <div style='text-align: right;'>
+                                <span style='font-size: 1.5rem; font-weight: bold;'>${current_price:.4f}</span><br>
+                                <span style='color: #546E7A; font-size: 0.9rem;'>{overall_signal}</span>
+                            </div>
+                        </div>
+                        <div style='margin-top: 15px;'>
+                            <div style='display: grid; grid-template-columns: repeat(2, 1fr); gap: 15px;'>
+                                <div>
+                                    <strong>Pivot Zone:</strong> {pivot_zone}<br>
+                                    <strong>RSI Zone:</strong> {row.get('rsi_zone', 'N/A')}<br>
+                                    <strong>MACD:</strong> {row.get('macd_signal', 'N/A')}
+                                </div>
+                                <div>
+                                    <strong>Forecasts:</strong><br>
+                                    1D: ${float(row.get('forecast_1d', current_price)):.4f}<br>
+                                    7D: ${float(row.get('forecast_7d', current_price)):.4f}<br>
+                                    30D: ${float(row.get('forecast_30d', current_price)):.4f}
+                                    {f"<br><span style='color: #F44336; font-weight: bold;'>({forecast_change:+.1f}%)</span>" if forecast_change is not None else ""}
+                                </div>
+                            </div>
+                            <div style='margin-top: 10px; font-size: 0.9rem; color: #546E7A;'>
+                                <strong>Updated:</strong> {row.get('timestamp', 'N/A')}
+                            </div>
+                        </div>
+                    </div>
+                    """, unsafe_allow_html=True)
+                    
+                    if show_forecasts and st.toggle("📈 Show Price Forecast", key=f"overvalued_forecast_{symbol}"):
+                        try:
+                            forecast_chart = dashboard.create_price_forecast_chart(
+                                symbol,
+                                current_price,
+                                float(row.get('forecast_1h', current_price)),
+                                float(row.get('forecast_1d', current_price)),
+                                float(row.get('forecast_7d', current_price)),
+                                float(row.get('forecast_14d', current_price)),
+                                float(row.get('forecast_30d', current_price))
+                            )
+                            st.plotly_chart(forecast_chart, use_container_width=True)
+                        except:
+                            pass
             
-            The Above Buy Zone identifies symbols where the current price is 
-            significantly above its historical resistance levels, potentially indicating 
-            overbought conditions and selling opportunities.
+            except:
+                continue
+        
+        # Data table
+        st.markdown("### 📊 Overvalued Data Table")
+        display_cols = ['symbol', 'current_price', 'pivot_zone', 'overall_signal', 
+                      'forecast_1d', 'forecast_7d', 'forecast_30d', 'timestamp']
+        
+        display_cols = [col for col in display_cols if col in display_overvalued_df.columns]
+        
+        if display_cols:
+            table_df = display_overvalued_df[display_cols].copy()
+            table_df['30d_change_pct'] = display_overvalued_df['pct_change_30d']
+            
+            st.dataframe(
+                table_df.rename(columns={
+                    'symbol': 'Symbol',
+                    'current_price': 'Current Price',
+                    'pivot_zone': 'Pivot Zone',
+                    'overall_signal': 'Signal',
+                    'forecast_1d': '1D Forecast',
+                    'forecast_7d': '7D Forecast',
+                    'forecast_30d': '30D Forecast',
+                    '30d_change_pct': '30D Change %',
+                    'timestamp': 'Updated'
+                }).style.format({
+                    'Current Price': '${:.4f}',
+                    '1D Forecast': '${:.4f}',
+                    '7D Forecast': '${:.4f}',
+                    '30D Forecast': '${:.4f}',
+                    '30D Change %': '{:.1f}%'
+                }).apply(
+                    lambda x: ['background-color: #E8F5E9' if v > 0 else 'background-color: #FFEBEE' 
+                              for v in x] if x.name == '30D Change %' else [''] * len(x),
+                    axis=0
+                ),
+                use_container_width=True,
+                hide_index=True
+            )
+    else:
+        st.warning("No symbols currently in Above Buy Zone.")
+        st.info("""
+        **What is Above Buy Zone?**
+        
+        The Above Buy Zone identifies symbols where the current price is 
+        significantly above its historical resistance levels, potentially indicating 
+        overbought conditions and selling opportunities.
+        
+        These symbols may be due for a price correction.
+        
+        Check back regularly as market conditions change!
+        """)
+
+# Dashboard views by selector label, in display order
+VIEWS = {
+    "📊 Overview": render_overview,
+    "📈 All Signals": render_all_signals,
+    "🎯 Strong Signals": render_strong_signals,
+    "📅 Forecasts": render_forecasts,
+    "📐 Fibonacci": render_fibonacci,
+    "📈 Regression": render_regression,
+    "🔥 Extreme Discount": render_extreme_discount,
+    "💰 Portfolio": render_portfolio,
+    "⚠️ Overvalued": render_overvalued
+}
+
+def main():
+    """Main Streamlit application - UPDATED FOR scheduler_v2.py compatibility"""
+    # Shared dashboard: downloads the latest data at most once per TTL for all sessions
+    dashboard_cache = get_dashboard_cache()
+    with dashboard_cache.use() as dashboard:
+        render_app(dashboard_cache, dashboard)
+
+def render_app(dashboard_cache: DashboardCache, dashboard: TradingDashboard):
+    """Render the page for one rerun with the dashboard it was lent"""
+    # Get database metadata
+    metadata = dashboard.get_database_metadata()
+    
+    # Header
+    col1, col2, col3 = st.columns([1, 2, 1])
+    with col2:
+        st.markdown("<h1 class='main-header'>📈 HVTS Trading Signals Dashboard</h1>", unsafe_allow_html=True)
+        
+        # Show database info with download status
+        status_color = "#4CAF50" if metadata.get('total_symbols', 0) > 0 else "#FF9800"
+        status_text = "🟢 Live Data" if metadata.get('total_symbols', 0) > 0 else "🟡 No Data"
+        
+        # Show file source info
+        if dashboard.db_path.endswith("_latest.db"):
+            source_text = "🌐 GitHub (Latest)"
+        elif dashboard.db_path == "trading_signals.db":
+            source_text = "💾 Local"
+        else:
+            source_text = "🧠 Memory"
+        
+        st.markdown(f"""
+        <div style='text-align: center; color: #546E7A; margin-bottom: 20px; padding: 10px; border-radius: 10px; background-color: {status_color}20; border: 1px solid {status_color}50;'>
+            <strong>📊 Database:</strong> {metadata.get('total_symbols', 0)} symbols | 
+            <strong>⏰ Last Updated:</strong> {metadata.get('last_updated', 'Never')} | 
+            <strong>📁 Source:</strong> {source_text}
+        </div>
+        """, unsafe_allow_html=True)
+    
+    # Sidebar
+    with st.sidebar:
+        st.markdown("### 🔧 Dashboard Controls")
+        
+        # Manual refresh only (auto-refresh disabled for Streamlit Cloud)
+        if st.button("🔄 Refresh Dashboard", use_container_width=True, type="primary"):
+            st.rerun()
+        
+        # Database refresh button
+        if st.button("🌐 Download Latest Data", use_container_width=True):
+            # The rerun reloads the shared dashboard, fetching whatever changed on GitHub
+            dashboard_cache.invalidate()
+            st.rerun()
+        st.caption(f"Data loaded {dashboard_cache.age() / 60:.0f} min ago, "
+                   f"refreshed every {DASHBOARD_TTL_SECONDS // 60} min")
+        
+        st.markdown("---")
+        st.markdown("### 📊 Signal Filters")
+        
+        signal_filter = st.selectbox(
+            "Filter by Signal Type",
+            ["All Signals", "STRONG BUY", "BUY", "NEUTRAL", "SELL", "STRONG SELL"]
+        )
+        
+        st.markdown("---")
+        st.markdown("### 📈 Display Options")
+        show_forecasts = st.checkbox("Show Price Forecast Charts", value=True)
+        show_charts = st.checkbox("Show Analysis Charts", value=True)
+        show_detailed = st.checkbox("Show Detailed Views", value=True)
+        
+        st.markdown("---")
+        st.markdown("### 📦 Database Info")
+        
+        # Check database status
+        if metadata.get('total_symbols', 0) == 0:
+            st.error("⚠️ Database is empty or failed to load")
+            st.info("Click 'Download Latest Data' to fetch fresh data")
+        else:
+            st.success(f"✅ {metadata.get('total_symbols', 0)} symbols loaded")
             
-            These symbols may be due for a price correction.
+            if metadata.get('last_updated', 'Unknown') != 'Unknown':
+                try:
+                    last_update = pd.to_datetime(metadata['last_updated'])
+                    st.info(f"**Last Updated:** {last_update.strftime('%Y-%m-%d %H:%M:%S')}")
+                except:
+                    st.info(f"**Last Updated:** {metadata.get('last_updated', 'Unknown')}")
             
-            Check back regularly as market conditions change!
-            """)
+            st.info(f"**Data Source:** {metadata.get('data_source', 'Unknown')}")
+        
+        st.markdown("---")
+        st.markdown("### ℹ️ About")
+        st.info("""
+        **HVTS Trading Signals Dashboard**
+        
+        This dashboard displays trading signals 
+        generated by algorithmic analysis of 
+        cryptocurrency markets.
+        
+        • Data from Gate.io Exchange
+        • Updated automatically from GitHub
+        • 9 different analysis views
+        • Real-time database updates
+        """)
+    
+    # Only the selected view runs: the others load, compute and render nothing
+    view = st.radio("View", list(VIEWS), horizontal=True, key="view", label_visibility="collapsed")
+    
+    if metadata.get('total_symbols', 0) == 0:
+        st.warning("⚠️ No signals found in database. Click 'Download Latest Data' to fetch fresh data.")
+    
+    VIEWS[view](dashboard, {
+        'signal_filter': signal_filter,
+        'show_forecasts': show_forecasts,
+        'show_charts': show_charts
+    })
     
     # Manual refresh button (safe for Streamlit Cloud)
     st.markdown("---")
@@ -0,0 +1,230 @@
+# candle_store.py - Persistent local OHLCV store for incremental candle fetching
+import logging
+import sqlite3
+import threading
+from typing import Optional, Tuple
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+OHLCV_COLUMNS = ['timestamp', 'open', 'high', 'low', 'close', 'volume']
+
+TIMEFRAME_MS = {
+    '1m': 60 * 1000,
+    '5m': 5 * 60 * 1000,
+    '15m': 15 * 60 * 1000,
+    '30m': 30 * 60 * 1000,
+    '1h': 60 * 60 * 1000,
+    '4h': 4 * 60 * 60 * 1000,
+    '1d': 24 * 60 * 60 * 1000,
+    '1w': 7 * 24 * 60 * 60 * 1000,
+}
+
+
+def timeframe_to_ms(timeframe: str) -> int:
+    """Get the candle duration of a ccxt timeframe string in milliseconds"""
+    if timeframe not in TIMEFRAME_MS:
+        raise ValueError(f"Unsupported timeframe '{timeframe}' (supported: {', '.join(TIMEFRAME_MS)})")
+    return TIMEFRAME_MS[timeframe]
+
+
+def to_epoch_ms(timestamps: pd.Series) -> pd.Series:
+    """Convert a datetime Series (any resolution) to integer epoch milliseconds"""
+    return (timestamps - pd.Timestamp('1970-01-01')) // pd.Timedelta(milliseconds=1)
+
+
+class CandleStore:
+    """On-disk OHLCV candles keyed by (symbol, timeframe, candle open time)"""
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self.lock = threading.Lock()
+        self.connection = sqlite3.connect(db_path, check_same_thread=False)
+        # Candles can always be refetched, so favour cheap commits over durability
+        self.connection.execute('PRAGMA journal_mode=WAL')
+        self.connection.execute('PRAGMA synchronous=NORMAL')
+        self.connection.execute('''
+            CREATE TABLE IF NOT EXISTS candles (
+                symbol TEXT NOT NULL,
+                timeframe TEXT NOT NULL,
+                timestamp INTEGER NOT NULL,
+                open REAL NOT NULL,
+                high REAL NOT NULL,
+                low REAL NOT NULL,
+                close REAL NOT NULL,
+                volume REAL,
+                PRIMARY KEY (symbol, timeframe, timestamp)
+            ) WITHOUT ROWID
+        ''')
+        # Open time of the oldest candle the exchange has, for series listed within the lookback
+        self.connection.execute('''
+            CREATE TABLE IF NOT EXISTS history_start (
+                symbol TEXT NOT NULL,
+                timeframe TEXT NOT NULL,
+                timestamp INTEGER NOT NULL,
+                PRIMARY KEY (symbol, timeframe)
+            ) WITHOUT ROWID
+        ''')
+        self.connection.commit()
+
+    def get_time_range(self, symbol: str, timeframe: str) -> Tuple[Optional[int], Optional[int]]:
+        """Get the open times (epoch ms) of the oldest and newest stored candles"""
+        with self.lock:
+            row = self.connection.execute(
+                'SELECT MIN(timestamp), MAX(timestamp) FROM candles WHERE symbol = ? AND timeframe = ?',
+                (symbol, timeframe)
+            ).fetchone()
+        if not row or row[0] is None:
+            return None, None
+        return int(row[0]), int(row[1])
+
+    def get_history_start(self, symbol: str, timeframe: str) -> Optional[int]:
+        """Get the open time (epoch ms) of the oldest candle the exchange has, if a backfill found it"""
+        with self.lock:
+            row = self.connection.execute(
+                'SELECT timestamp FROM history_start WHERE symbol = ? AND timeframe = ?',
+                (symbol, timeframe)
+            ).fetchone()
+        return int(row[0]) if row else None
+
+    def set_history_start(self, symbol: str, timeframe: str, timestamp: int):
+        with self.lock:
+            self.connection.execute(
+                'INSERT OR REPLACE INTO history_start (symbol, timeframe, timestamp) VALUES (?, ?, ?)',
+                (symbol, timeframe, timestamp)
+            )
+            self.connection.commit()
+
+    def upsert(self, symbol: str, timeframe: str, df: pd.DataFrame) -> int:
+        """Merge candles into the store; a re-fetched candle replaces the stored one"""
+        if df is None or df.empty:
+            return 0
+
+        timestamps = df['timestamp']
+        if pd.api.types.is_datetime64_any_dtype(timestamps):
+            timestamps = to_epoch_ms(timestamps)
+
+        rows = list(zip(
+            [symbol] * len(df), [timeframe] * len(df), timestamps.astype('int64').tolist(),
+            df['open'].astype(float).tolist(), df['high'].astype(float).tolist(),
+            df['low'].astype(float).tolist(), df['close'].astype(float).tolist(),
+            df['volume'].astype(float).tolist()
+        ))
+
+        with self.lock:
+            self.connection.executemany('''
+                INSERT OR REPLACE INTO candles
+                (symbol, timeframe, timestamp, open, high, low, close, volume)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ''', rows)
+            self.connection.commit()
+
+        return len(rows)
+
+    def load(self, symbol: str, timeframe: str, limit: int = 100) -> Optional[pd.DataFrame]:
+        """Load the newest `limit` candles in ascending time order"""
+        with self.lock:
+            rows = self.connection.execute('''
+                SELECT timestamp, open, high, low, close, volume FROM (
+                    SELECT timestamp, open, high, low, close, volume
+                    FROM candles
+                    WHERE symbol = ? AND timeframe = ?
+                    ORDER BY timestamp DESC
+                    LIMIT ?
+                ) ORDER BY timestamp ASC
+            ''', (symbol, timeframe, limit)).fetchall()
+
+        if not rows:
+            return None
+
+        df = pd.DataFrame(rows, columns=OHLCV_COLUMNS)
+        df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
+        return df
+
+    def prune(self, max_candles: int) -> int:
+        """Keep only the newest `max_candles` candles of every (symbol, timeframe) series"""
+        with self.lock:
+            cursor = self.connection.execute('''
+                DELETE FROM candles
+                WHERE (symbol, timeframe, timestamp) IN (
+                    SELECT symbol, timeframe, timestamp FROM (
+                        SELECT symbol, timeframe, timestamp,
+                               ROW_NUMBER() OVER (
+                                   PARTITION BY symbol, timeframe ORDER BY timestamp DESC
+                               ) AS row_num
+                        FROM candles
+                    ) WHERE row_num > ?
+                )
+            ''', (max_candles,))
+            self.connection.commit()
+            deleted = cursor.rowcount
+
+        if deleted:
+            logger.info(f"Pruned {deleted} old candles from {self.db_path}")
+        return deleted
+
+    def close(self):
+        with self.lock:
+            self.connection.close()
+
+
+def resample_ohlcv(df: pd.DataFrame, timeframe: str) -> pd.DataFrame:
+    """Aggregate ascending candles into a higher timeframe aligned to UTC epoch boundaries
+
+    Buckets line up with the exchange's own candles (4h at 00/04/08.. UTC, 1d at
+    00:00 UTC). The leading bucket is dropped when the source does not reach back
+    to its boundary; the trailing bucket is kept and is still forming, like the
+    newest candle the exchange returns.
+    """
+    if df is None or df.empty:
+        return df
+
+    timeframe_ms = timeframe_to_ms(timeframe)
+    timestamps = to_epoch_ms(df['timestamp'])
+    buckets = (timestamps // timeframe_ms * timeframe_ms).values
+
+    grouped = df.groupby(buckets, sort=True)
+    resampled = pd.DataFrame({
+        'open': grouped['open'].first(),
+        'high': grouped['high'].max(),
+        'low': grouped['low'].min(),
+        'close': grouped['close'].last(),
+        'volume': grouped['volume'].sum(),
+    })
+
+    if timestamps.iloc[0] != resampled.index[0]:
+        resampled = resampled.iloc[1:]
+
+    resampled.index = pd.to_datetime(resampled.index, unit='ms')
+    return resampled.rename_axis('timestamp').reset_index()[OHLCV_COLUMNS]
+
+
+def plan_fetch_since(first_timestamp: Optional[int], last_timestamp: Optional[int],
+                     timeframe: str, lookback: int, now_ms: int,
+                     history_start: Optional[int] = None) -> int:
+    """Pick the `since` (epoch ms) for an incremental fetch
+
+    The newest stored candle is requested again because it may still have been
+    forming when it was stored. Series that are missing or too old are
+    backfilled with a full lookback instead, as are series shorter than the
+    lookback unless they already reach back to history_start (the exchange
+    has nothing older).
+    """
+    timeframe_ms = timeframe_to_ms(timeframe)
+    backfill_since = (now_ms // timeframe_ms - (lookback - 1)) * timeframe_ms
+
+    if last_timestamp is None or last_timestamp < backfill_since:
+        return backfill_since
+    if first_timestamp > backfill_since and (history_start is None or first_timestamp > history_start):
+        return backfill_since
+    return last_timestamp
+
+
+def is_fetch_complete(fetched: int, newest_timestamp: int, page_limit: int,
+                      timeframe: str, now_ms: int) -> bool:
+    """Whether a paged fetch has caught up with the current candle"""
+    if fetched < page_limit:
+        return True
+    timeframe_ms = timeframe_to_ms(timeframe)
+    return newest_timestamp >= (now_ms // timeframe_ms) * timeframe_ms
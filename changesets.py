@@ -0,0 +1,246 @@
+# changesets.py - Append-only per-run changesets of the signals database
+"""Incremental publishing of trading_signals.db
+
+Every scheduler run writes one changeset: the rows it committed plus the
+retention it applied, as gzip-compressed JSON named by a sequence number.
+manifest.json lists the changesets that are still published and the
+sequence number of the published base database. The database records the
+last changeset it contains in changeset_state, so any copy of it can be
+brought up to date by applying the changesets after that number, in order.
+
+Deletes are replayed, not listed: a changeset carries the exact cutoffs
+(signal history `now`, indicator compaction timestamps) the scheduler used,
+and applying them to the same rows removes the same rows.
+"""
+import gzip
+import json
+import logging
+import os
+import sqlite3
+import time
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from db_storage import (CHANGESET_STATE_SCHEMA, INSERT_STATEMENTS, LATEST_TABLES, apply_signal_history_retention,
+                        compact_history_table, latest_insert_statement)
+from schema import SCHEMA_VERSION, migrate, schema_version
+
+logger = logging.getLogger(__name__)
+
+CHANGESET_FORMAT = 1
+MANIFEST_NAME = 'manifest.json'
+
+def changeset_file_name(seq: int) -> str:
+    return f"{seq:08d}.json.gz"
+
+
+def empty_manifest() -> Dict[str, Any]:
+    return {'format': CHANGESET_FORMAT, 'base_seq': 0, 'latest_seq': 0, 'changesets': []}
+
+
+def parse_manifest(data: bytes) -> Dict[str, Any]:
+    manifest = json.loads(data)
+    if manifest.get('format') != CHANGESET_FORMAT:
+        raise ValueError(f"Unsupported changeset format {manifest.get('format')}")
+    return manifest
+
+
+def load_manifest(changeset_dir: str) -> Dict[str, Any]:
+    """The manifest in changeset_dir, or an empty one if none was written yet"""
+    path = os.path.join(changeset_dir, MANIFEST_NAME)
+    if not os.path.exists(path):
+        return empty_manifest()
+    with open(path, 'rb') as f:
+        return parse_manifest(f.read())
+
+
+def save_manifest(changeset_dir: str, manifest: Dict[str, Any]):
+    path = os.path.join(changeset_dir, MANIFEST_NAME)
+    with open(f"{path}.tmp", 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=1)
+    os.replace(f"{path}.tmp", path)
+
+
+def applied_seq(connection: sqlite3.Connection) -> int:
+    """Sequence number of the last changeset contained in the database (0 if none)"""
+    try:
+        row = connection.execute('SELECT seq FROM changeset_state WHERE id = 1').fetchone()
+    except sqlite3.OperationalError:  # Database predates changesets
+        return 0
+    return row[0] if row else 0
+
+
+def set_applied_seq(connection: sqlite3.Connection, seq: int):
+    connection.execute(CHANGESET_STATE_SCHEMA)
+    connection.execute('INSERT OR REPLACE INTO changeset_state (id, seq) VALUES (1, ?)', (seq,))
+
+
+def json_value(value: Any) -> Any:
+    # numpy scalars and datetimes that slipped into a row
+    if hasattr(value, 'item'):
+        return value.item()
+    return str(value)
+
+
+def encode_changeset(changeset: Dict[str, Any]) -> bytes:
+    data = json.dumps(changeset, separators=(',', ':'), default=json_value).encode('utf-8')
+    return gzip.compress(data, mtime=0)
+
+
+def decode_changeset(data: bytes) -> Dict[str, Any]:
+    return json.loads(gzip.decompress(data))
+
+
+def write_changeset(changeset_dir: str, changeset: Dict[str, Any], retention: int = 200) -> int:
+    """Append a changeset to changeset_dir and the manifest; returns its sequence number
+
+    The file is written before the manifest lists it, so readers never see a
+    partial changeset. Only the newest `retention` changesets are kept, plus
+    every changeset after the base (needed to rebuild the current database
+    from the published one); clients further behind download the base again.
+    """
+    os.makedirs(changeset_dir, exist_ok=True)
+    manifest = load_manifest(changeset_dir)
+    seq = manifest['latest_seq'] + 1
+    changeset = dict(changeset, format=CHANGESET_FORMAT, seq=seq)
+
+    data = encode_changeset(changeset)
+    path = os.path.join(changeset_dir, changeset_file_name(seq))
+    with open(f"{path}.tmp", 'wb') as f:
+        f.write(data)
+    os.replace(f"{path}.tmp", path)
+
+    entries = manifest['changesets'] + [{
+        'seq': seq, 'file': changeset_file_name(seq), 'bytes': len(data), 'created': changeset.get('created'),
+    }]
+    keep_from = min(seq - max(1, retention) + 1, manifest['base_seq'] + 1)
+    for entry in entries:
+        if entry['seq'] < keep_from:
+            try:
+                os.remove(os.path.join(changeset_dir, entry['file']))
+            except OSError:
+                pass
+    manifest['changesets'] = [entry for entry in entries if entry['seq'] >= keep_from]
+    manifest['latest_seq'] = seq
+    save_manifest(changeset_dir, manifest)
+    return seq
+
+
+def rebase_due(manifest: Dict[str, Any], interval: int) -> bool:
+    """Whether `interval` changesets have accumulated on top of the published base"""
+    return manifest['latest_seq'] - manifest['base_seq'] >= max(1, interval)
+
+
+def rebase(changeset_dir: str) -> int:
+    """Record that the database now published as base contains every changeset; returns its seq"""
+    manifest = load_manifest(changeset_dir)
+    manifest['base_seq'] = manifest['latest_seq']
+    save_manifest(changeset_dir, manifest)
+    return manifest['base_seq']
+
+
+def pending_changesets(manifest: Dict[str, Any], seq: int) -> Optional[List[Dict[str, Any]]]:
+    """Manifest entries to apply to a database at `seq`, or None if they are no longer all published"""
+    if seq > manifest['latest_seq']:
+        return None
+    pending = [entry for entry in manifest['changesets'] if entry['seq'] > seq]
+    if [entry['seq'] for entry in pending] != list(range(seq + 1, manifest['latest_seq'] + 1)):
+        return None
+    return pending
+
+
+def apply_changeset(connection: sqlite3.Connection, changeset: Dict[str, Any]):
+    """Apply one changeset in a single transaction, in the order the scheduler wrote it"""
+    with connection:
+        for table, rows in changeset.get('rows', {}).items():
+            connection.executemany(INSERT_STATEMENTS[table], rows)
+            if table in LATEST_TABLES:
+                connection.executemany(latest_insert_statement(table), rows)
+
+        retention = changeset.get('signal_history_retention')
+        if retention:
+            apply_signal_history_retention(connection, retention['now'], retention['hourly_days'],
+                                           retention['max_days'])
+        for table, (raw_cutoff, max_cutoff) in changeset.get('compaction', {}).items():
+            compact_history_table(connection, table, raw_cutoff, max_cutoff)
+
+        metadata = changeset.get('dashboard_metadata')
+        if metadata:
+            connection.execute(
+                f"INSERT OR REPLACE INTO dashboard_metadata ({', '.join(metadata)}) "
+                f"VALUES ({', '.join('?' * len(metadata))})",
+                tuple(metadata.values())
+            )
+        set_applied_seq(connection, changeset['seq'])
+
+
+def sync_database(connection: sqlite3.Connection, fetch: Callable[[str], Optional[bytes]]) -> Optional[int]:
+    """Bring a database up to date with the published changesets
+
+    fetch(name) returns the bytes of the manifest or of a changeset file, or
+    None if it can't be read. Returns the number of changesets applied, or
+    None when the database can't be brought up to date this way (manifest
+    unreachable, changesets already rotated out, or the database is ahead of
+    the manifest) and the full database should be downloaded instead.
+    """
+    data = fetch(MANIFEST_NAME)
+    if data is None:
+        return None
+    manifest = parse_manifest(data)
+
+    seq = applied_seq(connection)
+    pending = pending_changesets(manifest, seq)
+    if pending is None:
+        logger.info(f"Database at changeset {seq} can't be updated incrementally "
+                    f"(published: {manifest['changesets'][0]['seq'] if manifest['changesets'] else '-'}"
+                    f"..{manifest['latest_seq']})")
+        return None
+
+    for entry in pending:
+        data = fetch(entry['file'])
+        if data is None:
+            logger.warning(f"Changeset {entry['file']} is missing")
+            return None
+        changeset = decode_changeset(data)
+        # Rows written after a schema change need the tables the change added
+        if changeset.get('schema_version', 0) > schema_version(connection):
+            migrate(connection, changeset['schema_version'])
+        apply_changeset(connection, changeset)
+    return len(pending)
+
+
+def local_fetcher(changeset_dir: str) -> Callable[[str], Optional[bytes]]:
+    """fetch() for sync_database reading from a local changeset directory"""
+    def fetch(name: str) -> Optional[bytes]:
+        path = os.path.join(changeset_dir, name)
+        if not os.path.exists(path):
+            return None
+        with open(path, 'rb') as f:
+            return f.read()
+    return fetch
+
+
+def new_changeset(rows: Optional[Dict[str, List[Tuple]]] = None, **operations: Any) -> Dict[str, Any]:
+    """A changeset dict stamped with the current time; `operations` are the optional
+    signal_history_retention, compaction and dashboard_metadata entries"""
+    changeset = {'created': time.strftime("%Y-%m-%d %H:%M:%S"), 'schema_version': SCHEMA_VERSION, 'rows': rows or {}}
+    changeset.update({name: value for name, value in operations.items() if value})
+    return changeset
+
+
+def publish_changeset(connection: sqlite3.Connection, changeset_dir: str, changeset: Dict[str, Any],
+                      retention: int = 200) -> int:
+    """Write a changeset and record its sequence number in the database it was taken from
+
+    Raises ValueError if the database is not at the manifest's latest
+    changeset, since the new changeset would then not apply on top of it.
+    """
+    seq = applied_seq(connection)
+    latest_seq = load_manifest(changeset_dir)['latest_seq']
+    if seq != latest_seq:
+        raise ValueError(f"Database is at changeset {seq} but {changeset_dir} is at {latest_seq}; "
+                         f"remove {changeset_dir} to start a new changeset chain")
+
+    seq = write_changeset(changeset_dir, changeset, retention)
+    with connection:
+        set_applied_seq(connection, seq)
+    return seq
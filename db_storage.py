@@ -0,0 +1,694 @@
+# db_storage.py - Signals database storage: WAL connections, checkpoints and batched writes
+import gzip
+import logging
+import os
+import queue
+import shutil
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+# How long a connection waits for a lock held by another process before failing
+DEFAULT_BUSY_TIMEOUT_MS = 10000
+# WAL pages after which a commit triggers SQLite's own passive checkpoint
+DEFAULT_WAL_AUTOCHECKPOINT = 1000
+# WAL size beyond which WalCheckpointer truncates the log
+DEFAULT_WAL_MAX_BYTES = 64 * 1024 * 1024
+
+# Signal history keeps one point per symbol and hour for this many days, then one per day
+HISTORY_HOURLY_DAYS = 7
+HISTORY_MAX_DAYS = 365
+
+# Compaction retention per indicator history table: (raw_days, max_days). Rows
+# newer than raw_days are kept as written, older ones thinned to the newest row
+# per symbol and day, and rows older than max_days dropped.
+DEFAULT_COMPACTION_POLICIES = {
+    'fibonacci_1h': '7/90',
+    'polynomial_regression_daily': '7/365',
+    'hvts_forecast': '7/365',
+}
+
+# Append-only signal history. The (symbol, ts) primary key is the clustered
+# WITHOUT ROWID b-tree, so "history of symbol X" is an index-only range scan;
+# the ts index serves retention.
+SIGNAL_HISTORY_SCHEMA = [
+    '''
+    CREATE TABLE IF NOT EXISTS signal_history (
+        symbol TEXT NOT NULL,
+        ts INTEGER NOT NULL,
+        overall_signal TEXT NOT NULL,
+        pivot_zone TEXT NOT NULL,
+        current_price REAL NOT NULL,
+        rsi REAL,
+        rsi_signal TEXT,
+        macd_signal TEXT,
+        poly_signal TEXT,
+        bullish_count INTEGER,
+        bearish_count INTEGER,
+        forecast_1d REAL,
+        forecast_30d REAL,
+        PRIMARY KEY (symbol, ts)
+    ) WITHOUT ROWID
+    ''',
+    'CREATE INDEX IF NOT EXISTS idx_signal_history_ts ON signal_history(ts)',
+]
+
+# Sequence number of the last changeset a database file contains (see changesets.py)
+CHANGESET_STATE_SCHEMA = '''
+    CREATE TABLE IF NOT EXISTS changeset_state (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        seq INTEGER NOT NULL
+    )
+'''
+
+
+def connect_database(db_path: str, busy_timeout_ms: int = DEFAULT_BUSY_TIMEOUT_MS,
+                     wal_autocheckpoint: int = DEFAULT_WAL_AUTOCHECKPOINT,
+                     check_same_thread: bool = True) -> sqlite3.Connection:
+    """Open the signals database in WAL mode
+
+    WAL lets the dashboard read while the scheduler writes, and with WAL
+    synchronous=NORMAL only syncs at checkpoints. busy_timeout makes writers
+    and checkpoints wait for each other instead of failing with "database is
+    locked". Falls back to the default journal if WAL can't be enabled
+    (in-memory or read-only databases).
+    """
+    connection = sqlite3.connect(db_path, timeout=busy_timeout_ms / 1000, check_same_thread=check_same_thread)
+    connection.execute(f'PRAGMA busy_timeout={int(busy_timeout_ms)}')
+    try:
+        journal_mode = connection.execute('PRAGMA journal_mode=WAL').fetchone()[0]
+    except sqlite3.OperationalError as e:
+        logger.warning(f"Could not enable WAL for {db_path}: {str(e)}")
+        journal_mode = None
+
+    if journal_mode == 'wal':
+        connection.execute('PRAGMA synchronous=NORMAL')
+        connection.execute(f'PRAGMA wal_autocheckpoint={int(wal_autocheckpoint)}')
+    return connection
+
+
+def checkpoint(connection: sqlite3.Connection, mode: str = 'PASSIVE') -> Optional[Tuple[int, int, int]]:
+    """Run a WAL checkpoint; returns (busy, wal_pages, checkpointed_pages) or None on error
+
+    PASSIVE copies what it can without waiting for readers; TRUNCATE waits
+    (up to busy_timeout) for readers to finish, then empties the WAL file.
+    """
+    mode = mode.upper()
+    if mode not in ('PASSIVE', 'FULL', 'RESTART', 'TRUNCATE'):
+        raise ValueError(f"Unknown checkpoint mode '{mode}'")
+    try:
+        return tuple(connection.execute(f'PRAGMA wal_checkpoint({mode})').fetchone())
+    except sqlite3.Error as e:
+        logger.warning(f"WAL checkpoint ({mode}) failed: {str(e)}")
+        return None
+
+
+def wal_size(db_path: str) -> int:
+    """Size of the database's WAL file in bytes (0 when there is none)"""
+    try:
+        return os.path.getsize(f"{db_path}-wal")
+    except OSError:
+        return 0
+
+
+class WalCheckpointer:
+    """Background thread that keeps the WAL of a database bounded
+
+    Every `interval` seconds it runs a PASSIVE checkpoint, which never blocks
+    the scheduler or the dashboard. When the WAL file has still grown past
+    `max_wal_bytes` (e.g. a reader kept old pages pinned) it runs a TRUNCATE
+    checkpoint to shrink it back to zero.
+    """
+
+    def __init__(self, db_path: str, interval: float = 60.0, max_wal_bytes: int = DEFAULT_WAL_MAX_BYTES,
+                 busy_timeout_ms: int = DEFAULT_BUSY_TIMEOUT_MS):
+        self.db_path = db_path
+        self.interval = interval
+        self.max_wal_bytes = max_wal_bytes
+        self.busy_timeout_ms = busy_timeout_ms
+        self.stop_event = threading.Event()
+        self.thread: Optional[threading.Thread] = None
+
+    def start(self):
+        if self.thread is None or not self.thread.is_alive():
+            self.stop_event.clear()
+            self.thread = threading.Thread(target=self.run, name='wal-checkpointer', daemon=True)
+            self.thread.start()
+
+    def stop(self):
+        self.stop_event.set()
+        if self.thread is not None:
+            self.thread.join()
+            self.thread = None
+
+    def run(self):
+        connection = connect_database(self.db_path, self.busy_timeout_ms)
+        try:
+            while not self.stop_event.wait(self.interval):
+                self.checkpoint_once(connection)
+        finally:
+            connection.close()
+
+    def checkpoint_once(self, connection: sqlite3.Connection):
+        checkpoint(connection, 'PASSIVE')
+        size = wal_size(self.db_path)
+        if size > self.max_wal_bytes:
+            logger.info(f"WAL is {size / 1024 / 1024:.1f} MB, truncating")
+            checkpoint(connection, 'TRUNCATE')
+
+
+# Insert statement per table, in the order the rows of a symbol are written
+INSERT_STATEMENTS = {
+    'polynomial_regression_daily': '''
+        INSERT OR REPLACE INTO polynomial_regression_daily
+        (symbol, current_price, poly_regression_value, poly_signal_daily, poly_confidence,
+         r_squared, trend_strength, support_level, resistance_level,
+         forecast_1d, forecast_7d, forecast_30d, timestamp)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ''',
+    'hvts_forecast': '''
+        INSERT OR REPLACE INTO hvts_forecast
+        (symbol, current_price, forecast_1d, forecast_7d, forecast_14d, forecast_30d, poly_signal, poly_emoji, timestamp)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ''',
+    'fibonacci_1h': '''
+        INSERT OR REPLACE INTO fibonacci_1h
+        (symbol, current_price, fib_level_0, fib_level_23_6, fib_level_38_2, fib_level_50,
+         fib_level_61_8, fib_level_78_6, fib_level_100, fib_level_127_2, fib_level_161_8,
+         fib_level_261_8, fib_level_423_6, fib_1h_signal, pivot_zone, timestamp)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ''',
+    'trading_signals': '''
+        INSERT OR REPLACE INTO trading_signals
+        (symbol, current_price, poly_1h_signal, fib_15m_signal, fib_signal,
+         poly_signal, rsi_zone, macd_signal, pivot_zone, overall_signal,
+         forecast_1h, forecast_1d, forecast_7d, forecast_14d, forecast_30d, timestamp)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ''',
+    'signal_state': '''
+        INSERT OR REPLACE INTO signal_state
+        (symbol, extreme_discount, accumulation_upper, reversal_zone, strong_support,
+         fib_level_38_2, fib_level_61_8, forecast_1h, forecast_1d,
+         rsi_signal, macd_signal, timestamp)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ''',
+    'signal_history': '''
+        INSERT OR REPLACE INTO signal_history
+        (symbol, ts, overall_signal, pivot_zone, current_price, rsi, rsi_signal, macd_signal,
+         poly_signal, bullish_count, bearish_count, forecast_1d, forecast_30d)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    ''',
+}
+
+
+# Latest row per symbol of each indicator history table, upserted in the same
+# transaction as the history insert so the dashboard reads O(symbols) rows
+LATEST_TABLES = {
+    'polynomial_regression_daily': 'polynomial_regression_daily_latest',
+    'hvts_forecast': 'hvts_forecast_latest',
+    'fibonacci_1h': 'fibonacci_1h_latest',
+}
+
+LATEST_TABLE_SCHEMA = {
+    'polynomial_regression_daily_latest': '''
+        CREATE TABLE IF NOT EXISTS polynomial_regression_daily_latest (
+            symbol TEXT PRIMARY KEY,
+            current_price REAL NOT NULL,
+            poly_regression_value REAL NOT NULL,
+            poly_signal_daily TEXT NOT NULL,
+            poly_confidence REAL NOT NULL,
+            r_squared REAL NOT NULL,
+            trend_strength REAL NOT NULL,
+            support_level REAL NOT NULL,
+            resistance_level REAL NOT NULL,
+            forecast_1d REAL NOT NULL,
+            forecast_7d REAL NOT NULL,
+            forecast_30d REAL NOT NULL,
+            timestamp DATETIME NOT NULL
+        ) WITHOUT ROWID
+    ''',
+    'hvts_forecast_latest': '''
+        CREATE TABLE IF NOT EXISTS hvts_forecast_latest (
+            symbol TEXT PRIMARY KEY,
+            current_price REAL NOT NULL,
+            forecast_1d REAL NOT NULL,
+            forecast_7d REAL NOT NULL,
+            forecast_14d REAL NOT NULL,
+            forecast_30d REAL NOT NULL,
+            poly_signal TEXT NOT NULL,
+            poly_emoji TEXT NOT NULL,
+            timestamp DATETIME NOT NULL
+        ) WITHOUT ROWID
+    ''',
+    'fibonacci_1h_latest': '''
+        CREATE TABLE IF NOT EXISTS fibonacci_1h_latest (
+            symbol TEXT PRIMARY KEY,
+            current_price REAL NOT NULL,
+            fib_level_0 REAL NOT NULL,
+            fib_level_23_6 REAL NOT NULL,
+            fib_level_38_2 REAL NOT NULL,
+            fib_level_50 REAL NOT NULL,
+            fib_level_61_8 REAL NOT NULL,
+            fib_level_78_6 REAL NOT NULL,
+            fib_level_100 REAL NOT NULL,
+            fib_level_127_2 REAL,
+            fib_level_161_8 REAL,
+            fib_level_261_8 REAL,
+            fib_level_423_6 REAL,
+            fib_1h_signal TEXT NOT NULL,
+            pivot_zone TEXT NOT NULL,
+            timestamp DATETIME NOT NULL
+        ) WITHOUT ROWID
+    ''',
+}
+
+
+def latest_insert_statement(table: str) -> str:
+    return INSERT_STATEMENTS[table].replace(f'INTO {table}', f'INTO {LATEST_TABLES[table]}', 1)
+
+
+def create_latest_tables(connection: sqlite3.Connection):
+    """Create the *_latest tables, filling new ones from the existing history"""
+    for table, latest_table in LATEST_TABLES.items():
+        exists = connection.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (latest_table,)
+        ).fetchone()
+        connection.execute(LATEST_TABLE_SCHEMA[latest_table])
+        if exists:
+            continue
+
+        columns = [row[1] for row in connection.execute(f'PRAGMA table_info({latest_table})')]
+        # Newest row per symbol; ties on timestamp go to the last inserted row
+        connection.execute(f'''
+            INSERT OR REPLACE INTO {latest_table} ({', '.join(columns)})
+            SELECT {', '.join(columns)} FROM {table}
+            WHERE id IN (
+                SELECT MAX(id) FROM {table} AS h
+                WHERE timestamp = (SELECT MAX(timestamp) FROM {table} WHERE symbol = h.symbol)
+                GROUP BY symbol
+            )
+        ''')
+
+
+def downsample_signal_history(connection: sqlite3.Connection, start: int, end: int, bucket_seconds: int) -> int:
+    """Keep only the newest point per symbol and time bucket among points with start <= ts < end"""
+    cursor = connection.execute('''
+        DELETE FROM signal_history
+        WHERE ts >= ? AND ts < ? AND EXISTS (
+            SELECT 1 FROM signal_history AS newer
+            WHERE newer.symbol = signal_history.symbol
+              AND newer.ts > signal_history.ts
+              AND newer.ts < (signal_history.ts / ? + 1) * ?
+        )
+    ''', (start, end, bucket_seconds, bucket_seconds))
+    return cursor.rowcount
+
+
+def prune_signal_history(connection: sqlite3.Connection, now: int, hourly_days: int = HISTORY_HOURLY_DAYS,
+                         max_days: int = HISTORY_MAX_DAYS) -> int:
+    """Apply the history retention policy; returns the number of points removed
+
+    Points from the last `hourly_days` days are thinned to one per symbol and
+    hour, older points to one per symbol and day, and points older than
+    `max_days` are dropped, so storage stays bounded by symbols x
+    (24 x hourly_days + max_days) rows.
+    """
+    with connection:
+        return apply_signal_history_retention(connection, now, hourly_days, max_days)
+
+
+def apply_signal_history_retention(connection: sqlite3.Connection, now: int, hourly_days: int,
+                                   max_days: int) -> int:
+    """prune_signal_history without its own transaction, for callers that already hold one"""
+    hourly_cutoff = now - hourly_days * 86400
+    removed = connection.execute('DELETE FROM signal_history WHERE ts < ?', (now - max_days * 86400,)).rowcount
+    removed += downsample_signal_history(connection, hourly_cutoff, now + 1, 3600)
+    removed += downsample_signal_history(connection, 0, hourly_cutoff, 86400)
+    return removed
+
+
+def load_signal_history(connection: sqlite3.Connection, symbol: str, start: Optional[int] = None,
+                        end: Optional[int] = None) -> pd.DataFrame:
+    """Signal history of one symbol between epoch seconds `start` and `end`, oldest first"""
+    query = 'SELECT * FROM signal_history WHERE symbol = ? AND ts >= ? AND ts <= ? ORDER BY ts'
+    df = pd.read_sql_query(query, connection, params=(symbol, start or 0, end if end is not None else 2 ** 62))
+    df['timestamp'] = pd.to_datetime(df['ts'], unit='s')
+    return df
+
+
+class BatchWriter:
+    """Buffers rows for the signal tables and writes them over one connection
+
+    Rows are queued with add() and written with executemany in a single
+    transaction once `flush_size` symbols are buffered (see end_symbol), or
+    when flush() is called. If a batch fails, its rows are retried one by one
+    so a single bad row only loses itself. With record_changes, committed rows
+    are also kept until take_changes() so they can be published as a
+    changeset (see changesets.py).
+    """
+
+    def __init__(self, db_path: str, flush_size: int = 50, busy_timeout_ms: int = DEFAULT_BUSY_TIMEOUT_MS,
+                 record_changes: bool = False):
+        self.db_path = db_path
+        self.flush_size = max(1, flush_size)
+        self.busy_timeout_ms = busy_timeout_ms
+        self.record_changes = record_changes
+        self.connection: Optional[sqlite3.Connection] = None
+        self.buffers: Dict[str, List[Tuple]] = {table: [] for table in INSERT_STATEMENTS}
+        self.changes: Dict[str, List[Tuple]] = {}
+        self.buffered_symbols = 0
+        self.reset_stats()
+
+    def reset_stats(self):
+        self.rows_written = 0
+        self.transactions = 0
+        self.failed_rows = 0
+
+    def connect(self) -> sqlite3.Connection:
+        if self.connection is None:
+            self.connection = connect_database(self.db_path, self.busy_timeout_ms)
+        return self.connection
+
+    def add(self, table: str, row: Tuple):
+        """Queue one row for `table` (a key of INSERT_STATEMENTS)"""
+        self.buffers[table].append(row)
+
+    def end_symbol(self):
+        """Mark the rows of one symbol as complete, flushing every `flush_size` symbols"""
+        self.buffered_symbols += 1
+        if self.buffered_symbols >= self.flush_size:
+            self.flush()
+
+    def pending_rows(self) -> int:
+        return sum(len(rows) for rows in self.buffers.values())
+
+    def request_flush(self):
+        """Write buffered rows now (BackgroundWriter does this without waiting)"""
+        self.flush()
+
+    def flush(self) -> int:
+        """Write all buffered rows in one transaction; returns the number of rows written"""
+        batches = [(table, rows) for table, rows in self.buffers.items() if rows]
+        self.buffers = {table: [] for table in INSERT_STATEMENTS}
+        self.buffered_symbols = 0
+        if not batches:
+            return 0
+
+        connection = self.connect()
+        try:
+            with connection:
+                for table, rows in batches:
+                    connection.executemany(INSERT_STATEMENTS[table], rows)
+                    if table in LATEST_TABLES:
+                        connection.executemany(latest_insert_statement(table), rows)
+            written = sum(len(rows) for _, rows in batches)
+            self.transactions += 1
+            for table, rows in batches:
+                self.record(table, rows)
+        except sqlite3.Error as e:
+            logger.error(f"Batch write of {sum(len(rows) for _, rows in batches)} rows failed, "
+                         f"retrying row by row: {str(e)}")
+            written = self.write_rows_individually(batches)
+
+        self.rows_written += written
+        return written
+
+    def write_rows_individually(self, batches: List[Tuple[str, List[Tuple]]]) -> int:
+        connection = self.connect()
+        written = 0
+        for table, rows in batches:
+            for row in rows:
+                try:
+                    with connection:
+                        connection.execute(INSERT_STATEMENTS[table], row)
+                        if table in LATEST_TABLES:
+                            connection.execute(latest_insert_statement(table), row)
+                    written += 1
+                    self.transactions += 1
+                    self.record(table, [row])
+                except sqlite3.Error as e:
+                    self.failed_rows += 1
+                    logger.error(f"Error saving {table} row for {row[0]}: {str(e)}")
+        return written
+
+    def record(self, table: str, rows: List[Tuple]):
+        if self.record_changes:
+            self.changes.setdefault(table, []).extend(rows)
+
+    def take_changes(self) -> Dict[str, List[Tuple]]:
+        """Flush, then return and forget the rows committed since the last call"""
+        self.flush()
+        changes, self.changes = self.changes, {}
+        return changes
+
+    def checkpoint(self, mode: str = 'TRUNCATE') -> Optional[Tuple[int, int, int]]:
+        """Flush, then checkpoint the WAL into the main database file"""
+        self.flush()
+        return checkpoint(self.connect(), mode)
+
+    def prune_signal_history(self, now: int, hourly_days: int = HISTORY_HOURLY_DAYS,
+                             max_days: int = HISTORY_MAX_DAYS) -> int:
+        """Flush, then apply the signal history retention policy (see prune_signal_history)"""
+        self.flush()
+        return prune_signal_history(self.connect(), now, hourly_days, max_days)
+
+    def log_stats(self):
+        logger.info(f"Persisted {self.rows_written} rows in {self.transactions} transactions"
+                    f"{f' ({self.failed_rows} failed)' if self.failed_rows else ''}")
+
+    def close(self):
+        """Flush what is left and close the connection"""
+        self.flush()
+        if self.connection is not None:
+            self.connection.close()
+            self.connection = None
+
+
+class BackgroundWriter:
+    """Write-behind wrapper running a BatchWriter on its own thread
+
+    add() and end_symbol() only put items on a bounded queue, so callers never
+    wait on disk I/O unless the queue is full (backpressure). The thread owns
+    the connection and writes in batches of `flush_size` symbols. flush(),
+    checkpoint() and close() wait until everything queued before them is
+    written. Same interface as BatchWriter.
+    """
+
+    def __init__(self, db_path: str, flush_size: int = 50, queue_size: int = 1000,
+                 busy_timeout_ms: int = DEFAULT_BUSY_TIMEOUT_MS, record_changes: bool = False):
+        self.writer = BatchWriter(db_path, flush_size, busy_timeout_ms, record_changes)
+        self.queue: queue.Queue = queue.Queue(maxsize=max(1, queue_size))
+        self.backpressure_waits = 0
+        self.thread = threading.Thread(target=self.run, name='db-writer', daemon=True)
+        self.thread.start()
+
+    def put(self, item: Tuple):
+        try:
+            self.queue.put_nowait(item)
+        except queue.Full:
+            # Writer is behind: block the producer until it catches up
+            self.backpressure_waits += 1
+            self.queue.put(item)
+
+    def add(self, table: str, row: Tuple):
+        self.put(('row', table, row))
+
+    def end_symbol(self):
+        self.put(('end_symbol',))
+
+    def submit(self, function: Callable[[BatchWriter], Any]) -> Future:
+        """Run function(batch_writer) on the writer thread after the items queued so far"""
+        future = Future()
+        if not self.thread.is_alive():
+            future.set_exception(RuntimeError("Background writer is closed"))
+        else:
+            self.put(('call', function, future))
+        return future
+
+    def request_flush(self):
+        self.submit(lambda writer: writer.flush())
+
+    def flush(self) -> int:
+        return self.submit(lambda writer: writer.flush()).result()
+
+    def checkpoint(self, mode: str = 'TRUNCATE') -> Optional[Tuple[int, int, int]]:
+        return self.submit(lambda writer: writer.checkpoint(mode)).result()
+
+    def prune_signal_history(self, now: int, hourly_days: int = HISTORY_HOURLY_DAYS,
+                             max_days: int = HISTORY_MAX_DAYS) -> int:
+        return self.submit(lambda writer: writer.prune_signal_history(now, hourly_days, max_days)).result()
+
+    def take_changes(self) -> Dict[str, List[Tuple]]:
+        return self.submit(lambda writer: writer.take_changes()).result()
+
+    def reset_stats(self):
+        self.backpressure_waits = 0
+        self.submit(lambda writer: writer.reset_stats()).result()
+
+    def log_stats(self):
+        self.submit(lambda writer: writer.log_stats()).result()
+        if self.backpressure_waits:
+            logger.info(f"Write queue was full {self.backpressure_waits} times (raise DB_WRITE_QUEUE_SIZE)")
+
+    def close(self):
+        """Write everything still queued, then stop the thread and close the connection"""
+        if self.thread.is_alive():
+            self.put(('stop',))
+            self.thread.join()
+
+    def run(self):
+        while True:
+            item = self.queue.get()
+            kind = item[0]
+            if kind == 'stop':
+                try:
+                    self.writer.close()
+                except Exception as e:
+                    logger.error(f"Background writer error on close: {str(e)}")
+                return
+
+            try:
+                if kind == 'row':
+                    self.writer.add(item[1], item[2])
+                elif kind == 'end_symbol':
+                    self.writer.end_symbol()
+                elif kind == 'call':
+                    function, future = item[1], item[2]
+                    try:
+                        future.set_result(function(self.writer))
+                    except Exception as e:
+                        future.set_exception(e)
+            except Exception as e:
+                logger.error(f"Background writer error: {str(e)}")
+
+
+def parse_retention(value: str) -> Tuple[int, int]:
+    """Parse a "raw_days/max_days" retention string such as "7/90" """
+    try:
+        raw_part, max_part = value.split('/', 1)
+        raw_days = int(raw_part.strip())
+        max_days = int(max_part.strip())
+    except (AttributeError, ValueError):
+        raise ValueError(f"Invalid retention '{value}', expected format 'raw_days/max_days' (e.g. 7/90)")
+
+    if raw_days < 0 or max_days < raw_days:
+        raise ValueError(f"Invalid retention '{value}', need 0 <= raw_days <= max_days")
+
+    return raw_days, max_days
+
+
+def compaction_policies_from_env() -> Dict[str, Tuple[int, int]]:
+    """Read COMPACT_<TABLE> overrides (format: raw_days/max_days) over the defaults"""
+    return {
+        table: parse_retention(os.getenv(f'COMPACT_{table.upper()}', default))
+        for table, default in DEFAULT_COMPACTION_POLICIES.items()
+    }
+
+
+def compaction_cutoffs(policies: Dict[str, Tuple[int, int]], now: Optional[float] = None) -> Dict[str, Tuple[str, str]]:
+    """Turn (raw_days, max_days) policies into (raw_cutoff, max_cutoff) timestamps per table
+
+    Indicator tables store local "YYYY-MM-DD HH:MM:SS" timestamps, which sort
+    as text, so the cutoffs are formatted the same way.
+    """
+    now = time.time() if now is None else now
+    return {
+        table: (time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now - raw_days * 86400)),
+                time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(now - max_days * 86400)))
+        for table, (raw_days, max_days) in policies.items()
+    }
+
+
+def compact_history_table(connection: sqlite3.Connection, table: str, raw_cutoff: str, max_cutoff: str) -> int:
+    """Apply one table's retention cutoffs (see compaction_cutoffs); returns the number of rows removed"""
+    removed = connection.execute(f'DELETE FROM {table} WHERE timestamp < ?', (max_cutoff,)).rowcount
+    removed += connection.execute(f'''
+        DELETE FROM {table}
+        WHERE timestamp < ? AND EXISTS (
+            SELECT 1 FROM {table} AS newer
+            WHERE newer.symbol = {table}.symbol
+              AND substr(newer.timestamp, 1, 10) = substr({table}.timestamp, 1, 10)
+              AND newer.timestamp > {table}.timestamp
+        )
+    ''', (raw_cutoff,)).rowcount
+    return removed
+
+
+def database_size(db_path: str) -> int:
+    """Size of the database file plus its WAL in bytes"""
+    return os.path.getsize(db_path) + wal_size(db_path)
+
+
+def gzip_database(db_path: str, out_path: Optional[str] = None) -> str:
+    """Write a gzip-compressed copy of a checkpointed database for download; returns its path"""
+    out_path = out_path or f"{db_path}.gz"
+    with open(db_path, 'rb') as source, open(f"{out_path}.tmp", 'wb') as raw:
+        # mtime=0 keeps the bytes identical for identical databases
+        with gzip.GzipFile(fileobj=raw, mode='wb', mtime=0) as target:
+            shutil.copyfileobj(source, target, 1024 * 1024)
+    os.replace(f"{out_path}.tmp", out_path)
+    return out_path
+
+
+def compact_database(db_path: str, policies: Optional[Dict[str, Tuple[int, int]]] = None,
+                     history_hourly_days: int = HISTORY_HOURLY_DAYS, history_max_days: int = HISTORY_MAX_DAYS,
+                     busy_timeout_ms: int = DEFAULT_BUSY_TIMEOUT_MS) -> Dict[str, Any]:
+    """Prune history per policy, rebuild indexes and VACUUM INTO a fresh file that replaces db_path
+
+    Meant to run while nothing else has the database open: the compacted copy
+    is swapped in with os.replace, and sqlite3.OperationalError is raised
+    instead when the WAL can't be emptied or another connection still holds it.
+    Returns the rows removed per table, the file sizes before and after, and
+    the cutoffs and history `now` used, so the same pruning can be replayed
+    elsewhere (see changesets.py).
+    """
+    policies = policies if policies is not None else compaction_policies_from_env()
+    now = int(time.time())
+    cutoffs = compaction_cutoffs(policies, now)
+    size_before = database_size(db_path)
+    compact_path = f"{db_path}.compact"
+    if os.path.exists(compact_path):
+        os.remove(compact_path)
+
+    connection = connect_database(db_path, busy_timeout_ms)
+    try:
+        tables = {row[0] for row in connection.execute("SELECT name FROM sqlite_master WHERE type = 'table'")}
+        removed = {}
+        with connection:
+            for table, (raw_cutoff, max_cutoff) in cutoffs.items():
+                if table in tables:
+                    removed[table] = compact_history_table(connection, table, raw_cutoff, max_cutoff)
+        if 'signal_history' in tables:
+            removed['signal_history'] = prune_signal_history(connection, now, history_hourly_days,
+                                                             history_max_days)
+
+        connection.execute('REINDEX')
+        connection.commit()
+        # A reader holding the WAL would leave frames behind that SQLite replays onto the new file
+        result = checkpoint(connection, 'TRUNCATE')
+        if result != (0, 0, 0):
+            raise sqlite3.OperationalError(f"WAL checkpoint of {db_path} was blocked ({result}), "
+                                           f"close other connections and retry")
+        connection.execute('VACUUM INTO ?', (compact_path,))
+    finally:
+        connection.close()
+
+    # Closing the last connection removes -wal and -shm; if they are still there, someone else has it open
+    leftovers = [path for path in (f"{db_path}-wal", f"{db_path}-shm") if os.path.exists(path)]
+    if leftovers:
+        os.remove(compact_path)
+        raise sqlite3.OperationalError(f"{', '.join(leftovers)} still exist, another connection has "
+                                       f"{db_path} open; not replacing it")
+    os.replace(compact_path, db_path)
+
+    size_after = database_size(db_path)
+    logger.info(f"Compacted {db_path}: {size_before / 1024:.1f} KB -> {size_after / 1024:.1f} KB, "
+                f"removed {sum(removed.values())} rows")
+    return {'removed': removed, 'size_before': size_before, 'size_after': size_after, 'cutoffs': cutoffs,
+            'now': now}
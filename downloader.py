@@ -0,0 +1,159 @@
+# downloader.py - Conditional HTTP downloads into a persistent local cache
+import json
+import logging
+import os
+import time
+import zlib
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+# GitHub's raw file CDN caches for about 5 minutes, so asking more often gains nothing
+DEFAULT_MAX_AGE = 300
+DEFAULT_CHUNK_SIZE = 1024 * 1024
+
+
+class CachedDownloader:
+    """Downloads files into cache_dir and reuses them while they are unchanged
+
+    A cached file younger than `max_age` seconds is used without any request.
+    Older ones are revalidated with If-None-Match / If-Modified-Since, so an
+    unchanged file costs one empty 304 response. Bodies are streamed to disk
+    in `chunk_size` pieces (decompressing gzip transfer encoding or a .gz
+    artifact on the way) and renamed into place, so memory use doesn't grow
+    with the file and readers never see a partial file.
+    """
+
+    def __init__(self, cache_dir: str, max_age: float = DEFAULT_MAX_AGE, timeout: float = 30,
+                 chunk_size: int = DEFAULT_CHUNK_SIZE):
+        self.cache_dir = cache_dir
+        self.max_age = max_age
+        self.timeout = timeout
+        self.chunk_size = chunk_size
+        self.session = requests.Session()
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def path(self, name: str) -> str:
+        return os.path.join(self.cache_dir, name)
+
+    def load_meta(self, name: str) -> Dict[str, Any]:
+        try:
+            with open(f"{self.path(name)}.meta.json", encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def save_meta(self, name: str, meta: Dict[str, Any]):
+        meta_path = f"{self.path(name)}.meta.json"
+        with open(f"{meta_path}.tmp", 'w', encoding='utf-8') as f:
+            json.dump(meta, f)
+        os.replace(f"{meta_path}.tmp", meta_path)
+
+    def fetch(self, url: str, name: str, gunzip: bool = False, immutable: bool = False) -> Tuple[Optional[str], str]:
+        """Make cache_dir/name an up-to-date copy of url; returns (path, status)
+
+        With gunzip, url is a gzip-compressed artifact stored decompressed.
+        With immutable, url never changes once published, so a cached copy is
+        used without revalidating it.
+        status is 'cached' (used without a request), 'not_modified',
+        'downloaded', 'missing' (the server has no such file) or 'failed'; the
+        path is None when there is no usable copy, and a stale copy is still
+        returned when the request fails.
+        """
+        path = self.path(name)
+        meta = self.load_meta(name) if os.path.exists(path) else {}
+        if meta.get('url') != url:
+            meta = {}
+
+        if meta and (immutable or time.time() - meta.get('checked', 0) < self.max_age):
+            return path, 'cached'
+
+        headers = {'Accept-Encoding': 'gzip, deflate'}
+        if meta.get('etag'):
+            headers['If-None-Match'] = meta['etag']
+        if meta.get('last_modified'):
+            headers['If-Modified-Since'] = meta['last_modified']
+
+        try:
+            with self.session.get(url, headers=headers, timeout=self.timeout, stream=True) as response:
+                if response.status_code == 304 and meta:
+                    meta['checked'] = time.time()
+                    self.save_meta(name, meta)
+                    return path, 'not_modified'
+                if response.status_code == 404:
+                    return None, 'missing'
+                if response.status_code != 200:
+                    logger.warning(f"⚠️ Download of {url} failed: Status {response.status_code}")
+                    return (path if meta else None), 'failed'
+
+                size = self.stream_to_file(response, path, gunzip)
+                self.save_meta(name, {
+                    'url': url,
+                    'etag': response.headers.get('ETag'),
+                    'last_modified': response.headers.get('Last-Modified'),
+                    'checked': time.time(),
+                    'size': size,
+                })
+                return path, 'downloaded'
+
+        except (requests.RequestException, OSError, zlib.error) as e:
+            logger.warning(f"⚠️ Download of {url} failed: {e}")
+            return (path if meta else None), 'failed'
+
+    def stream_to_file(self, response: requests.Response, path: str, gunzip: bool) -> int:
+        """Write the (decoded) response body to path via a temporary file; returns the bytes written"""
+        decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS) if gunzip else None
+        size = 0
+        try:
+            with open(f"{path}.part", 'wb') as f:
+                # iter_content undoes the transfer encoding (Content-Encoding: gzip) chunk by chunk
+                for chunk in response.iter_content(self.chunk_size):
+                    if decompressor is None:
+                        f.write(chunk)
+                        size += len(chunk)
+                        continue
+                    # Bound each decompressed piece too, however well the artifact compresses
+                    data = decompressor.decompress(chunk, self.chunk_size)
+                    while data:
+                        f.write(data)
+                        size += len(data)
+                        data = decompressor.decompress(decompressor.unconsumed_tail, self.chunk_size)
+                if decompressor is not None:
+                    data = decompressor.flush()
+                    f.write(data)
+                    size += len(data)
+                    if not decompressor.eof:
+                        raise zlib.error("truncated gzip artifact")
+            os.replace(f"{path}.part", path)
+        finally:
+            if os.path.exists(f"{path}.part"):
+                os.remove(f"{path}.part")
+        return size
+
+    def close(self):
+        self.session.close()
+
+    def read(self, url: str, name: str, immutable: bool = False) -> Optional[bytes]:
+        """fetch() a small file and return its contents (None if there is no copy)"""
+        path, _ = self.fetch(url, name, immutable=immutable)
+        if path is None:
+            return None
+        with open(path, 'rb') as f:
+            return f.read()
+
+    def prune(self, prefix: str, keep: Iterable[str]) -> int:
+        """Delete cached files named prefix* that are not in keep; returns how many were deleted"""
+        keep = set(keep)
+        removed = 0
+        for name in os.listdir(self.cache_dir):
+            if not name.startswith(prefix) or name.endswith('.meta.json') or name in keep:
+                continue
+            for path in (self.path(name), f"{self.path(name)}.meta.json"):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            removed += 1
+        return removed
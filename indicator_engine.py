@@ -0,0 +1,254 @@
+# indicator_engine.py - Vectorized indicators over a symbols x candles matrix
+"""Batch versions of the per-symbol indicators in SignalCalculator
+
+Every function takes 2-D arrays with one row per symbol and one column per
+candle, oldest first. Rows of different lengths are right-aligned and
+left-padded with NaN (see stack_columns), so the last column is always the
+newest candle. Results match the pandas implementations in SignalCalculator.
+"""
+from functools import lru_cache
+from typing import Dict, Sequence, Tuple
+
+import numpy as np
+import pandas as pd
+from numpy.lib.stride_tricks import sliding_window_view
+
+FIBONACCI_RATIOS = {
+    '0%': None,
+    '23.6%': 0.236,
+    '38.2%': 0.382,
+    '50%': 0.5,
+    '61.8%': 0.618,
+    '78.6%': 0.786,
+    '100%': None,
+}
+FIBONACCI_EXTENSIONS = {
+    '127.2%': 0.272,
+    '161.8%': 0.618,
+    '261.8%': 1.618,
+    '423.6%': 3.236,
+}
+
+PIVOT_ZONE_NAMES = ['Extreme Discount', 'Accumulation Zone', 'Reversal Zone', 'Strong Support']
+
+
+def stack_columns(frames: Sequence[pd.DataFrame], column: str) -> Tuple[np.ndarray, np.ndarray]:
+    """Stack one column of several candle frames into a right-aligned, NaN-padded matrix"""
+    lengths = np.array([len(frame) for frame in frames], dtype=np.int64)
+    width = int(lengths.max()) if len(lengths) else 0
+    values = np.full((len(frames), width), np.nan)
+    for row, frame in enumerate(frames):
+        if len(frame):
+            values[row, width - len(frame):] = frame[column].to_numpy(dtype=float)
+    return values, lengths
+
+
+def valid_mask(values: np.ndarray, lengths: np.ndarray) -> np.ndarray:
+    """Mask of the real (non-padding) cells"""
+    columns = np.arange(values.shape[1])
+    return columns[None, :] >= (values.shape[1] - lengths)[:, None]
+
+
+def rolling_sum(values: np.ndarray, window: int) -> np.ndarray:
+    """Trailing window sum; the first window - 1 columns are NaN"""
+    result = np.full(values.shape, np.nan)
+    if values.shape[1] >= window:
+        result[:, window - 1:] = sliding_window_view(values, window, axis=1).sum(axis=-1)
+    return result
+
+
+def rolling_extremes(highs: np.ndarray, lows: np.ndarray, window: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Trailing window max of highs and min of lows, ignoring padding (like tail(window))"""
+    padding = np.full((highs.shape[0], window - 1), np.nan)
+    high_windows = sliding_window_view(np.hstack([padding, highs]), window, axis=1)
+    low_windows = sliding_window_view(np.hstack([padding, lows]), window, axis=1)
+    return np.fmax.reduce(high_windows, axis=-1), np.fmin.reduce(low_windows, axis=-1)
+
+
+def rsi(closes: np.ndarray, lengths: np.ndarray, period: int = 14) -> np.ndarray:
+    """Simple-moving-average RSI (SignalCalculator.calculate_rsi) for every row"""
+    delta = np.diff(closes, axis=1, prepend=np.nan)
+    # NaN deltas (first candle, padding) count as zero, like Series.where
+    gain = np.where(delta > 0, delta, 0.0)
+    loss = np.where(delta < 0, -delta, 0.0)
+
+    valid = valid_mask(closes, lengths)
+    # Windows reaching into the padding are incomplete
+    first_full = closes.shape[1] - lengths + period - 1
+    complete = np.arange(closes.shape[1])[None, :] >= first_full[:, None]
+
+    average_gain = np.where(complete, rolling_sum(gain, period) / period, np.nan)
+    average_loss = np.where(complete, rolling_sum(loss, period) / period, np.nan)
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        rs = average_gain / np.where(average_loss == 0, np.nan, average_loss)
+        values = 100 - (100 / (1 + rs))
+
+    values = np.clip(np.where(np.isnan(values), 50.0, values), 0, 100)
+    values[lengths < period + 1] = 50.0
+    return np.where(valid, values, np.nan)
+
+
+def ema(values: np.ndarray, span: int) -> np.ndarray:
+    """Exponential moving average (ewm(span, adjust=False)) seeded at each row's first value"""
+    alpha = 2.0 / (span + 1)
+    result = np.full(values.shape, np.nan)
+    previous = np.full(values.shape[0], np.nan)
+    for column in range(values.shape[1]):
+        current = values[:, column]
+        previous = np.where(np.isnan(previous), current, (1 - alpha) * previous + alpha * current)
+        result[:, column] = previous
+    return result
+
+
+def macd(closes: np.ndarray, lengths: np.ndarray, fast_period: int = 12, slow_period: int = 26,
+         signal_period: int = 9) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """MACD line, signal line and histogram (SignalCalculator.calculate_macd) for every row"""
+    macd_line = ema(closes, fast_period) - ema(closes, slow_period)
+    signal_line = ema(macd_line, signal_period)
+    histogram = macd_line - signal_line
+
+    # Too short for the slow EMA: all zeros, like the per-symbol version
+    short = lengths < slow_period
+    valid = valid_mask(closes, lengths)
+    for array in (macd_line, signal_line, histogram):
+        array[short] = np.where(valid[short], 0.0, np.nan)
+    return macd_line, signal_line, histogram
+
+
+def macd_signals(macd_line: np.ndarray, signal_line: np.ndarray, histogram: np.ndarray) -> np.ndarray:
+    """Classify the last two MACD values of every row (SignalCalculator.get_macd_signal)"""
+    labels = np.full(macd_line.shape[0], 'Neutral', dtype=object)
+    if macd_line.shape[1] < 2:
+        return labels
+
+    current_macd, prev_macd = macd_line[:, -1], macd_line[:, -2]
+    current_signal, prev_signal = signal_line[:, -1], signal_line[:, -2]
+    current_hist, prev_hist = histogram[:, -1], histogram[:, -2]
+
+    with np.errstate(invalid='ignore'):
+        return np.select(
+            [(current_macd > current_signal) & (prev_macd <= prev_signal),
+             (current_hist > 0) & (prev_hist <= 0),
+             (current_macd > 0) & (current_macd > current_signal),
+             (current_macd < current_signal) & (prev_macd >= prev_signal),
+             (current_hist < 0) & (prev_hist >= 0),
+             (current_macd < 0) & (current_macd < current_signal)],
+            ['Bullish Crossover', 'Bullish Momentum', 'Bullish',
+             'Bearish Crossover', 'Bearish Momentum', 'Bearish'],
+            'Neutral'
+        ).astype(object)
+
+
+@lru_cache(maxsize=64)
+def regression_operators(length: int, degree: int, periods: int) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Least-squares projection, fit and forecast matrices for x = arange(length)
+
+    Returns (projection, vandermonde, forecast_vandermonde) so that for closes y
+    coeffs = projection @ y (highest power first, like np.polyfit), the fitted
+    values are vandermonde @ coeffs and the next `periods` values are
+    forecast_vandermonde @ coeffs. The arrays are cached and must not be modified.
+    """
+    vandermonde = np.vander(np.arange(length, dtype=float), degree + 1)
+    # Scale the columns before inverting, as np.polyfit does, to keep the solve well conditioned
+    scale = np.sqrt((vandermonde * vandermonde).sum(axis=0))
+    projection = np.linalg.pinv(vandermonde / scale) / scale[:, None]
+    forecast_vandermonde = np.vander(np.arange(length, length + periods, dtype=float), degree + 1)
+    return projection, vandermonde, forecast_vandermonde
+
+
+def polynomial_regression(closes: np.ndarray, lengths: np.ndarray, degree: int = 3,
+                          periods: int = 30) -> Dict[str, np.ndarray]:
+    """Polynomial fit, forecast and R² for every row (SignalCalculator.polynomial_regression_forecast)
+
+    Rows are grouped by length so each group is solved with one cached
+    projection matrix (see regression_operators). Returns 'valid' (rows with a
+    fit), 'coeffs', 'forecast' (clamped at 10% of the last close) and
+    'r_squared'; invalid rows are NaN.
+    """
+    rows = closes.shape[0]
+    coeffs = np.full((rows, degree + 1), np.nan)
+    forecast = np.full((rows, periods), np.nan)
+    r_squared = np.full(rows, np.nan)
+
+    # Too few candles, non-finite closes or a flat series have no fit
+    valid = lengths >= degree + 1
+    with np.errstate(invalid='ignore'):
+        for row in np.flatnonzero(valid):
+            values = closes[row, closes.shape[1] - lengths[row]:]
+            valid[row] = np.isfinite(values).all() and (values != values[0]).any()
+
+    for length in np.unique(lengths[valid]):
+        group = valid & (lengths == length)
+        y = closes[group, closes.shape[1] - length:]
+        projection, vandermonde, forecast_vandermonde = regression_operators(int(length), degree, periods)
+
+        group_coeffs = y @ projection.T
+        fitted = group_coeffs @ vandermonde.T
+        coeffs[group] = group_coeffs
+        # Don't drop below 10% of the current price
+        forecast[group] = np.maximum(group_coeffs @ forecast_vandermonde.T, y[:, -1:] * 0.1)
+
+        ss_res = ((y - fitted) ** 2).sum(axis=1)
+        ss_tot = ((y - y.mean(axis=1, keepdims=True)) ** 2).sum(axis=1)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            r_squared[group] = np.where(ss_tot != 0, np.clip(1 - ss_res / ss_tot, 0, 1), 0.0)
+
+    return {'valid': valid, 'coeffs': coeffs, 'forecast': forecast, 'r_squared': r_squared}
+
+
+def fibonacci_levels(high: np.ndarray, low: np.ndarray) -> Dict[str, np.ndarray]:
+    """Fibonacci retracement and extension levels (SignalCalculator.calculate_fibonacci_levels)"""
+    high = np.where(high <= low, np.maximum(high, low * 1.01), high)
+    diff = high - low
+
+    levels = {}
+    for name, ratio in FIBONACCI_RATIOS.items():
+        if ratio is None:
+            levels[name] = high if name == '0%' else low
+        else:
+            levels[name] = high - diff * ratio
+    for name, ratio in FIBONACCI_EXTENSIONS.items():
+        levels[name] = low - diff * ratio
+    return levels
+
+
+def pivot_zones(highs: np.ndarray, lows: np.ndarray, window: int = 20) -> Dict[str, np.ndarray]:
+    """Pivot zone boundaries from the last `window` candles (SignalCalculator.calculate_pivot_zones)"""
+    recent_high = np.fmax.reduce(highs[:, -window:], axis=1)
+    recent_low = np.fmin.reduce(lows[:, -window:], axis=1)
+    recent_high = np.where(recent_high <= recent_low, recent_low * 1.05, recent_high)
+    price_range = recent_high - recent_low
+
+    zones = {
+        'extreme_discount': recent_low + 0.1 * price_range,
+        'accumulation_lower': recent_low + 0.1 * price_range,
+        'accumulation_upper': recent_low + 0.3 * price_range,
+        'reversal_zone': recent_low + 0.5 * price_range,
+        'strong_support': recent_low + 0.7 * price_range,
+        'recent_low': recent_low,
+        'recent_high': recent_high,
+        'price_range': price_range,
+    }
+    zones['accumulation_mid_range'] = (zones['accumulation_lower'] + zones['accumulation_upper']) / 2
+    return zones
+
+
+def classify_pivot_zones(prices: np.ndarray, extreme_discount: np.ndarray, accumulation_upper: np.ndarray,
+                         reversal_zone: np.ndarray, strong_support: np.ndarray) -> np.ndarray:
+    """Name the pivot zone each price sits in (SignalCalculator.get_pivot_zone)"""
+    with np.errstate(invalid='ignore'):
+        return np.select(
+            [np.isnan(extreme_discount),
+             prices <= extreme_discount,
+             prices <= accumulation_upper,
+             prices <= reversal_zone,
+             prices <= strong_support],
+            ['Unknown'] + PIVOT_ZONE_NAMES,
+            'Above Buy Zone'
+        )
+
+
+def row_values(arrays: Dict[str, np.ndarray], row: int) -> Dict[str, float]:
+    """Pick one symbol's values out of a dict of per-symbol arrays"""
+    return {name: float(values[row]) for name, values in arrays.items()}
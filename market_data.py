@@ -0,0 +1,257 @@
+# market_data.py - Pluggable market data sources (live Gate.io or offline replay)
+import asyncio
+import logging
+import os
+import random
+import time
+import zlib
+from typing import Any, Dict, List, Optional
+
+import ccxt
+import ccxt.async_support as ccxt_async
+import numpy as np
+import pandas as pd
+
+from candle_store import OHLCV_COLUMNS, timeframe_to_ms, to_epoch_ms
+
+logger = logging.getLogger(__name__)
+
+
+class MarketDataSource:
+    """Where the signal generator gets its candles and prices from
+
+    A source hands out exchange clients exposing the ccxt methods the generator
+    uses (fetch_time, load_markets, fetch_ohlcv, fetch_tickers and, for the
+    async client, close), so fetch logic and retries stay the same for every
+    source.
+    """
+
+    name = 'unknown'
+
+    def create_client(self):
+        """Create a blocking exchange client"""
+        raise NotImplementedError
+
+    def create_async_client(self):
+        """Create an asyncio exchange client (must be closed by the caller)"""
+        raise NotImplementedError
+
+
+class GateioDataSource(MarketDataSource):
+    """Live Gate.io futures market data through ccxt"""
+
+    name = 'gateio'
+
+    def __init__(self, api_key: Optional[str] = None, api_secret: Optional[str] = None):
+        self.api_key = api_key or os.getenv('GATE_API_KEY')
+        self.api_secret = api_secret or os.getenv('GATE_API_SECRET')
+
+        if not self.api_key or not self.api_secret:
+            logger.error("GATE_API_KEY and GATE_API_SECRET are required in .env file")
+            logger.error("Please set these environment variables and try again.")
+            raise ValueError("API keys are required for real trading data")
+
+    def get_exchange_config(self) -> Dict[str, Any]:
+        """Get the Gate.io client configuration shared by the sync and async clients"""
+        return {
+            'apiKey': self.api_key,
+            'secret': self.api_secret,
+            # Throttling is handled by the generator's rate limiter so all requests share one budget
+            'enableRateLimit': False,
+            'options': {
+                'defaultType': 'future',
+                'adjustForTimeDifference': True,
+            },
+            'timeout': 30000,
+        }
+
+    def create_client(self):
+        return ccxt.gateio(self.get_exchange_config())
+
+    def create_async_client(self):
+        return ccxt_async.gateio(self.get_exchange_config())
+
+
+class ReplayDataSource(MarketDataSource):
+    """Offline OHLCV served from recorded CSV files or a deterministic synthetic walk
+
+    Recorded candles are read from `<data_dir>/<BASE>_<QUOTE>_<timeframe>.csv`
+    (e.g. BTC_USDT_1h.csv) with columns timestamp, open, high, low, close, volume
+    and shifted so the newest candle is the current one. Symbols without a file
+    get synthetic candles. Every request waits `latency_ms` and fails with a
+    ccxt.NetworkError at `error_rate`, so the generator's retry path is exercised.
+    No API keys are needed.
+    """
+
+    name = 'replay'
+
+    def __init__(self, data_dir: Optional[str] = None, latency_ms: float = 0.0,
+                 error_rate: float = 0.0, history: int = 5000, seed: int = 42):
+        self.data_dir = data_dir
+        self.latency = max(0.0, latency_ms) / 1000
+        self.error_rate = min(max(error_rate, 0.0), 1.0)
+        self.history = history
+        self.seed = seed
+        self.anchor_ms = int(time.time() * 1000)
+        self.random = random.Random(seed)
+        self.series: Dict[tuple, np.ndarray] = {}
+
+    @classmethod
+    def from_env(cls) -> 'ReplayDataSource':
+        """Build from REPLAY_DATA_DIR, REPLAY_LATENCY_MS, REPLAY_ERROR_RATE, REPLAY_HISTORY and REPLAY_SEED"""
+        return cls(
+            data_dir=os.getenv('REPLAY_DATA_DIR') or None,
+            latency_ms=float(os.getenv('REPLAY_LATENCY_MS', '0')),
+            error_rate=float(os.getenv('REPLAY_ERROR_RATE', '0')),
+            history=int(os.getenv('REPLAY_HISTORY', '5000')),
+            seed=int(os.getenv('REPLAY_SEED', '42')),
+        )
+
+    def create_client(self):
+        return ReplayExchange(self)
+
+    def create_async_client(self):
+        return AsyncReplayExchange(self)
+
+    def get_series(self, symbol: str, timeframe: str) -> np.ndarray:
+        """Get the full candle array (rows of timestamp ms, open, high, low, close, volume)"""
+        key = (symbol, timeframe)
+        if key not in self.series:
+            candles = self.load_recorded(symbol, timeframe)
+            if candles is None:
+                candles = self.generate_synthetic(symbol, timeframe)
+            self.series[key] = candles
+        return self.series[key]
+
+    def load_recorded(self, symbol: str, timeframe: str) -> Optional[np.ndarray]:
+        if not self.data_dir:
+            return None
+
+        base_symbol = symbol.split(':')[0].replace('/', '_')
+        path = os.path.join(self.data_dir, f"{base_symbol}_{timeframe}.csv")
+        if not os.path.exists(path):
+            return None
+
+        df = pd.read_csv(path)[OHLCV_COLUMNS].sort_values('timestamp')
+        if pd.api.types.is_numeric_dtype(df['timestamp']):
+            timestamps = df['timestamp'].astype('int64')
+        else:
+            timestamps = to_epoch_ms(pd.to_datetime(df['timestamp'], utc=True).dt.tz_localize(None))
+
+        # Replay the recording as if its newest candle were the current one
+        timeframe_ms = timeframe_to_ms(timeframe)
+        current_open = self.anchor_ms // timeframe_ms * timeframe_ms
+        df['timestamp'] = timestamps - timestamps.iloc[-1] + current_open
+
+        logger.info(f"Replaying {len(df)} recorded {timeframe} candles for {symbol} from {path}")
+        return df.to_numpy(dtype=float)
+
+    def generate_synthetic(self, symbol: str, timeframe: str) -> np.ndarray:
+        """Deterministic random walk ending at the current candle"""
+        timeframe_ms = timeframe_to_ms(timeframe)
+        rng = np.random.default_rng(zlib.crc32(f"{self.seed}:{symbol}:{timeframe}".encode()))
+
+        current_open = self.anchor_ms // timeframe_ms * timeframe_ms
+        timestamps = current_open - np.arange(self.history - 1, -1, -1, dtype=np.int64) * timeframe_ms
+
+        start_price = 10 ** rng.uniform(-2, 4)
+        volatility = 0.01 * np.sqrt(timeframe_ms / timeframe_to_ms('1h'))
+        closes = start_price * np.exp(np.cumsum(rng.normal(0, volatility, self.history)))
+        opens = np.concatenate(([start_price], closes[:-1]))
+        wicks = np.abs(rng.normal(0, volatility / 2, (2, self.history)))
+        highs = np.maximum(opens, closes) * (1 + wicks[0])
+        lows = np.minimum(opens, closes) * (1 - wicks[1])
+        volumes = rng.uniform(1e3, 1e6, self.history)
+
+        return np.column_stack([timestamps, opens, highs, lows, closes, volumes])
+
+    def simulate_request(self, endpoint: str):
+        """Raise an injected failure for a share of requests"""
+        if self.error_rate and self.random.random() < self.error_rate:
+            raise ccxt.NetworkError(f"replay: injected failure for {endpoint}")
+
+    def ohlcv(self, symbol: str, timeframe: str, since: Optional[int] = None,
+              limit: Optional[int] = None) -> List[List[float]]:
+        candles = self.get_series(symbol, timeframe)
+        limit = limit or 100
+        if since is None:
+            window = candles[-limit:]
+        else:
+            start = int(np.searchsorted(candles[:, 0], since))
+            window = candles[start:start + limit]
+        return [[int(row[0]), *row[1:]] for row in window.tolist()]
+
+    def tickers(self, symbols: Optional[List[str]]) -> Dict[str, Dict[str, Any]]:
+        tickers = {}
+        for symbol in symbols or []:
+            last_candle = self.get_series(symbol, '1h')[-1]
+            tickers[symbol] = {
+                'symbol': symbol,
+                'timestamp': int(time.time() * 1000),
+                'last': float(last_candle[4]),
+                'close': float(last_candle[4]),
+            }
+        return tickers
+
+
+class ReplayExchange:
+    """Blocking ccxt-style client over a ReplayDataSource"""
+
+    def __init__(self, source: ReplayDataSource):
+        self.source = source
+
+    def request(self, endpoint: str):
+        if self.source.latency:
+            time.sleep(self.source.latency)
+        self.source.simulate_request(endpoint)
+
+    def fetch_time(self) -> int:
+        self.request('fetch_time')
+        return int(time.time() * 1000)
+
+    def load_markets(self) -> Dict[str, Any]:
+        self.request('load_markets')
+        return {}
+
+    def fetch_ohlcv(self, symbol: str, timeframe: str = '1h', since: Optional[int] = None,
+                    limit: Optional[int] = None) -> List[List[float]]:
+        self.request('fetch_ohlcv')
+        return self.source.ohlcv(symbol, timeframe, since, limit)
+
+    def fetch_tickers(self, symbols: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+        self.request('fetch_tickers')
+        return self.source.tickers(symbols)
+
+
+class AsyncReplayExchange:
+    """asyncio ccxt-style client over a ReplayDataSource"""
+
+    def __init__(self, source: ReplayDataSource):
+        self.source = source
+
+    async def request(self, endpoint: str):
+        if self.source.latency:
+            await asyncio.sleep(self.source.latency)
+        self.source.simulate_request(endpoint)
+
+    async def fetch_ohlcv(self, symbol: str, timeframe: str = '1h', since: Optional[int] = None,
+                          limit: Optional[int] = None) -> List[List[float]]:
+        await self.request('fetch_ohlcv')
+        return self.source.ohlcv(symbol, timeframe, since, limit)
+
+    async def fetch_tickers(self, symbols: Optional[List[str]] = None) -> Dict[str, Dict[str, Any]]:
+        await self.request('fetch_tickers')
+        return self.source.tickers(symbols)
+
+    async def close(self):
+        pass
+
+
+def create_data_source(name: Optional[str] = None) -> MarketDataSource:
+    """Create the source named by `name` or MARKET_DATA_SOURCE (gateio | replay)"""
+    name = (name or os.getenv('MARKET_DATA_SOURCE', 'gateio')).strip().lower()
+    if name == 'gateio':
+        return GateioDataSource()
+    if name == 'replay':
+        return ReplayDataSource.from_env()
+    raise ValueError(f"Unknown market data source '{name}' (expected 'gateio' or 'replay')")
@@ -0,0 +1,161 @@
+# rate_limiter.py - Shared token-bucket rate limiting for exchange requests
+import asyncio
+import logging
+import os
+import threading
+import time
+from typing import Dict, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Requests per window (seconds) for each endpoint class, e.g. "200/10"
+DEFAULT_RATE_LIMITS = {
+    'public': '200/10',   # Gate.io public market data (candles, tickers, server time)
+    'private': '100/10',  # Gate.io authenticated endpoints (balances, orders)
+}
+
+
+def parse_rate_limit(value: str) -> Tuple[int, float]:
+    """Parse a "requests/window_seconds" string such as "200/10" """
+    try:
+        requests_part, window_part = value.split('/', 1)
+        max_requests = int(requests_part.strip())
+        window_seconds = float(window_part.strip())
+    except (AttributeError, ValueError):
+        raise ValueError(f"Invalid rate limit '{value}', expected format 'requests/seconds' (e.g. 200/10)")
+
+    if max_requests <= 0 or window_seconds <= 0:
+        raise ValueError(f"Invalid rate limit '{value}', requests and window must be positive")
+
+    return max_requests, window_seconds
+
+
+class TokenBucket:
+    """Token bucket that hands out request slots to sync and async callers alike
+
+    Tokens may go negative: every caller reserves its slot under the lock and then
+    sleeps until that slot comes due, so waiting callers are served in order
+    without polling.
+    """
+
+    def __init__(self, name: str, max_requests: int, window_seconds: float):
+        self.name = name
+        self.max_requests = max_requests
+        self.window_seconds = window_seconds
+        self.capacity = float(max_requests)
+        self.refill_rate = max_requests / window_seconds
+        self.tokens = self.capacity
+        self.updated_at = time.monotonic()
+        self.lock = threading.Lock()
+        self.reset_usage()
+
+    def reset_usage(self):
+        """Start a new usage accounting period (typically one run)"""
+        with self.lock:
+            self.usage_started_at = time.monotonic()
+            self.requests = 0
+            self.waited_seconds = 0.0
+            self.penalties = 0
+
+    def _refill(self, now: float):
+        elapsed = now - self.updated_at
+        if elapsed > 0:
+            self.tokens = min(self.capacity, self.tokens + elapsed * self.refill_rate)
+            self.updated_at = now
+
+    def reserve(self, tokens: int = 1) -> float:
+        """Reserve tokens and return how many seconds the caller must wait before using them"""
+        with self.lock:
+            self._refill(time.monotonic())
+            self.tokens -= tokens
+            wait_time = max(0.0, -self.tokens / self.refill_rate)
+            self.requests += tokens
+            self.waited_seconds += wait_time
+            return wait_time
+
+    def acquire(self, tokens: int = 1):
+        """Block the calling thread until a request slot is available"""
+        wait_time = self.reserve(tokens)
+        if wait_time > 0:
+            time.sleep(wait_time)
+
+    async def acquire_async(self, tokens: int = 1):
+        """Wait (without blocking the event loop) until a request slot is available"""
+        wait_time = self.reserve(tokens)
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
+
+    def penalize(self, seconds: float):
+        """Push every pending and future request back after the exchange reports a rate limit hit"""
+        with self.lock:
+            self._refill(time.monotonic())
+            self.tokens = min(self.tokens, 0.0) - seconds * self.refill_rate
+            self.penalties += 1
+
+    def get_usage(self) -> Dict[str, float]:
+        """Get request usage against the budget for the current accounting period"""
+        with self.lock:
+            elapsed = max(time.monotonic() - self.usage_started_at, 1e-9)
+            budget = self.capacity + elapsed * self.refill_rate
+            return {
+                'requests': self.requests,
+                'elapsed_seconds': elapsed,
+                'budget': budget,
+                'budget_used_pct': min(100.0, self.requests / budget * 100),
+                'requests_per_second': self.requests / elapsed,
+                'waited_seconds': self.waited_seconds,
+                'penalties': self.penalties,
+            }
+
+
+class RateLimiter:
+    """One rate-limit budget per endpoint class, shared by every fetcher"""
+
+    def __init__(self, limits: Optional[Dict[str, str]] = None):
+        limits = limits or DEFAULT_RATE_LIMITS
+        self.buckets: Dict[str, TokenBucket] = {}
+        for endpoint, value in limits.items():
+            max_requests, window_seconds = parse_rate_limit(value)
+            self.buckets[endpoint] = TokenBucket(endpoint, max_requests, window_seconds)
+
+    @classmethod
+    def from_env(cls) -> 'RateLimiter':
+        """Build limits from RATE_LIMIT_PUBLIC / RATE_LIMIT_PRIVATE (format: requests/seconds)"""
+        limits = {
+            endpoint: os.getenv(f'RATE_LIMIT_{endpoint.upper()}', default)
+            for endpoint, default in DEFAULT_RATE_LIMITS.items()
+        }
+        return cls(limits)
+
+    def bucket(self, endpoint: str) -> TokenBucket:
+        if endpoint not in self.buckets:
+            raise KeyError(f"Unknown endpoint class '{endpoint}' (configured: {', '.join(self.buckets)})")
+        return self.buckets[endpoint]
+
+    def acquire(self, endpoint: str = 'public', tokens: int = 1):
+        self.bucket(endpoint).acquire(tokens)
+
+    async def acquire_async(self, endpoint: str = 'public', tokens: int = 1):
+        await self.bucket(endpoint).acquire_async(tokens)
+
+    def penalize(self, endpoint: str, seconds: float):
+        self.bucket(endpoint).penalize(seconds)
+
+    def reset_usage(self):
+        for bucket in self.buckets.values():
+            bucket.reset_usage()
+
+    def log_usage(self):
+        """Log how much of each endpoint budget was used since the last reset"""
+        for endpoint, bucket in self.buckets.items():
+            usage = bucket.get_usage()
+            if usage['requests'] == 0:
+                continue
+            logger.info(
+                f"Rate limit budget [{endpoint}]: {usage['requests']} requests in "
+                f"{usage['elapsed_seconds']:.1f}s ({bucket.max_requests}/{bucket.window_seconds:g}s limit) - "
+                f"{usage['budget_used_pct']:.1f}% of budget used, "
+                f"{usage['requests_per_second']:.2f} req/s, "
+                f"{usage['waited_seconds']:.1f}s cumulative caller wait, "
+                f"{usage['penalties']} rate-limit backoffs"
+            )
@@ -0,0 +1,82 @@
+# result_cache.py - Memory-bounded LRU cache of query results keyed by data version
+import logging
+import threading
+from collections import OrderedDict
+from typing import Callable, Hashable, Optional
+
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 128 * 1024 * 1024
+
+
+def frame_size(df: pd.DataFrame) -> int:
+    return int(df.memory_usage(index=True, deep=True).sum())
+
+
+class ResultCache:
+    """Caches DataFrames per (data version, name), evicting least recently used ones past max_bytes
+
+    Entries only live for one data version: the first lookup with a new
+    version drops everything cached for the previous one. Callers get a copy,
+    so they may modify it freely. Thread-safe; a loader runs outside the lock,
+    so two sessions missing the same entry may both load it.
+    """
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        self.entries: 'OrderedDict[Hashable, pd.DataFrame]' = OrderedDict()
+        self.sizes = {}
+        self.total_bytes = 0
+        self.version: Optional[Hashable] = None
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, version: Optional[Hashable], name: Hashable, loader: Callable[[], pd.DataFrame]) -> pd.DataFrame:
+        """The cached result of loader() for `name` at `version`; None versions are never cached"""
+        if version is None:
+            return loader()
+
+        with self.lock:
+            if version != self.version:
+                self.clear_locked()
+                self.version = version
+            df = self.entries.get(name)
+            if df is not None:
+                self.entries.move_to_end(name)
+                self.hits += 1
+                return df.copy()
+            self.misses += 1
+
+        df = loader()
+        self.put(version, name, df)
+        return df.copy()
+
+    def put(self, version: Hashable, name: Hashable, df: pd.DataFrame):
+        size = frame_size(df)
+        with self.lock:
+            # Loaded for a version that was replaced meanwhile, or too big to ever fit
+            if version != self.version or size > self.max_bytes:
+                return
+            if name in self.entries:
+                self.total_bytes -= self.sizes[name]
+            self.entries[name] = df
+            self.entries.move_to_end(name)
+            self.sizes[name] = size
+            self.total_bytes += size
+
+            while self.total_bytes > self.max_bytes:
+                evicted, _ = self.entries.popitem(last=False)
+                self.total_bytes -= self.sizes.pop(evicted)
+                logger.debug(f"Evicted {evicted} from the result cache")
+
+    def clear(self):
+        with self.lock:
+            self.clear_locked()
+
+    def clear_locked(self):
+        self.entries.clear()
+        self.sizes.clear()
+        self.total_bytes = 0
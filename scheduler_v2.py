@@ -1,18 +1,30 @@
 # scheduler_v2.py - PRODUCTION VERSION FOR REAL TRADING DATA ONLY
 import ccxt
+import asyncio
+from concurrent.futures import ProcessPoolExecutor
 import pandas as pd
-import numpy as np
 from datetime import datetime, timedelta
 import requests
 import time
 import logging
-import sqlite3
-from typing import Dict, Any, List, Optional, Tuple
+from typing import Callable, Dict, Any, List, Optional, Tuple
 import os
 from dotenv import load_dotenv
 import traceback
 import sys
 
+from rate_limiter import RateLimiter
+from market_data import MarketDataSource, create_data_source
+from db_storage import (BackgroundWriter, BatchWriter, WalCheckpointer, compact_database, connect_database,
+                        gzip_database)
+from schema import migrate, schema_version
+from snapshot import export_snapshot, snapshot_available
+from changesets import (load_manifest, local_fetcher, new_changeset, publish_changeset, rebase, rebase_due,
+                        sync_database)
+from signal_calculator import SignalCalculator, evaluate_batch, get_emoji
+from candle_store import (CandleStore, plan_fetch_since, is_fetch_complete, resample_ohlcv,
+                          timeframe_to_ms, to_epoch_ms)
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -27,70 +39,64 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-def get_emoji(emoji_name):
-    """Get platform-appropriate emoji or text alternative"""
-    if sys.platform == 'win32':
-        emoji_map = {
-            'key': '[KEY]',
-            'chart': '[DATA]',
-            'check': '[OK]',
-            'cross': '[ERROR]',
-            'warning': '[WARNING]',
-            'clock': '[TIME]',
-            'database': '[DB]',
-            'rocket': '[ROCKET]',
-            'signal': '[SIGNAL]',
-            'star': '[STAR]',
-            'hourglass': '[WAIT]',
-            'info': '[INFO]',
-            'magnify': '[SEARCH]',
-            'list': '[LIST]',
-            'bell': '[ALERT]',
-            'money': '[MONEY]',
-            'up': '[UP]',
-            'down': '[DOWN]',
-            'neutral': '[NEUTRAL]',
-            'fire': '[FIRE]',
-            'portfolio': '[PORTFOLIO]',
-            'discount': '[DISCOUNT]',
-            'overvalued': '[OVERVALUED]',
-        }
-        return emoji_map.get(emoji_name, '')
-    else:
-        emoji_map = {
-            'key': '🔑',
-            'chart': '📊',
-            'check': '✅',
-            'cross': '❌',
-            'warning': '⚠️',
-            'clock': '⏰',
-            'database': '📁',
-            'rocket': '🚀',
-            'signal': '📈',
-            'star': '⭐',
-            'hourglass': '⏳',
-            'info': 'ℹ️',
-            'magnify': '🔍',
-            'list': '📋',
-            'bell': '🔔',
-            'money': '💰',
-            'up': '🟢',
-            'down': '🔴',
-            'neutral': '🟡',
-            'fire': '🔥',
-            'portfolio': '💼',
-            'discount': '🔥',
-            'overvalued': '⚠️',
-        }
-        return emoji_map.get(emoji_name, '')
-
 # Configuration - loaded from environment variables
-GATE_API_KEY = os.getenv('GATE_API_KEY')
-GATE_API_SECRET = os.getenv('GATE_API_SECRET')
 TELEGRAM_BOT_TOKEN = os.getenv('TELEGRAM_BOT_TOKEN')
 TELEGRAM_CHAT_ID = os.getenv('TELEGRAM_CHAT_ID')
 DATABASE_PATH = os.getenv('DATABASE_PATH', 'trading_signals.db')
 
+# Market data source: 'gateio' (live, needs API keys) or 'replay' (offline, see market_data.py)
+MARKET_DATA_SOURCE = os.getenv('MARKET_DATA_SOURCE', 'gateio')
+
+# Data fetching - async mode fetches every symbol/timeframe pair concurrently
+ASYNC_FETCH = os.getenv('ASYNC_FETCH', 'true').lower() in ('1', 'true', 'yes')
+FETCH_CONCURRENCY = int(os.getenv('FETCH_CONCURRENCY', '10'))
+SIGNAL_TIMEFRAMES = ['1h', '4h', '1d']
+OHLCV_LIMIT = int(os.getenv('CANDLE_LOOKBACK', '100'))
+
+# Local candle store - only candles newer than the last stored one are fetched
+USE_CANDLE_STORE = os.getenv('USE_CANDLE_STORE', 'true').lower() in ('1', 'true', 'yes')
+CANDLE_STORE_PATH = os.getenv('CANDLE_STORE_PATH', 'candle_store.db')
+CANDLE_PAGE_LIMIT = int(os.getenv('CANDLE_PAGE_LIMIT', '1000'))
+CANDLE_STORE_MAX_CANDLES = int(os.getenv('CANDLE_STORE_MAX_CANDLES', '5000'))
+
+# Build 4h/1d views from stored base candles instead of fetching each timeframe (needs the candle store)
+RESAMPLE_TIMEFRAMES = os.getenv('RESAMPLE_TIMEFRAMES', 'true').lower() in ('1', 'true', 'yes')
+BASE_TIMEFRAME = os.getenv('BASE_TIMEFRAME', '1h')
+
+# Indicator computation runs in a process pool (0 workers computes inline in the main process)
+COMPUTE_WORKERS = int(os.getenv('COMPUTE_WORKERS') or os.cpu_count() or 1)
+COMPUTE_CHUNK_SIZE = max(1, int(os.getenv('COMPUTE_CHUNK_SIZE', '8')))
+
+# Signal rows are buffered and written in one transaction per DB_FLUSH_SIZE symbols
+DB_FLUSH_SIZE = max(1, int(os.getenv('DB_FLUSH_SIZE', '50')))
+# Write signal rows from a background thread through a bounded queue (false writes inline)
+DB_BACKGROUND_WRITER = os.getenv('DB_BACKGROUND_WRITER', 'true').lower() in ('1', 'true', 'yes')
+DB_WRITE_QUEUE_SIZE = int(os.getenv('DB_WRITE_QUEUE_SIZE', '5000'))
+
+# The database runs in WAL mode so the dashboard can read while the scheduler writes
+DB_BUSY_TIMEOUT_MS = int(os.getenv('DB_BUSY_TIMEOUT_MS', '10000'))
+DB_CHECKPOINT_INTERVAL = float(os.getenv('DB_CHECKPOINT_INTERVAL', '60'))
+DB_WAL_MAX_MB = float(os.getenv('DB_WAL_MAX_MB', '64'))
+
+# Columnar Parquet snapshot of the latest state for the dashboard (needs pyarrow)
+EXPORT_SNAPSHOT = os.getenv('EXPORT_SNAPSHOT', 'true').lower() in ('1', 'true', 'yes')
+SNAPSHOT_DIR = os.getenv('SNAPSHOT_DIR', 'snapshot')
+SNAPSHOT_HISTORY_DAYS = int(os.getenv('SNAPSHOT_HISTORY_DAYS', '7'))
+
+# Signal history retention: hourly points for SIGNAL_HISTORY_HOURLY_DAYS, then daily up to SIGNAL_HISTORY_MAX_DAYS
+SIGNAL_HISTORY_HOURLY_DAYS = int(os.getenv('SIGNAL_HISTORY_HOURLY_DAYS', '7'))
+SIGNAL_HISTORY_MAX_DAYS = int(os.getenv('SIGNAL_HISTORY_MAX_DAYS', '365'))
+
+# Per-run changesets, so the dashboard downloads only what changed (see changesets.py).
+# The full database is republished as the new base every CHANGESET_REBASE_INTERVAL changesets.
+PUBLISH_CHANGESETS = os.getenv('PUBLISH_CHANGESETS', 'true').lower() in ('1', 'true', 'yes')
+CHANGESET_DIR = os.getenv('CHANGESET_DIR', 'changesets')
+CHANGESET_RETENTION = int(os.getenv('CHANGESET_RETENTION', '200'))
+CHANGESET_REBASE_INTERVAL = int(os.getenv('CHANGESET_REBASE_INTERVAL', '30'))
+
+# Price-only refreshes between full runs in scheduled mode (0 disables)
+FAST_REFRESH_MINUTES = int(os.getenv('FAST_REFRESH_MINUTES', '0'))
+
 # Trading symbols - configurable via environment variable
 DEFAULT_SYMBOLS = [
 # 🚀 TOP-TIER BLUE-CHIP CRYPTOCURRENCIES
@@ -255,36 +261,49 @@ else:
 class TradingSignalGenerator:
     """Production signal generator for real trading data only"""
     
-    def __init__(self, db_path: Optional[str] = None):
-        """Initialize the signal generator with API validation"""
-        self.db_path = db_path or DATABASE_PATH
+    def __init__(self, db_path: Optional[str] = None, data_source: Optional[MarketDataSource] = None,
+                 candle_store_path: Optional[str] = None, snapshot_dir: Optional[str] = None,
+                 changeset_dir: Optional[str] = None):
+        """Initialize the signal generator with API validation
         
-        # Validate API keys before initialization
-        if not GATE_API_KEY or not GATE_API_SECRET:
-            logger.error(f"{get_emoji('cross')} GATE_API_KEY and GATE_API_SECRET are required in .env file")
-            logger.error("Please set these environment variables and try again.")
-            raise ValueError("API keys are required for real trading data")
+        data_source defaults to MARKET_DATA_SOURCE; the Gate.io source raises
+        ValueError when the API keys are missing.
+        """
+        self.db_path = db_path or DATABASE_PATH
+        self.snapshot_dir = snapshot_dir or SNAPSHOT_DIR
+        self.changeset_dir = changeset_dir or CHANGESET_DIR
+        self.data_source = data_source or create_data_source(MARKET_DATA_SOURCE)
+        self.calculator = SignalCalculator()
         
         self.exchange = None
+        # Single request budget shared by every fetcher (replaces ccxt's own throttling)
+        self.rate_limiter = RateLimiter.from_env()
+        self.candle_store = CandleStore(candle_store_path or CANDLE_STORE_PATH) if USE_CANDLE_STORE else None
+        self.resample_enabled = RESAMPLE_TIMEFRAMES and self.candle_store is not None
+        # One connection for all signal rows, flushed in batches of symbols (off the hot path by default)
+        if DB_BACKGROUND_WRITER:
+            self.writer = BackgroundWriter(self.db_path, DB_FLUSH_SIZE, DB_WRITE_QUEUE_SIZE, DB_BUSY_TIMEOUT_MS,
+                                           record_changes=PUBLISH_CHANGESETS)
+        else:
+            self.writer = BatchWriter(self.db_path, DB_FLUSH_SIZE, DB_BUSY_TIMEOUT_MS,
+                                      record_changes=PUBLISH_CHANGESETS)
         self.initialize_exchange()
         self.init_database()
+        if PUBLISH_CHANGESETS:
+            self.catch_up_changesets()
+    
+    def close(self):
+        """Write any queued rows and close the database and candle store connections"""
+        self.writer.close()
+        if self.candle_store is not None:
+            self.candle_store.close()
     
     def initialize_exchange(self):
-        """Initialize the Gate.io exchange connection with validation"""
+        """Initialize the exchange connection of the market data source with validation"""
         try:
-            logger.info(f"{get_emoji('key')} Initializing Gate.io exchange connection...")
+            logger.info(f"{get_emoji('key')} Initializing {self.data_source.name} exchange connection...")
             
-            self.exchange = ccxt.gateio({
-                'apiKey': GATE_API_KEY,
-                'secret': GATE_API_SECRET,
-                'enableRateLimit': True,
-                'options': {
-                    'defaultType': 'future',
-                    'adjustForTimeDifference': True,
-                },
-                'timeout': 30000,
-                'rateLimit': 1000,
-            })
+            self.exchange = self.data_source.create_client()
             
             # Test the connection with a lightweight API call
             logger.info("Testing exchange connection...")
@@ -292,21 +311,15 @@ class TradingSignalGenerator:
             # Try a different API call since fetch_status() is not supported
             try:
                 # Use fetch_time() which is more universally supported
+                self.rate_limiter.acquire('public')
                 server_time = self.exchange.fetch_time()
                 logger.info(f"Exchange connection successful (server time: {server_time})")
                 
-                # Verify API permissions
-                try:
-                    # Try to fetch ticker to verify API works
-                    ticker = self.exchange.fetch_ticker('BTC/USDT')
-                    logger.info(f"{get_emoji('check')} API connection successful. BTC/USDT price: {ticker.get('last', 'N/A')}")
-                except Exception as e:
-                    logger.warning(f"{get_emoji('warning')} Limited API permissions (may not affect data fetching): {str(e)}")
-                    
             except Exception as e:
                 # If fetch_time() also fails, try a simpler test
                 logger.info(f"Using alternative connection test: {str(e)}")
                 try:
+                    self.rate_limiter.acquire('public')
                     markets = self.exchange.load_markets()
                     logger.info(f"{get_emoji('check')} Successfully loaded {len(markets)} markets")
                 except Exception as e2:
@@ -323,127 +336,19 @@ class TradingSignalGenerator:
             raise
     
     def init_database(self):
-        """Initialize SQLite database and create all tables"""
+        """Initialize SQLite database: create or migrate all tables to the current schema version"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
+            conn = connect_database(self.db_path, DB_BUSY_TIMEOUT_MS)
             
             logger.info(f"{get_emoji('database')} Initializing database at: {self.db_path}")
             
-            # Create dashboard_metadata table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS dashboard_metadata (
-                    id INTEGER PRIMARY KEY,
-                    last_updated TIMESTAMP,
-                    total_symbols INTEGER,
-                    last_update_status TEXT,
-                    update_duration_seconds REAL,
-                    data_source TEXT DEFAULT 'gateio'
-                )
-            ''')
-            
-            # Create hvts_forecast table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS hvts_forecast (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    symbol TEXT NOT NULL,
-                    current_price REAL NOT NULL,
-                    forecast_1d REAL NOT NULL,
-                    forecast_7d REAL NOT NULL,
-                    forecast_14d REAL NOT NULL,
-                    forecast_30d REAL NOT NULL,
-                    poly_signal TEXT NOT NULL,
-                    poly_emoji TEXT NOT NULL,
-                    timestamp DATETIME NOT NULL,
-                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    UNIQUE(symbol, timestamp)
-                )
-            ''')
-            
-            # Create trading_signals table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS trading_signals (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    symbol TEXT UNIQUE NOT NULL,
-                    current_price REAL NOT NULL,
-                    poly_1h_signal TEXT NOT NULL,
-                    fib_15m_signal TEXT NOT NULL,
-                    fib_signal TEXT NOT NULL,
-                    poly_signal TEXT NOT NULL,
-                    rsi_zone TEXT NOT NULL,
-                    macd_signal TEXT NOT NULL,
-                    pivot_zone TEXT NOT NULL,
-                    overall_signal TEXT NOT NULL,
-                    forecast_1h REAL,
-                    forecast_1d REAL,
-                    forecast_7d REAL,
-                    forecast_14d REAL,
-                    forecast_30d REAL,
-                    timestamp DATETIME NOT NULL,
-                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
-            
-            # Create fibonacci_1h table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS fibonacci_1h (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    symbol TEXT NOT NULL,
-                    current_price REAL NOT NULL,
-                    fib_level_0 REAL NOT NULL,
-                    fib_level_23_6 REAL NOT NULL,
-                    fib_level_38_2 REAL NOT NULL,
-                    fib_level_50 REAL NOT NULL,
-                    fib_level_61_8 REAL NOT NULL,
-                    fib_level_78_6 REAL NOT NULL,
-                    fib_level_100 REAL NOT NULL,
-                    fib_level_127_2 REAL,
-                    fib_level_161_8 REAL,
-                    fib_level_261_8 REAL,
-                    fib_level_423_6 REAL,
-                    fib_1h_signal TEXT NOT NULL,
-                    pivot_zone TEXT NOT NULL,
-                    timestamp DATETIME NOT NULL,
-                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    UNIQUE(symbol, timestamp)
-                )
-            ''')
-            
-            # Create polynomial_regression_daily table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS polynomial_regression_daily (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    symbol TEXT NOT NULL,
-                    current_price REAL NOT NULL,
-                    poly_regression_value REAL NOT NULL,
-                    poly_signal_daily TEXT NOT NULL,
-                    poly_confidence REAL NOT NULL,
-                    r_squared REAL NOT NULL,
-                    trend_strength REAL NOT NULL,
-                    support_level REAL NOT NULL,
-                    resistance_level REAL NOT NULL,
-                    forecast_1d REAL NOT NULL,
-                    forecast_7d REAL NOT NULL,
-                    forecast_30d REAL NOT NULL,
-                    timestamp DATETIME NOT NULL,
-                    created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
-                    UNIQUE(symbol, timestamp)
-                )
-            ''')
-            
-            # Create indices for performance
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_signals_symbol ON trading_signals(symbol)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_signals_timestamp ON trading_signals(timestamp)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_fib_1h_symbol ON fibonacci_1h(symbol)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_fib_1h_timestamp ON fibonacci_1h(timestamp)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_reg_symbol ON polynomial_regression_daily(symbol)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_reg_timestamp ON polynomial_regression_daily(timestamp)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_hvts_symbol ON hvts_forecast(symbol)')
-            cursor.execute('CREATE INDEX IF NOT EXISTS idx_hvts_timestamp ON hvts_forecast(timestamp)')
-            
-            conn.commit()
+            # Tables, indexes and later schema changes are versioned migrations (see schema.py)
+            previous_version = schema_version(conn)
+            version = migrate(conn)
             conn.close()
             
+            if version != previous_version:
+                logger.info(f"{get_emoji('database')} Migrated database schema from version {previous_version} to {version}")
             logger.info(f"{get_emoji('check')} Database initialization completed successfully")
             
         except Exception as e:
@@ -451,8 +356,9 @@ class TradingSignalGenerator:
             logger.error(traceback.format_exc())
             raise
     
-    def fetch_data(self, symbol: str, timeframe: str = '1h', limit: int = 100) -> Optional[pd.DataFrame]:
-        """Fetch real OHLCV data from Gate.io"""
+    def fetch_data(self, symbol: str, timeframe: str = '1h', limit: int = 100,
+                   since: Optional[int] = None) -> Optional[pd.DataFrame]:
+        """Fetch real OHLCV data from Gate.io (optionally only candles opened at or after `since` ms)"""
         if self.exchange is None:
             raise RuntimeError("Exchange not initialized")
         
@@ -472,27 +378,23 @@ class TradingSignalGenerator:
                     clean_symbol = symbol
                 
                 # Fetch OHLCV data
-                ohlcv = self.exchange.fetch_ohlcv(clean_symbol, timeframe, limit=limit)
+                self.rate_limiter.acquire('public')
+                ohlcv = self.exchange.fetch_ohlcv(clean_symbol, timeframe, since=since, limit=limit)
                 
                 if not ohlcv or len(ohlcv) == 0:
                     logger.warning(f"No data returned for {symbol} with timeframe {timeframe}")
                     return None
                 
-                df = pd.DataFrame(ohlcv, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
-                df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
-                
-                # Validate data
-                if df['close'].isnull().any():
-                    logger.warning(f"NaN values found in {symbol} data, attempting to fill")
-                    df = df.ffill().bfill()
+                df = self.ohlcv_to_dataframe(symbol, ohlcv)
                 
                 logger.info(f"{get_emoji('check')} Successfully fetched {len(df)} {timeframe} records for {symbol}")
                 return df
                 
             except ccxt.RateLimitExceeded:
+                # Back off the shared budget so every fetcher slows down together
                 wait_time = retry_delay * (attempt + 1)
-                logger.warning(f"Rate limit exceeded for {symbol}. Waiting {wait_time} seconds...")
-                time.sleep(wait_time)
+                logger.warning(f"Rate limit exceeded for {symbol}. Pausing public requests for {wait_time} seconds...")
+                self.rate_limiter.penalize('public', wait_time)
                 continue
                 
             except ccxt.NetworkError as e:
@@ -507,7 +409,8 @@ class TradingSignalGenerator:
                     # Try spot format
                     spot_symbol = symbol.replace(':USDT', '')
                     try:
-                        ohlcv = self.exchange.fetch_ohlcv(spot_symbol, timeframe, limit=limit)
+                        self.rate_limiter.acquire('public')
+                        ohlcv = self.exchange.fetch_ohlcv(spot_symbol, timeframe, since=since, limit=limit)
                         if ohlcv and len(ohlcv) > 0:
                             df = pd.DataFrame(ohlcv, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
                             df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
@@ -531,419 +434,317 @@ class TradingSignalGenerator:
         
         return None
     
-    def calculate_rsi(self, prices: pd.Series, period: int = 14) -> pd.Series:
-        """Calculate Relative Strength Index with validation"""
-        try:
-            if len(prices) < period + 1:
-                logger.warning(f"Insufficient data for RSI calculation (needed: {period}, got: {len(prices)})")
-                return pd.Series([50] * len(prices), index=prices.index)
-            
-            delta = prices.diff()
-            gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-            loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-            
-            # Avoid division by zero
-            rs = gain / loss.replace(0, np.nan)
-            rsi = 100 - (100 / (1 + rs))
-            
-            # Fill NaN values
-            rsi = rsi.fillna(50)
-            
-            # Clip to valid range
-            rsi = rsi.clip(0, 100)
-            
-            return rsi
-            
-        except Exception as e:
-            logger.error(f"Error calculating RSI: {str(e)}")
-            return pd.Series([50] * len(prices), index=prices.index)
+    def ohlcv_to_dataframe(self, symbol: str, ohlcv: List[List[float]]) -> pd.DataFrame:
+        """Convert raw ccxt OHLCV rows into a validated DataFrame"""
+        df = pd.DataFrame(ohlcv, columns=['timestamp', 'open', 'high', 'low', 'close', 'volume'])
+        df['timestamp'] = pd.to_datetime(df['timestamp'], unit='ms')
+        
+        # Validate data
+        if df['close'].isnull().any():
+            logger.warning(f"NaN values found in {symbol} data, attempting to fill")
+            df = df.ffill().bfill()
+        
+        return df
     
-    def calculate_macd(self, prices: pd.Series, fast_period: int = 12, 
-                       slow_period: int = 26, signal_period: int = 9) -> Tuple[pd.Series, pd.Series, pd.Series]:
-        """Calculate MACD indicator with validation"""
-        try:
-            if len(prices) < slow_period:
-                logger.warning(f"Insufficient data for MACD (needed: {slow_period}, got: {len(prices)})")
-                zeros = pd.Series([0] * len(prices), index=prices.index)
-                return zeros, zeros, zeros
-            
-            # Calculate EMAs
-            ema_fast = prices.ewm(span=fast_period, adjust=False).mean()
-            ema_slow = prices.ewm(span=slow_period, adjust=False).mean()
-            
-            # MACD line
-            macd_line = ema_fast - ema_slow
-            
-            # Signal line
-            signal_line = macd_line.ewm(span=signal_period, adjust=False).mean()
-            
-            # MACD histogram
-            macd_histogram = macd_line - signal_line
-            
-            return macd_line, signal_line, macd_histogram
-            
-        except Exception as e:
-            logger.error(f"Error calculating MACD: {str(e)}")
-            zeros = pd.Series([0] * len(prices), index=prices.index)
-            return zeros, zeros, zeros
+    def create_async_exchange(self):
+        """Create an async exchange client for concurrent fetching (must be closed by the caller)"""
+        return self.data_source.create_async_client()
     
-    def get_macd_signal(self, macd_line: pd.Series, signal_line: pd.Series, 
-                       macd_histogram: pd.Series) -> Tuple[str, str]:
-        """Get MACD trading signal"""
-        try:
-            if len(macd_line) < 2:
-                return "Neutral", get_emoji('neutral')
-            
-            current_macd = macd_line.iloc[-1]
-            current_signal = signal_line.iloc[-1]
-            current_hist = macd_histogram.iloc[-1]
-            prev_macd = macd_line.iloc[-2]
-            prev_signal = signal_line.iloc[-2]
-            prev_hist = macd_histogram.iloc[-2]
-            
-            # Bullish signals
-            if current_macd > current_signal and prev_macd <= prev_signal:
-                return "Bullish Crossover", get_emoji('up')
-            elif current_hist > 0 and prev_hist <= 0:
-                return "Bullish Momentum", get_emoji('up')
-            elif current_macd > 0 and current_macd > current_signal:
-                return "Bullish", get_emoji('up')
-            
-            # Bearish signals
-            elif current_macd < current_signal and prev_macd >= prev_signal:
-                return "Bearish Crossover", get_emoji('down')
-            elif current_hist < 0 and prev_hist >= 0:
-                return "Bearish Momentum", get_emoji('down')
-            elif current_macd < 0 and current_macd < current_signal:
-                return "Bearish", get_emoji('down')
-            
-            # Neutral
-            else:
-                return "Neutral", get_emoji('neutral')
+    async def fetch_data_async(self, exchange, semaphore: asyncio.Semaphore, symbol: str,
+                               timeframe: str = '1h', limit: int = 100,
+                               since: Optional[int] = None) -> Optional[pd.DataFrame]:
+        """Fetch real OHLCV data from Gate.io using the async client"""
+        max_retries = 3
+        retry_delay = 5
+        
+        for attempt in range(max_retries):
+            try:
+                logger.debug(f"Attempt {attempt + 1}/{max_retries}: Fetching {timeframe} data for {symbol} (async)")
                 
-        except Exception as e:
-            logger.error(f"Error getting MACD signal: {str(e)}")
-            return "Neutral", get_emoji('neutral')
-    
-    def polynomial_regression_forecast(self, df: pd.DataFrame, degree: int = 3, 
-                                      periods: int = 30) -> Tuple[Optional[np.ndarray], Optional[np.ndarray]]:
-        """Generate polynomial regression forecast"""
-        try:
-            if len(df) < degree + 1:
-                logger.warning(f"Insufficient data for polynomial regression (needed: {degree+1}, got: {len(df)})")
-                return None, None
-            
-            x = np.arange(len(df))
-            y = df['close'].values
-            
-            # Ensure we have valid data
-            if len(np.unique(y)) < 2:
-                logger.warning("Insufficient price variation for regression")
-                return None, None
-            
-            # Perform polynomial regression
-            coeffs = np.polyfit(x, y, degree)
-            polynomial = np.poly1d(coeffs)
-            
-            # Generate forecast
-            x_forecast = np.arange(len(df), len(df) + periods)
-            y_forecast = polynomial(x_forecast)
-            
-            # Ensure forecast is reasonable (no negative prices)
-            y_forecast = np.maximum(y_forecast, y[-1] * 0.1)  # Don't drop below 10% of current price
-            
-            return y_forecast, coeffs
-            
-        except Exception as e:
-            logger.error(f"Error in polynomial regression: {str(e)}")
-            return None, None
-    
-    def get_poly_signal_1h(self, df: pd.DataFrame, current_price: float) -> Tuple[str, str, float]:
-        """Get 1-hour polynomial regression trend signal"""
-        try:
-            forecast, _ = self.polynomial_regression_forecast(df, degree=3, periods=5)
-            
-            if forecast is not None and len(forecast) >= 1:
-                forecast_1 = forecast[0]
+                async with semaphore:
+                    await self.rate_limiter.acquire_async('public')
+                    ohlcv = await exchange.fetch_ohlcv(symbol, timeframe, since=since, limit=limit)
                 
-                # Determine trend based on forecast
-                price_change_pct = ((forecast_1 - current_price) / current_price) * 100
+                if not ohlcv or len(ohlcv) == 0:
+                    logger.warning(f"No data returned for {symbol} with timeframe {timeframe}")
+                    return None
                 
-                if price_change_pct > 0.5:  # 0.5% increase
-                    return "Bullish", get_emoji('up'), forecast_1
-                elif price_change_pct < -0.5:  # 0.5% decrease
-                    return "Bearish", get_emoji('down'), forecast_1
-                else:
-                    return "Neutral", get_emoji('neutral'), forecast_1
-            else:
-                return "Neutral", get_emoji('neutral'), current_price
+                df = self.ohlcv_to_dataframe(symbol, ohlcv)
+                logger.info(f"{get_emoji('check')} Successfully fetched {len(df)} {timeframe} records for {symbol}")
+                return df
                 
-        except Exception as e:
-            logger.error(f"Error in 1-hour polynomial signal: {str(e)}")
-            return "Neutral", get_emoji('neutral'), current_price
+            except ccxt.RateLimitExceeded:
+                wait_time = retry_delay * (attempt + 1)
+                logger.warning(f"Rate limit exceeded for {symbol}. Pausing public requests for {wait_time} seconds...")
+                self.rate_limiter.penalize('public', wait_time)
+                continue
+                
+            except ccxt.NetworkError as e:
+                logger.warning(f"Network error for {symbol}: {str(e)}. Retrying in {retry_delay} seconds...")
+                await asyncio.sleep(retry_delay)
+                continue
+                
+            except ccxt.ExchangeError as e:
+                # Try alternative symbol format
+                if "Invalid symbol" in str(e) and attempt == 0:
+                    logger.warning(f"Invalid symbol {symbol}, trying alternative format...")
+                    spot_symbol = symbol.replace(':USDT', '')
+                    try:
+                        async with semaphore:
+                            await self.rate_limiter.acquire_async('public')
+                            ohlcv = await exchange.fetch_ohlcv(spot_symbol, timeframe, since=since, limit=limit)
+                        if ohlcv and len(ohlcv) > 0:
+                            logger.info(f"{get_emoji('check')} Successfully fetched spot data for {spot_symbol}")
+                            return self.ohlcv_to_dataframe(spot_symbol, ohlcv)
+                    except Exception:
+                        pass
+                
+                logger.error(f"Exchange error for {symbol}: {str(e)}")
+                if attempt == max_retries - 1:
+                    return None
+                await asyncio.sleep(retry_delay)
+                continue
+                
+            except Exception as e:
+                logger.error(f"Unexpected error fetching data for {symbol}: {str(e)}")
+                if attempt == max_retries - 1:
+                    return None
+                await asyncio.sleep(retry_delay)
+                continue
+        
+        return None
     
-    def calculate_fibonacci_levels(self, high: float, low: float) -> Dict[str, float]:
-        """Calculate Fibonacci retracement and extension levels"""
-        try:
-            if high <= low:
-                logger.warning(f"Invalid high/low values: high={high}, low={low}")
-                high = max(high, low * 1.01)  # Ensure high > low
-            
-            diff = high - low
-            
-            levels = {
-                '0%': high,
-                '23.6%': high - diff * 0.236,
-                '38.2%': high - diff * 0.382,
-                '50%': high - diff * 0.5,
-                '61.8%': high - diff * 0.618,
-                '78.6%': high - diff * 0.786,
-                '100%': low,
-                '127.2%': low - diff * 0.272,
-                '161.8%': low - diff * 0.618,
-                '261.8%': low - diff * 1.618,
-                '423.6%': low - diff * 3.236
-            }
-            
-            return levels
-            
-        except Exception as e:
-            logger.error(f"Error calculating Fibonacci levels: {str(e)}")
-            return {'0%': high, '100%': low}
+    def store_candle_page(self, symbol: str, timeframe: str, df: pd.DataFrame, since: int, backfill: bool) -> int:
+        """Upsert one fetched page of candles; returns the open time of its newest candle
+        
+        The first page of a backfill starting after `since` means the exchange
+        has nothing older, which is recorded so the series is not backfilled again.
+        """
+        self.candle_store.upsert(symbol, timeframe, df)
+        timestamps = to_epoch_ms(df['timestamp'])
+        if backfill and int(timestamps.iloc[0]) > since:
+            self.candle_store.set_history_start(symbol, timeframe, int(timestamps.iloc[0]))
+        return int(timestamps.iloc[-1])
     
-    def get_fibonacci_signal(self, current_price: float, fib_levels: Dict[str, float]) -> Tuple[str, str]:
-        """Get Fibonacci-based signal"""
-        try:
-            if '61.8%' in fib_levels and '38.2%' in fib_levels:
-                if current_price > fib_levels['61.8%']:
-                    return "Bullish", get_emoji('up')
-                elif current_price < fib_levels['38.2%']:
-                    return "Bearish", get_emoji('down')
+    def get_candles(self, symbol: str, timeframe: str = '1h', limit: int = 100) -> Optional[pd.DataFrame]:
+        """Get the newest candles, fetching only what the local candle store is missing
+        
+        Every page is stored as soon as it arrives, so when a later page fails
+        the earlier ones are kept and the next run only fetches the rest.
+        """
+        if self.candle_store is None:
+            return self.fetch_data(symbol, timeframe, limit)
+        
+        now_ms = int(time.time() * 1000)
+        first_ts, last_ts = self.candle_store.get_time_range(symbol, timeframe)
+        since = plan_fetch_since(first_ts, last_ts, timeframe, limit, now_ms,
+                                 self.candle_store.get_history_start(symbol, timeframe))
+        backfill = since != last_ts
+        stored = 0
+        
+        while True:
+            df = self.fetch_data(symbol, timeframe, CANDLE_PAGE_LIMIT, since=since)
+            if df is None or df.empty:
+                if stored:
+                    logger.warning(f"⚠️ Candle fetch for {symbol} {timeframe} stopped after {stored} candles; "
+                                   f"they stay stored and the next run resumes after them")
+                return None
             
-            return "Neutral", get_emoji('neutral')
+            newest_ts = self.store_candle_page(symbol, timeframe, df, since, backfill and not stored)
+            stored += len(df)
+            if is_fetch_complete(len(df), newest_ts, CANDLE_PAGE_LIMIT, timeframe, now_ms):
+                break
+            since = newest_ts + timeframe_to_ms(timeframe)
+        
+        return self.candle_store.load(symbol, timeframe, limit)
+    
+    async def get_candles_async(self, exchange, semaphore: asyncio.Semaphore, symbol: str,
+                                timeframe: str = '1h', limit: int = 100) -> Optional[pd.DataFrame]:
+        """Async variant of get_candles"""
+        if self.candle_store is None:
+            return await self.fetch_data_async(exchange, semaphore, symbol, timeframe, limit)
+        
+        now_ms = int(time.time() * 1000)
+        first_ts, last_ts = self.candle_store.get_time_range(symbol, timeframe)
+        since = plan_fetch_since(first_ts, last_ts, timeframe, limit, now_ms,
+                                 self.candle_store.get_history_start(symbol, timeframe))
+        backfill = since != last_ts
+        stored = 0
+        
+        while True:
+            df = await self.fetch_data_async(exchange, semaphore, symbol, timeframe, CANDLE_PAGE_LIMIT, since=since)
+            if df is None or df.empty:
+                if stored:
+                    logger.warning(f"⚠️ Candle fetch for {symbol} {timeframe} stopped after {stored} candles; "
+                                   f"they stay stored and the next run resumes after them")
+                return None
             
-        except Exception as e:
-            logger.error(f"Error getting Fibonacci signal: {str(e)}")
-            return "Neutral", get_emoji('neutral')
+            newest_ts = self.store_candle_page(symbol, timeframe, df, since, backfill and not stored)
+            stored += len(df)
+            if is_fetch_complete(len(df), newest_ts, CANDLE_PAGE_LIMIT, timeframe, now_ms):
+                break
+            since = newest_ts + timeframe_to_ms(timeframe)
+        
+        return self.candle_store.load(symbol, timeframe, limit)
     
-    def get_rsi_zone(self, rsi_value: float) -> Tuple[str, str]:
-        """Get RSI zone"""
-        try:
-            if rsi_value < 30:
-                return "Oversold", get_emoji('up')
-            elif rsi_value < 40:
-                return "Undervalued", get_emoji('up')
-            elif rsi_value < 60:
-                return "Neutral", get_emoji('neutral')
-            elif rsi_value < 70:
-                return "Overvalued", get_emoji('down')
-            else:
-                return "Overbought", get_emoji('down')
-        except Exception as e:
-            logger.error(f"Error getting RSI zone: {str(e)}")
-            return "Neutral", get_emoji('neutral')
+    def get_base_lookback(self, timeframes: List[str], limit: int) -> int:
+        """Number of base candles needed to resample `limit` candles of every timeframe"""
+        base_ms = timeframe_to_ms(BASE_TIMEFRAME)
+        lookback = limit
+        for timeframe in timeframes:
+            timeframe_ms = timeframe_to_ms(timeframe)
+            if timeframe_ms % base_ms != 0:
+                raise ValueError(f"Cannot resample {BASE_TIMEFRAME} candles into {timeframe}")
+            # One extra bucket covers the incomplete leading bucket dropped by resample_ohlcv
+            lookback = max(lookback, (limit + 1) * (timeframe_ms // base_ms))
+        return lookback
     
-    def calculate_pivot_zones(self, df: pd.DataFrame) -> Dict[str, float]:
-        """Calculate precise pivot zones according to pseudocode specification"""
-        try:
-            # Use daily data for pivot zone calculation
-            if len(df) < 20:
-                recent_data = df
-            else:
-                recent_data = df.tail(20)  # Last 20 daily candles
-            
-            # Calculate recent high and low
-            recent_low = float(recent_data['low'].min())
-            recent_high = float(recent_data['high'].max())
-            
-            # Ensure we have a valid price range
-            if recent_high <= recent_low:
-                recent_high = recent_low * 1.05  # Add 5% margin if high <= low
-            
-            price_range = recent_high - recent_low
-            
-            # Calculate zones as percentages of range from recent_low
-            zones = {
-                'extreme_discount': recent_low + 0.1 * price_range,
-                'accumulation_lower': recent_low + 0.1 * price_range,
-                'accumulation_upper': recent_low + 0.3 * price_range,
-                'reversal_zone': recent_low + 0.5 * price_range,
-                'strong_support': recent_low + 0.7 * price_range,
-                'recent_low': recent_low,
-                'recent_high': recent_high,
-                'price_range': price_range
-            }
-            
-            # Calculate accumulation mid-range
-            zones['accumulation_mid_range'] = (zones['accumulation_lower'] + zones['accumulation_upper']) / 2
-            
-            logger.debug(f"Pivot zones calculated:")
-            logger.debug(f"  Recent Low: ${recent_low:.4f}, Recent High: ${recent_high:.4f}")
-            logger.debug(f"  Extreme Discount: ${zones['extreme_discount']:.4f}")
-            logger.debug(f"  Accumulation: ${zones['accumulation_lower']:.4f} - ${zones['accumulation_upper']:.4f}")
-            logger.debug(f"  Reversal Zone: ${zones['reversal_zone']:.4f}")
-            logger.debug(f"  Strong Support: ${zones['strong_support']:.4f}")
-            
-            return zones
+    def build_timeframe_views(self, base_data: Optional[pd.DataFrame], timeframes: List[str],
+                              limit: int) -> Dict[str, Optional[pd.DataFrame]]:
+        """Resample base candles into the newest `limit` candles of each timeframe"""
+        views: Dict[str, Optional[pd.DataFrame]] = {}
+        for timeframe in timeframes:
+            if base_data is None or base_data.empty:
+                views[timeframe] = None
+                continue
             
-        except Exception as e:
-            logger.error(f"Error calculating pivot zones: {str(e)}")
-            return {}
+            view = base_data if timeframe == BASE_TIMEFRAME else resample_ohlcv(base_data, timeframe)
+            views[timeframe] = view.tail(limit).reset_index(drop=True)
+        return views
     
-    def get_pivot_zone(self, current_price: float, pivot_levels: Dict[str, float]) -> Tuple[str, str, Dict[str, float]]:
-        """Get current pivot zone with detailed zone information"""
-        try:
-            if not pivot_levels or 'extreme_discount' not in pivot_levels:
-                return "Unknown", get_emoji('neutral'), {}
-            
-            # Determine current zone
-            extreme_discount = pivot_levels['extreme_discount']
-            accumulation_upper = pivot_levels.get('accumulation_upper', extreme_discount * 1.2)
-            reversal_zone = pivot_levels.get('reversal_zone', accumulation_upper * 1.2)
-            strong_support = pivot_levels.get('strong_support', reversal_zone * 1.2)
-            
-            # Determine zone based on current price
-            if current_price <= extreme_discount:
-                zone_name = "Extreme Discount"
-                zone_emoji = get_emoji('discount')
-                is_bullish_zone = True
-            elif current_price <= accumulation_upper:
-                zone_name = "Accumulation Zone"
-                zone_emoji = get_emoji('up')
-                is_bullish_zone = True
-            elif current_price <= reversal_zone:
-                zone_name = "Reversal Zone"
-                zone_emoji = get_emoji('neutral')
-                is_bullish_zone = False
-            elif current_price <= strong_support:
-                zone_name = "Strong Support"
-                zone_emoji = get_emoji('down')
-                is_bullish_zone = False
-            else:
-                zone_name = "Above Buy Zone"
-                zone_emoji = get_emoji('overvalued')
-                is_bullish_zone = False
-            
-            # Prepare zone details
-            zone_details = {
-                'zone_name': zone_name,
-                'zone_emoji': zone_emoji,
-                'is_bullish_zone': is_bullish_zone,
-                'extreme_discount': extreme_discount,
-                'accumulation_lower': pivot_levels.get('accumulation_lower', extreme_discount),
-                'accumulation_upper': accumulation_upper,
-                'accumulation_mid_range': pivot_levels.get('accumulation_mid_range', 
-                    (pivot_levels.get('accumulation_lower', extreme_discount) + accumulation_upper) / 2),
-                'reversal_zone': reversal_zone,
-                'strong_support': strong_support,
-                'recent_low': pivot_levels.get('recent_low', 0),
-                'recent_high': pivot_levels.get('recent_high', 0),
-                'price_range': pivot_levels.get('price_range', 0)
-            }
-            
-            return zone_name, zone_emoji, zone_details
-            
-        except Exception as e:
-            logger.error(f"Error getting pivot zone: {str(e)}")
-            return "Unknown", get_emoji('neutral'), {}
+    def get_market_data(self, symbol: str, timeframes: Optional[List[str]] = None,
+                        limit: int = OHLCV_LIMIT) -> Dict[str, Optional[pd.DataFrame]]:
+        """Get candles for each timeframe of one symbol (one base fetch when resampling)"""
+        timeframes = timeframes or SIGNAL_TIMEFRAMES
+        if self.resample_enabled:
+            base_data = self.get_candles(symbol, BASE_TIMEFRAME, self.get_base_lookback(timeframes, limit))
+            return self.build_timeframe_views(base_data, timeframes, limit)
+        return {timeframe: self.get_candles(symbol, timeframe, limit) for timeframe in timeframes}
     
-    def get_pivot_zone_signal(self, zone_details: Dict[str, Any]) -> Tuple[str, str]:
-        """Get pivot zone signal (Bullish/Bearish/Neutral) based on zone"""
-        try:
-            if not zone_details:
-                return "Neutral", get_emoji('neutral')
-            
-            zone_name = zone_details.get('zone_name', '')
-            is_bullish_zone = zone_details.get('is_bullish_zone', False)
-            
-            if zone_name in ["Extreme Discount", "Accumulation Zone"] and is_bullish_zone:
-                return "Bullish", get_emoji('up')
-            elif zone_name in ["Above Buy Zone", "Strong Support"] and not is_bullish_zone:
-                return "Bearish", get_emoji('down')
-            else:
-                return "Neutral", get_emoji('neutral')
-                
-        except Exception as e:
-            logger.error(f"Error getting pivot zone signal: {str(e)}")
-            return "Neutral", get_emoji('neutral')
+    async def get_market_data_async(self, exchange, semaphore: asyncio.Semaphore, symbol: str,
+                                    timeframes: Optional[List[str]] = None,
+                                    limit: int = OHLCV_LIMIT) -> Dict[str, Optional[pd.DataFrame]]:
+        """Async variant of get_market_data"""
+        timeframes = timeframes or SIGNAL_TIMEFRAMES
+        if self.resample_enabled:
+            base_data = await self.get_candles_async(exchange, semaphore, symbol, BASE_TIMEFRAME,
+                                                     self.get_base_lookback(timeframes, limit))
+            return self.build_timeframe_views(base_data, timeframes, limit)
+        
+        results = await asyncio.gather(
+            *(self.get_candles_async(exchange, semaphore, symbol, timeframe, limit) for timeframe in timeframes),
+            return_exceptions=True
+        )
+        market_data: Dict[str, Optional[pd.DataFrame]] = {}
+        for timeframe, result in zip(timeframes, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error fetching {timeframe} data for {symbol}: {str(result)}")
+                result = None
+            market_data[timeframe] = result
+        return market_data
     
-    def calculate_regression_metrics(self, df: pd.DataFrame, coeffs: np.ndarray) -> Tuple[float, float, float]:
-        """Calculate regression quality metrics"""
+    async def fetch_universe_async(self, symbols: List[str], timeframes: Optional[List[str]] = None,
+                                   limit: int = OHLCV_LIMIT,
+                                   on_symbol_ready: Optional[Callable[[str, Dict[str, Optional[pd.DataFrame]]], None]] = None
+                                   ) -> Dict[str, Dict[str, Optional[pd.DataFrame]]]:
+        """Fetch every symbol concurrently, bounded by FETCH_CONCURRENCY and the rate limiter
+        
+        With resampling enabled only BASE_TIMEFRAME is fetched and the other views are built from it.
+        on_symbol_ready is called with each symbol's candles as soon as they are complete.
+        """
+        semaphore = asyncio.Semaphore(max(1, FETCH_CONCURRENCY))
+        exchange = self.create_async_exchange()
+        
+        async def fetch_symbol(symbol: str) -> Dict[str, Optional[pd.DataFrame]]:
+            try:
+                market_data = await self.get_market_data_async(exchange, semaphore, symbol, timeframes, limit)
+            except Exception as e:
+                logger.error(f"Error fetching data for {symbol}: {str(e)}")
+                market_data = {}
+            if on_symbol_ready is not None:
+                on_symbol_ready(symbol, market_data)
+            return market_data
+        
         try:
-            if len(coeffs) == 0:
-                return 0.0, 0.0, 0.0
-            
-            x = np.arange(len(df))
-            y = df['close'].values
-            
-            polynomial = np.poly1d(coeffs)
-            y_pred = polynomial(x)
-            
-            # R-squared
-            ss_res = np.sum((y - y_pred) ** 2)
-            ss_tot = np.sum((y - np.mean(y)) ** 2) if len(y) > 1 else 1
-            r_squared = max(0, min(1, 1 - (ss_res / ss_tot))) if ss_tot != 0 else 0
-            
-            # Confidence based on R-squared
-            confidence = min(100, max(0, r_squared * 100))
-            
-            # Trend strength based on slope
-            if len(coeffs) > 1:
-                slope = coeffs[-2]
-                trend_strength = min(100, max(0, abs(slope) * 1000))
-            else:
-                trend_strength = 0
-            
-            return r_squared, confidence, trend_strength
-            
-        except Exception as e:
-            logger.error(f"Error calculating regression metrics: {str(e)}")
-            return 0.0, 0.0, 0.0
+            results = await asyncio.gather(*(fetch_symbol(symbol) for symbol in symbols))
+        finally:
+            await exchange.close()
+        
+        return dict(zip(symbols, results))
     
-    def calculate_support_resistance(self, df: pd.DataFrame) -> Tuple[float, float]:
-        """Calculate support and resistance levels"""
-        try:
-            if len(df) < 10:
-                support = df['low'].min()
-                resistance = df['high'].max()
-            else:
-                # Use recent data
-                recent = df.tail(20)
-                support = recent['low'].min()
-                resistance = recent['high'].max()
-            
-            # Ensure support < resistance
-            if support >= resistance:
-                resistance = support * 1.05
-            
-            return float(support), float(resistance)
-            
-        except Exception as e:
-            logger.error(f"Error calculating support/resistance: {str(e)}")
-            return 0.0, 0.0
+    def fetch_universe(self, symbols: List[str], timeframes: Optional[List[str]] = None,
+                       limit: int = OHLCV_LIMIT,
+                       on_symbol_ready: Optional[Callable[[str, Dict[str, Optional[pd.DataFrame]]], None]] = None
+                       ) -> Dict[str, Dict[str, Optional[pd.DataFrame]]]:
+        """Blocking wrapper around fetch_universe_async"""
+        fetch_start = time.time()
+        timeframes = timeframes or SIGNAL_TIMEFRAMES
+        if self.resample_enabled:
+            logger.info(f"{get_emoji('hourglass')} Fetching {len(symbols)} {BASE_TIMEFRAME} OHLCV series, "
+                        f"resampling to {', '.join(timeframes)} (concurrency: {FETCH_CONCURRENCY})")
+        else:
+            logger.info(f"{get_emoji('hourglass')} Fetching {len(symbols) * len(timeframes)} OHLCV series "
+                        f"(concurrency: {FETCH_CONCURRENCY})")
+        
+        market_data = asyncio.run(self.fetch_universe_async(symbols, timeframes, limit, on_symbol_ready))
+        
+        fetched = sum(1 for frames in market_data.values() for df in frames.values() if df is not None)
+        logger.info(f"{get_emoji('check')} Fetched {fetched}/{len(symbols) * len(timeframes)} series "
+                    f"in {time.time() - fetch_start:.2f} seconds")
+        return market_data
+    
+    def fetch_price_snapshot(self, symbols: List[str]) -> Dict[str, float]:
+        """Fetch the last price of every symbol with one bulk ticker request
+        
+        All symbols are priced at the same moment. Symbols missing from the
+        response (or every symbol, if the request fails) are left out so callers
+        can fall back to the latest candle close.
+        """
+        max_retries = 3
+        retry_delay = 5
+        
+        for attempt in range(max_retries):
+            try:
+                self.rate_limiter.acquire('public')
+                tickers = self.exchange.fetch_tickers(symbols)
+                
+                snapshot = {}
+                for symbol in symbols:
+                    ticker = tickers.get(symbol) or {}
+                    price = ticker.get('last') or ticker.get('close')
+                    if price:
+                        snapshot[symbol] = float(price)
+                
+                logger.info(f"{get_emoji('check')} Price snapshot: {len(snapshot)}/{len(symbols)} symbols priced")
+                return snapshot
+                
+            except ccxt.RateLimitExceeded:
+                wait_time = retry_delay * (attempt + 1)
+                logger.warning(f"Rate limit exceeded fetching tickers. Pausing public requests for {wait_time} seconds...")
+                self.rate_limiter.penalize('public', wait_time)
+                continue
+                
+            except Exception as e:
+                logger.error(f"Error fetching price snapshot: {str(e)}")
+                if attempt == max_retries - 1:
+                    break
+                time.sleep(retry_delay)
+        
+        logger.warning(f"{get_emoji('warning')} No price snapshot, using latest candle closes")
+        return {}
     
     def save_daily_forecast_to_db(self, symbol: str, current_price: float, 
                                  forecast_1d: float, forecast_7d: float, 
                                  forecast_14d: float, forecast_30d: float, 
                                  poly_signal: str, poly_emoji: str) -> bool:
-        """Save daily polynomial regression forecast to database"""
+        """Queue the daily polynomial regression forecast (see BatchWriter)"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                INSERT OR REPLACE INTO hvts_forecast 
-                (symbol, current_price, forecast_1d, forecast_7d, forecast_14d, forecast_30d, poly_signal, poly_emoji, timestamp)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
+            self.writer.add('hvts_forecast', (
                 symbol, current_price, forecast_1d, forecast_7d, 
                 forecast_14d, forecast_30d, poly_signal, poly_emoji,
                 datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             ))
-            
-            conn.commit()
-            conn.close()
-            logger.debug(f"Saved daily forecast for {symbol}")
+            logger.debug(f"Queued daily forecast for {symbol}")
             return True
             
         except Exception as e:
@@ -953,18 +754,9 @@ class TradingSignalGenerator:
     def save_fibonacci_data_to_db(self, symbol: str, current_price: float, 
                                  fib_levels: Dict[str, float], fib_1h_signal: str, 
                                  pivot_zone: str) -> bool:
-        """Save Fibonacci 1-hour data to database"""
+        """Queue Fibonacci 1-hour data (see BatchWriter)"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                INSERT OR REPLACE INTO fibonacci_1h 
-                (symbol, current_price, fib_level_0, fib_level_23_6, fib_level_38_2, fib_level_50, 
-                 fib_level_61_8, fib_level_78_6, fib_level_100, fib_level_127_2, fib_level_161_8,
-                 fib_level_261_8, fib_level_423_6, fib_1h_signal, pivot_zone, timestamp)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
+            self.writer.add('fibonacci_1h', (
                 symbol, current_price,
                 fib_levels.get('0%', 0), fib_levels.get('23.6%', 0),
                 fib_levels.get('38.2%', 0), fib_levels.get('50%', 0),
@@ -974,10 +766,7 @@ class TradingSignalGenerator:
                 fib_levels.get('423.6%', 0), fib_1h_signal, pivot_zone,
                 datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             ))
-            
-            conn.commit()
-            conn.close()
-            logger.debug(f"Saved Fibonacci data for {symbol}")
+            logger.debug(f"Queued Fibonacci data for {symbol}")
             return True
             
         except Exception as e:
@@ -990,27 +779,15 @@ class TradingSignalGenerator:
                                   trend_strength: float, support_level: float, 
                                   resistance_level: float, forecast_1d: float, 
                                   forecast_7d: float, forecast_30d: float) -> bool:
-        """Save polynomial regression daily data to database"""
+        """Queue polynomial regression daily data (see BatchWriter)"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                INSERT OR REPLACE INTO polynomial_regression_daily 
-                (symbol, current_price, poly_regression_value, poly_signal_daily, poly_confidence,
-                 r_squared, trend_strength, support_level, resistance_level,
-                 forecast_1d, forecast_7d, forecast_30d, timestamp)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
+            self.writer.add('polynomial_regression_daily', (
                 symbol, current_price, poly_regression_value, poly_signal_daily,
                 poly_confidence, r_squared, trend_strength, support_level,
                 resistance_level, forecast_1d, forecast_7d, forecast_30d,
                 datetime.now().strftime("%Y-%m-%d %H:%M:%S")
             ))
-            
-            conn.commit()
-            conn.close()
-            logger.debug(f"Saved regression data for {symbol}")
+            logger.debug(f"Queued regression data for {symbol}")
             return True
             
         except Exception as e:
@@ -1018,18 +795,9 @@ class TradingSignalGenerator:
             return False
     
     def save_trading_signal_to_db(self, signal: Dict[str, Any]) -> bool:
-        """Save complete trading signal to database"""
+        """Queue the complete trading signal (see BatchWriter)"""
         try:
-            conn = sqlite3.connect(self.db_path)
-            cursor = conn.cursor()
-            
-            cursor.execute('''
-                INSERT OR REPLACE INTO trading_signals 
-                (symbol, current_price, poly_1h_signal, fib_15m_signal, fib_signal, 
-                 poly_signal, rsi_zone, macd_signal, pivot_zone, overall_signal,
-                 forecast_1h, forecast_1d, forecast_7d, forecast_14d, forecast_30d, timestamp)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
+            self.writer.add('trading_signals', (
                 signal['symbol'], signal['current_price'],
                 signal['poly_1h_signal'], signal['fib_15m_signal'],
                 signal['fib_signal'], signal['poly_signal'],
@@ -1039,21 +807,56 @@ class TradingSignalGenerator:
                 signal['forecast_7d'], signal['forecast_14d'],
                 signal['forecast_30d'], signal['timestamp']
             ))
-            
-            conn.commit()
-            conn.close()
-            logger.debug(f"Saved trading signal for {signal['symbol']}")
+            logger.debug(f"Queued trading signal for {signal['symbol']}")
             return True
             
         except Exception as e:
             logger.error(f"Error saving trading signal for {signal['symbol']}: {str(e)}")
             return False
     
+    def save_signal_state_to_db(self, symbol: str, zone_details: Dict[str, Any], fib_levels: Dict[str, float],
+                                forecast_1h: Optional[float], forecast_1d: Optional[float],
+                                rsi_signal: str, macd_signal: str) -> bool:
+        """Queue the price-independent signal inputs used by fast_refresh (see BatchWriter)"""
+        try:
+            self.writer.add('signal_state', (
+                symbol,
+                zone_details.get('extreme_discount'), zone_details.get('accumulation_upper'),
+                zone_details.get('reversal_zone'), zone_details.get('strong_support'),
+                fib_levels.get('38.2%'), fib_levels.get('61.8%'),
+                forecast_1h, forecast_1d, rsi_signal, macd_signal,
+                datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            ))
+            logger.debug(f"Queued signal state for {symbol}")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error saving signal state for {symbol}: {str(e)}")
+            return False
+    
+    def save_signal_history_to_db(self, symbol: str, overall_signal: str, pivot_zone: str,
+                                  current_price: float, rsi: float, rsi_signal: str, macd_signal: str,
+                                  poly_signal: str, bullish_count: int, bearish_count: int,
+                                  forecast_1d: float, forecast_30d: float) -> bool:
+        """Queue a signal_history point for this run (see BatchWriter)"""
+        try:
+            self.writer.add('signal_history', (
+                symbol, int(time.time()), overall_signal, pivot_zone, current_price, rsi,
+                rsi_signal, macd_signal, poly_signal, bullish_count, bearish_count,
+                forecast_1d, forecast_30d
+            ))
+            logger.debug(f"Queued signal history for {symbol}")
+            return True
+            
+        except Exception as e:
+            logger.error(f"Error saving signal history for {symbol}: {str(e)}")
+            return False
+    
     def update_dashboard_metadata(self, total_symbols: int, update_duration: float, 
                                  status: str = 'success') -> bool:
         """Update dashboard metadata table"""
         try:
-            conn = sqlite3.connect(self.db_path)
+            conn = connect_database(self.db_path, DB_BUSY_TIMEOUT_MS)
             cursor = conn.cursor()
             
             cursor.execute('''
@@ -1065,7 +868,7 @@ class TradingSignalGenerator:
                 total_symbols,
                 status,
                 update_duration,
-                'gateio'
+                self.data_source.name
             ))
             
             conn.commit()
@@ -1077,210 +880,126 @@ class TradingSignalGenerator:
             logger.error(f"Error updating dashboard metadata: {str(e)}")
             return False
     
-    def generate_signal(self, symbol: str) -> Optional[Dict[str, Any]]:
-        """Generate trading signal for a symbol with real data only - Updated for precise pivot zones"""
-        logger.info(f"{get_emoji('signal')} Generating signal for {symbol}")
+    def catch_up_changesets(self) -> Optional[int]:
+        """Apply changesets in changeset_dir that this database doesn't contain yet
         
+        Between rebases the published database is older than the changesets
+        next to it (see run_rebase), so this restores the current state before
+        a run adds to it.
+        """
         try:
-            # Fetch real data from Gate.io
-            hourly_data = self.fetch_data(symbol, '1h', 100)
-            four_hour_data = self.fetch_data(symbol, '4h', 100)
-            daily_data = self.fetch_data(symbol, '1d', 100)
-            
-            # Validate data
-            if hourly_data is None or hourly_data.empty:
-                logger.error(f"No hourly data for {symbol}")
-                return None
-            
-            if daily_data is None or daily_data.empty:
-                logger.error(f"No daily data for {symbol}")
-                return None
-            
-            if four_hour_data is None or four_hour_data.empty:
-                logger.warning(f"No 4h data for {symbol}, using hourly data")
-                four_hour_data = hourly_data
-            
-            # Current price from daily data
-            current_price = float(daily_data['close'].iloc[-1])
-            logger.info(f"{symbol} current price: ${current_price:.4f}")
-            
-            # 1-hour Polynomial Regression Trend Signal
-            poly_1h_signal, poly_1h_emoji, poly_1h_forecast = self.get_poly_signal_1h(hourly_data, current_price)
-            
-            # 1-hour Fibonacci Analysis
-            fib_levels_1h = self.calculate_fibonacci_levels(
-                hourly_data['high'].max(), 
-                hourly_data['low'].min()
-            )
-            fib_1h_signal, fib_1h_emoji = self.get_fibonacci_signal(current_price, fib_levels_1h)
-            
-            # Fibonacci Signal for comparison
-            fib_signal, fib_emoji = self.get_fibonacci_signal(current_price, fib_levels_1h)
-            
-            # Daily Polynomial Regression
-            forecast, coeffs = self.polynomial_regression_forecast(daily_data, degree=3, periods=30)
-            
-            if forecast is not None and coeffs is not None:
-                # Extract forecasts
-                forecast_1d = forecast[0] if len(forecast) >= 1 else current_price
-                forecast_7d = forecast[6] if len(forecast) >= 7 else current_price
-                forecast_14d = forecast[13] if len(forecast) >= 14 else current_price
-                forecast_30d = forecast[29] if len(forecast) >= 30 else current_price
-                
-                # Regression metrics
-                r_squared, confidence, trend_strength = self.calculate_regression_metrics(daily_data, coeffs)
-                
-                # Support and resistance
-                support, resistance = self.calculate_support_resistance(daily_data)
-                
-                # Determine trend based on pseudocode logic (1% threshold)
-                price_change_1d_pct = ((forecast_1d - current_price) / current_price) * 100
-                if price_change_1d_pct > 1.0:  # 1% increase threshold from pseudocode
-                    poly_signal, poly_emoji = "Bullish", get_emoji('up')
-                elif price_change_1d_pct < -1.0:  # 1% decrease threshold
-                    poly_signal, poly_emoji = "Bearish", get_emoji('down')
-                else:
-                    poly_signal, poly_emoji = "Neutral", get_emoji('neutral')
-                
-                # Save regression data
-                self.save_regression_data_to_db(
-                    symbol, current_price,
-                    coeffs[-2] if len(coeffs) > 1 else 0,
-                    f"{poly_emoji} {poly_signal}",
-                    confidence, r_squared, trend_strength,
-                    support, resistance,
-                    forecast_1d, forecast_7d, forecast_30d
-                )
-                
-                # Save daily forecast
-                self.save_daily_forecast_to_db(
-                    symbol, current_price, forecast_1d, forecast_7d,
-                    forecast_14d, forecast_30d, poly_signal, poly_emoji
-                )
-            else:
-                # Fallback if regression fails
-                forecast_1d = forecast_7d = forecast_14d = forecast_30d = current_price
-                poly_signal, poly_emoji = "Neutral", get_emoji('neutral')
-                r_squared = confidence = trend_strength = 0
-                support = resistance = current_price
-            
-            # RSI Analysis (4-hour) - Updated thresholds from pseudocode
-            rsi_values = self.calculate_rsi(four_hour_data['close'])
-            current_rsi = rsi_values.iloc[-1] if not rsi_values.empty else 50
-            
-            # Get RSI zone for display
-            rsi_zone, rsi_zone_emoji = self.get_rsi_zone(current_rsi)
-            
-            # Get RSI signal based on pseudocode thresholds
-            if current_rsi < 40:
-                rsi_signal, rsi_signal_emoji = "Bullish", get_emoji('up')
-            elif current_rsi > 60:
-                rsi_signal, rsi_signal_emoji = "Bearish", get_emoji('down')
-            else:
-                rsi_signal, rsi_signal_emoji = "Neutral", get_emoji('neutral')
-            
-            # MACD Analysis (4-hour)
-            macd_line, signal_line, macd_histogram = self.calculate_macd(four_hour_data['close'])
-            macd_signal, macd_emoji = self.get_macd_signal(macd_line, signal_line, macd_histogram)
-            
-            # NEW: Precise Pivot Zone Analysis
-            pivot_levels = self.calculate_pivot_zones(daily_data)
-            pivot_zone, pivot_emoji, zone_details = self.get_pivot_zone(current_price, pivot_levels)
-            pivot_signal, pivot_signal_emoji = self.get_pivot_zone_signal(zone_details)
-            
-            # Save Fibonacci data with actual pivot zone
-            self.save_fibonacci_data_to_db(
-                symbol, current_price, fib_levels_1h,
-                f"{fib_1h_emoji} {fib_1h_signal}",
-                f"{pivot_emoji} {pivot_zone}"
-            )
-            
-            # Combined signal analysis - Updated for 3+ signal threshold from pseudocode
-            # Convert signals to consistent format for counting
-            signal_list = [
-                ('Poly 1H', poly_1h_signal),
-                ('Fibonacci', fib_signal),
-                ('Poly Daily', poly_signal),
-                ('RSI', rsi_signal),
-                ('MACD', macd_signal),
-                ('Pivot Zone', pivot_signal)
-            ]
-            
-            # Count bullish and bearish signals
-            bull_keywords = ['bull', 'up']
-            bear_keywords = ['bear', 'down']
-            
-            bull_count = 0
-            bear_count = 0
-            
-            for _, signal in signal_list:
-                signal_str = str(signal).lower()
-                if any(k in signal_str for k in bull_keywords):
-                    bull_count += 1
-                elif any(k in signal_str for k in bear_keywords):
-                    bear_count += 1
-            
-            # Determine overall signal based on pseudocode logic (3+ signals)
-            if bull_count >= 3 and zone_details.get('is_bullish_zone', False):
-                overall_signal, overall_emoji = "BUY", get_emoji('up')
-            elif bear_count >= 3 and not zone_details.get('is_bullish_zone', False):
-                overall_signal, overall_emoji = "SELL", get_emoji('down')
-            else:
-                overall_signal, overall_emoji = "NEUTRAL", get_emoji('neutral')
-            
-            # STRONG signals based on additional criteria
-            if bull_count >= 4 and pivot_zone in ["Extreme Discount", "Accumulation Zone"]:
-                overall_signal, overall_emoji = "STRONG BUY", get_emoji('up')
-            elif bear_count >= 4 and pivot_zone in ["Above Buy Zone", "Strong Support"]:
-                overall_signal, overall_emoji = "STRONG SELL", get_emoji('down')
-            
-            # Create signal dictionary with enhanced zone details
-            signal_data = {
-                'symbol': symbol,
-                'current_price': current_price,
-                'poly_1h_signal': f"{poly_1h_emoji} {poly_1h_signal}",
-                'fib_15m_signal': f"{fib_1h_emoji} {fib_1h_signal}",
-                'fib_signal': f"{fib_emoji} {fib_signal}",
-                'poly_signal': f"{poly_emoji} {poly_signal}",
-                'rsi_zone': f"{rsi_zone_emoji} {rsi_zone} (RSI: {current_rsi:.2f})",
-                'rsi_signal': f"{rsi_signal_emoji} {rsi_signal}",
-                'macd_signal': f"{macd_emoji} {macd_signal}",
-                'pivot_zone': f"{pivot_emoji} {pivot_zone}",
-                'pivot_signal': f"{pivot_signal_emoji} {pivot_signal}",
-                'overall_signal': f"{overall_emoji} {overall_signal}",
-                'overall_signal_type': overall_signal,
-                'pivot_zone_type': pivot_zone,
-                'pivot_emoji': pivot_emoji,
-                'zone_details': zone_details,
-                'signal_counts': {'bullish': bull_count, 'bearish': bear_count, 'total': len(signal_list)},
-                'forecast_1h': poly_1h_forecast,
-                'forecast_1d': forecast_1d,
-                'forecast_7d': forecast_7d,
-                'forecast_14d': forecast_14d,
-                'forecast_30d': forecast_30d,
-                'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-                'data_source': 'gateio'
-            }
-            
-            # Save to database
-            self.save_trading_signal_to_db(signal_data)
-            
-            # Enhanced logging for pivot zones
-            if zone_details:
-                logger.info(f"Pivot Zone Analysis for {symbol}:")
-                logger.info(f"  Zone: {pivot_zone} ({pivot_signal})")
-                logger.info(f"  Price Range: ${zone_details.get('price_range', 0):.4f}")
-                logger.info(f"  Accumulation Zone: ${zone_details.get('accumulation_lower', 0):.4f} - ${zone_details.get('accumulation_upper', 0):.4f}")
-                logger.info(f"  Signal Counts: Bullish={bull_count}, Bearish={bear_count}")
-            
-            logger.info(f"{get_emoji('check')} Generated signal for {symbol}: {overall_signal} ({pivot_zone})")
-            return signal_data
+            conn = connect_database(self.db_path, DB_BUSY_TIMEOUT_MS)
+            try:
+                applied = sync_database(conn, local_fetcher(self.changeset_dir))
+            finally:
+                conn.close()
+        except Exception as e:
+            logger.error(f"{get_emoji('cross')} Error applying changesets: {str(e)}")
+            return None
+        
+        if applied:
+            logger.info(f"{get_emoji('database')} Applied {applied} changesets from {self.changeset_dir}")
+        return applied
+    
+    def publish_changeset(self, **operations) -> Optional[int]:
+        """Write the rows committed since the last changeset, plus `operations`, as a new changeset"""
+        try:
+            changes = self.writer.take_changes()
+            conn = connect_database(self.db_path, DB_BUSY_TIMEOUT_MS)
+            try:
+                cursor = conn.execute('SELECT * FROM dashboard_metadata WHERE id = 1')
+                row = cursor.fetchone()
+                metadata = dict(zip([column[0] for column in cursor.description], row)) if row else None
+                changeset = new_changeset(changes, dashboard_metadata=metadata, **operations)
+                seq = publish_changeset(conn, self.changeset_dir, changeset, CHANGESET_RETENTION)
+            finally:
+                conn.close()
+            logger.info(f"{get_emoji('database')} Published changeset {seq} to {self.changeset_dir}: "
+                        f"{sum(len(rows) for rows in changes.values())} rows")
+            return seq
             
         except Exception as e:
-            logger.error(f"{get_emoji('cross')} Error generating signal for {symbol}: {str(e)}")
-            logger.error(traceback.format_exc())
+            logger.error(f"{get_emoji('cross')} Error publishing changeset: {str(e)}")
             return None
     
+    def publish_snapshot(self) -> bool:
+        """Export the latest state and recent history as Parquet files into snapshot_dir (see snapshot.py)"""
+        snapshot_dir = self.snapshot_dir
+        if not snapshot_available():
+            logger.warning(f"{get_emoji('warning')} pyarrow is not installed, skipping the Parquet snapshot")
+            return False
+        
+        try:
+            conn = connect_database(self.db_path, DB_BUSY_TIMEOUT_MS)
+            try:
+                rows = export_snapshot(conn, snapshot_dir, SNAPSHOT_HISTORY_DAYS)
+            finally:
+                conn.close()
+            size = sum(os.path.getsize(os.path.join(snapshot_dir, f"{table}.parquet")) for table in rows)
+            logger.info(f"{get_emoji('database')} Exported snapshot to {snapshot_dir}: "
+                        f"{sum(rows.values())} rows in {len(rows)} tables, {size / 1024:.1f} KB")
+            return True
+            
+        except Exception as e:
+            logger.error(f"{get_emoji('cross')} Error exporting snapshot: {str(e)}")
+            return False
+    
+    def generate_signal(self, symbol: str, 
+                        market_data: Optional[Dict[str, Optional[pd.DataFrame]]] = None,
+                        current_price: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Generate and save the trading signal for one symbol - Updated for precise pivot zones
+        
+        market_data holds pre-fetched '1h', '4h' and '1d' candles (see fetch_universe);
+        when omitted the candles are fetched here (see get_market_data).
+        current_price normally comes from the run's price snapshot; when omitted
+        the last daily close is used.
+        """
+        logger.info(f"{get_emoji('signal')} Generating signal for {symbol}")
+        
+        if market_data is None:
+            # Fetch real data from Gate.io (incrementally when the candle store is enabled)
+            market_data = self.get_market_data(symbol)
+        
+        signal = self.calculator.evaluate_signal(symbol, market_data, current_price, self.data_source.name)
+        if signal:
+            self.save_signal(signal)
+            self.writer.request_flush()
+        return signal
+    
+    def save_signal(self, signal: Dict[str, Any]):
+        """Queue an evaluated signal and its indicator rows (see SignalCalculator.evaluate_signal)
+        
+        Rows are written once DB_FLUSH_SIZE symbols are queued (by the writer
+        thread when DB_BACKGROUND_WRITER is on); call self.writer.flush() to
+        wait for the rest.
+        """
+        symbol = signal['symbol']
+        records = signal.pop('records', {})
+        
+        if records.get('regression'):
+            self.save_regression_data_to_db(**records['regression'])
+        if records.get('daily_forecast'):
+            self.save_daily_forecast_to_db(**records['daily_forecast'])
+        if records.get('fibonacci'):
+            self.save_fibonacci_data_to_db(**records['fibonacci'])
+        self.save_trading_signal_to_db(signal)
+        if records.get('state'):
+            self.save_signal_state_to_db(**records['state'])
+        if records.get('history'):
+            self.save_signal_history_to_db(**records['history'])
+        self.writer.end_symbol()
+        
+        # Enhanced logging for pivot zones
+        zone_details = signal.get('zone_details')
+        if zone_details:
+            logger.info(f"Pivot Zone Analysis for {symbol}:")
+            logger.info(f"  Zone: {signal['pivot_zone_type']} ({signal['pivot_signal']})")
+            logger.info(f"  Price Range: ${zone_details.get('price_range', 0):.4f}")
+            logger.info(f"  Accumulation Zone: ${zone_details.get('accumulation_lower', 0):.4f} - ${zone_details.get('accumulation_upper', 0):.4f}")
+            logger.info(f"  Signal Counts: Bullish={signal['signal_counts']['bullish']}, Bearish={signal['signal_counts']['bearish']}")
+        
+        logger.info(f"{get_emoji('check')} Generated signal for {symbol}: {signal['overall_signal_type']} ({signal['pivot_zone_type']})")
+    
     def send_telegram_message(self, message: str) -> bool:
         """Send message to Telegram channel"""
         if not TELEGRAM_BOT_TOKEN or not TELEGRAM_CHAT_ID:
@@ -1386,21 +1105,201 @@ class TradingSignalGenerator:
         print(f"\n{get_emoji('clock')} 30-Day Forecast: ${signal['forecast_30d']:.4f}")
         print("="*70)
     
+    def fast_refresh(self) -> int:
+        """Reclassify pivot zones and signals for all symbols from one ticker snapshot
+        
+        Candles are not refetched: zone boundaries, Fibonacci levels and forecasts
+        come from signal_state as saved by the last full run. The refreshed rows
+        are published like a run's (changeset, snapshot), so dashboards that
+        sync incrementally see them too. Returns the number of trading_signals
+        rows updated.
+        """
+        start_time = time.time()
+        self.rate_limiter.reset_usage()
+        
+        try:
+            conn = connect_database(self.db_path, DB_BUSY_TIMEOUT_MS)
+            try:
+                state = pd.read_sql_query('SELECT * FROM signal_state', conn, index_col='symbol')
+                current = pd.read_sql_query('SELECT * FROM trading_signals', conn, index_col='symbol')
+                # RSI isn't recomputed without candles: carry the last recorded value forward
+                rsi = pd.read_sql_query('''
+                    SELECT symbol, rsi FROM signal_history h
+                    WHERE ts = (SELECT MAX(ts) FROM signal_history WHERE symbol = h.symbol)
+                ''', conn, index_col='symbol')['rsi']
+            finally:
+                conn.close()
+        except Exception as e:
+            logger.error(f"{get_emoji('cross')} Error loading signal state: {str(e)}")
+            return 0
+        
+        # Only symbols with a full-run row: the other columns are carried over from it
+        state = state[state.index.isin(SYMBOLS) & state.index.isin(current.index)]
+        if state.empty:
+            logger.warning(f"{get_emoji('warning')} No signal state stored yet - run a full update first")
+            return 0
+        
+        price_snapshot = self.fetch_price_snapshot(list(state.index))
+        state = state[state.index.isin(price_snapshot.keys())]
+        if state.empty:
+            logger.warning(f"{get_emoji('warning')} Fast refresh skipped: no prices available")
+            return 0
+        
+        refreshed = self.calculator.reclassify_signals(state, pd.Series(price_snapshot))
+        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        
+        # Through the writer like a full run, so the rows land in the changeset and signal_history
+        for symbol, row in refreshed.iterrows():
+            previous = current.loc[symbol]
+            self.save_trading_signal_to_db({
+                'symbol': symbol, 'current_price': row.current_price,
+                'poly_1h_signal': row.poly_1h_signal, 'fib_15m_signal': row.fib_signal,
+                'fib_signal': row.fib_signal, 'poly_signal': row.poly_signal,
+                'rsi_zone': previous['rsi_zone'], 'macd_signal': previous['macd_signal'],
+                'pivot_zone': row.pivot_zone, 'overall_signal': row.overall_signal,
+                'forecast_1h': previous['forecast_1h'], 'forecast_1d': previous['forecast_1d'],
+                'forecast_7d': previous['forecast_7d'], 'forecast_14d': previous['forecast_14d'],
+                'forecast_30d': previous['forecast_30d'], 'timestamp': timestamp
+            })
+            self.save_signal_history_to_db(
+                symbol, row.overall_signal_type, row.pivot_zone_type, row.current_price,
+                None if pd.isna(rsi.get(symbol)) else float(rsi.get(symbol)),
+                state.at[symbol, 'rsi_signal'], state.at[symbol, 'macd_signal'], row.poly_signal_type,
+                int(row.bullish_count), int(row.bearish_count),
+                previous['forecast_1d'], previous['forecast_30d']
+            )
+            self.writer.end_symbol()
+        
+        self.writer.flush()
+        updated = len(refreshed)
+        
+        if PUBLISH_CHANGESETS:
+            self.publish_changeset()
+        
+        # Fold the WAL into the main file so the database file is complete on its own
+        self.writer.checkpoint('TRUNCATE')
+        
+        if EXPORT_SNAPSHOT:
+            self.publish_snapshot()
+        
+        strong_count = int(refreshed['overall_signal_type'].isin(['STRONG BUY', 'STRONG SELL']).sum())
+        logger.info(f"{get_emoji('check')} Fast refresh updated {updated} symbols in {time.time() - start_time:.2f} seconds "
+                    f"({strong_count} strong signals)")
+        self.rate_limiter.log_usage()
+        return updated
+    
+    def evaluate_universe(self, symbols: List[str],
+                          price_snapshot: Dict[str, float]) -> Tuple[Dict[str, Optional[Dict[str, Any]]], Dict[str, float]]:
+        """Fetch candles and evaluate signals for every symbol, overlapping the two stages
+        
+        Symbols are handed to a ProcessPoolExecutor in chunks of COMPUTE_CHUNK_SIZE
+        as soon as their candles arrive, so indicator math runs on all cores while
+        the fetchers keep going. With COMPUTE_WORKERS=0 the signals are computed
+        inline after fetching. Returns the signals by symbol and stage timings.
+        """
+        pool = ProcessPoolExecutor(max_workers=COMPUTE_WORKERS) if COMPUTE_WORKERS > 0 else None
+        pending: List[Tuple[str, Dict[str, Optional[pd.DataFrame]], Optional[float]]] = []
+        inline_items: List[Tuple[str, Dict[str, Optional[pd.DataFrame]], Optional[float]]] = []
+        futures = []
+        first_submit = None
+        
+        def submit(chunk):
+            nonlocal first_submit
+            if pool is None:
+                inline_items.extend(chunk)
+            else:
+                first_submit = first_submit or time.time()
+                futures.append((chunk, pool.submit(evaluate_batch, chunk, self.data_source.name)))
+        
+        def on_symbol_ready(symbol: str, market_data: Dict[str, Optional[pd.DataFrame]]):
+            pending.append((symbol, market_data, price_snapshot.get(symbol)))
+            if len(pending) >= COMPUTE_CHUNK_SIZE:
+                submit(list(pending))
+                pending.clear()
+        
+        fetch_start = time.time()
+        results: Dict[str, Optional[Dict[str, Any]]] = {}
+        compute_seconds = 0.0
+        
+        try:
+            # Both fetch modes are paced by self.rate_limiter
+            if ASYNC_FETCH:
+                self.fetch_universe(symbols, on_symbol_ready=on_symbol_ready)
+            else:
+                for symbol in symbols:
+                    on_symbol_ready(symbol, self.get_market_data(symbol))
+            if pending:
+                submit(list(pending))
+            fetch_end = time.time()
+            
+            if pool is None:
+                batch_results, compute_seconds = evaluate_batch(inline_items, self.data_source.name)
+                results.update(batch_results)
+            
+            for chunk, future in futures:
+                try:
+                    batch_results, batch_seconds = future.result()
+                    results.update(batch_results)
+                    compute_seconds += batch_seconds
+                except Exception as e:
+                    logger.error(f"{get_emoji('cross')} Error evaluating {len(chunk)} symbols in worker: {str(e)}")
+            compute_end = time.time()
+        finally:
+            if pool is not None:
+                pool.shutdown()
+        
+        stage_stats = {
+            'fetch_seconds': fetch_end - fetch_start,
+            'compute_seconds': compute_seconds,
+            'compute_span_seconds': compute_end - (first_submit or fetch_end),
+            'compute_lag_seconds': compute_end - fetch_end,
+        }
+        return results, stage_stats
+    
+    def log_stage_utilization(self, stage_stats: Dict[str, float]):
+        """Log per-stage timings so the compute pool can be sized
+        
+        A large lag after fetching means compute is the bottleneck (add workers);
+        low pool utilization with no lag means the run is fetch-bound.
+        """
+        workers = max(1, COMPUTE_WORKERS)
+        capacity = workers * max(stage_stats['compute_span_seconds'], 1e-9)
+        utilization = min(100.0, stage_stats['compute_seconds'] / capacity * 100)
+        logger.info(
+            f"{get_emoji('chart')} Stage utilization - "
+            f"fetch: {stage_stats['fetch_seconds']:.2f}s | "
+            f"compute: {stage_stats['compute_seconds']:.2f}s busy "
+            f"{f'on {COMPUTE_WORKERS} workers' if COMPUTE_WORKERS > 0 else 'inline'} "
+            f"over {stage_stats['compute_span_seconds']:.2f}s ({utilization:.0f}% utilized), "
+            f"finished {stage_stats['compute_lag_seconds']:.2f}s after fetching | "
+            f"persist: {stage_stats['persist_seconds']:.2f}s"
+        )
+    
     def run(self, send_telegram: bool = False) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
         """Main execution method - generate signals for all symbols"""
         start_time = time.time()
         logger.info(f"{get_emoji('rocket')} Starting trading signal generation for {len(SYMBOLS)} symbols")
+        self.rate_limiter.reset_usage()
         
         all_signals = []
         strong_signals = []
         successful_symbols = 0
         
+        # One bulk ticker request prices every symbol at the same moment
+        price_snapshot = self.fetch_price_snapshot(SYMBOLS)
+        
+        # Fetch candles and compute signals; results are written here in the main process
+        evaluations, stage_stats = self.evaluate_universe(SYMBOLS, price_snapshot)
+        
+        persist_start = time.time()
+        self.writer.reset_stats()
         for i, symbol in enumerate(SYMBOLS):
             try:
                 logger.info(f"Processing symbol {i+1}/{len(SYMBOLS)}: {symbol}")
-                signal = self.generate_signal(symbol)
+                signal = evaluations.get(symbol)
                 
                 if signal:
+                    self.save_signal(signal)
                     all_signals.append(signal)
                     successful_symbols += 1
                     
@@ -1422,18 +1321,37 @@ class TradingSignalGenerator:
                 
                 else:
                     logger.warning(f"{get_emoji('warning')} Failed to generate signal for {symbol}")
-                
-                # Rate limiting to avoid API restrictions
-                if i < len(SYMBOLS) - 1:
-                    wait_time = 3  # 3 seconds between symbols
-                    logger.debug(f"Waiting {wait_time} seconds before next symbol...")
-                    time.sleep(wait_time)
                     
             except Exception as e:
                 logger.error(f"{get_emoji('cross')} Error processing {symbol}: {str(e)}")
                 logger.error(traceback.format_exc())
                 continue
         
+        self.writer.flush()
+        stage_stats['persist_seconds'] = time.time() - persist_start
+        self.log_stage_utilization(stage_stats)
+        self.writer.log_stats()
+        
+        # Keep signal history bounded: hourly points for recent days, daily points before that
+        history_retention = None
+        try:
+            prune_now = int(time.time())
+            removed = self.writer.prune_signal_history(prune_now, SIGNAL_HISTORY_HOURLY_DAYS,
+                                                       SIGNAL_HISTORY_MAX_DAYS)
+            history_retention = {'now': prune_now, 'hourly_days': SIGNAL_HISTORY_HOURLY_DAYS,
+                                 'max_days': SIGNAL_HISTORY_MAX_DAYS}
+            if removed:
+                logger.info(f"{get_emoji('database')} Downsampled signal history: removed {removed} points")
+        except Exception as e:
+            logger.error(f"{get_emoji('cross')} Error pruning signal history: {str(e)}")
+        
+        # Keep the local candle store bounded
+        if self.candle_store is not None:
+            max_candles = CANDLE_STORE_MAX_CANDLES
+            if self.resample_enabled:
+                max_candles = max(max_candles, self.get_base_lookback(SIGNAL_TIMEFRAMES, OHLCV_LIMIT))
+            self.candle_store.prune(max_candles)
+        
         # Calculate duration and update metadata
         duration = time.time() - start_time
         self.update_dashboard_metadata(
@@ -1442,6 +1360,15 @@ class TradingSignalGenerator:
             status='success' if successful_symbols > 0 else 'failed'
         )
         
+        if PUBLISH_CHANGESETS:
+            self.publish_changeset(signal_history_retention=history_retention)
+        
+        # Fold the WAL into the main file so the database file is complete on its own
+        self.writer.checkpoint('TRUNCATE')
+        
+        if EXPORT_SNAPSHOT:
+            self.publish_snapshot()
+        
         # Send summary to Telegram if requested
         if send_telegram and strong_signals:
             summary_message = self.format_summary_message(strong_signals)
@@ -1454,6 +1381,7 @@ class TradingSignalGenerator:
         logger.info(f"{get_emoji('check')} Signal generation completed in {duration:.2f} seconds")
         logger.info(f"{get_emoji('check')} Generated signals for {successful_symbols}/{len(SYMBOLS)} symbols")
         logger.info(f"{get_emoji('check')} Found {len(strong_signals)} strong signals")
+        self.rate_limiter.log_usage()
         
         return all_signals, strong_signals
 
@@ -1476,10 +1404,17 @@ def run_scheduled_signals():
     print("="*70)
     print(f"{get_emoji('chart')} Symbols: {len(SYMBOLS)}")
     print(f"{get_emoji('clock')} Schedule: Every 1 hour")
+    if FAST_REFRESH_MINUTES > 0:
+        print(f"{get_emoji('clock')} Price-only refresh: Every {FAST_REFRESH_MINUTES} minutes")
     print(f"{get_emoji('database')} Database: {DATABASE_PATH}")
     print("="*70)
     print("Press Ctrl+C to stop the scheduler\n")
     
+    # Keeps the WAL bounded while the dashboard reads between runs
+    checkpointer = WalCheckpointer(generator.db_path, DB_CHECKPOINT_INTERVAL,
+                                   int(DB_WAL_MAX_MB * 1024 * 1024), DB_BUSY_TIMEOUT_MS)
+    checkpointer.start()
+    
     iteration = 0
     try:
         while True:
@@ -1524,9 +1459,18 @@ def run_scheduled_signals():
             print(f"\n{get_emoji('clock')} Next update in {minutes} minutes {seconds} seconds")
             print(f"{'='*70}")
             
-            # Sleep until next iteration
-            if sleep_time > 0:
-                time.sleep(sleep_time)
+            # Sleep until next iteration, reclassifying on fresh prices in between
+            next_run = time.time() + sleep_time
+            while FAST_REFRESH_MINUTES > 0 and next_run - time.time() > FAST_REFRESH_MINUTES * 60:
+                time.sleep(FAST_REFRESH_MINUTES * 60)
+                try:
+                    generator.fast_refresh()
+                except Exception as e:
+                    logger.error(f"Error in fast refresh: {str(e)}")
+            
+            remaining = next_run - time.time()
+            if remaining > 0:
+                time.sleep(remaining)
                 
     except KeyboardInterrupt:
         print(f"\n\n{get_emoji('info')} Scheduler stopped by user")
@@ -1534,6 +1478,146 @@ def run_scheduled_signals():
     except Exception as e:
         print(f"\n{get_emoji('cross')} Fatal error in scheduler: {e}")
         logger.error(f"Fatal error in scheduler: {str(e)}")
+    finally:
+        # Also reached on Ctrl+C: queued rows are written before exiting
+        checkpointer.stop()
+        generator.close()
+
+def run_fast_refresh():
+    """Run one price-only refresh of the stored signals"""
+    try:
+        generator = TradingSignalGenerator()
+    except ValueError as e:
+        print(f"\n{get_emoji('cross')} {e}")
+        print("Please set GATE_API_KEY and GATE_API_SECRET in your .env file")
+        return
+    
+    updated = generator.fast_refresh()
+    generator.close()
+    print(f"\n{get_emoji('check')} Fast refresh updated {updated} symbols")
+
+def run_compaction() -> bool:
+    """Prune old indicator history, rebuild indexes and VACUUM the database into a fresh file
+    
+    Retention per table comes from COMPACT_<TABLE> (raw_days/max_days, see
+    db_storage.DEFAULT_COMPACTION_POLICIES). Run it while the scheduler is stopped.
+    The pruning is published as a changeset so dashboard copies prune the same rows.
+    """
+    print("\n" + "="*70)
+    print("TRADING SIGNAL GENERATOR - DATABASE COMPACTION")
+    print("="*70)
+    
+    if not os.path.exists(DATABASE_PATH):
+        print(f"\n{get_emoji('cross')} Database not found: {DATABASE_PATH}")
+        return False
+    
+    try:
+        report = compact_database(DATABASE_PATH, history_hourly_days=SIGNAL_HISTORY_HOURLY_DAYS,
+                                  history_max_days=SIGNAL_HISTORY_MAX_DAYS, busy_timeout_ms=DB_BUSY_TIMEOUT_MS)
+    except Exception as e:
+        print(f"\n{get_emoji('cross')} Compaction failed: {e}")
+        logger.error(f"Error compacting database: {str(e)}")
+        logger.error(traceback.format_exc())
+        return False
+    
+    for table, removed in report['removed'].items():
+        print(f"   {table}: removed {removed} rows")
+    size_before, size_after = report['size_before'], report['size_after']
+    saved_pct = (1 - size_after / size_before) * 100 if size_before else 0
+    print(f"\n{get_emoji('database')} {DATABASE_PATH}: {size_before / 1024:,.1f} KB -> "
+          f"{size_after / 1024:,.1f} KB ({saved_pct:.1f}% smaller)")
+    
+    if PUBLISH_CHANGESETS:
+        history_retention = None
+        if 'signal_history' in report['removed']:
+            history_retention = {'now': report['now'], 'hourly_days': SIGNAL_HISTORY_HOURLY_DAYS,
+                                 'max_days': SIGNAL_HISTORY_MAX_DAYS}
+        compaction = {table: cutoffs for table, cutoffs in report['cutoffs'].items() if table in report['removed']}
+        try:
+            conn = connect_database(DATABASE_PATH, DB_BUSY_TIMEOUT_MS)
+            try:
+                seq = publish_changeset(conn, CHANGESET_DIR,
+                                        new_changeset(compaction=compaction,
+                                                      signal_history_retention=history_retention),
+                                        CHANGESET_RETENTION)
+            finally:
+                conn.close()
+            print(f"{get_emoji('database')} Published compaction as changeset {seq}")
+        except Exception as e:
+            print(f"\n{get_emoji('cross')} Could not publish the compaction changeset: {e}")
+            logger.error(f"Error publishing compaction changeset: {str(e)}")
+            return False
+    print("="*70)
+    return True
+
+def run_rebase():
+    """Compact the database and publish it as the new changeset base when one is due
+    
+    A rebase is due once CHANGESET_REBASE_INTERVAL changesets were published
+    since the last one. Until then only the changesets need to be published;
+    afterwards the database file itself and its .gz copy (see update-database.yml).
+    """
+    manifest = load_manifest(CHANGESET_DIR)
+    if not rebase_due(manifest, CHANGESET_REBASE_INTERVAL):
+        print(f"\n{get_emoji('info')} {manifest['latest_seq'] - manifest['base_seq']} changesets since the base "
+              f"(rebase every {CHANGESET_REBASE_INTERVAL}), nothing to do")
+        return
+    
+    if run_compaction():
+        seq = rebase(CHANGESET_DIR)
+        # The dashboard downloads this compressed copy of a new base instead of the raw file
+        gz_path = gzip_database(DATABASE_PATH)
+        print(f"{get_emoji('check')} {DATABASE_PATH} is the new base at changeset {seq} "
+              f"({os.path.getsize(gz_path) / 1024:,.1f} KB compressed)")
+
+def run_benchmark(runs: int = 3):
+    """Time run() end to end against a throwaway database and candle store
+    
+    Uses the offline replay source unless MARKET_DATA_SOURCE is set explicitly,
+    so it needs no API keys or network access. The first run starts from an
+    empty candle store (cold), later runs fetch incrementally (warm).
+    """
+    import tempfile
+    
+    source_name = os.getenv('MARKET_DATA_SOURCE', 'replay')
+    print("\n" + "="*70)
+    print("TRADING SIGNAL GENERATOR - BENCHMARK")
+    print("="*70)
+    print(f"{get_emoji('chart')} Symbols: {len(SYMBOLS)}")
+    print(f"{get_emoji('database')} Data source: {source_name}")
+    print(f"{get_emoji('clock')} Runs: {runs}")
+    print("="*70)
+    
+    results = []
+    with tempfile.TemporaryDirectory() as work_dir:
+        generator = TradingSignalGenerator(
+            db_path=os.path.join(work_dir, 'benchmark_signals.db'),
+            data_source=create_data_source(source_name),
+            candle_store_path=os.path.join(work_dir, 'benchmark_candles.db'),
+            snapshot_dir=os.path.join(work_dir, 'snapshot'),
+            changeset_dir=os.path.join(work_dir, 'changesets')
+        )
+        
+        for i in range(runs):
+            start_time = time.time()
+            all_signals, _ = generator.run(send_telegram=False)
+            duration = time.time() - start_time
+            requests_made = generator.rate_limiter.bucket('public').get_usage()['requests']
+            results.append((duration, len(all_signals), requests_made))
+        
+        generator.close()
+    
+    print(f"\n{'='*70}")
+    print(f"{get_emoji('chart')} BENCHMARK RESULTS")
+    print(f"{'='*70}")
+    for i, (duration, signal_count, requests_made) in enumerate(results):
+        label = 'cold' if i == 0 else 'warm'
+        print(f"   Run {i+1} ({label}): {duration:.2f}s | {signal_count}/{len(SYMBOLS)} signals | "
+              f"{signal_count / max(duration, 1e-9):.1f} symbols/s | {requests_made} requests")
+    if len(results) > 1:
+        warm = [duration for duration, _, _ in results[1:]]
+        print(f"   Warm average: {sum(warm) / len(warm):.2f}s")
+    print(f"{'='*70}")
 
 def main():
     """Main function - run once for database update"""
@@ -1609,10 +1693,20 @@ def main():
         print("Check scheduler.log for details")
         logger.error(f"Error in main execution: {str(e)}")
         logger.error(traceback.format_exc())
+    finally:
+        generator.close()
 
 if __name__ == "__main__":
     # Check if running in scheduled mode
     if len(sys.argv) > 1 and sys.argv[1] == '--scheduled':
         run_scheduled_signals()
+    elif len(sys.argv) > 1 and sys.argv[1] == '--fast-refresh':
+        run_fast_refresh()
+    elif len(sys.argv) > 1 and sys.argv[1] == '--compact':
+        run_compaction()
+    elif len(sys.argv) > 1 and sys.argv[1] == '--rebase':
+        run_rebase()
+    elif len(sys.argv) > 1 and sys.argv[1] == '--benchmark':
+        run_benchmark(int(sys.argv[2]) if len(sys.argv) > 2 else 3)
     else:
         main()
\ No newline at end of file
@@ -0,0 +1,275 @@
+# schema.py - Versioned schema of the signals database: migrations and dashboard read queries
+"""Schema registry for trading_signals.db
+
+The database records its schema version in schema_version. MIGRATIONS lists
+every schema change in order; migrate() applies the ones a database is
+missing, each in its own transaction together with the version bump.
+Readers look up the queries for a database's version once (read_queries)
+instead of inspecting tables and columns on every query.
+
+To change the schema, append a migration, bump SCHEMA_VERSION and, if the
+dashboard reads change, add a READ_QUERIES entry for the new version.
+"""
+import sqlite3
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple
+
+from db_storage import CHANGESET_STATE_SCHEMA, SIGNAL_HISTORY_SCHEMA, create_latest_tables
+
+SCHEMA_VERSION = 4
+
+SCHEMA_VERSION_SCHEMA = '''
+    CREATE TABLE IF NOT EXISTS schema_version (
+        id INTEGER PRIMARY KEY CHECK (id = 1),
+        version INTEGER NOT NULL,
+        updated_at DATETIME DEFAULT CURRENT_TIMESTAMP
+    )
+'''
+
+BASE_SCHEMA = [
+    '''
+    CREATE TABLE IF NOT EXISTS dashboard_metadata (
+        id INTEGER PRIMARY KEY,
+        last_updated TIMESTAMP,
+        total_symbols INTEGER,
+        last_update_status TEXT,
+        update_duration_seconds REAL,
+        data_source TEXT DEFAULT 'gateio'
+    )
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS hvts_forecast (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        symbol TEXT NOT NULL,
+        current_price REAL NOT NULL,
+        forecast_1d REAL NOT NULL,
+        forecast_7d REAL NOT NULL,
+        forecast_14d REAL NOT NULL,
+        forecast_30d REAL NOT NULL,
+        poly_signal TEXT NOT NULL,
+        poly_emoji TEXT NOT NULL,
+        timestamp DATETIME NOT NULL,
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+        UNIQUE(symbol, timestamp)
+    )
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS trading_signals (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        symbol TEXT UNIQUE NOT NULL,
+        current_price REAL NOT NULL,
+        poly_1h_signal TEXT NOT NULL,
+        fib_15m_signal TEXT NOT NULL,
+        fib_signal TEXT NOT NULL,
+        poly_signal TEXT NOT NULL,
+        rsi_zone TEXT NOT NULL,
+        macd_signal TEXT NOT NULL,
+        pivot_zone TEXT NOT NULL,
+        overall_signal TEXT NOT NULL,
+        forecast_1h REAL,
+        forecast_1d REAL,
+        forecast_7d REAL,
+        forecast_14d REAL,
+        forecast_30d REAL,
+        timestamp DATETIME NOT NULL,
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP
+    )
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS fibonacci_1h (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        symbol TEXT NOT NULL,
+        current_price REAL NOT NULL,
+        fib_level_0 REAL NOT NULL,
+        fib_level_23_6 REAL NOT NULL,
+        fib_level_38_2 REAL NOT NULL,
+        fib_level_50 REAL NOT NULL,
+        fib_level_61_8 REAL NOT NULL,
+        fib_level_78_6 REAL NOT NULL,
+        fib_level_100 REAL NOT NULL,
+        fib_level_127_2 REAL,
+        fib_level_161_8 REAL,
+        fib_level_261_8 REAL,
+        fib_level_423_6 REAL,
+        fib_1h_signal TEXT NOT NULL,
+        pivot_zone TEXT NOT NULL,
+        timestamp DATETIME NOT NULL,
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+        UNIQUE(symbol, timestamp)
+    )
+    ''',
+    '''
+    CREATE TABLE IF NOT EXISTS polynomial_regression_daily (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        symbol TEXT NOT NULL,
+        current_price REAL NOT NULL,
+        poly_regression_value REAL NOT NULL,
+        poly_signal_daily TEXT NOT NULL,
+        poly_confidence REAL NOT NULL,
+        r_squared REAL NOT NULL,
+        trend_strength REAL NOT NULL,
+        support_level REAL NOT NULL,
+        resistance_level REAL NOT NULL,
+        forecast_1d REAL NOT NULL,
+        forecast_7d REAL NOT NULL,
+        forecast_30d REAL NOT NULL,
+        timestamp DATETIME NOT NULL,
+        created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
+        UNIQUE(symbol, timestamp)
+    )
+    ''',
+    # Price-independent inputs kept for fast refreshes
+    '''
+    CREATE TABLE IF NOT EXISTS signal_state (
+        symbol TEXT PRIMARY KEY,
+        extreme_discount REAL,
+        accumulation_upper REAL,
+        reversal_zone REAL,
+        strong_support REAL,
+        fib_level_38_2 REAL,
+        fib_level_61_8 REAL,
+        forecast_1h REAL,
+        forecast_1d REAL,
+        rsi_signal TEXT NOT NULL,
+        macd_signal TEXT NOT NULL,
+        timestamp DATETIME NOT NULL
+    )
+    ''',
+    'CREATE INDEX IF NOT EXISTS idx_signals_symbol ON trading_signals(symbol)',
+    'CREATE INDEX IF NOT EXISTS idx_signals_timestamp ON trading_signals(timestamp)',
+    'CREATE INDEX IF NOT EXISTS idx_fib_1h_symbol ON fibonacci_1h(symbol)',
+    'CREATE INDEX IF NOT EXISTS idx_fib_1h_timestamp ON fibonacci_1h(timestamp)',
+    'CREATE INDEX IF NOT EXISTS idx_reg_symbol ON polynomial_regression_daily(symbol)',
+    'CREATE INDEX IF NOT EXISTS idx_reg_timestamp ON polynomial_regression_daily(timestamp)',
+    'CREATE INDEX IF NOT EXISTS idx_hvts_symbol ON hvts_forecast(symbol)',
+    'CREATE INDEX IF NOT EXISTS idx_hvts_timestamp ON hvts_forecast(timestamp)',
+]
+
+
+def execute_all(statements: List[str]) -> Callable[[sqlite3.Connection], None]:
+    def apply(connection: sqlite3.Connection):
+        for statement in statements:
+            connection.execute(statement)
+    return apply
+
+
+# (version, description, apply). Databases written before versioning was
+# introduced are at version 0; since every statement is IF NOT EXISTS,
+# migrating them only adds what they lack.
+MIGRATIONS: List[Tuple[int, str, Callable[[sqlite3.Connection], None]]] = [
+    (1, 'signal and indicator tables', execute_all(BASE_SCHEMA)),
+    (2, 'append-only signal_history', execute_all(SIGNAL_HISTORY_SCHEMA)),
+    (3, 'latest-row-per-symbol tables', create_latest_tables),
+    (4, 'changeset_state', execute_all([CHANGESET_STATE_SCHEMA])),
+]
+
+
+def schema_version(connection: sqlite3.Connection) -> int:
+    """Schema version of a database (0 if it predates versioning)"""
+    try:
+        row = connection.execute('SELECT version FROM schema_version WHERE id = 1').fetchone()
+    except sqlite3.OperationalError:
+        return 0
+    return row[0] if row else 0
+
+
+def migrate(connection: sqlite3.Connection, target: Optional[int] = None) -> int:
+    """Apply the migrations after the database's version up to `target` (default: the latest)
+
+    Each migration and its version bump commit together, so an interrupted
+    run resumes at the first migration that didn't finish. Returns the
+    resulting version.
+    """
+    target = SCHEMA_VERSION if target is None else target
+    version = schema_version(connection)
+    for migration_version, description, apply in MIGRATIONS:
+        if migration_version <= version or migration_version > target:
+            continue
+        # Explicit BEGIN: sqlite3 doesn't open a transaction for DDL on its own
+        connection.execute('BEGIN')
+        try:
+            apply(connection)
+            connection.execute(SCHEMA_VERSION_SCHEMA)
+            connection.execute('INSERT OR REPLACE INTO schema_version (id, version) VALUES (1, ?)',
+                               (migration_version,))
+            connection.commit()
+        except Exception:
+            connection.rollback()
+            raise
+        version = migration_version
+    return version
+
+
+# The dashboard's reads per schema version; a database uses the entry with the
+# highest version not above its own. Fixed SQL text also lets sqlite3 reuse the
+# prepared statements across calls.
+READ_QUERIES: Dict[int, Dict[str, str]] = {
+    # Only the indicator histories: latest row per symbol by correlated subquery
+    0: {
+        'trading_signals': '''
+            SELECT symbol, current_price, poly_1h_signal, fib_15m_signal, fib_signal, poly_signal,
+                   rsi_zone, macd_signal, pivot_zone, overall_signal, forecast_1h, forecast_1d,
+                   forecast_7d, forecast_14d, forecast_30d, timestamp, created_at
+            FROM trading_signals
+            ORDER BY timestamp DESC
+        ''',
+        'hvts_forecast': '''
+            SELECT symbol, current_price, forecast_1d, forecast_7d, forecast_14d, forecast_30d,
+                   poly_signal, poly_emoji, timestamp
+            FROM hvts_forecast
+            ORDER BY timestamp DESC
+        ''',
+        'fibonacci_1h': '''
+            SELECT symbol, current_price, fib_level_0, fib_level_23_6, fib_level_38_2, fib_level_50,
+                   fib_level_61_8, fib_level_78_6, fib_level_100, fib_level_127_2, fib_level_161_8,
+                   fib_level_261_8, fib_level_423_6, fib_1h_signal, pivot_zone, timestamp
+            FROM fibonacci_1h f1
+            WHERE timestamp = (SELECT MAX(timestamp) FROM fibonacci_1h f2 WHERE f2.symbol = f1.symbol)
+            ORDER BY symbol
+        ''',
+        'polynomial_regression_daily': '''
+            SELECT symbol, current_price, poly_regression_value, poly_signal_daily, poly_confidence,
+                   r_squared, trend_strength, support_level, resistance_level,
+                   forecast_1d, forecast_7d, forecast_30d, timestamp
+            FROM polynomial_regression_daily r1
+            WHERE timestamp = (SELECT MAX(timestamp) FROM polynomial_regression_daily r2 WHERE r2.symbol = r1.symbol)
+            ORDER BY symbol
+        ''',
+    },
+    # The *_latest tables
+    3: {
+        'trading_signals': '''
+            SELECT symbol, current_price, poly_1h_signal, fib_15m_signal, fib_signal, poly_signal,
+                   rsi_zone, macd_signal, pivot_zone, overall_signal, forecast_1h, forecast_1d,
+                   forecast_7d, forecast_14d, forecast_30d, timestamp, created_at
+            FROM trading_signals
+            ORDER BY timestamp DESC
+        ''',
+        'hvts_forecast': '''
+            SELECT symbol, current_price, forecast_1d, forecast_7d, forecast_14d, forecast_30d,
+                   poly_signal, poly_emoji, timestamp
+            FROM hvts_forecast_latest
+            ORDER BY timestamp DESC
+        ''',
+        'fibonacci_1h': '''
+            SELECT symbol, current_price, fib_level_0, fib_level_23_6, fib_level_38_2, fib_level_50,
+                   fib_level_61_8, fib_level_78_6, fib_level_100, fib_level_127_2, fib_level_161_8,
+                   fib_level_261_8, fib_level_423_6, fib_1h_signal, pivot_zone, timestamp
+            FROM fibonacci_1h_latest
+            ORDER BY symbol
+        ''',
+        'polynomial_regression_daily': '''
+            SELECT symbol, current_price, poly_regression_value, poly_signal_daily, poly_confidence,
+                   r_squared, trend_strength, support_level, resistance_level,
+                   forecast_1d, forecast_7d, forecast_30d, timestamp
+            FROM polynomial_regression_daily_latest
+            ORDER BY symbol
+        ''',
+    },
+}
+
+
+@lru_cache(maxsize=None)
+def read_queries(version: int) -> Dict[str, str]:
+    """The dashboard's read queries for a database at schema `version` (shared; don't modify)"""
+    return READ_QUERIES[max(v for v in READ_QUERIES if v <= max(version, 0))]
@@ -32,6 +32,68 @@ TELEGRAM_CHAT_ID=
 
 # Database path
 DATABASE_PATH=trading_signals.db
+# Signal rows are written in one transaction per this many symbols
+DB_FLUSH_SIZE=50
+# Write rows from a background thread; queue size bounds memory (producers wait when full)
+DB_BACKGROUND_WRITER=true
+DB_WRITE_QUEUE_SIZE=5000
+# WAL tuning: lock wait, background checkpoint interval (seconds) and WAL size cap in --scheduled mode
+DB_BUSY_TIMEOUT_MS=10000
+DB_CHECKPOINT_INTERVAL=60
+DB_WAL_MAX_MB=64
+
+# Signal history: hourly points for this many days, then daily points up to the max age
+SIGNAL_HISTORY_HOURLY_DAYS=7
+SIGNAL_HISTORY_MAX_DAYS=365
+
+# python scheduler_v2.py --compact retention per table (raw_days/max_days): full detail for raw_days,
+# then one row per symbol and day, nothing older than max_days
+COMPACT_FIBONACCI_1H=7/90
+COMPACT_POLYNOMIAL_REGRESSION_DAILY=7/365
+COMPACT_HVTS_FORECAST=7/365
+
+# Parquet snapshot of the latest state for the dashboard (needs pyarrow)
+EXPORT_SNAPSHOT=true
+SNAPSHOT_DIR=snapshot
+SNAPSHOT_HISTORY_DAYS=7
+
+# Per-run changesets the dashboard applies to its copy of the database; changesets kept,
+# and how many changesets before python scheduler_v2.py --rebase republishes the full database
+PUBLISH_CHANGESETS=true
+CHANGESET_DIR=changesets
+CHANGESET_RETENTION=200
+CHANGESET_REBASE_INTERVAL=30
+
+# Market data source: gateio (live) or replay (offline, no API keys needed)
+MARKET_DATA_SOURCE=gateio
+# Replay options: CSV dir (<BASE>_<QUOTE>_<timeframe>.csv), per-request latency and failure rate
+REPLAY_DATA_DIR=
+REPLAY_LATENCY_MS=0
+REPLAY_ERROR_RATE=0
+
+# Data fetching (async mode fetches all symbols concurrently)
+ASYNC_FETCH=true
+FETCH_CONCURRENCY=10
+
+# Indicator computation process pool (0 = compute inline); defaults to one worker per CPU
+COMPUTE_WORKERS=
+COMPUTE_CHUNK_SIZE=8
+
+# Shared request budgets per endpoint class (requests/seconds)
+RATE_LIMIT_PUBLIC=200/10
+RATE_LIMIT_PRIVATE=100/10
+
+# Local candle store (only new candles are fetched each run)
+USE_CANDLE_STORE=true
+CANDLE_STORE_PATH=candle_store.db
+CANDLE_LOOKBACK=100
+CANDLE_PAGE_LIMIT=1000
+CANDLE_STORE_MAX_CANDLES=5000
+RESAMPLE_TIMEFRAMES=true
+BASE_TIMEFRAME=1h
+
+# Price-only signal refresh between hourly runs in --scheduled mode (0 = off)
+FAST_REFRESH_MINUTES=0
 """)
         print("✓ Created .env.template file")
         print("  → Copy to .env and add your API keys")
@@ -0,0 +1,933 @@
+# signal_calculator.py - Pure indicator and signal computation (safe to run in worker processes)
+import logging
+import sys
+import time
+import traceback
+from datetime import datetime
+from typing import Dict, Any, List, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+import indicator_engine
+
+logger = logging.getLogger(__name__)
+
+def get_emoji(emoji_name):
+    """Get platform-appropriate emoji or text alternative"""
+    if sys.platform == 'win32':
+        emoji_map = {
+            'key': '[KEY]',
+            'chart': '[DATA]',
+            'check': '[OK]',
+            'cross': '[ERROR]',
+            'warning': '[WARNING]',
+            'clock': '[TIME]',
+            'database': '[DB]',
+            'rocket': '[ROCKET]',
+            'signal': '[SIGNAL]',
+            'star': '[STAR]',
+            'hourglass': '[WAIT]',
+            'info': '[INFO]',
+            'magnify': '[SEARCH]',
+            'list': '[LIST]',
+            'bell': '[ALERT]',
+            'money': '[MONEY]',
+            'up': '[UP]',
+            'down': '[DOWN]',
+            'neutral': '[NEUTRAL]',
+            'fire': '[FIRE]',
+            'portfolio': '[PORTFOLIO]',
+            'discount': '[DISCOUNT]',
+            'overvalued': '[OVERVALUED]',
+        }
+        return emoji_map.get(emoji_name, '')
+    else:
+        emoji_map = {
+            'key': '🔑',
+            'chart': '📊',
+            'check': '✅',
+            'cross': '❌',
+            'warning': '⚠️',
+            'clock': '⏰',
+            'database': '📁',
+            'rocket': '🚀',
+            'signal': '📈',
+            'star': '⭐',
+            'hourglass': '⏳',
+            'info': 'ℹ️',
+            'magnify': '🔍',
+            'list': '📋',
+            'bell': '🔔',
+            'money': '💰',
+            'up': '🟢',
+            'down': '🔴',
+            'neutral': '🟡',
+            'fire': '🔥',
+            'portfolio': '💼',
+            'discount': '🔥',
+            'overvalued': '⚠️',
+        }
+        return emoji_map.get(emoji_name, '')
+
+
+class SignalCalculator:
+    """Indicator math and signal classification without any I/O
+    
+    Everything here works on candles and prices passed in, so it can run in a
+    ProcessPoolExecutor worker while the main process keeps fetching and writing.
+    """
+    
+    def calculate_rsi(self, prices: pd.Series, period: int = 14) -> pd.Series:
+        """Calculate Relative Strength Index with validation"""
+        try:
+            if len(prices) < period + 1:
+                logger.warning(f"Insufficient data for RSI calculation (needed: {period}, got: {len(prices)})")
+                return pd.Series([50] * len(prices), index=prices.index)
+            
+            delta = prices.diff()
+            gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
+            loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
+            
+            # Avoid division by zero
+            rs = gain / loss.replace(0, np.nan)
+            rsi = 100 - (100 / (1 + rs))
+            
+            # Fill NaN values
+            rsi = rsi.fillna(50)
+            
+            # Clip to valid range
+            rsi = rsi.clip(0, 100)
+            
+            return rsi
+            
+        except Exception as e:
+            logger.error(f"Error calculating RSI: {str(e)}")
+            return pd.Series([50] * len(prices), index=prices.index)
+    
+    def calculate_macd(self, prices: pd.Series, fast_period: int = 12, 
+                       slow_period: int = 26, signal_period: int = 9) -> Tuple[pd.Series, pd.Series, pd.Series]:
+        """Calculate MACD indicator with validation"""
+        try:
+            if len(prices) < slow_period:
+                logger.warning(f"Insufficient data for MACD (needed: {slow_period}, got: {len(prices)})")
+                zeros = pd.Series([0] * len(prices), index=prices.index)
+                return zeros, zeros, zeros
+            
+            # Calculate EMAs
+            ema_fast = prices.ewm(span=fast_period, adjust=False).mean()
+            ema_slow = prices.ewm(span=slow_period, adjust=False).mean()
+            
+            # MACD line
+            macd_line = ema_fast - ema_slow
+            
+            # Signal line
+            signal_line = macd_line.ewm(span=signal_period, adjust=False).mean()
+            
+            # MACD histogram
+            macd_histogram = macd_line - signal_line
+            
+            return macd_line, signal_line, macd_histogram
+            
+        except Exception as e:
+            logger.error(f"Error calculating MACD: {str(e)}")
+            zeros = pd.Series([0] * len(prices), index=prices.index)
+            return zeros, zeros, zeros
+    
+    def get_macd_signal(self, macd_line: pd.Series, signal_line: pd.Series, 
+                       macd_histogram: pd.Series) -> Tuple[str, str]:
+        """Get MACD trading signal"""
+        try:
+            if len(macd_line) < 2:
+                return "Neutral", get_emoji('neutral')
+            
+            current_macd = macd_line.iloc[-1]
+            current_signal = signal_line.iloc[-1]
+            current_hist = macd_histogram.iloc[-1]
+            prev_macd = macd_line.iloc[-2]
+            prev_signal = signal_line.iloc[-2]
+            prev_hist = macd_histogram.iloc[-2]
+            
+            # Bullish signals
+            if current_macd > current_signal and prev_macd <= prev_signal:
+                return "Bullish Crossover", get_emoji('up')
+            elif current_hist > 0 and prev_hist <= 0:
+                return "Bullish Momentum", get_emoji('up')
+            elif current_macd > 0 and current_macd > current_signal:
+                return "Bullish", get_emoji('up')
+            
+            # Bearish signals
+            elif current_macd < current_signal and prev_macd >= prev_signal:
+                return "Bearish Crossover", get_emoji('down')
+            elif current_hist < 0 and prev_hist >= 0:
+                return "Bearish Momentum", get_emoji('down')
+            elif current_macd < 0 and current_macd < current_signal:
+                return "Bearish", get_emoji('down')
+            
+            # Neutral
+            else:
+                return "Neutral", get_emoji('neutral')
+                
+        except Exception as e:
+            logger.error(f"Error getting MACD signal: {str(e)}")
+            return "Neutral", get_emoji('neutral')
+    
+    def polynomial_regression_forecast(self, df: pd.DataFrame, degree: int = 3, 
+                                      periods: int = 30) -> Tuple[Optional[np.ndarray], Optional[np.ndarray]]:
+        """Generate polynomial regression forecast"""
+        try:
+            if len(df) < degree + 1:
+                logger.warning(f"Insufficient data for polynomial regression (needed: {degree+1}, got: {len(df)})")
+                return None, None
+            
+            x = np.arange(len(df))
+            y = df['close'].values
+            
+            # Ensure we have valid data
+            if len(np.unique(y)) < 2:
+                logger.warning("Insufficient price variation for regression")
+                return None, None
+            
+            # Perform polynomial regression
+            coeffs = np.polyfit(x, y, degree)
+            polynomial = np.poly1d(coeffs)
+            
+            # Generate forecast
+            x_forecast = np.arange(len(df), len(df) + periods)
+            y_forecast = polynomial(x_forecast)
+            
+            # Ensure forecast is reasonable (no negative prices)
+            y_forecast = np.maximum(y_forecast, y[-1] * 0.1)  # Don't drop below 10% of current price
+            
+            return y_forecast, coeffs
+            
+        except Exception as e:
+            logger.error(f"Error in polynomial regression: {str(e)}")
+            return None, None
+    
+    def get_poly_signal_1h(self, df: pd.DataFrame, current_price: float) -> Tuple[str, str, float]:
+        """Get 1-hour polynomial regression trend signal"""
+        try:
+            forecast, _ = self.polynomial_regression_forecast(df, degree=3, periods=5)
+            
+            if forecast is not None and len(forecast) >= 1:
+                forecast_1 = forecast[0]
+                
+                # Determine trend based on forecast
+                price_change_pct = ((forecast_1 - current_price) / current_price) * 100
+                
+                if price_change_pct > 0.5:  # 0.5% increase
+                    return "Bullish", get_emoji('up'), forecast_1
+                elif price_change_pct < -0.5:  # 0.5% decrease
+                    return "Bearish", get_emoji('down'), forecast_1
+                else:
+                    return "Neutral", get_emoji('neutral'), forecast_1
+            else:
+                return "Neutral", get_emoji('neutral'), current_price
+                
+        except Exception as e:
+            logger.error(f"Error in 1-hour polynomial signal: {str(e)}")
+            return "Neutral", get_emoji('neutral'), current_price
+    
+    def calculate_fibonacci_levels(self, high: float, low: float) -> Dict[str, float]:
+        """Calculate Fibonacci retracement and extension levels"""
+        try:
+            if high <= low:
+                logger.warning(f"Invalid high/low values: high={high}, low={low}")
+                high = max(high, low * 1.01)  # Ensure high > low
+            
+            diff = high - low
+            
+            levels = {
+                '0%': high,
+                '23.6%': high - diff * 0.236,
+                '38.2%': high - diff * 0.382,
+                '50%': high - diff * 0.5,
+                '61.8%': high - diff * 0.618,
+                '78.6%': high - diff * 0.786,
+                '100%': low,
+                '127.2%': low - diff * 0.272,
+                '161.8%': low - diff * 0.618,
+                '261.8%': low - diff * 1.618,
+                '423.6%': low - diff * 3.236
+            }
+            
+            return levels
+            
+        except Exception as e:
+            logger.error(f"Error calculating Fibonacci levels: {str(e)}")
+            return {'0%': high, '100%': low}
+    
+    def get_fibonacci_signal(self, current_price: float, fib_levels: Dict[str, float]) -> Tuple[str, str]:
+        """Get Fibonacci-based signal"""
+        try:
+            if '61.8%' in fib_levels and '38.2%' in fib_levels:
+                if current_price > fib_levels['61.8%']:
+                    return "Bullish", get_emoji('up')
+                elif current_price < fib_levels['38.2%']:
+                    return "Bearish", get_emoji('down')
+            
+            return "Neutral", get_emoji('neutral')
+            
+        except Exception as e:
+            logger.error(f"Error getting Fibonacci signal: {str(e)}")
+            return "Neutral", get_emoji('neutral')
+    
+    def get_rsi_zone(self, rsi_value: float) -> Tuple[str, str]:
+        """Get RSI zone"""
+        try:
+            if rsi_value < 30:
+                return "Oversold", get_emoji('up')
+            elif rsi_value < 40:
+                return "Undervalued", get_emoji('up')
+            elif rsi_value < 60:
+                return "Neutral", get_emoji('neutral')
+            elif rsi_value < 70:
+                return "Overvalued", get_emoji('down')
+            else:
+                return "Overbought", get_emoji('down')
+        except Exception as e:
+            logger.error(f"Error getting RSI zone: {str(e)}")
+            return "Neutral", get_emoji('neutral')
+    
+    def calculate_pivot_zones(self, df: pd.DataFrame) -> Dict[str, float]:
+        """Calculate precise pivot zones according to pseudocode specification"""
+        try:
+            # Use daily data for pivot zone calculation
+            if len(df) < 20:
+                recent_data = df
+            else:
+                recent_data = df.tail(20)  # Last 20 daily candles
+            
+            # Calculate recent high and low
+            recent_low = float(recent_data['low'].min())
+            recent_high = float(recent_data['high'].max())
+            
+            # Ensure we have a valid price range
+            if recent_high <= recent_low:
+                recent_high = recent_low * 1.05  # Add 5% margin if high <= low
+            
+            price_range = recent_high - recent_low
+            
+            # Calculate zones as percentages of range from recent_low
+            zones = {
+                'extreme_discount': recent_low + 0.1 * price_range,
+                'accumulation_lower': recent_low + 0.1 * price_range,
+                'accumulation_upper': recent_low + 0.3 * price_range,
+                'reversal_zone': recent_low + 0.5 * price_range,
+                'strong_support': recent_low + 0.7 * price_range,
+                'recent_low': recent_low,
+                'recent_high': recent_high,
+                'price_range': price_range
+            }
+            
+            # Calculate accumulation mid-range
+            zones['accumulation_mid_range'] = (zones['accumulation_lower'] + zones['accumulation_upper']) / 2
+            
+            logger.debug(f"Pivot zones calculated:")
+            logger.debug(f"  Recent Low: ${recent_low:.4f}, Recent High: ${recent_high:.4f}")
+            logger.debug(f"  Extreme Discount: ${zones['extreme_discount']:.4f}")
+            logger.debug(f"  Accumulation: ${zones['accumulation_lower']:.4f} - ${zones['accumulation_upper']:.4f}")
+            logger.debug(f"  Reversal Zone: ${zones['reversal_zone']:.4f}")
+            logger.debug(f"  Strong Support: ${zones['strong_support']:.4f}")
+            
+            return zones
+            
+        except Exception as e:
+            logger.error(f"Error calculating pivot zones: {str(e)}")
+            return {}
+    
+    def get_pivot_zone(self, current_price: float, pivot_levels: Dict[str, float]) -> Tuple[str, str, Dict[str, float]]:
+        """Get current pivot zone with detailed zone information"""
+        try:
+            if not pivot_levels or 'extreme_discount' not in pivot_levels:
+                return "Unknown", get_emoji('neutral'), {}
+            
+            # Determine current zone
+            extreme_discount = pivot_levels['extreme_discount']
+            accumulation_upper = pivot_levels.get('accumulation_upper', extreme_discount * 1.2)
+            reversal_zone = pivot_levels.get('reversal_zone', accumulation_upper * 1.2)
+            strong_support = pivot_levels.get('strong_support', reversal_zone * 1.2)
+            
+            # Determine zone based on current price
+            if current_price <= extreme_discount:
+                zone_name = "Extreme Discount"
+                zone_emoji = get_emoji('discount')
+                is_bullish_zone = True
+            elif current_price <= accumulation_upper:
+                zone_name = "Accumulation Zone"
+                zone_emoji = get_emoji('up')
+                is_bullish_zone = True
+            elif current_price <= reversal_zone:
+                zone_name = "Reversal Zone"
+                zone_emoji = get_emoji('neutral')
+                is_bullish_zone = False
+            elif current_price <= strong_support:
+                zone_name = "Strong Support"
+                zone_emoji = get_emoji('down')
+                is_bullish_zone = False
+            else:
+                zone_name = "Above Buy Zone"
+                zone_emoji = get_emoji('overvalued')
+                is_bullish_zone = False
+            
+            # Prepare zone details
+            zone_details = {
+                'zone_name': zone_name,
+                'zone_emoji': zone_emoji,
+                'is_bullish_zone': is_bullish_zone,
+                'extreme_discount': extreme_discount,
+                'accumulation_lower': pivot_levels.get('accumulation_lower', extreme_discount),
+                'accumulation_upper': accumulation_upper,
+                'accumulation_mid_range': pivot_levels.get('accumulation_mid_range', 
+                    (pivot_levels.get('accumulation_lower', extreme_discount) + accumulation_upper) / 2),
+                'reversal_zone': reversal_zone,
+                'strong_support': strong_support,
+                'recent_low': pivot_levels.get('recent_low', 0),
+                'recent_high': pivot_levels.get('recent_high', 0),
+                'price_range': pivot_levels.get('price_range', 0)
+            }
+            
+            return zone_name, zone_emoji, zone_details
+            
+        except Exception as e:
+            logger.error(f"Error getting pivot zone: {str(e)}")
+            return "Unknown", get_emoji('neutral'), {}
+    
+    def get_pivot_zone_signal(self, zone_details: Dict[str, Any]) -> Tuple[str, str]:
+        """Get pivot zone signal (Bullish/Bearish/Neutral) based on zone"""
+        try:
+            if not zone_details:
+                return "Neutral", get_emoji('neutral')
+            
+            zone_name = zone_details.get('zone_name', '')
+            is_bullish_zone = zone_details.get('is_bullish_zone', False)
+            
+            if zone_name in ["Extreme Discount", "Accumulation Zone"] and is_bullish_zone:
+                return "Bullish", get_emoji('up')
+            elif zone_name in ["Above Buy Zone", "Strong Support"] and not is_bullish_zone:
+                return "Bearish", get_emoji('down')
+            else:
+                return "Neutral", get_emoji('neutral')
+                
+        except Exception as e:
+            logger.error(f"Error getting pivot zone signal: {str(e)}")
+            return "Neutral", get_emoji('neutral')
+    
+    def calculate_regression_metrics(self, df: pd.DataFrame, coeffs: np.ndarray) -> Tuple[float, float, float]:
+        """Calculate regression quality metrics"""
+        try:
+            if len(coeffs) == 0:
+                return 0.0, 0.0, 0.0
+            
+            x = np.arange(len(df))
+            y = df['close'].values
+            
+            polynomial = np.poly1d(coeffs)
+            y_pred = polynomial(x)
+            
+            # R-squared
+            ss_res = np.sum((y - y_pred) ** 2)
+            ss_tot = np.sum((y - np.mean(y)) ** 2) if len(y) > 1 else 1
+            r_squared = max(0, min(1, 1 - (ss_res / ss_tot))) if ss_tot != 0 else 0
+            
+            # Confidence based on R-squared
+            confidence = min(100, max(0, r_squared * 100))
+            
+            # Trend strength based on slope
+            if len(coeffs) > 1:
+                slope = coeffs[-2]
+                trend_strength = min(100, max(0, abs(slope) * 1000))
+            else:
+                trend_strength = 0
+            
+            return r_squared, confidence, trend_strength
+            
+        except Exception as e:
+            logger.error(f"Error calculating regression metrics: {str(e)}")
+            return 0.0, 0.0, 0.0
+    
+    def calculate_support_resistance(self, df: pd.DataFrame) -> Tuple[float, float]:
+        """Calculate support and resistance levels"""
+        try:
+            if len(df) < 10:
+                support = df['low'].min()
+                resistance = df['high'].max()
+            else:
+                # Use recent data
+                recent = df.tail(20)
+                support = recent['low'].min()
+                resistance = recent['high'].max()
+            
+            # Ensure support < resistance
+            if support >= resistance:
+                resistance = support * 1.05
+            
+            return float(support), float(resistance)
+            
+        except Exception as e:
+            logger.error(f"Error calculating support/resistance: {str(e)}")
+            return 0.0, 0.0
+    
+    def prepare_inputs(self, symbol: str, market_data: Dict[str, Optional[pd.DataFrame]],
+                       current_price: Optional[float]) -> Optional[Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, float]]:
+        """Validate one symbol's candles and resolve its current price
+        
+        Returns (hourly, four_hour, daily, current_price), or None when candles are missing.
+        """
+        hourly_data = market_data.get('1h')
+        four_hour_data = market_data.get('4h')
+        daily_data = market_data.get('1d')
+        
+        # Validate data
+        if hourly_data is None or hourly_data.empty:
+            logger.error(f"No hourly data for {symbol}")
+            return None
+        
+        if daily_data is None or daily_data.empty:
+            logger.error(f"No daily data for {symbol}")
+            return None
+        
+        if four_hour_data is None or four_hour_data.empty:
+            logger.warning(f"No 4h data for {symbol}, using hourly data")
+            four_hour_data = hourly_data
+        
+        # Current price from the price snapshot, falling back to daily data
+        if current_price is None:
+            current_price = float(daily_data['close'].iloc[-1])
+        logger.info(f"{symbol} current price: ${current_price:.4f}")
+        
+        return hourly_data, four_hour_data, daily_data, current_price
+    
+    def compute_indicators(self, hourly_data: pd.DataFrame, four_hour_data: pd.DataFrame,
+                           daily_data: pd.DataFrame) -> Dict[str, Any]:
+        """Compute the price-independent indicators of one symbol (see build_signal)"""
+        # 1-hour Polynomial Regression forecast
+        forecast_1h, _ = self.polynomial_regression_forecast(hourly_data, degree=3, periods=5)
+        
+        indicators = {
+            'forecast_1h': float(forecast_1h[0]) if forecast_1h is not None and len(forecast_1h) >= 1 else None,
+            'fib_levels_1h': self.calculate_fibonacci_levels(hourly_data['high'].max(), hourly_data['low'].min()),
+        }
+        
+        # Daily Polynomial Regression
+        forecast, coeffs = self.polynomial_regression_forecast(daily_data, degree=3, periods=30)
+        if forecast is not None and coeffs is not None:
+            r_squared, confidence, trend_strength = self.calculate_regression_metrics(daily_data, coeffs)
+            support, resistance = self.calculate_support_resistance(daily_data)
+            indicators.update({
+                'daily_forecast': forecast,
+                'daily_slope': coeffs[-2] if len(coeffs) > 1 else 0,
+                'r_squared': r_squared,
+                'confidence': confidence,
+                'trend_strength': trend_strength,
+                'support': support,
+                'resistance': resistance,
+            })
+        else:
+            indicators['daily_forecast'] = None
+        
+        # RSI and MACD (4-hour)
+        rsi_values = self.calculate_rsi(four_hour_data['close'])
+        indicators['rsi'] = rsi_values.iloc[-1] if not rsi_values.empty else 50
+        macd_line, signal_line, macd_histogram = self.calculate_macd(four_hour_data['close'])
+        indicators['macd_signal'] = self.get_macd_signal(macd_line, signal_line, macd_histogram)[0]
+        
+        # Pivot zones (daily)
+        indicators['pivot_levels'] = self.calculate_pivot_zones(daily_data)
+        return indicators
+    
+    def compute_indicators_batch(self, inputs: List[Tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame]]) -> List[Dict[str, Any]]:
+        """Vectorized compute_indicators for many symbols at once (see indicator_engine)"""
+        if not inputs:
+            return []
+        
+        hourly_frames, four_hour_frames, daily_frames = zip(*inputs)
+        
+        # 1-hour Fibonacci levels over the whole hourly window
+        hourly_highs, hourly_lengths = indicator_engine.stack_columns(hourly_frames, 'high')
+        hourly_lows, _ = indicator_engine.stack_columns(hourly_frames, 'low')
+        fib_levels = indicator_engine.fibonacci_levels(
+            np.fmax.reduce(hourly_highs, axis=1), np.fmin.reduce(hourly_lows, axis=1)
+        )
+        
+        # RSI and MACD (4-hour)
+        closes_4h, lengths_4h = indicator_engine.stack_columns(four_hour_frames, 'close')
+        rsi_values = indicator_engine.rsi(closes_4h, lengths_4h)
+        macd_signals = indicator_engine.macd_signals(*indicator_engine.macd(closes_4h, lengths_4h))
+        
+        # Pivot zones and support/resistance share the last 20 daily candles
+        daily_highs, _ = indicator_engine.stack_columns(daily_frames, 'high')
+        daily_lows, _ = indicator_engine.stack_columns(daily_frames, 'low')
+        zones = indicator_engine.pivot_zones(daily_highs, daily_lows, window=20)
+        rolling_highs, rolling_lows = indicator_engine.rolling_extremes(daily_highs, daily_lows, 20)
+        support, resistance = rolling_lows[:, -1], rolling_highs[:, -1]
+        resistance = np.where(support >= resistance, support * 1.05, resistance)
+        
+        # Polynomial regression: 1-hour trend forecast and daily forecast with fit metrics
+        closes_1h, _ = indicator_engine.stack_columns(hourly_frames, 'close')
+        hourly_fit = indicator_engine.polynomial_regression(closes_1h, hourly_lengths, degree=3, periods=5)
+        daily_closes, daily_lengths = indicator_engine.stack_columns(daily_frames, 'close')
+        daily_fit = indicator_engine.polynomial_regression(daily_closes, daily_lengths, degree=3, periods=30)
+        
+        results = []
+        for row in range(len(inputs)):
+            indicators = {
+                'forecast_1h': float(hourly_fit['forecast'][row, 0]) if hourly_fit['valid'][row] else None,
+                'fib_levels_1h': indicator_engine.row_values(fib_levels, row),
+                'rsi': float(rsi_values[row, -1]),
+                'macd_signal': macd_signals[row],
+                'pivot_levels': indicator_engine.row_values(zones, row),
+            }
+            
+            if daily_fit['valid'][row]:
+                r_squared = float(daily_fit['r_squared'][row])
+                slope = float(daily_fit['coeffs'][row, -2])
+                indicators.update({
+                    'daily_forecast': daily_fit['forecast'][row],
+                    'daily_slope': slope,
+                    'r_squared': r_squared,
+                    'confidence': min(100, max(0, r_squared * 100)),
+                    'trend_strength': min(100, max(0, abs(slope) * 1000)),
+                    'support': float(support[row]),
+                    'resistance': float(resistance[row]),
+                })
+            else:
+                indicators['daily_forecast'] = None
+            results.append(indicators)
+        
+        return results
+    
+    def evaluate_signal(self, symbol: str, market_data: Dict[str, Optional[pd.DataFrame]],
+                        current_price: Optional[float] = None,
+                        data_source: str = 'gateio') -> Optional[Dict[str, Any]]:
+        """Compute the full signal for one symbol from its '1h', '4h' and '1d' candles
+        
+        current_price normally comes from the run's price snapshot; when omitted
+        the last daily close is used. The returned signal carries the indicator
+        table rows under 'records'. Returns None when candles are missing.
+        """
+        try:
+            inputs = self.prepare_inputs(symbol, market_data, current_price)
+            if inputs is None:
+                return None
+            
+            hourly_data, four_hour_data, daily_data, current_price = inputs
+            indicators = self.compute_indicators(hourly_data, four_hour_data, daily_data)
+            return self.build_signal(symbol, current_price, indicators, data_source)
+            
+        except Exception as e:
+            logger.error(f"{get_emoji('cross')} Error generating signal for {symbol}: {str(e)}")
+            logger.error(traceback.format_exc())
+            return None
+    
+    def evaluate_signals(self, items: List[Tuple[str, Dict[str, Optional[pd.DataFrame]], Optional[float]]],
+                         data_source: str = 'gateio') -> List[Tuple[str, Optional[Dict[str, Any]]]]:
+        """evaluate_signal for many symbols, computing indicators in one vectorized pass"""
+        prepared = []
+        for symbol, market_data, current_price in items:
+            try:
+                inputs = self.prepare_inputs(symbol, market_data, current_price)
+            except Exception as e:
+                logger.error(f"{get_emoji('cross')} Error generating signal for {symbol}: {str(e)}")
+                inputs = None
+            if inputs is not None:
+                prepared.append((symbol, inputs))
+        
+        try:
+            batch_indicators = self.compute_indicators_batch([inputs[:3] for _, inputs in prepared])
+        except Exception as e:
+            # Fall back to per-symbol computation so one bad series cannot sink the whole chunk
+            logger.error(f"{get_emoji('cross')} Batch indicator computation failed, computing per symbol: {str(e)}")
+            return [
+                (symbol, self.evaluate_signal(symbol, market_data, current_price, data_source))
+                for symbol, market_data, current_price in items
+            ]
+        
+        signals = {}
+        for (symbol, inputs), indicators in zip(prepared, batch_indicators):
+            try:
+                signals[symbol] = self.build_signal(symbol, inputs[3], indicators, data_source)
+            except Exception as e:
+                logger.error(f"{get_emoji('cross')} Error generating signal for {symbol}: {str(e)}")
+                logger.error(traceback.format_exc())
+        
+        return [(symbol, signals.get(symbol)) for symbol, _, _ in items]
+    
+    def build_signal(self, symbol: str, current_price: float, indicators: Dict[str, Any],
+                     data_source: str = 'gateio') -> Dict[str, Any]:
+        """Turn one symbol's indicators and current price into its signal (decision logic)"""
+        # 1-hour Polynomial Regression Trend Signal
+        poly_1h_forecast = indicators['forecast_1h']
+        if poly_1h_forecast is not None:
+            price_change_pct = ((poly_1h_forecast - current_price) / current_price) * 100
+            if price_change_pct > 0.5:  # 0.5% increase
+                poly_1h_signal, poly_1h_emoji = "Bullish", get_emoji('up')
+            elif price_change_pct < -0.5:  # 0.5% decrease
+                poly_1h_signal, poly_1h_emoji = "Bearish", get_emoji('down')
+            else:
+                poly_1h_signal, poly_1h_emoji = "Neutral", get_emoji('neutral')
+        else:
+            poly_1h_signal, poly_1h_emoji, poly_1h_forecast = "Neutral", get_emoji('neutral'), current_price
+        
+        # 1-hour Fibonacci Analysis
+        fib_levels_1h = indicators['fib_levels_1h']
+        fib_1h_signal, fib_1h_emoji = self.get_fibonacci_signal(current_price, fib_levels_1h)
+        
+        # Fibonacci Signal for comparison
+        fib_signal, fib_emoji = self.get_fibonacci_signal(current_price, fib_levels_1h)
+        
+        # Daily Polynomial Regression
+        forecast = indicators['daily_forecast']
+        
+        if forecast is not None:
+            # Extract forecasts
+            forecast_1d = forecast[0] if len(forecast) >= 1 else current_price
+            forecast_7d = forecast[6] if len(forecast) >= 7 else current_price
+            forecast_14d = forecast[13] if len(forecast) >= 14 else current_price
+            forecast_30d = forecast[29] if len(forecast) >= 30 else current_price
+            
+            # Regression metrics
+            r_squared = indicators['r_squared']
+            confidence = indicators['confidence']
+            trend_strength = indicators['trend_strength']
+            
+            # Support and resistance
+            support, resistance = indicators['support'], indicators['resistance']
+            
+            # Determine trend based on pseudocode logic (1% threshold)
+            price_change_1d_pct = ((forecast_1d - current_price) / current_price) * 100
+            if price_change_1d_pct > 1.0:  # 1% increase threshold from pseudocode
+                poly_signal, poly_emoji = "Bullish", get_emoji('up')
+            elif price_change_1d_pct < -1.0:  # 1% decrease threshold
+                poly_signal, poly_emoji = "Bearish", get_emoji('down')
+            else:
+                poly_signal, poly_emoji = "Neutral", get_emoji('neutral')
+            
+            # Regression data and daily forecast rows
+            regression_record = {
+                'symbol': symbol, 'current_price': current_price,
+                'poly_regression_value': indicators['daily_slope'],
+                'poly_signal_daily': f"{poly_emoji} {poly_signal}",
+                'poly_confidence': confidence, 'r_squared': r_squared, 'trend_strength': trend_strength,
+                'support_level': support, 'resistance_level': resistance,
+                'forecast_1d': forecast_1d, 'forecast_7d': forecast_7d, 'forecast_30d': forecast_30d
+            }
+            forecast_record = {
+                'symbol': symbol, 'current_price': current_price,
+                'forecast_1d': forecast_1d, 'forecast_7d': forecast_7d,
+                'forecast_14d': forecast_14d, 'forecast_30d': forecast_30d,
+                'poly_signal': poly_signal, 'poly_emoji': poly_emoji
+            }
+        else:
+            # Fallback if regression fails
+            forecast_1d = forecast_7d = forecast_14d = forecast_30d = current_price
+            poly_signal, poly_emoji = "Neutral", get_emoji('neutral')
+            regression_record = forecast_record = None
+        
+        # RSI Analysis (4-hour) - Updated thresholds from pseudocode
+        current_rsi = indicators['rsi']
+        
+        # Get RSI zone for display
+        rsi_zone, rsi_zone_emoji = self.get_rsi_zone(current_rsi)
+        
+        # Get RSI signal based on pseudocode thresholds
+        if current_rsi < 40:
+            rsi_signal, rsi_signal_emoji = "Bullish", get_emoji('up')
+        elif current_rsi > 60:
+            rsi_signal, rsi_signal_emoji = "Bearish", get_emoji('down')
+        else:
+            rsi_signal, rsi_signal_emoji = "Neutral", get_emoji('neutral')
+        
+        # MACD Analysis (4-hour)
+        macd_signal = indicators['macd_signal']
+        if macd_signal.startswith('Bullish'):
+            macd_emoji = get_emoji('up')
+        elif macd_signal.startswith('Bearish'):
+            macd_emoji = get_emoji('down')
+        else:
+            macd_emoji = get_emoji('neutral')
+        
+        # NEW: Precise Pivot Zone Analysis
+        pivot_zone, pivot_emoji, zone_details = self.get_pivot_zone(current_price, indicators['pivot_levels'])
+        pivot_signal, pivot_signal_emoji = self.get_pivot_zone_signal(zone_details)
+        
+        # Fibonacci data row with actual pivot zone
+        fibonacci_record = {
+            'symbol': symbol, 'current_price': current_price, 'fib_levels': fib_levels_1h,
+            'fib_1h_signal': f"{fib_1h_emoji} {fib_1h_signal}",
+            'pivot_zone': f"{pivot_emoji} {pivot_zone}"
+        }
+        
+        # Combined signal analysis - Updated for 3+ signal threshold from pseudocode
+        # Convert signals to consistent format for counting
+        signal_list = [
+            ('Poly 1H', poly_1h_signal),
+            ('Fibonacci', fib_signal),
+            ('Poly Daily', poly_signal),
+            ('RSI', rsi_signal),
+            ('MACD', macd_signal),
+            ('Pivot Zone', pivot_signal)
+        ]
+        
+        # Count bullish and bearish signals
+        bull_keywords = ['bull', 'up']
+        bear_keywords = ['bear', 'down']
+        
+        bull_count = 0
+        bear_count = 0
+        
+        for _, signal in signal_list:
+            signal_str = str(signal).lower()
+            if any(k in signal_str for k in bull_keywords):
+                bull_count += 1
+            elif any(k in signal_str for k in bear_keywords):
+                bear_count += 1
+        
+        # Determine overall signal based on pseudocode logic (3+ signals)
+        if bull_count >= 3 and zone_details.get('is_bullish_zone', False):
+            overall_signal, overall_emoji = "BUY", get_emoji('up')
+        elif bear_count >= 3 and not zone_details.get('is_bullish_zone', False):
+            overall_signal, overall_emoji = "SELL", get_emoji('down')
+        else:
+            overall_signal, overall_emoji = "NEUTRAL", get_emoji('neutral')
+        
+        # STRONG signals based on additional criteria
+        if bull_count >= 4 and pivot_zone in ["Extreme Discount", "Accumulation Zone"]:
+            overall_signal, overall_emoji = "STRONG BUY", get_emoji('up')
+        elif bear_count >= 4 and pivot_zone in ["Above Buy Zone", "Strong Support"]:
+            overall_signal, overall_emoji = "STRONG SELL", get_emoji('down')
+        
+        # Create signal dictionary with enhanced zone details
+        signal_data = {
+            'symbol': symbol,
+            'current_price': current_price,
+            'poly_1h_signal': f"{poly_1h_emoji} {poly_1h_signal}",
+            'fib_15m_signal': f"{fib_1h_emoji} {fib_1h_signal}",
+            'fib_signal': f"{fib_emoji} {fib_signal}",
+            'poly_signal': f"{poly_emoji} {poly_signal}",
+            'rsi_zone': f"{rsi_zone_emoji} {rsi_zone} (RSI: {current_rsi:.2f})",
+            'rsi_signal': f"{rsi_signal_emoji} {rsi_signal}",
+            'macd_signal': f"{macd_emoji} {macd_signal}",
+            'pivot_zone': f"{pivot_emoji} {pivot_zone}",
+            'pivot_signal': f"{pivot_signal_emoji} {pivot_signal}",
+            'overall_signal': f"{overall_emoji} {overall_signal}",
+            'overall_signal_type': overall_signal,
+            'pivot_zone_type': pivot_zone,
+            'pivot_emoji': pivot_emoji,
+            'zone_details': zone_details,
+            'signal_counts': {'bullish': bull_count, 'bearish': bear_count, 'total': len(signal_list)},
+            'forecast_1h': poly_1h_forecast,
+            'forecast_1d': forecast_1d,
+            'forecast_7d': forecast_7d,
+            'forecast_14d': forecast_14d,
+            'forecast_30d': forecast_30d,
+            'timestamp': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            'data_source': data_source,
+            # Rows for the indicator tables, written by the caller
+            'records': {
+                'regression': regression_record,
+                'daily_forecast': forecast_record,
+                'fibonacci': fibonacci_record,
+                'state': {
+                    'symbol': symbol, 'zone_details': zone_details, 'fib_levels': fib_levels_1h,
+                    # Missing fits stay NULL so reclassify_signals keeps them Neutral
+                    'forecast_1h': indicators['forecast_1h'],
+                    'forecast_1d': forecast_1d if regression_record is not None else None,
+                    'rsi_signal': rsi_signal, 'macd_signal': macd_signal
+                },
+                'history': {
+                    'symbol': symbol, 'overall_signal': overall_signal, 'pivot_zone': pivot_zone,
+                    'current_price': current_price, 'rsi': float(current_rsi),
+                    'rsi_signal': rsi_signal, 'macd_signal': macd_signal, 'poly_signal': poly_signal,
+                    'bullish_count': bull_count, 'bearish_count': bear_count,
+                    'forecast_1d': forecast_1d, 'forecast_30d': forecast_30d
+                }
+            }
+        }
+        
+        return signal_data
+    
+    def reclassify_signals(self, state: pd.DataFrame, prices: pd.Series) -> pd.DataFrame:
+        """Re-derive every price-dependent signal for all symbols in one vectorized pass
+        
+        Mirrors get_poly_signal_1h, get_fibonacci_signal, the daily poly threshold,
+        get_pivot_zone, get_pivot_zone_signal and the overall vote in generate_signal,
+        using the stored zone boundaries, Fibonacci levels and forecasts.
+        """
+        price = prices.reindex(state.index).astype(float)
+        
+        def trend(change_pct: pd.Series, threshold: float) -> np.ndarray:
+            return np.select([change_pct > threshold, change_pct < -threshold], ['Bullish', 'Bearish'], 'Neutral')
+        
+        poly_1h = trend((state['forecast_1h'] - price) / price * 100, 0.5)
+        poly_daily = trend((state['forecast_1d'] - price) / price * 100, 1.0)
+        fib = np.select([price > state['fib_level_61_8'], price < state['fib_level_38_2']], ['Bullish', 'Bearish'], 'Neutral')
+        
+        zone = indicator_engine.classify_pivot_zones(
+            price.to_numpy(), state['extreme_discount'].to_numpy(dtype=float),
+            state['accumulation_upper'].to_numpy(dtype=float), state['reversal_zone'].to_numpy(dtype=float),
+            state['strong_support'].to_numpy(dtype=float)
+        )
+        is_bullish_zone = np.isin(zone, ['Extreme Discount', 'Accumulation Zone'])
+        is_bearish_zone = np.isin(zone, ['Above Buy Zone', 'Strong Support'])
+        pivot = np.select([is_bullish_zone, is_bearish_zone], ['Bullish', 'Bearish'], 'Neutral')
+        
+        votes = pd.DataFrame({
+            'poly_1h': poly_1h, 'fib': fib, 'poly_daily': poly_daily,
+            'rsi': state['rsi_signal'].values, 'macd': state['macd_signal'].values, 'pivot': pivot
+        }, index=state.index).apply(lambda column: column.astype(str).str.lower())
+        is_bull = votes.apply(lambda column: column.str.contains('bull|up'))
+        is_bear = ~is_bull & votes.apply(lambda column: column.str.contains('bear|down'))
+        bull_count = is_bull.sum(axis=1).values
+        bear_count = is_bear.sum(axis=1).values
+        
+        overall = np.select(
+            [(bull_count >= 4) & is_bullish_zone,
+             (bear_count >= 4) & is_bearish_zone,
+             (bull_count >= 3) & is_bullish_zone,
+             (bear_count >= 3) & ~is_bullish_zone],
+            ['STRONG BUY', 'STRONG SELL', 'BUY', 'SELL'],
+            'NEUTRAL'
+        )
+        
+        trend_emojis = {'Bullish': get_emoji('up'), 'Bearish': get_emoji('down'), 'Neutral': get_emoji('neutral')}
+        zone_emojis = {
+            'Extreme Discount': get_emoji('discount'), 'Accumulation Zone': get_emoji('up'),
+            'Reversal Zone': get_emoji('neutral'), 'Strong Support': get_emoji('down'),
+            'Above Buy Zone': get_emoji('overvalued'), 'Unknown': get_emoji('neutral')
+        }
+        overall_emojis = {
+            'STRONG BUY': get_emoji('up'), 'BUY': get_emoji('up'),
+            'STRONG SELL': get_emoji('down'), 'SELL': get_emoji('down'), 'NEUTRAL': get_emoji('neutral')
+        }
+        
+        def label(values: np.ndarray, emojis: Dict[str, str]) -> List[str]:
+            return [f"{emojis[value]} {value}" for value in values]
+        
+        return pd.DataFrame({
+            'current_price': price,
+            'poly_1h_signal': label(poly_1h, trend_emojis),
+            'fib_signal': label(fib, trend_emojis),
+            'poly_signal': label(poly_daily, trend_emojis),
+            'pivot_zone': label(zone, zone_emojis),
+            'overall_signal': label(overall, overall_emojis),
+            'overall_signal_type': overall,
+            # Plain values, as a full run writes them to signal_history
+            'pivot_zone_type': zone,
+            'poly_signal_type': poly_daily,
+            'bullish_count': bull_count,
+            'bearish_count': bear_count,
+        }, index=state.index)
+
+
+def evaluate_batch(items: List[Tuple[str, Dict[str, Optional[pd.DataFrame]], Optional[float]]],
+                   data_source: str = 'gateio') -> Tuple[List[Tuple[str, Optional[Dict[str, Any]]]], float]:
+    """Evaluate a chunk of (symbol, market_data, current_price) items
+    
+    This is the ProcessPoolExecutor entry point. Returns the (symbol, signal)
+    pairs and the seconds spent computing, for utilization reporting.
+    """
+    start_time = time.perf_counter()
+    results = SignalCalculator().evaluate_signals(items, data_source)
+    return results, time.perf_counter() - start_time
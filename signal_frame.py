@@ -0,0 +1,119 @@
+# signal_frame.py - Latest signal per symbol, parsed once for every dashboard view
+from typing import Any, Callable, Dict, List, Optional
+
+import numpy as np
+import pandas as pd
+
+SIGNAL_TYPES = ['STRONG BUY', 'BUY', 'NEUTRAL', 'SELL', 'STRONG SELL', 'UNKNOWN']
+# Zone names written by signal_calculator.py (behind an emoji)
+PIVOT_ZONES = ['Extreme Discount', 'Accumulation Zone', 'Reversal Zone', 'Strong Support', 'Above Buy Zone', 'Unknown']
+
+
+def parse_signal_type(text: Any) -> str:
+    """Signal type of an overall_signal string such as '🟢 STRONG BUY'"""
+    if not isinstance(text, str):
+        return 'UNKNOWN'
+    upper = text.upper()
+    if 'STRONG BUY' in upper:
+        return 'STRONG BUY'
+    if 'STRONG SELL' in upper:
+        return 'STRONG SELL'
+    if 'STRONG' not in upper:
+        if 'BUY' in upper:
+            return 'BUY'
+        if 'SELL' in upper:
+            return 'SELL'
+    if 'NEUTRAL' in upper:
+        return 'NEUTRAL'
+    return 'UNKNOWN'
+
+
+def parse_pivot_zone(text: Any) -> str:
+    """Zone name of a pivot_zone string such as '🔥 Extreme Discount'"""
+    if isinstance(text, str):
+        lower = text.lower()
+        for zone in PIVOT_ZONES[:-1]:
+            if zone.lower() in lower:
+                return zone
+    return 'Unknown'
+
+
+def categorize(values: pd.Series, parse: Callable[[Any], str], categories: List[str]) -> pd.Series:
+    """Parse each distinct string of a column once into a categorical column"""
+    labels = {value: parse(value) for value in values.dropna().unique()}
+    parsed = values.map(labels).fillna(parse(None))
+    return pd.Series(pd.Categorical(parsed, categories=categories), index=values.index)
+
+
+def latest_per_symbol(df: pd.DataFrame) -> pd.DataFrame:
+    df = df.sort_values(['symbol', 'timestamp'], ascending=[True, False])
+    return df.drop_duplicates(subset=['symbol'], keep='first').reset_index(drop=True)
+
+
+class SignalFrame:
+    """The latest trading signal per symbol with everything the dashboard views derive from it
+
+    Built once from the trading_signals and regression reads: signal type and
+    pivot zone parsed into categorical columns, the 30-day forecast change in
+    percent (pct_change_30d), and a boolean mask per view. Views are
+    selections of one shared frame, so they share row order (by symbol).
+    """
+
+    def __init__(self, signals: pd.DataFrame, regression: Optional[pd.DataFrame] = None):
+        if signals.empty or 'symbol' not in signals.columns:
+            signals = pd.DataFrame(columns=['symbol', 'current_price', 'overall_signal', 'pivot_zone',
+                                            'forecast_30d', 'timestamp'])
+        df = latest_per_symbol(signals)
+        df['signal_type'] = categorize(df['overall_signal'], parse_signal_type, SIGNAL_TYPES)
+        df['zone'] = categorize(df['pivot_zone'], parse_pivot_zone, PIVOT_ZONES)
+        if 'forecast_30d' in df.columns:
+            price = pd.to_numeric(df['current_price'], errors='coerce')
+            df['pct_change_30d'] = (pd.to_numeric(df['forecast_30d'], errors='coerce') - price) / price * 100
+        else:
+            df['pct_change_30d'] = np.nan
+        self.frame = df
+
+        signal_type = df['signal_type']
+        bullish_regression = set()
+        if regression is not None and not regression.empty and 'poly_signal_daily' in regression.columns:
+            bullish = regression['poly_signal_daily'].str.contains('BULLISH', case=False, na=False)
+            bullish_regression = set(regression.loc[bullish, 'symbol'])
+        extreme_discount = df['zone'] == 'Extreme Discount'
+
+        self.masks: Dict[str, pd.Series] = {
+            'all': pd.Series(True, index=df.index),
+            'strong_buy': signal_type == 'STRONG BUY',
+            'buy': signal_type == 'BUY',
+            'neutral': signal_type == 'NEUTRAL',
+            'sell': signal_type == 'SELL',
+            'strong_sell': signal_type == 'STRONG SELL',
+            'bullish': signal_type.isin(['STRONG BUY', 'BUY']),
+            'bearish': signal_type.isin(['STRONG SELL', 'SELL']),
+            'extreme_discount': extreme_discount,
+            'overvalued': df['zone'] == 'Above Buy Zone',
+            # Bullish daily regression + Extreme Discount
+            'portfolio': extreme_discount & df['symbol'].isin(bullish_regression),
+        }
+
+    @property
+    def empty(self) -> bool:
+        return self.frame.empty
+
+    def view(self, name: str = 'all') -> pd.DataFrame:
+        """Rows of view `name` (a new frame, safe to modify)"""
+        return self.frame[self.masks[name]]
+
+    def count(self, name: str, within: str = 'all') -> int:
+        return int((self.masks[name] & self.masks[within]).sum())
+
+    def signal_counts(self, name: str = 'all') -> Dict[str, int]:
+        """Symbols per signal type in view `name`, keyed like the views ('strong_buy', ...)"""
+        counts = self.frame.loc[self.masks[name], 'signal_type'].value_counts()
+        return {signal.lower().replace(' ', '_'): int(counts[signal]) for signal in SIGNAL_TYPES[:-1]}
+
+    def top_movers(self, name: str, n: int = 5, largest: bool = True) -> List[Dict[str, Any]]:
+        """The n symbols of view `name` with the largest (or smallest) 30-day forecast change"""
+        df = self.view(name).dropna(subset=['current_price', 'forecast_30d', 'pct_change_30d'])
+        df = df.nlargest(n, 'pct_change_30d') if largest else df.nsmallest(n, 'pct_change_30d')
+        return df[['symbol', 'current_price', 'forecast_30d', 'pct_change_30d']].rename(
+            columns={'pct_change_30d': 'forecast_change_30d'}).to_dict('records')
@@ -0,0 +1,86 @@
+# snapshot.py - Columnar Parquet snapshot of the dashboard's current state
+import logging
+import os
+import sqlite3
+import time
+from typing import Dict, Optional, Union
+
+import pandas as pd
+
+from schema import SCHEMA_VERSION, read_queries
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # Snapshots are optional; the dashboard falls back to the SQLite file
+    pa = pq = None
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_COMPRESSION = 'zstd'
+
+# One Parquet file per table, with the rows and order the dashboard's getters return
+SNAPSHOT_QUERIES = {
+    'dashboard_metadata': '''
+        SELECT last_updated, total_symbols, last_update_status, update_duration_seconds, data_source
+        FROM dashboard_metadata WHERE id = 1
+    ''',
+    **read_queries(SCHEMA_VERSION),
+    'signal_history': '''
+        SELECT * FROM signal_history WHERE ts >= ? ORDER BY symbol, ts
+    ''',
+}
+
+
+def snapshot_available() -> bool:
+    """Whether pyarrow is installed, so snapshots can be written and read"""
+    return pq is not None
+
+
+def export_snapshot(connection: sqlite3.Connection, out_dir: str, history_days: int = 7) -> Dict[str, int]:
+    """Write one compressed Parquet file per SNAPSHOT_QUERIES table into out_dir
+
+    signal_history is limited to the last `history_days` days. Each file is
+    written to a temporary name and renamed, so readers never see a partial
+    file. Returns the rows written per table.
+    """
+    if not snapshot_available():
+        raise ImportError("pyarrow is required to export snapshots (pip install pyarrow)")
+
+    os.makedirs(out_dir, exist_ok=True)
+    rows = {}
+    for table, query in SNAPSHOT_QUERIES.items():
+        params = (int(time.time()) - history_days * 86400,) if table == 'signal_history' else ()
+        df = pd.read_sql_query(query, connection, params=params)
+
+        path = os.path.join(out_dir, f"{table}.parquet")
+        pq.write_table(pa.Table.from_pandas(df, preserve_index=False), f"{path}.tmp",
+                       compression=SNAPSHOT_COMPRESSION)
+        os.replace(f"{path}.tmp", path)
+        rows[table] = len(df)
+    return rows
+
+
+def read_snapshot_table(source: Union[str, bytes]) -> pd.DataFrame:
+    """Read one snapshot table from a file path or downloaded bytes
+
+    Bytes are wrapped without copying, and the Arrow buffers are released
+    column by column as pandas takes them over.
+    """
+    if isinstance(source, bytes):
+        source = pa.BufferReader(source)
+    return pq.read_table(source).to_pandas(split_blocks=True, self_destruct=True)
+
+
+def snapshot_files(snapshot_dir: str) -> Optional[Dict[str, str]]:
+    """Paths of every snapshot table in a local directory, or None if any is missing"""
+    if not snapshot_available():
+        return None
+
+    files = {}
+    for table in SNAPSHOT_QUERIES:
+        path = os.path.join(snapshot_dir, f"{table}.parquet")
+        if not os.path.exists(path):
+            return None
+        files[table] = path
+    return files
@@ -3,7 +3,8 @@ import subprocess
 import time
 import os
 from datetime import datetime
-import sqlite3
+
+from db_storage import connect_database
 
 def run_scheduler_once():
     """Run the scheduler one time to update the database"""
@@ -17,6 +18,7 @@ def run_scheduler_once():
     # Run signal generation once
     print("Generating signals for all symbols...")
     all_signals, strong_signals = generator.run(send_telegram=False)
+    generator.close()
     
     if all_signals:
         print(f"✓ Successfully updated {len(all_signals)} symbols")
@@ -33,7 +35,7 @@ def run_scheduler_once():
 def add_update_metadata():
     """Add metadata about when the database was last updated"""
     try:
-        conn = sqlite3.connect('trading_signals.db')
+        conn = connect_database('trading_signals.db')
         cursor = conn.cursor()
         
         # Create metadata table if it doesn't exist
@@ -68,7 +70,7 @@ def add_update_metadata():
 def check_database_health():
     """Check if the database has valid data"""
     try:
-        conn = sqlite3.connect('trading_signals.db')
+        conn = connect_database('trading_signals.db')
         cursor = conn.cursor()
         
         # Check if tables exist
@@ -120,7 +122,7 @@ def main():
         print("=" * 60)
         
         # Show summary
-        conn = sqlite3.connect('trading_signals.db')
+        conn = connect_database('trading_signals.db')
         cursor = conn.cursor()
         
         cursor.execute("SELECT last_updated, total_symbols FROM dashboard_metadata WHERE id = 1")